@@ -0,0 +1,10 @@
+from mcp.server import MCPServer
+from mcp.types import ToolAnnotations
+
+mcp = MCPServer("Bookshop")
+
+
+@mcp.tool(annotations=ToolAnnotations(read_only_hint=True), memoize=60)
+def count_books(author: str) -> int:
+    """Count the books by an author (an expensive catalog scan)."""
+    return len(author)
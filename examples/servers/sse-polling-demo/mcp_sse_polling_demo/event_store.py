@@ -6,10 +6,20 @@ not for production use where a persistent storage solution would be more appropr
 
 import logging
 from collections import deque
+from collections.abc import AsyncGenerator, Sequence
 from dataclasses import dataclass
+from itertools import islice
 from uuid import uuid4
 
-from mcp.server.streamable_http import EventCallback, EventId, EventMessage, EventStore, StreamId
+from mcp.server.streamable_http import (
+    REPLAY_BATCH_SIZE,
+    EventCallback,
+    EventId,
+    EventMessage,
+    EventReplay,
+    EventStore,
+    StreamId,
+)
 from mcp.types import JSONRPCMessage
 
 logger = logging.getLogger(__name__)
@@ -22,6 +32,7 @@ class EventEntry:
     event_id: EventId
     stream_id: StreamId
     message: JSONRPCMessage | None  # None for priming events
+    seq: int  # position in the stream, counting evicted events
 
 
 class InMemoryEventStore(EventStore):
@@ -52,11 +63,13 @@ class InMemoryEventStore(EventStore):
             message: The message to store, or None for priming events
         """
         event_id = str(uuid4())
-        event_entry = EventEntry(event_id=event_id, stream_id=stream_id, message=message)
 
         # Get or create deque for this stream
         if stream_id not in self.streams:
             self.streams[stream_id] = deque(maxlen=self.max_events_per_stream)
+        stream_events = self.streams[stream_id]
+        seq = stream_events[-1].seq + 1 if stream_events else 0
+        event_entry = EventEntry(event_id=event_id, stream_id=stream_id, message=message, seq=seq)
 
         # If deque is full, the oldest event will be automatically removed
         # We need to remove it from the event_index as well
@@ -96,3 +109,33 @@ class InMemoryEventStore(EventStore):
                 found_last = True
 
         return stream_id
+
+    async def replay_batches_after(self, last_event_id: EventId, *, limit: int | None = None) -> EventReplay | None:
+        """Pages through the events after the specified event ID, a batch at a time."""
+        if last_event_id not in self.event_index:
+            logger.warning(f"Event ID {last_event_id} not found in store")
+            return None
+        last_event = self.event_index[last_event_id]
+        return EventReplay(last_event.stream_id, self._pages_after(last_event, limit))
+
+    async def _pages_after(
+        self, last_event: EventEntry, limit: int | None
+    ) -> AsyncGenerator[Sequence[EventMessage], None]:
+        """Reads one page per batch the transport pulls, resuming from a cursor rather than a snapshot."""
+        cursor = last_event.seq
+        remaining = limit
+        while remaining is None or remaining > 0:
+            stream_events = self.streams[last_event.stream_id]
+            # Sequence numbers are contiguous, so the cursor maps straight to a deque position
+            start = max(cursor + 1 - stream_events[0].seq, 0)
+            page = list(islice(stream_events, start, start + REPLAY_BATCH_SIZE))
+            if not page:
+                return
+            cursor = page[-1].seq
+            # Skip priming events (None messages) during replay
+            batch = [EventMessage(event.message, event.event_id) for event in page if event.message is not None]
+            if remaining is not None:
+                batch = batch[:remaining]
+                remaining -= len(batch)
+            if batch:
+                yield batch
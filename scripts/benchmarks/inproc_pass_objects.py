@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Compare the in-process `Client` paths with and without `pass_objects`.
+
+`Client(server)` on an in-process server skips streams and JSON-RPC framing,
+but every result is still dumped to its wire dict by the server and parsed
+back into a model by the client. `Client(server, pass_objects=True)` hands the
+handler's result model across instead. This script times `tools/list` and
+`tools/call` over both and reports the time per request.
+
+Usage:
+    python scripts/benchmarks/inproc_pass_objects.py
+    python scripts/benchmarks/inproc_pass_objects.py --requests 5000 --tools 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Awaitable, Callable
+
+import anyio
+
+from mcp.client import Client
+from mcp.client.validation import OutputValidation
+from mcp.server.mcpserver import MCPServer
+
+
+def build_server(tools: int) -> MCPServer:
+    """`tools` listed tools, plus `rows`, whose structured result is a small table."""
+    server = MCPServer("bench")
+
+    for index in range(tools):
+
+        def noop(a: int, b: str = "") -> int:
+            return a
+
+        server.add_tool(noop, name=f"tool_{index}", description=f"Tool number {index}, which does nothing.")
+
+    @server.tool()
+    def rows(n: int) -> list[dict[str, int | str]]:
+        return [{"id": i, "name": f"row {i}"} for i in range(n)]
+
+    return server
+
+
+async def time_per_request(requests: int, call: Callable[[], Awaitable[object]]) -> float:
+    await call()
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(requests):
+            await call()
+        best = min(best, (time.perf_counter() - start) / requests)
+    return best
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Time in-process requests with and without pass_objects.")
+    parser.add_argument("--requests", type=int, default=2_000, help="requests per measurement")
+    parser.add_argument("--tools", type=int, default=50, help="tools in the tools/list result")
+    parser.add_argument("--rows", type=int, default=20, help="rows in the tools/call structured result")
+    args = parser.parse_args()
+
+    server = build_server(args.tools)
+    print(f"{'':10} {'wire':>12} {'pass_objects':>14}")
+    timings: dict[str, list[float]] = {"tools/list": [], "tools/call": []}
+    for pass_objects in (False, True):
+        # No response cache or output validation: both would hide the cost being measured.
+        async with Client(
+            server, pass_objects=pass_objects, cache=None, output_validation=OutputValidation(mode="off")
+        ) as client:
+            timings["tools/list"].append(await time_per_request(args.requests, client.list_tools))
+            timings["tools/call"].append(
+                await time_per_request(args.requests, lambda: client.call_tool("rows", {"n": args.rows}))
+            )
+    for method, (wire, passed) in timings.items():
+        print(f"{method:10} {wire * 1e6:9.1f} µs {passed * 1e6:11.1f} µs  ({wire / passed:.1f}x)")
+
+
+if __name__ == "__main__":
+    anyio.run(main)
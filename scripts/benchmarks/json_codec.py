@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Compare JSON backends on the frames an MCP session actually moves.
+
+`mcp.shared._json` parses and encodes wire JSON with pydantic-core. This
+script times it against the stdlib `json` module, and against orjson and
+msgspec when they are importable, on three payloads: a `tools/call` request
+frame, a `tools/list` result with many tools, and a `tools/call` result with
+structured content. It reports the time per encode and per decode.
+
+Usage:
+    python scripts/benchmarks/json_codec.py
+    python scripts/benchmarks/json_codec.py --tools 500 --rows 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from mcp.shared import _json
+
+Codec = tuple[Callable[[Any], bytes | str], Callable[[bytes], Any]]
+
+
+def build_payloads(tools: int, rows: int) -> dict[str, Any]:
+    schema = {
+        "type": "object",
+        "properties": {"a": {"type": "integer"}, "b": {"type": "string", "description": "Free text."}},
+        "required": ["a"],
+    }
+    listing = [
+        {"name": f"tool_{i}", "description": f"Tool number {i}, which does nothing.", "inputSchema": schema}
+        for i in range(tools)
+    ]
+    table = [{"id": i, "name": f"row {i}", "score": i / 7} for i in range(rows)]
+    return {
+        "request frame": {
+            "jsonrpc": "2.0",
+            "id": 42,
+            "method": "tools/call",
+            "params": {"name": "search", "arguments": {"query": "weather in Zürich", "limit": 10}},
+        },
+        "tools/list": {"jsonrpc": "2.0", "id": 1, "result": {"tools": listing, "resultType": "complete"}},
+        "tools/call": {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "result": {
+                "content": [{"type": "text", "text": json.dumps(table)}],
+                "structuredContent": {"result": table},
+                "resultType": "complete",
+            },
+        },
+    }
+
+
+def codecs() -> dict[str, Codec]:
+    found: dict[str, Codec] = {
+        "stdlib": (lambda value: json.dumps(value, separators=(",", ":")).encode(), json.loads),
+        "mcp._json": (_json.dump_bytes, _json.loads),
+    }
+    for name in ("orjson", "msgspec"):
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            continue
+        found[name] = (module.dumps, module.loads) if name == "orjson" else (module.json.encode, module.json.decode)
+    return found
+
+
+def time_per_call(number: int, call: Callable[[], object]) -> float:
+    return min(timeit.repeat(call, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time JSON encode/decode of typical MCP frames per backend.")
+    parser.add_argument("--number", type=int, default=2_000, help="calls per measurement")
+    parser.add_argument("--tools", type=int, default=50, help="tools in the tools/list result")
+    parser.add_argument("--rows", type=int, default=50, help="rows in the tools/call structured result")
+    args = parser.parse_args()
+
+    available = codecs()
+    print(f"{'':21} " + " ".join(f"{name:>22}" for name in available))
+    for label, payload in build_payloads(args.tools, args.rows).items():
+        encoded = json.dumps(payload).encode()
+        for verb in ("encode", "decode"):
+            cells: list[str] = []
+            for encode, decode in available.values():
+                if verb == "encode":
+                    seconds = time_per_call(args.number, lambda: encode(payload))
+                else:
+                    seconds = time_per_call(args.number, lambda: decode(encoded))
+                cells.append(f"{seconds * 1e6:19.1f} µs")
+            print(f"{label:14} {verb:6} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
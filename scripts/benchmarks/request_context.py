@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Measure the per-request context objects a `tools/call` builds.
+
+Every inbound request gets a `ServerSession` and a `ServerRequestContext` from
+`ServerRunner._make_context`; `MCPServer` then wraps them in its `Context`.
+This script builds that trio the way the server does and reports the time
+per request and the memory each live request holds.
+
+Usage:
+    python scripts/benchmarks/request_context.py
+    python scripts/benchmarks/request_context.py --requests 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import timeit
+import tracemalloc
+from typing import Any
+
+from mcp_types import CallToolRequestParams
+from mcp_types.version import LATEST_MODERN_VERSION
+
+from mcp.server.connection import Connection
+from mcp.server.context import ServerRequestContext
+from mcp.server.mcpserver import Context, MCPServer
+from mcp.server.session import ServerSession
+
+
+def build_context(dctx: Any, connection: Connection, server: MCPServer, params: CallToolRequestParams) -> Context:
+    """One request's worth of context objects, as `_make_context` and `_handle_call_tool` build them."""
+    session = ServerSession(dctx, connection, request_meta=None)
+    request_context: ServerRequestContext[dict[str, Any], Any] = ServerRequestContext(
+        session=session,
+        lifespan_context={},
+        method="tools/call",
+        params={"name": params.name},
+        request_id=1,
+        protocol_version=connection.protocol_version,
+    )
+    return Context(request_context=request_context, mcp_server=server, input_params=params)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time and size the per-request context objects.")
+    parser.add_argument("--requests", type=int, default=20_000, help="contexts to build per measurement")
+    args = parser.parse_args()
+
+    connection = Connection.from_envelope(LATEST_MODERN_VERSION, None, None)
+    server = MCPServer("bench")
+    params = CallToolRequestParams(name="echo", arguments={})
+    dctx = object()
+
+    def build() -> Context:
+        return build_context(dctx, connection, server, params)
+
+    build()
+    seconds = min(timeit.repeat(build, number=args.requests, repeat=5)) / args.requests
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    held = [build() for _ in range(args.requests)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    allocations = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    del held
+
+    print(f"{seconds * 1e6:8.2f} µs per request")
+    print(f"{retained / args.requests:8.0f} bytes held per request")
+    print(f"{allocations / args.requests:8.1f} objects held per request")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 """Per-version method maps and parse/serialize functions for MCP traffic.
 
 This module is supported public API; the `mcp_types._v*` packages it draws on
-are internal validators and not for direct import.
+are internal validators and not for direct import. Each is imported on the
+first lookup of a row it serves, so a process speaking one protocol era never
+builds the other era's models.
 
 Surface maps key `(method, version)` to per-version wire types (key absence is
 the version gate; shape validation is per schema era, i.e. 2025-11-25 for every
@@ -10,16 +12,16 @@ version-free `mcp_types` models user code receives."""
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import importlib
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
 from functools import cache
 from types import MappingProxyType, UnionType
-from typing import Any, Final, Literal, TypeGuard, TypeVar, cast, get_args
+from typing import TYPE_CHECKING, Any, Final, Literal, TypeGuard, TypeVar, cast, get_args
 
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, Field, TypeAdapter, create_model
 
 import mcp_types as types
-import mcp_types._v2025_11_25 as v2025
-import mcp_types._v2026_07_28 as v2026
 from mcp_types.version import KNOWN_PROTOCOL_VERSIONS
 
 __all__ = [
@@ -40,6 +42,7 @@ __all__ = [
     "is_input_required",
     "parse_client_notification",
     "parse_client_request",
+    "parse_client_request_params",
     "parse_client_result",
     "parse_server_notification",
     "parse_server_request",
@@ -52,9 +55,79 @@ __all__ = [
 ]
 
 
+# --- Deferred surface rows ---
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+@dataclass(frozen=True, slots=True)
+class _DeferredRow:
+    """A surface map value not yet imported: `module.attr`."""
+
+    module: str
+    attr: str
+
+    def resolve(self) -> Any:
+        return getattr(importlib.import_module(self.module), self.attr)
+
+
+class _DeferredModule:
+    """Stand-in for a `mcp_types._v*` package while the maps below are built.
+
+    Attribute access names a row value without importing the package, so the
+    map literals read exactly as they would against the real module.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __getattr__(self, attr: str) -> _DeferredRow:
+        return _DeferredRow(self._name, attr)
+
+
+class _SurfaceMap(Mapping[_K, _V]):
+    """Read-only surface map whose values import their version's package on first lookup.
+
+    Keys (and so membership, iteration and the version gate) never import
+    anything; a resolved value is kept for later lookups.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows: dict[_K, _V]) -> None:
+        self._rows = rows
+
+    def __getitem__(self, key: _K) -> _V:
+        value: Any = self._rows[key]
+        if isinstance(value, _DeferredRow):
+            value = self._rows[key] = value.resolve()
+        return cast(_V, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    def __iter__(self) -> Iterator[_K]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+
+if TYPE_CHECKING:
+    import mcp_types._v2025_11_25 as v2025
+    import mcp_types._v2026_07_28 as v2026
+else:
+    v2025 = _DeferredModule("mcp_types._v2025_11_25")
+    v2026 = _DeferredModule("mcp_types._v2026_07_28")
+
+
 # --- Surface maps: client-to-server ---
 
-CLIENT_REQUESTS: Final[Mapping[tuple[str, str], type[BaseModel]]] = MappingProxyType(
+CLIENT_REQUESTS: Final[Mapping[tuple[str, str], type[BaseModel]]] = _SurfaceMap(
     {
         # 2024-11-05
         ("completion/complete", "2024-11-05"): v2025.CompleteRequest,
@@ -126,7 +199,7 @@ CLIENT_REQUESTS: Final[Mapping[tuple[str, str], type[BaseModel]]] = MappingProxy
     }
 )
 
-CLIENT_NOTIFICATIONS: Final[Mapping[tuple[str, str], type[BaseModel]]] = MappingProxyType(
+CLIENT_NOTIFICATIONS: Final[Mapping[tuple[str, str], type[BaseModel]]] = _SurfaceMap(
     {
         # 2024-11-05
         ("notifications/cancelled", "2024-11-05"): v2025.CancelledNotification,
@@ -156,7 +229,7 @@ CLIENT_NOTIFICATIONS: Final[Mapping[tuple[str, str], type[BaseModel]]] = Mapping
 
 # --- Surface maps: server-to-client ---
 
-SERVER_REQUESTS: Final[Mapping[tuple[str, str], type[BaseModel]]] = MappingProxyType(
+SERVER_REQUESTS: Final[Mapping[tuple[str, str], type[BaseModel]]] = _SurfaceMap(
     {
         # 2024-11-05
         ("ping", "2024-11-05"): v2025.PingRequest,
@@ -180,7 +253,7 @@ SERVER_REQUESTS: Final[Mapping[tuple[str, str], type[BaseModel]]] = MappingProxy
     }
 )
 
-SERVER_NOTIFICATIONS: Final[Mapping[tuple[str, str], type[BaseModel]]] = MappingProxyType(
+SERVER_NOTIFICATIONS: Final[Mapping[tuple[str, str], type[BaseModel]]] = _SurfaceMap(
     {
         # 2024-11-05
         ("notifications/cancelled", "2024-11-05"): v2025.CancelledNotification,
@@ -230,7 +303,7 @@ SERVER_NOTIFICATIONS: Final[Mapping[tuple[str, str], type[BaseModel]]] = Mapping
 
 # --- Surface maps: results ---
 
-SERVER_RESULTS: Final[Mapping[tuple[str, str], type[BaseModel] | UnionType]] = MappingProxyType(
+SERVER_RESULTS: Final[Mapping[tuple[str, str], type[BaseModel] | UnionType]] = _SurfaceMap(
     {
         # 2024-11-05
         ("completion/complete", "2024-11-05"): v2025.CompleteResult,
@@ -303,7 +376,7 @@ SERVER_RESULTS: Final[Mapping[tuple[str, str], type[BaseModel] | UnionType]] = M
 )
 """Results servers send, keyed by the originating client request's (method, version)."""
 
-CLIENT_RESULTS: Final[Mapping[tuple[str, str], type[BaseModel] | UnionType]] = MappingProxyType(
+CLIENT_RESULTS: Final[Mapping[tuple[str, str], type[BaseModel] | UnionType]] = _SurfaceMap(
     {
         # 2024-11-05
         ("ping", "2024-11-05"): v2025.EmptyResult,
@@ -528,6 +601,54 @@ def parse_client_request(
     return _monolith_row(monolith, method).model_validate(_body(method, params), by_name=False)
 
 
+_ParamsT = TypeVar("_ParamsT", bound=BaseModel)
+
+
+@cache
+def _params_validator(surface_type: type[BaseModel], params_type: type[BaseModel]) -> type[BaseModel]:
+    """Compile one model checking params against `surface_type`'s `params` field and parsing them into `params_type`.
+
+    The envelope fields the surface frame also declares are fixed by the
+    caller (the method keys the row), so only `params` needs checking.
+    """
+    fields: dict[str, Any] = {"typed": (params_type, Field(alias="typed"))}
+    surface_field = surface_type.model_fields.get("params")
+    if surface_field is not None:
+        default = ... if surface_field.is_required() else surface_field.default
+        fields["params"] = (surface_field.annotation, Field(default, alias="params"))
+    return create_model(f"{surface_type.__name__}Params", **fields)
+
+
+def parse_client_request_params(
+    method: str,
+    version: str,
+    params: Mapping[str, Any] | None,
+    params_type: type[_ParamsT],
+    *,
+    surface: Mapping[tuple[str, str], type[BaseModel]] = CLIENT_REQUESTS,
+) -> _ParamsT:
+    """Version-gate a client request, check its params against `surface`, and parse them into `params_type`.
+
+    Equivalent to `validate_client_request` followed by
+    `params_type.model_validate(params or {})`, but both checks run in one
+    validator call compiled per `(surface row, params_type)`, without
+    building a full surface frame.
+
+    Raises:
+        ValueError: `version` is not a known protocol version.
+        KeyError: `(method, version)` is not in `surface` (the version gate).
+        pydantic.ValidationError: params fail surface or `params_type` validation.
+    """
+    _check_known_version(version)
+    validator = _params_validator(surface[(method, version)], params_type)
+    # Absent params validate as {} for `params_type` (required fields still
+    # reject), while the surface row sees them absent.
+    body: dict[str, Any] = {"typed": {} if params is None else params}
+    if params is not None:
+        body["params"] = params
+    return cast(_ParamsT, getattr(validator.model_validate(body, by_name=False), "typed"))
+
+
 def parse_server_request(
     method: str,
     version: str,
@@ -1,3 +1,6 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from mcp_types import (
     CallToolRequest,
     ClientCapabilities,
@@ -61,15 +64,49 @@ from mcp_types import Role as SamplingRole
 # Bind the `mcp.types` submodule on the package, as v1's `from .types import
 # ...` did, so `import mcp` followed by `mcp.types.Tool` keeps working.
 from . import types as types
-from .client._input_required import InputRequiredRoundsExceededError
-from .client.client import Client
-from .client.session import ClientSession
-from .client.session_group import ClientSessionGroup
-from .client.stdio import StdioServerParameters, stdio_client
-from .server.session import ServerSession
-from .server.stdio import stdio_server
-from .shared.exceptions import MCPDeprecationWarning, MCPError, UrlElicitationRequiredError
-from .shared.uri_template import InvalidUriTemplate, UriTemplate
+
+if TYPE_CHECKING:
+    from .client._input_required import InputRequiredRoundsExceededError
+    from .client.client import Client
+    from .client.session import ClientSession
+    from .client.session_group import ClientSessionGroup
+    from .client.stdio import StdioServerParameters, stdio_client
+    from .server.session import ServerSession
+    from .server.stdio import stdio_server
+    from .shared.exceptions import MCPDeprecationWarning, MCPError, UrlElicitationRequiredError
+    from .shared.uri_template import InvalidUriTemplate, UriTemplate
+
+# The client and server stacks (transports, HTTP clients, telemetry) are
+# imported on first access, so `import mcp` for the types alone stays cheap.
+_LAZY_EXPORTS: dict[str, str] = {
+    "InputRequiredRoundsExceededError": ".client._input_required",
+    "Client": ".client.client",
+    "ClientSession": ".client.session",
+    "ClientSessionGroup": ".client.session_group",
+    "StdioServerParameters": ".client.stdio",
+    "stdio_client": ".client.stdio",
+    "ServerSession": ".server.session",
+    "stdio_server": ".server.stdio",
+    "MCPDeprecationWarning": ".shared.exceptions",
+    "MCPError": ".shared.exceptions",
+    "UrlElicitationRequiredError": ".shared.exceptions",
+    "InvalidUriTemplate": ".shared.uri_template",
+    "UriTemplate": ".shared.uri_template",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS})
+
 
 __all__ = [
     "CallToolRequest",
@@ -1,14 +1,21 @@
 """MCP Client module."""
 
 from mcp.client._input_required import InputRequiredRoundsExceededError
+from mcp.client._pagination import PaginationCycleError
+from mcp.client._tool_stream import ToolStreamError
 from mcp.client._transport import Transport
+from mcp.client.batch import ToolCall, ToolCallProgressFnT, ToolCallResults
 from mcp.client.caching import (
     CacheConfig,
     CacheEntry,
     CacheKey,
     CacheMode,
+    EraVerdict,
+    EraVerdictStore,
+    InMemoryEraVerdictStore,
     InMemoryResponseCacheStore,
     ResponseCacheStore,
+    SQLiteResponseCacheStore,
 )
 from mcp.client.client import Client
 from mcp.client.context import ClientRequestContext
@@ -21,6 +28,7 @@ from mcp.client.extension import (
     advertise,
 )
 from mcp.client.session import ClientSession, IncomingMessage
+from mcp.client.validation import OutputValidation, OutputValidationMode
 
 __all__ = [
     "CacheConfig",
@@ -32,12 +40,23 @@ __all__ = [
     "ClientExtension",
     "ClientRequestContext",
     "ClientSession",
+    "EraVerdict",
+    "EraVerdictStore",
     "IncomingMessage",
+    "InMemoryEraVerdictStore",
     "InMemoryResponseCacheStore",
     "InputRequiredRoundsExceededError",
     "NotificationBinding",
+    "OutputValidation",
+    "OutputValidationMode",
+    "PaginationCycleError",
     "ResponseCacheStore",
     "ResultClaim",
+    "SQLiteResponseCacheStore",
+    "ToolCall",
+    "ToolCallProgressFnT",
+    "ToolCallResults",
+    "ToolStreamError",
     "Transport",
     "UnexpectedClaimedResult",
     "advertise",
@@ -0,0 +1,90 @@
+"""Fetching the binary resource contents a server offloaded (`mcp.shared.blob_offload`).
+
+A URL `Client` holds one `BlobFetcher`, bound at connect time to the HTTP
+client its streamable HTTP transport runs on, so a fetch carries the same
+authentication as the MCP requests themselves. That is why a reference is
+only followed to a path on the MCP endpoint's own origin: a server must not
+be able to point the client's credentials at another host. A body is read
+no further than the length the reference and range promise.
+"""
+
+from __future__ import annotations
+
+import base64
+
+import httpx2
+from mcp_types import BlobResourceContents, ReadResourceResult, TextResourceContents
+
+from mcp.shared.blob_offload import BLOB_OFFLOAD_META_KEY, BlobRef, blob_ref
+
+
+class BlobFetcher:
+    """Fetches offloaded blobs from the server behind one MCP endpoint URL."""
+
+    def __init__(self, endpoint: str) -> None:
+        self._endpoint = endpoint
+        self.http_client: httpx2.AsyncClient | None = None
+        """The connection's HTTP client; set when the `Client` connects."""
+
+    async def fetch(self, ref: BlobRef, start: int = 0, end: int | None = None) -> bytes | None:
+        """The blob's bytes from `start` up to `end`, or `None` when the server no longer holds it.
+
+        Out-of-range bounds clamp like a slice's, so they never reach the server.
+
+        Raises:
+            ValueError: The reference is not a path on the MCP endpoint's origin, or the
+                body's length is not the one the reference and range promise.
+            httpx2.HTTPStatusError: The server refused the fetch for any other reason.
+        """
+        assert self.http_client is not None
+        url = self._resolve(ref["url"])
+        size = ref["size"]
+        end = size if end is None else min(end, size)
+        if start >= end:
+            return b""
+        whole = (start, end) == (0, size)
+        headers = {} if whole else {"Range": f"bytes={start}-{end - 1}"}
+        async with self.http_client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            # A server may answer a range request with the whole blob (200); slicing then is still correct.
+            ranged = not whole and response.status_code == 206
+            expected = end - start if ranged else size
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+                if len(body) > expected:
+                    break
+        if len(body) != expected:
+            raise ValueError(f"blob fetch from {url} returned a body of the wrong length, expected {expected} bytes")
+        return bytes(body) if whole or ranged else bytes(body[start:end])
+
+    def _resolve(self, ref_url: str) -> httpx2.URL:
+        """`ref_url` on the endpoint's origin; it must be a path there, never another scheme, host or port."""
+        endpoint = httpx2.URL(self._endpoint)
+        url: httpx2.URL | None = None
+        # Path-absolute only: a scheme or `//authority` would leave the endpoint's origin.
+        if ref_url.startswith("/") and not ref_url.startswith("//"):
+            try:
+                url = endpoint.join(ref_url)
+            except httpx2.InvalidURL:
+                pass
+        if url is None or (url.scheme, url.host, url.port) != (endpoint.scheme, endpoint.host, endpoint.port):
+            raise ValueError(f"blob URL {ref_url!r} is not a path on the MCP endpoint's server")
+        return url
+
+    async def inline(self, result: ReadResourceResult) -> ReadResourceResult | None:
+        """`result` with each offloaded blob fetched and put back inline, or `None` when one has expired."""
+        if not any(isinstance(item, BlobResourceContents) and blob_ref(item) for item in result.contents):
+            return result
+        contents: list[TextResourceContents | BlobResourceContents] = []
+        for item in result.contents:
+            if isinstance(item, BlobResourceContents) and (ref := blob_ref(item)) is not None:
+                data = await self.fetch(ref)
+                if data is None:
+                    return None
+                meta = {key: value for key, value in (item.meta or {}).items() if key != BLOB_OFFLOAD_META_KEY}
+                item = item.model_copy(update={"blob": base64.b64encode(data).decode(), "meta": meta or None})
+            contents.append(item)
+        return result.model_copy(update={"contents": contents})
@@ -0,0 +1,98 @@
+"""Cursor-following page iterator behind `Client.iter_tools` and the other `iter_*` verbs.
+
+`paginate()` walks a list method's pages by `nextCursor`. While the caller
+consumes one page, the next is already being fetched in the background of the
+session's task group, so at most one page is held ahead of the caller. A cursor
+the server has already handed out in this walk means the listing loops, and
+the walk stops with an error instead of repeating forever.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Generic, TypeVar
+
+import anyio
+import anyio.abc
+from mcp_types import PaginatedResult
+
+PageT = TypeVar("PageT", bound=PaginatedResult)
+
+
+class PaginationCycleError(RuntimeError):
+    """The server returned a `nextCursor` it had already returned earlier in the same listing."""
+
+    def __init__(self, method: str, cursor: str) -> None:
+        super().__init__(f"{method} returned cursor {cursor!r} twice; the listing would never end")
+        self.method = method
+        self.cursor = cursor
+
+
+class _Prefetch(Generic[PageT]):
+    """One page fetched in the background, awaited when the caller gets to it."""
+
+    __slots__ = ("scope", "_fetch", "_cursor", "_done", "_page", "_error")
+
+    def __init__(self, fetch: Callable[[str], Awaitable[PageT]], cursor: str) -> None:
+        self.scope = anyio.CancelScope()
+        self._fetch = fetch
+        self._cursor = cursor
+        self._done = anyio.Event()
+        self._page: PageT | None = None
+        self._error: Exception | None = None
+
+    async def run(self) -> None:
+        try:
+            with self.scope:
+                self._page = await self._fetch(self._cursor)
+        except Exception as exc:  # boundary: re-raised to the caller that awaits the page
+            self._error = exc
+        finally:
+            self._done.set()
+
+    async def result(self) -> PageT:
+        await self._done.wait()
+        if self._error is not None:
+            raise self._error
+        if self._page is None:
+            # The task group running the prefetch was cancelled under it; fetch in the caller instead.
+            return await self._fetch(self._cursor)
+        return self._page
+
+
+async def paginate(
+    method: str,
+    fetch: Callable[[str | None], Awaitable[PageT]],
+    task_group: anyio.abc.TaskGroup | None,
+) -> AsyncGenerator[PageT]:
+    """Yield every page of `method`, starting from the first (`cursor=None`).
+
+    With a `task_group`, the next page is fetched there while the current one is
+    consumed; without one, each page is fetched when the caller asks for it.
+    Closing the generator early cancels an outstanding prefetch.
+
+    Raises:
+        PaginationCycleError: The server repeated a cursor.
+    """
+    seen: set[str] = set()
+    ahead: _Prefetch[PageT] | None = None
+    try:
+        page = await fetch(None)
+        while (cursor := page.next_cursor) is not None:
+            if cursor in seen:
+                raise PaginationCycleError(method, cursor)
+            seen.add(cursor)
+            if task_group is None:
+                yield page
+                page = await fetch(cursor)
+                continue
+            ahead = _Prefetch(fetch, cursor)
+            task_group.start_soon(ahead.run)
+            yield page
+            page = await ahead.result()
+            ahead = None
+        yield page
+    finally:
+        # Synchronous on purpose: an abandoned generator is finalized without a chance to await.
+        if ahead is not None:
+            ahead.scope.cancel()
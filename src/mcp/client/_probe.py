@@ -22,6 +22,14 @@ that timed out client-side but succeeded on a slow-starting server locked the
 connection modern before the pipelined ``initialize`` arrived. That code is
 itself positive modern evidence (it names the server's versions), so it
 triggers one re-probe at a mutual version instead of failing the connect.
+
+With a `ClientEraVerdicts` memo the outcome is remembered per server, and a
+reconnect inside the TTL skips the probe: a modern verdict adopts the
+remembered ``DiscoverResult`` with no wire traffic, a legacy one goes
+straight to ``initialize``. A legacy verdict the server contradicts with
+``-32022`` (it has since gone modern) is forgotten and the probe runs as
+usual. A modern verdict is trusted until it expires, because adopting it
+sends nothing the server could contradict.
 """
 
 from __future__ import annotations
@@ -37,6 +45,7 @@ from mcp_types.version import (
 )
 from pydantic import ValidationError
 
+from mcp.client.caching import ClientEraVerdicts
 from mcp.client.session import ClientSession
 from mcp.shared.exceptions import MCPError
 
@@ -49,14 +58,15 @@ def _parse_supported(data: Any) -> list[str] | None:
         return None
 
 
-async def negotiate_auto(session: ClientSession) -> None:
+async def negotiate_auto(session: ClientSession, verdicts: ClientEraVerdicts | None = None) -> None:
     """Drive the ``mode='auto'`` connect-time policy on ``session``.
 
-    Probes ``server/discover`` once (twice if the server names a mutual
+    Replays a fresh verdict from ``verdicts`` when there is one; otherwise
+    probes ``server/discover`` once (twice if the server names a mutual
     modern version via -32022), then either ``adopt()``s the result or falls
-    back to ``initialize()``. Idempotent only in the sense that one of
-    ``session.discover_result`` / ``session.initialize_result`` is set on
-    return.
+    back to ``initialize()``, and records the outcome in ``verdicts``.
+    Idempotent only in the sense that one of ``session.discover_result`` /
+    ``session.initialize_result`` is set on return.
 
     Raises:
         MCPError: The server is modern-only and shares no version with this
@@ -64,6 +74,39 @@ async def negotiate_auto(session: ClientSession) -> None:
             fallback handshake failed and one corrective re-probe did too.
         Exception: Any transport/network error from the probe propagates as-is.
     """
+    if verdicts is None:
+        await _probe(session)
+        return
+    if await _replay(session, verdicts):
+        return
+    await verdicts.remember(await _probe(session))
+
+
+async def _replay(session: ClientSession, verdicts: ClientEraVerdicts) -> bool:
+    """Connect on a remembered verdict; `False` when there is none or the server contradicted it."""
+    verdict = await verdicts.recall()
+    if verdict is None:
+        return False
+    if verdict.discover is not None:
+        try:
+            session.adopt(verdict.discover)
+        except RuntimeError:
+            # Remembered by a client speaking other modern versions than this one.
+            await verdicts.forget()
+            return False
+        return True
+    try:
+        await session.initialize()
+    except MCPError as e:
+        if e.code != UNSUPPORTED_PROTOCOL_VERSION:
+            raise
+        await verdicts.forget()  # the server has gone modern since
+        return False
+    return True
+
+
+async def _probe(session: ClientSession) -> types.DiscoverResult | None:
+    """The uncached policy; returns the adopted `DiscoverResult`, or `None` after a legacy handshake."""
     version = LATEST_MODERN_VERSION
     for attempt in range(2):
         try:
@@ -93,14 +136,14 @@ async def negotiate_auto(session: ClientSession) -> None:
                     raise
                 version = mutual[-1]
                 continue
-            return
+            return None
         # any other exception (httpx2.TransportError, ConnectionError,
         # anyio errors) → propagate
         try:
             result = types.DiscoverResult.model_validate(raw)
         except ValidationError:
             await session.initialize()  # unparseable result → not modern evidence
-            return
+            return None
         if not any(v in result.supported_versions for v in MODERN_PROTOCOL_VERSIONS):
             # A discover-answering server that advertises no modern version
             # (go-sdk's stateful streamable default does this) is an explicit
@@ -108,7 +151,7 @@ async def negotiate_auto(session: ClientSession) -> None:
             # instead of letting `adopt()` raise. The ts and go clients fall
             # back here too.
             await session.initialize()
-            return
+            return None
         session.adopt(result)
-        return
+        return result
     raise AssertionError("unreachable")  # pragma: no cover — loop body always returns or raises
@@ -0,0 +1,129 @@
+"""Streamed tool calls behind `Client.call_tool_stream` (`mcp.shared.partial_content`).
+
+`stream_tool_call()` sends one `tools/call` opted in to partial content and
+yields the result's content blocks as the server sends them, followed by
+whatever content the final result still holds. The call itself runs in the
+session's task group; the session feeds each chunk to the call's
+`ContentRoute` synchronously in receive order, so chunks are yielded in the
+order the server sent them and always before the result's own content.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
+from itertools import count
+from typing import TYPE_CHECKING
+
+import anyio
+from mcp_types import INTERNAL_ERROR, CallToolResult, ContentBlock, ProgressToken, RequestParamsMeta
+
+from mcp.shared.exceptions import MCPError
+from mcp.shared.partial_content import PARTIAL_CONTENT_META_KEY
+
+if TYPE_CHECKING:
+    from mcp.client.session import ClientSession
+
+_stream_ids = count(1)
+"""Process-wide `stream-N` sequence for the tokens correlating chunks with their call."""
+
+_MAX_PENDING_BLOCKS = 4096
+"""Backlog backstop: blocks the consumer has not taken yet. Overflowing it fails the
+stream (and cancels the call) rather than growing client memory without bound."""
+
+
+class ToolStreamError(RuntimeError):
+    """A streamed tool call ended with an error result (`isError`).
+
+    The content before it has already been yielded; the full result is carried as `result`.
+    """
+
+    def __init__(self, name: str, result: CallToolResult) -> None:
+        super().__init__(f"tool {name!r} returned an error result")
+        self.result = result
+
+
+class ContentRoute:
+    """Package-internal demux state for one streamed call, fed synchronously in receive order by the session."""
+
+    def __init__(self) -> None:
+        self.error: BaseException | None = None
+        self.done = False
+        self._pending: deque[ContentBlock] = deque()
+        self._wake = anyio.Event()
+
+    def deliver(self, content: Sequence[ContentBlock]) -> None:
+        """Queue one chunk's blocks, unless the stream has ended."""
+        if self.done:
+            return
+        if len(self._pending) + len(content) > _MAX_PENDING_BLOCKS:
+            self.settle(
+                MCPError(INTERNAL_ERROR, f"streamed tool call backlog exceeded {_MAX_PENDING_BLOCKS} unconsumed blocks")
+            )
+            return
+        self._pending.extend(content)
+        self._wake.set()
+
+    def settle(self, error: BaseException | None = None) -> None:
+        """Record the stream's end; the first reason wins."""
+        if not self.done:
+            self.done = True
+            self.error = error
+            self._wake.set()
+
+    async def next_block(self) -> ContentBlock | None:
+        """The next queued block, or `None` once the stream has ended and the backlog is drained."""
+        while True:
+            wake = self._wake
+            if self._pending:
+                return self._pending.popleft()
+            if self.done:
+                return None
+            await wake.wait()
+            self._wake = anyio.Event()
+
+
+async def stream_tool_call(
+    session: ClientSession,
+    name: str,
+    call: Callable[[RequestParamsMeta], Awaitable[CallToolResult]],
+    meta: RequestParamsMeta | None,
+) -> AsyncGenerator[ContentBlock]:
+    """Run `call` with `meta` opted in to partial content and yield the content as it arrives.
+
+    Closing the generator early cancels the call.
+
+    Raises:
+        ToolStreamError: The result is an error result.
+        MCPError: The call failed, or the consumer fell too far behind.
+    """
+    task_group = session._task_group  # pyright: ignore[reportPrivateUsage]
+    assert task_group is not None  # `Client.session` only hands out an entered session
+    token: ProgressToken = f"stream-{next(_stream_ids)}"
+    result: list[CallToolResult] = []
+    driver_scope = anyio.CancelScope()
+
+    async def drive() -> None:
+        with driver_scope:
+            try:
+                result.append(await call({**(meta or {}), PARTIAL_CONTENT_META_KEY: token}))
+            except Exception as error:  # boundary: re-raised to the consumer
+                route.settle(error)
+                return
+            route.settle()
+
+    # Register the route before the request is written so the first chunk cannot race it.
+    route = session._register_content_route(token)  # pyright: ignore[reportPrivateUsage]
+    try:
+        task_group.start_soon(drive)
+        while (block := await route.next_block()) is not None:
+            yield block
+        if route.error is not None:
+            raise route.error
+        for block in result[0].content:
+            yield block
+        if result[0].is_error:
+            raise ToolStreamError(name, result[0])
+    finally:
+        driver_scope.cancel()
+        session._unregister_content_route(token)  # pyright: ignore[reportPrivateUsage]
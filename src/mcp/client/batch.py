@@ -0,0 +1,131 @@
+"""Bulk `tools/call`: many tool calls pipelined over one session under a concurrency bound.
+
+`call_tool_results()` backs `Client.call_tools` and `Client.call_tools_as_completed`.
+At most `max_concurrency` calls are in flight at once; the next call starts only
+when one finishes *and* its outcome has room in a buffer of the same size, so a
+slow consumer holds back the batch instead of piling up results. Leaving the
+context manager early cancels every call still in flight and waits for them to unwind.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Final, Protocol
+
+import anyio
+import anyio.abc
+from anyio.streams.memory import MemoryObjectReceiveStream
+from mcp_types import CallToolResult, RequestParamsMeta
+
+from mcp.shared.dispatcher import ProgressFnT
+
+__all__ = ["DEFAULT_MAX_CONCURRENCY", "ToolCall", "ToolCallProgressFnT", "ToolCallResults"]
+
+DEFAULT_MAX_CONCURRENCY: Final[int] = 8
+"""Calls a batch keeps in flight when the caller sets no `max_concurrency`."""
+
+ToolCallOutcome = tuple[int, CallToolResult | Exception]
+"""(index of the call in the batch, its result or the exception it raised)."""
+
+
+@dataclass(frozen=True, slots=True)
+class ToolCall:
+    """One call in a `Client.call_tools` batch."""
+
+    name: str
+    arguments: dict[str, Any] | None = None
+    meta: RequestParamsMeta | None = None
+
+
+class ToolCallProgressFnT(Protocol):
+    """Progress callback shared by every call in a batch; `index` is the reporting call's position."""
+
+    async def __call__(self, index: int, progress: float, total: float | None, message: str | None) -> None: ...
+
+
+class ToolCallResults:
+    """The outcomes of a batch as `(index, result)` pairs, in completion order.
+
+    A call that raised yields `(index, exception)` when the batch returns
+    exceptions, and raises that exception from the iteration otherwise.
+    """
+
+    __slots__ = ("_outcomes", "_return_exceptions")
+
+    def __init__(self, outcomes: MemoryObjectReceiveStream[ToolCallOutcome], return_exceptions: bool) -> None:
+        self._outcomes = outcomes
+        self._return_exceptions = return_exceptions
+
+    def __aiter__(self) -> ToolCallResults:
+        return self
+
+    async def __anext__(self) -> ToolCallOutcome:
+        index, outcome = await self._outcomes.__anext__()
+        if isinstance(outcome, Exception) and not self._return_exceptions:
+            raise outcome
+        return index, outcome
+
+
+@asynccontextmanager
+async def call_tool_results(
+    task_group: anyio.abc.TaskGroup,
+    call_tool: Callable[[ToolCall, ProgressFnT | None], Awaitable[CallToolResult]],
+    calls: Sequence[ToolCall],
+    *,
+    max_concurrency: int,
+    return_exceptions: bool,
+    progress_callback: ToolCallProgressFnT | None = None,
+) -> AsyncGenerator[ToolCallResults]:
+    """Run `calls` through `call_tool` in the background of `task_group`, yielding their outcomes.
+
+    Raises:
+        ValueError: If `max_concurrency` is below 1.
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+    send, receive = anyio.create_memory_object_stream[ToolCallOutcome](max_concurrency)
+    slots = anyio.Semaphore(max_concurrency)
+    driver_scope = anyio.CancelScope()
+    driver_done = anyio.Event()
+
+    async def run_one(index: int, call: ToolCall) -> None:
+        progress: ProgressFnT | None = None
+        if progress_callback is not None:
+            reporter = progress_callback
+
+            async def report(progress: float, total: float | None, message: str | None) -> None:
+                await reporter(index, progress, total, message)
+
+            progress = report
+
+        try:
+            try:
+                outcome: CallToolResult | Exception = await call_tool(call, progress)
+            except Exception as exc:  # boundary: the consumer decides whether a failed call ends the batch
+                outcome = exc
+            await send.send((index, outcome))
+        finally:
+            slots.release()
+
+    async def drive() -> None:
+        # In the session's task group, like `listen()`'s driver: a failure is an outcome, never a group error.
+        try:
+            with driver_scope:
+                async with send, anyio.create_task_group() as calls_group:
+                    for index, call in enumerate(calls):
+                        await slots.acquire()
+                        calls_group.start_soon(run_one, index, call)
+        finally:
+            driver_done.set()
+
+    with receive:
+        task_group.start_soon(drive)
+        try:
+            yield ToolCallResults(receive, return_exceptions)
+        finally:
+            driver_scope.cancel()
+            # Keep the buffer open until the cancelled calls unwind, so none of them sends into a closed stream.
+            with anyio.CancelScope(shield=True):
+                await driver_done.wait()
@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
-import json
+import copy
 import logging
+import sqlite3
+import threading
 import time
-from collections.abc import Callable
+import weakref
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Final, Literal, Protocol
+from os import PathLike
+from typing import Any, Final, Literal, Protocol, TypeVar
 
 import anyio
 import anyio.lowlevel
+import anyio.to_thread
+import mcp_types
 from mcp_types import (
     CacheableResult,
+    DiscoverResult,
     PromptListChangedNotification,
     ResourceListChangedNotification,
     ResourceUpdatedNotification,
@@ -20,6 +28,10 @@ from mcp_types import (
     ToolListChangedNotification,
 )
 from mcp_types.version import MODERN_PROTOCOL_VERSIONS
+from pydantic import BaseModel
+
+from mcp.shared import _metrics
+from mcp.shared._json import canonical_dumps, canonical_loads
 
 __all__ = [
     "MAX_TTL_MS",
@@ -27,8 +39,12 @@ __all__ = [
     "CacheEntry",
     "CacheKey",
     "CacheMode",
+    "EraVerdict",
+    "EraVerdictStore",
+    "InMemoryEraVerdictStore",
     "InMemoryResponseCacheStore",
     "ResponseCacheStore",
+    "SQLiteResponseCacheStore",
 ]
 
 logger = logging.getLogger(__name__)
@@ -59,7 +75,7 @@ class CacheEntry:
     """One cached response with its freshness and sharing metadata."""
 
     value: Any
-    """The cached result; the SDK deep-copies on write and on serve, so a store may hold it as-is."""
+    """The cached result; the SDK copies it on write and on serve, so a store may hold it as-is."""
 
     scope: Literal["public", "private"]
     """Server-asserted `cacheScope`: only `"public"` entries may be shared across authorization contexts."""
@@ -88,12 +104,40 @@ class ResponseCacheStore(Protocol):
     async def clear(self) -> None: ...
 
 
+@dataclass(frozen=True, slots=True)
+class EraVerdict:
+    """A remembered `mode='auto'` negotiation outcome for one server."""
+
+    discover: DiscoverResult | None
+    """The `DiscoverResult` a modern server answered the probe with; `None` records a handshake-era server."""
+
+    expires_at: float
+    """Epoch seconds after which the verdict is stale and the next connect probes again."""
+
+
+class EraVerdictStore(Protocol):
+    """Storage contract for remembered `mode='auto'` negotiation verdicts.
+
+    Keys are opaque strings derived from the server identity (hashed, never
+    the raw URL) and the cache partition. Operations may raise - the SDK then
+    probes as though nothing were remembered. A store holding verdicts in
+    process may keep `verdict` as-is: the SDK copies it on write and on read.
+    """
+
+    async def get(self, key: str) -> EraVerdict | None: ...
+
+    async def set(self, key: str, verdict: EraVerdict) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+
 @dataclass(frozen=True, slots=True)
 class CacheConfig:
     """Configuration for a `Client`'s response cache.
 
     Raises:
-        ValueError: On a custom `store` without `partition`, an empty `target_id`, or a negative `default_ttl_ms`.
+        ValueError: On a custom `store` without `partition`, an empty `target_id`, or a negative
+            `default_ttl_ms`, `era_ttl_ms` or `stale_while_revalidate_ms`.
     """
 
     store: ResponseCacheStore | None = None
@@ -123,6 +167,19 @@ class CacheConfig:
     principal sharing the store - a mislabeled response leaks across tenants.
     Constructor-level only: the per-call `cache_mode` can never widen sharing."""
 
+    era_store: EraVerdictStore | None = None
+    """Remembers which protocol era each server speaks, so a `mode='auto'` reconnect
+    skips the `server/discover` probe; `None` (the default) probes on every connect.
+    Share one store across the clients that reconnect to the same servers. Requires
+    `target_id` when the server is not a URL."""
+
+    era_ttl_ms: int = 10 * 60 * 1000
+    """How long a remembered verdict is trusted, in milliseconds (clamped to `MAX_TTL_MS`)."""
+
+    stale_while_revalidate_ms: int = 0
+    """How long past its expiry an entry may still be served, in milliseconds, while one
+    background fetch refreshes it; the default `0` never serves an expired entry."""
+
     def __post_init__(self) -> None:
         if self.store is not None and not self.partition:
             raise ValueError("a custom store requires an explicit partition")
@@ -130,6 +187,10 @@ class CacheConfig:
             raise ValueError("target_id must be a non-empty string or omitted")
         if self.default_ttl_ms < 0:
             raise ValueError(f"default_ttl_ms must be >= 0, got {self.default_ttl_ms}")
+        if self.era_ttl_ms < 0:
+            raise ValueError(f"era_ttl_ms must be >= 0, got {self.era_ttl_ms}")
+        if self.stale_while_revalidate_ms < 0:
+            raise ValueError(f"stale_while_revalidate_ms must be >= 0, got {self.stale_while_revalidate_ms}")
 
 
 class InMemoryResponseCacheStore:
@@ -170,6 +231,292 @@ class InMemoryResponseCacheStore:
         self._entries.clear()
 
 
+class InMemoryEraVerdictStore:
+    """In-process `EraVerdictStore`, shared by whichever clients are handed the same instance.
+
+    `max_entries` caps the store, evicting the least recently used verdict
+    at the cap (`0` disables it).
+
+    Raises:
+        ValueError: If `max_entries` is negative.
+    """
+
+    def __init__(self, *, max_entries: int = 256) -> None:
+        if max_entries < 0:
+            raise ValueError(f"max_entries must be >= 0, got {max_entries}")
+        self._max_entries = max_entries
+        self._verdicts: dict[str, EraVerdict] = {}
+
+    async def get(self, key: str) -> EraVerdict | None:
+        verdict = self._verdicts.get(key)
+        if verdict is not None:
+            self._verdicts[key] = self._verdicts.pop(key)
+        return verdict
+
+    async def set(self, key: str, verdict: EraVerdict) -> None:
+        self._verdicts.pop(key, None)
+        self._verdicts[key] = verdict
+        if self._max_entries and len(self._verdicts) > self._max_entries:
+            del self._verdicts[next(iter(self._verdicts))]
+
+    async def delete(self, key: str) -> None:
+        self._verdicts.pop(key, None)
+
+
+_SQLITE_SCHEMA_VERSION: Final[int] = 1
+
+# `size` is the stored value's length in bytes; the triggers keep the one
+# `mcp_response_cache_totals` row in step with the table, in the same
+# transaction as the write, so checking the caps never scans the cache.
+_SQLITE_SCHEMA: Final[str] = """
+CREATE TABLE IF NOT EXISTS mcp_response_cache (
+    method TEXT NOT NULL,
+    params_key TEXT NOT NULL,
+    partition TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    expires_at REAL,
+    value_type TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER GENERATED ALWAYS AS (length(CAST(value AS BLOB))) STORED,
+    PRIMARY KEY (method, params_key, partition)
+);
+CREATE INDEX IF NOT EXISTS mcp_response_cache_expiry ON mcp_response_cache (expires_at);
+CREATE TABLE IF NOT EXISTS mcp_response_cache_totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO mcp_response_cache_totals VALUES (0, 0, 0);
+CREATE TRIGGER IF NOT EXISTS mcp_response_cache_inserted AFTER INSERT ON mcp_response_cache BEGIN
+    UPDATE mcp_response_cache_totals SET entries = entries + 1, bytes = bytes + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS mcp_response_cache_updated AFTER UPDATE ON mcp_response_cache BEGIN
+    UPDATE mcp_response_cache_totals SET bytes = bytes - OLD.size + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS mcp_response_cache_deleted AFTER DELETE ON mcp_response_cache BEGIN
+    UPDATE mcp_response_cache_totals SET entries = entries - 1, bytes = bytes - OLD.size;
+END;
+"""
+
+# A database from before the schema had a version: it is only a cache, so start it over.
+_SQLITE_RESET: Final[str] = """
+DROP TABLE IF EXISTS mcp_response_cache;
+DROP TABLE IF EXISTS mcp_response_cache_totals;
+"""
+
+
+class SQLiteResponseCacheStore:
+    """`ResponseCacheStore` in a SQLite database file, shared by every process that opens it.
+
+    Short-lived processes on one host pointed at the same `path` start warm:
+    the coordinator's arm already encodes the partition (and, with
+    `share_public`, leaves it out of `"public"` arms), so entries are shared
+    exactly as the `CacheConfig` of each reader allows. The database runs in
+    WAL mode, so readers never block on a writer.
+
+    Values are stored as JSON and rehydrated into their `mcp_types` result
+    model; an entry that no longer decodes is dropped and read as a miss.
+    Past `max_entries` or `max_bytes` of stored JSON (`0` disables either
+    cap), a `set` first drops every entry already stale by `clock` and then
+    evicts in expiry order, both through an index; running totals kept by
+    triggers mean a `set` under the caps never scans the table. `clear` empties the
+    database for every process sharing it. Queries run in a worker thread, so a writer in
+    another process holding the lock (up to `timeout` seconds) never stalls
+    the event loop.
+
+    Raises:
+        ValueError: If `max_entries` or `max_bytes` is negative.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        *,
+        max_entries: int = 10_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        timeout: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries < 0:
+            raise ValueError(f"max_entries must be >= 0, got {max_entries}")
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0, got {max_bytes}")
+        self._path = path
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._timeout = timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._closer: weakref.finalize[[], SQLiteResponseCacheStore] | None = None
+
+    async def get(self, key: CacheKey) -> CacheEntry | None:
+        return await anyio.to_thread.run_sync(self._get, key)
+
+    async def set(self, key: CacheKey, entry: CacheEntry) -> None:
+        value = entry.value
+        if isinstance(value, BaseModel):
+            value_type, encoded = type(value).__name__, value.model_dump_json(by_alias=True, exclude_unset=True)
+        else:
+            value_type, encoded = "", canonical_dumps(value, compact=False)
+        await anyio.to_thread.run_sync(self._set, key, entry, value_type, encoded)
+
+    async def delete(self, key: CacheKey) -> None:
+        await anyio.to_thread.run_sync(
+            self._execute,
+            "DELETE FROM mcp_response_cache WHERE method = ? AND params_key = ? AND partition = ?",
+            (key.method, key.params_key, key.partition),
+        )
+
+    async def clear(self) -> None:
+        await anyio.to_thread.run_sync(self._execute, "DELETE FROM mcp_response_cache", ())
+
+    def close(self) -> None:
+        """Close the database connection; the next operation reopens it."""
+        with self._lock:
+            if self._closer is not None:
+                self._closer()
+                self._connection = self._closer = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            # Autocommit: every statement is its own transaction, save the explicit one in `_set`.
+            connection = sqlite3.connect(
+                self._path, timeout=self._timeout, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            if connection.execute("PRAGMA user_version").fetchone()[0] != _SQLITE_SCHEMA_VERSION:
+                connection.executescript(_SQLITE_RESET)
+            connection.executescript(_SQLITE_SCHEMA)
+            connection.execute(f"PRAGMA user_version = {_SQLITE_SCHEMA_VERSION}")
+            self._connection = connection
+            # A store dropped without `close` still closes its connection.
+            self._closer = weakref.finalize(self, connection.close)
+        return self._connection
+
+    def _execute(self, sql: str, parameters: tuple[str, ...]) -> None:
+        with self._lock:
+            self._connect().execute(sql, parameters)
+
+    def _get(self, key: CacheKey) -> CacheEntry | None:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT scope, expires_at, value_type, value FROM mcp_response_cache"
+                    " WHERE method = ? AND params_key = ? AND partition = ?",
+                    (key.method, key.params_key, key.partition),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        scope, expires_at, value_type, encoded = row
+        try:
+            value = _decode_value(value_type, encoded)
+        except ValueError:
+            # Written by a different SDK version, or damaged: it can never be served again.
+            self._execute(
+                "DELETE FROM mcp_response_cache WHERE method = ? AND params_key = ? AND partition = ?",
+                (key.method, key.params_key, key.partition),
+            )
+            return None
+        return CacheEntry(value=value, scope=scope, expires_at=expires_at)
+
+    def _set(self, key: CacheKey, entry: CacheEntry, value_type: str, encoded: str) -> None:
+        with self._lock:
+            connection = self._connect()
+            # Take the write lock up front; the block commits, or rolls back on error.
+            connection.execute("BEGIN IMMEDIATE")
+            with connection:
+                # An upsert rather than `INSERT OR REPLACE`: REPLACE's implicit delete fires no trigger.
+                connection.execute(
+                    "INSERT INTO mcp_response_cache"
+                    " (method, params_key, partition, scope, expires_at, value_type, value)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (method, params_key, partition) DO UPDATE SET"
+                    " scope = excluded.scope, expires_at = excluded.expires_at,"
+                    " value_type = excluded.value_type, value = excluded.value",
+                    (key.method, key.params_key, key.partition, entry.scope, entry.expires_at, value_type, encoded),
+                )
+                self._evict_over_caps(connection)
+
+    def _evict_over_caps(self, connection: sqlite3.Connection) -> None:
+        if self._within_caps(*self._totals(connection)):
+            return
+        # NULL is never fresh. Stale entries go in one sweep, which may already be enough.
+        connection.execute(
+            "DELETE FROM mcp_response_cache WHERE expires_at IS NULL OR expires_at <= ?", (self._clock(),)
+        )
+        count, size = self._totals(connection)
+        if self._within_caps(count, size):
+            return
+        doomed: list[tuple[str, str, str]] = []
+        rows = connection.execute(
+            "SELECT method, params_key, partition, size FROM mcp_response_cache ORDER BY expires_at"
+        )
+        for method, params_key, partition, length in rows:
+            if self._within_caps(count, size):
+                break
+            doomed.append((method, params_key, partition))
+            count -= 1
+            size -= length
+        connection.executemany(
+            "DELETE FROM mcp_response_cache WHERE method = ? AND params_key = ? AND partition = ?", doomed
+        )
+
+    def _within_caps(self, count: int, size: int) -> bool:
+        return (not self._max_entries or count <= self._max_entries) and (
+            not self._max_bytes or size <= self._max_bytes
+        )
+
+    @staticmethod
+    def _totals(connection: sqlite3.Connection) -> tuple[int, int]:
+        return connection.execute("SELECT entries, bytes FROM mcp_response_cache_totals").fetchone()
+
+
+def _decode_value(value_type: str, encoded: str) -> Any:
+    """Rehydrate a stored value; `ValueError` (pydantic's included) if it no longer decodes."""
+    if not value_type:
+        return canonical_loads(encoded)
+    model = getattr(mcp_types, value_type, None)
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        raise ValueError(f"unknown result type {value_type!r}")
+    return model.model_validate_json(encoded)
+
+
+_ResultT = TypeVar("_ResultT", bound=CacheableResult)
+
+
+def _expired(entry: CacheEntry, now: float) -> bool:
+    return entry.expires_at is None or entry.expires_at <= now
+
+
+def _fresh_error(error: Exception) -> Exception:
+    """A shallow copy of `error` with no traceback of its own yet.
+
+    Built without calling `__init__`, which may not take back the `args` it
+    produced; a type whose `__new__` needs more than those (pydantic's
+    `ValidationError`) goes through its own pickling support instead.
+    """
+    try:
+        fresh = type(error).__new__(type(error), *error.args)
+    except TypeError:
+        return copy.copy(error)
+    fresh.__dict__.update(error.__dict__)
+    return fresh
+
+
+def _detached_copy(result: _ResultT) -> _ResultT:
+    """Copy `result` so that no mutable state is shared with it.
+
+    Serializing builds fresh containers and validating rebuilds the models,
+    both inside pydantic-core, so this runs several times faster than
+    `model_copy(deep=True)`'s Python-level `deepcopy` walk on a large listing.
+    Unset fields stay unset, so the copy's `model_fields_set` matches.
+    """
+    return type(result).model_validate(result.model_dump(by_alias=True, exclude_unset=True, round_trip=True))
+
+
 _GENERATION_MAP_CAP: Final[int] = 4096
 """Cap on the generation map; at the cap the oldest key's eviction-race guard is dropped (FIFO)."""
 
@@ -178,6 +525,77 @@ _STORE_CLEANUP_TIMEOUT: Final[float] = 5
 a wedged store delete must not hold client teardown uncancellably."""
 
 
+class Flight:
+    """One in-flight fetch of a cache key, which concurrent misses on the key wait for."""
+
+    __slots__ = ("done", "result", "error", "waiting")
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.result: CacheableResult | None = None
+        self.error: Exception | None = None
+        self.waiting = 0
+
+    def share(self, result: CacheableResult) -> None:
+        """Hand the fetched result to the waiting callers; call it last, after the cache write."""
+        # The leader returns `result` to its own caller, which may mutate it before the waiters run.
+        if self.waiting:
+            self.result = _detached_copy(result)
+
+    def raise_error(self) -> None:
+        """Raise the fetch's exception in a waiter, if the fetch failed."""
+        if self.error is not None:
+            # Each waiter raises its own copy: one shared object would pile every waiter's traceback onto it.
+            raise _fresh_error(self.error) from self.error
+
+
+class ClientEraVerdicts:
+    """One client's view of an `EraVerdictStore`: its key, TTL and clock.
+
+    Store failures are logged and treated as a miss (or a dropped write), so
+    a broken store costs the probe it was meant to save, never the connect.
+    """
+
+    def __init__(
+        self, store: EraVerdictStore, *, arm_id: str, partition: str, ttl_ms: int, clock: Callable[[], float]
+    ) -> None:
+        self._store = store
+        # Same JSON-array framing as the response cache's arms, so the fields cannot collide.
+        self._key = canonical_dumps([arm_id, partition], compact=False)
+        self._ttl_ms = min(ttl_ms, MAX_TTL_MS)
+        self._clock = clock
+
+    async def recall(self) -> EraVerdict | None:
+        """The fresh remembered verdict, or `None`."""
+        try:
+            verdict = await self._store.get(self._key)
+        except Exception:
+            logger.warning("Era verdict store get failed; probing instead", exc_info=True)
+            return None
+        if verdict is None or verdict.expires_at <= self._clock():
+            return None
+        discover = None if verdict.discover is None else _detached_copy(verdict.discover)
+        return EraVerdict(discover=discover, expires_at=verdict.expires_at)
+
+    async def remember(self, discover: DiscoverResult | None) -> None:
+        """Record this connect's outcome: its `DiscoverResult`, or `None` for a legacy server."""
+        if not self._ttl_ms:
+            return
+        copied = None if discover is None else _detached_copy(discover)
+        verdict = EraVerdict(discover=copied, expires_at=self._clock() + self._ttl_ms / 1000)
+        try:
+            await self._store.set(self._key, verdict)
+        except Exception:
+            logger.warning("Era verdict store set failed; the next connect will probe", exc_info=True)
+
+    async def forget(self) -> None:
+        """Drop a verdict the server contradicted."""
+        try:
+            await self._store.delete(self._key)
+        except Exception:
+            logger.warning("Era verdict store delete failed", exc_info=True)
+
+
 class ClientResponseCache:
     """Coordinates the `Client` caching verbs with a `ResponseCacheStore`: keys, era gate, TTL/scope, eviction."""
 
@@ -193,6 +611,7 @@ class ClientResponseCache:
         negotiated_version: Callable[[], str | None],
         generation_map_cap: int = _GENERATION_MAP_CAP,
         store_cleanup_timeout: float = _STORE_CLEANUP_TIMEOUT,
+        stale_while_revalidate_ms: int = 0,
     ) -> None:
         self._store = store
         self._partition = partition
@@ -205,7 +624,9 @@ class ClientResponseCache:
         self._generations: dict[tuple[str, str], int] = {}
         self._generation_map_cap = generation_map_cap
         self._store_cleanup_timeout = store_cleanup_timeout
+        self._stale_grace = stale_while_revalidate_ms / 1000
         self._warned_store_ops: set[str] = set()
+        self._flights: dict[tuple[str, str], Flight] = {}
 
     def _arm(self, scope: Literal["public", "private"]) -> str:
         # JSON arrays so crafted arm_id/partition values cannot collide across field boundaries.
@@ -216,35 +637,100 @@ class ClientResponseCache:
         fields: list[str | None] = [scope, self._negotiated_version(), self._arm_id]
         if scope == "private" or not self._share_public:
             fields.append(self._partition)
-        return json.dumps(fields)
+        return canonical_dumps(fields, compact=False)
 
     async def read(self, method: str, params_key: str) -> CacheableResult | None:
-        """Serve a fresh entry for the key, or `None`; the served result is a deep copy."""
+        """Serve a fresh entry for the key, or `None`; the served result is a private copy."""
+        served, _ = await self._lookup(method, params_key, 0)
+        return served
+
+    async def read_stale(self, method: str, params_key: str) -> tuple[CacheableResult | None, bool]:
+        """Like `read`, but also serve an entry expired within the stale-while-revalidate window.
+
+        The flag says the served entry is stale: the caller should refresh it.
+        """
+        return await self._lookup(method, params_key, self._stale_grace)
+
+    async def _lookup(self, method: str, params_key: str, grace: float) -> tuple[CacheableResult | None, bool]:
         # A hit completes without any other yielding await, so checkpoint here: a poll
         # loop over a fresh entry must not starve spawned tasks (eviction dispatch).
         await anyio.lowlevel.checkpoint()
+        now = self._clock()
         # A wrong-shape entry raises as late as the copy, so the boundary wraps the whole read path.
         try:
-            entry = await self._get_fresh(CacheKey(method, params_key, self._arm("private")))
-            if entry is None:
+            entry = await self._get_fresh(CacheKey(method, params_key, self._arm("private")), now - grace)
+            if entry is None or _expired(entry, now):
                 # After a scope flip, a stale private entry must not shadow a fresh public one.
-                entry = await self._get_fresh(CacheKey(method, params_key, self._arm("public")))
-                if entry is not None and entry.scope != "public":
-                    # Never serve an entry the server scoped "private" out of the shared arm.
-                    entry = None
-            copied: CacheableResult | None = None if entry is None else entry.value.model_copy(deep=True)
+                public = await self._get_fresh(CacheKey(method, params_key, self._arm("public")), now - grace)
+                # Never serve an entry the server scoped "private" out of the shared arm.
+                if public is not None and public.scope == "public" and (entry is None or not _expired(public, now)):
+                    entry = public
+            copied: CacheableResult | None = None if entry is None else _detached_copy(entry.value)
         except Exception:  # boundary around user store code: any read-path failure is a miss, never a failed call
             self._warn_store_failure("get")
-            return None
+            _metrics.client_cache_lookups.add(1, {"mcp.method.name": method, "mcp.cache.result": "error"})
+            return None, False
         self._warned_store_ops.discard("get")
-        return copied
+        stale = entry is not None and _expired(entry, now)
+        outcome = "miss" if copied is None else "stale" if stale else "hit"
+        _metrics.client_cache_lookups.add(1, {"mcp.method.name": method, "mcp.cache.result": outcome})
+        return copied, stale
 
-    async def _get_fresh(self, key: CacheKey) -> CacheEntry | None:
+    async def _get_fresh(self, key: CacheKey, cutoff: float) -> CacheEntry | None:
         entry = await self._store.get(key)
-        if entry is None or entry.expires_at is None or entry.expires_at <= self._clock():
+        if entry is None or entry.expires_at is None or entry.expires_at <= cutoff:
             return None
         return entry
 
+    @contextmanager
+    def fetching(self, method: str, params_key: str) -> Generator[Flight]:
+        """Lead the key's fetch: concurrent `follow` calls wait for it instead of sending their own.
+
+        An exception out of the block is raised to the waiters too; a cancelled
+        fetch releases them empty-handed, to fetch for themselves. A key already
+        in flight (a `refresh` racing a fetch) is fetched again, unshared.
+        """
+        gen_key = (method, params_key)
+        flight = Flight()
+        leading = gen_key not in self._flights
+        if leading:
+            self._flights[gen_key] = flight
+        try:
+            yield flight
+        except Exception as exc:
+            flight.error = exc
+            raise
+        finally:
+            if leading:
+                del self._flights[gen_key]
+            flight.done.set()
+
+    def in_flight(self, method: str, params_key: str) -> bool:
+        """Whether a fetch of the key is in flight."""
+        return (method, params_key) in self._flights
+
+    async def follow(self, method: str, params_key: str) -> CacheableResult | None:
+        """Wait for the key's in-flight fetch and serve a private copy of its result.
+
+        `None` when nothing is in flight, or the fetch ended without a result to
+        share (cancelled, or not cacheable); the fetch's exception is re-raised.
+        """
+        flight = self._flights.get((method, params_key))
+        if flight is None:
+            return None
+        flight.waiting += 1
+        try:
+            await flight.done.wait()
+        finally:
+            flight.waiting -= 1
+        flight.raise_error()
+        shared = flight.result
+        if shared is None:
+            return None
+        _metrics.client_cache_coalesced.add(1, {"mcp.method.name": method})
+        # The last waiter out takes the leader's snapshot; every other one gets its own copy.
+        return shared if not flight.waiting else _detached_copy(shared)
+
     def capture(self, method: str, params_key: str) -> int:
         """Register the key for eviction-race detection before the fetch; `write` takes the returned generation."""
         gen_key = (method, params_key)
@@ -281,7 +767,7 @@ class ClientResponseCache:
             # The own arm's entry is superseded too: best-effort delete, degrading to a full miss.
             await self._cleanup_delete(own)
             return
-        entry = CacheEntry(value=result.model_copy(deep=True), scope=scope, expires_at=self._clock() + ttl_ms / 1000)
+        entry = CacheEntry(value=_detached_copy(result), scope=scope, expires_at=self._clock() + ttl_ms / 1000)
         try:
             if not await self._set(own, entry):
                 # The fetch superseded any pre-existing own-arm entry, and the failed set
@@ -309,6 +795,7 @@ class ClientResponseCache:
         # the deletes - a persistent store may hold uncaptured entries.
         if gen_key in self._generations:
             self._generations[gen_key] += 1
+        _metrics.client_cache_evictions.add(1, {"mcp.method.name": method})
         # Must complete: a cancellation between the deletes would leave one arm serving the evicted entry.
         await self._cleanup_delete(
             CacheKey(method, params_key, self._arm("private")),
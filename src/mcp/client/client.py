@@ -2,22 +2,28 @@
 
 from __future__ import annotations
 
+import base64
 import hashlib
 import logging
 import uuid
-from collections.abc import Awaitable, Callable, Mapping, Sequence
-from contextlib import AbstractAsyncContextManager, AsyncExitStack
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable, Mapping, Sequence
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, aclosing
 from dataclasses import KW_ONLY, dataclass, field
-from typing import Any, Literal, TypeVar, cast
+from functools import partial
+from typing import Any, Literal, TypeVar, cast, overload
 
 import anyio
+import anyio.abc
 import anyio.lowlevel
+import httpx2
 import mcp_types as types
 from mcp_types import (
     INVALID_PARAMS,
+    BlobResourceContents,
     CacheableResult,
     CallToolResult,
     CompleteResult,
+    ContentBlock,
     EmptyResult,
     ErrorData,
     GetPromptResult,
@@ -32,21 +38,42 @@ from mcp_types import (
     ListToolsResult,
     LoggingLevel,
     PaginatedRequestParams,
+    PaginatedResult,
+    Prompt,
     PromptReference,
     ReadResourceResult,
     RequestParamsMeta,
+    Resource,
+    ResourceTemplate,
     ResourceTemplateReference,
     Result,
     ServerCapabilities,
+    Tool,
 )
 from mcp_types.version import HANDSHAKE_PROTOCOL_VERSIONS, MODERN_PROTOCOL_VERSIONS
 from typing_extensions import deprecated
 
+from mcp.client._blobs import BlobFetcher
 from mcp.client._input_required import DEFAULT_INPUT_REQUIRED_MAX_ROUNDS, run_input_required_driver
 from mcp.client._memory import InMemoryTransport
+from mcp.client._pagination import paginate
 from mcp.client._probe import negotiate_auto
+from mcp.client._tool_stream import stream_tool_call
 from mcp.client._transport import Transport
-from mcp.client.caching import CacheConfig, CacheMode, ClientResponseCache, InMemoryResponseCacheStore
+from mcp.client.batch import (
+    DEFAULT_MAX_CONCURRENCY,
+    ToolCall,
+    ToolCallProgressFnT,
+    ToolCallResults,
+    call_tool_results,
+)
+from mcp.client.caching import (
+    CacheConfig,
+    CacheMode,
+    ClientEraVerdicts,
+    ClientResponseCache,
+    InMemoryResponseCacheStore,
+)
 from mcp.client.extension import ClaimContext, ClientExtension, NotificationBinding, ResultClaim
 from mcp.client.session import (
     ClientRequestContext,
@@ -62,9 +89,12 @@ from mcp.client.stdio import StdioServerParameters, stdio_client
 from mcp.client.streamable_http import streamable_http_client
 from mcp.client.subscriptions import ServerEvent, Subscription
 from mcp.client.subscriptions import listen as _listen
+from mcp.client.validation import OutputValidation
 from mcp.server import Server
 from mcp.server.mcpserver import MCPServer
 from mcp.server.runner import modern_on_request
+from mcp.shared._httpx_utils import create_mcp_http_client
+from mcp.shared.blob_offload import BLOB_OFFLOAD_META_KEY, blob_ref
 from mcp.shared.direct_dispatcher import create_direct_dispatcher_pair
 from mcp.shared.dispatcher import Dispatcher, ProgressFnT
 from mcp.shared.exceptions import MCPDeprecationWarning, MCPError
@@ -82,6 +112,7 @@ forward-compat; ``Client.__post_init__`` rejects anything outside that set at co
 _T = TypeVar("_T")
 _ResultT = TypeVar("_ResultT")
 _CacheableT = TypeVar("_CacheableT", bound=CacheableResult)
+_PageT = TypeVar("_PageT", bound=PaginatedResult)
 
 _Connector = Callable[[AsyncExitStack, ConnectMode, bool], Awaitable["Dispatcher[Any]"]]
 """Resolved at ``__post_init__`` from the shape of ``server`` alone: enter whatever resources
@@ -100,10 +131,27 @@ def _connect_transport(transport: Transport) -> _Connector:
     return connect
 
 
-def _connect_inproc(server: Server[Any]) -> _Connector:
+def _connect_http(url: str, http_client: httpx2.AsyncClient | None, blobs: BlobFetcher) -> _Connector:
+    """Connector for a URL: streamable HTTP over ``http_client`` (a default one when ``None``), which
+    ``blobs`` is bound to so offloaded resource blobs are fetched with the same credentials."""
+
+    async def connect(exit_stack: AsyncExitStack, mode: ConnectMode, raise_exceptions: bool) -> Dispatcher[Any]:
+        client = http_client
+        if client is None:
+            client = await exit_stack.enter_async_context(create_mcp_http_client())
+        blobs.http_client = client
+        return await _connect_transport(streamable_http_client(url, http_client=client))(
+            exit_stack, mode, raise_exceptions
+        )
+
+    return connect
+
+
+def _connect_inproc(server: Server[Any], *, pass_objects: bool = False) -> _Connector:
     """Connector for an in-process ``Server``: legacy mode drives the stream loop via
     ``InMemoryTransport``; any other mode drives the modern per-request path through a
-    ``DirectDispatcher`` peer pair (no streams, no JSON-RPC framing, no initialize handshake)."""
+    ``DirectDispatcher`` peer pair (no streams, no JSON-RPC framing, no initialize handshake).
+    ``pass_objects`` lets that pair hand result models across without a wire round trip."""
 
     async def connect(exit_stack: AsyncExitStack, mode: ConnectMode, raise_exceptions: bool) -> Dispatcher[Any]:
         if mode == "legacy":
@@ -111,7 +159,9 @@ def _connect_inproc(server: Server[Any]) -> _Connector:
             read_stream, write_stream = await exit_stack.enter_async_context(transport)
             return JSONRPCDispatcher(read_stream, write_stream)
         lifespan_state = await exit_stack.enter_async_context(server.lifespan(server))
-        client_disp, server_disp = create_direct_dispatcher_pair(raise_handler_exceptions=raise_exceptions)
+        client_disp, server_disp = create_direct_dispatcher_pair(
+            raise_handler_exceptions=raise_exceptions, pass_objects=pass_objects
+        )
         tg = await exit_stack.enter_async_context(anyio.create_task_group())
         exit_stack.callback(server_disp.close)
         on_request = modern_on_request(server, lifespan_state)
@@ -288,7 +338,8 @@ class Client:
     server: Server[Any] | MCPServer | Transport | StdioServerParameters | str
     """The MCP server to connect to.
 
-    If the server is a URL string, it will be used as the URL for a `streamable_http_client` transport.
+    If the server is a URL string, it will be used as the URL for a `streamable_http_client` transport
+    (over `http_client`, when given).
     If the server is a `StdioServerParameters`, the command is launched with `stdio_client`.
     If the server is a `Transport` instance, it will be used directly.
     If the server is a `Server` or `MCPServer` instance, it will be connected in-process.
@@ -367,14 +418,41 @@ class Client:
     per-client in-memory store; pass a customized `CacheConfig`, or `None` to
     disable. The cacheable verbs take a per-call `cache_mode` (see `CacheMode`);
     calls carrying `meta` always reach the server. A `CacheConfig` with a custom
-    `store` requires `target_id` when the server is not a URL (no identity can be
-    derived)."""
+    `store` or an `era_store` requires `target_id` when the server is not a URL (no
+    identity can be derived)."""
+
+    output_validation: OutputValidation | None = None
+    """How often `call_tool` checks structured results against the tool's output schema.
+
+    `None` (the default) checks every result, like `OutputValidation()`. Against a trusted
+    server, `OutputValidation(mode="sampled")`, `mode="first"` or `mode="off"` skip most or
+    all of that work; see `OutputValidation`."""
+
+    pass_objects: bool = False
+    """Take results from an in-process server as the server's own model objects.
+
+    By default an in-process `Server`/`MCPServer` still dumps every result to its wire
+    form and the client parses it back, exactly as over a real transport. With
+    `pass_objects=True` the result model the handler returned is handed across as-is:
+    no dump, no parse, no per-version checks. The client gets a shallow copy, so
+    rebinding a field never reaches the server; nested values (a tool's `input_schema`,
+    `structured_content`) are the server's own, so copy one before changing it. Only
+    for a server you trust, in this process, on a modern (non-`"legacy"`) `mode`."""
+
+    http_client: httpx2.AsyncClient | None = None
+    """The HTTP client to reach a URL `server` with: headers, auth, timeouts. The caller owns its lifecycle.
+
+    `None` (the default) uses a client with the SDK's default timeouts. Offloaded
+    binary resource contents (see `read_resource`) are fetched with it too."""
 
     _entered: bool = field(init=False, default=False)
     _session: ClientSession | None = field(init=False, default=None)
     _exit_stack: AsyncExitStack | None = field(init=False, default=None)
     _connect: _Connector = field(init=False, repr=False, compare=False)
+    _blob_fetcher: BlobFetcher | None = field(init=False, default=None, repr=False, compare=False)
     _response_cache: ClientResponseCache | None = field(init=False, default=None, repr=False, compare=False)
+    _era_verdicts: ClientEraVerdicts | None = field(init=False, default=None, repr=False, compare=False)
+    _revalidations: anyio.abc.TaskGroup | None = field(init=False, default=None, repr=False, compare=False)
     _folded_extensions: _FoldedExtensions = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
@@ -393,10 +471,15 @@ class Client:
         srv = self.server
         if isinstance(srv, MCPServer):
             srv = srv._lowlevel_server  # pyright: ignore[reportPrivateUsage]
+        if self.pass_objects and (not isinstance(srv, Server) or self.mode == "legacy"):
+            raise ValueError("pass_objects requires an in-process Server or MCPServer and a mode other than 'legacy'")
+        if self.http_client is not None and not isinstance(srv, str):
+            raise ValueError("http_client requires a URL server")
         if isinstance(srv, Server):
-            self._connect = _connect_inproc(srv)
+            self._connect = _connect_inproc(srv, pass_objects=self.pass_objects)
         elif isinstance(srv, str):
-            self._connect = _connect_transport(streamable_http_client(srv))
+            self._blob_fetcher = BlobFetcher(srv)
+            self._connect = _connect_http(srv, self.http_client, self._blob_fetcher)
         elif isinstance(srv, StdioServerParameters):
             self._connect = _connect_transport(stdio_client(srv))
         else:
@@ -409,20 +492,30 @@ class Client:
             if target_id is None and isinstance(self.server, str):
                 target_id = _strip_userinfo(self.server)
             if target_id is None:
-                if config.store is not None:
+                if config.store is not None or config.era_store is not None:
                     raise ValueError(
                         "a custom cache store requires CacheConfig.target_id when the server is not a URL: "
                         "in-process servers and Transport instances get a random per-client identity, so "
                         "their entries in a shared store could never be served to another client"
                     )
                 target_id = uuid.uuid4().hex
+            arm_id = hashlib.sha256(target_id.encode()).hexdigest()
+            if config.era_store is not None:
+                self._era_verdicts = ClientEraVerdicts(
+                    config.era_store,
+                    arm_id=arm_id,
+                    partition=config.partition,
+                    ttl_ms=config.era_ttl_ms,
+                    clock=config.clock,
+                )
             self._response_cache = ClientResponseCache(
                 store=config.store if config.store is not None else InMemoryResponseCacheStore(),
                 partition=config.partition,
-                arm_id=hashlib.sha256(target_id.encode()).hexdigest(),
+                arm_id=arm_id,
                 default_ttl_ms=config.default_ttl_ms,
                 clock=config.clock,
                 share_public=config.share_public,
+                stale_while_revalidate_ms=config.stale_while_revalidate_ms,
                 # Lazy: the negotiated version is unknown until __aenter__'s handshake.
                 negotiated_version=lambda: self._session.protocol_version if self._session is not None else None,
             )
@@ -447,6 +540,7 @@ class Client:
             extensions=self._folded_extensions.ad,
             result_claims=self._folded_extensions.claims,
             notification_bindings=self._folded_extensions.bindings,
+            output_validation=self.output_validation,
         )
 
     async def __aenter__(self) -> Client:
@@ -462,10 +556,15 @@ class Client:
             if self.mode == "legacy":
                 await session.initialize()
             elif self.mode == "auto":
-                await negotiate_auto(session)
+                await negotiate_auto(session, self._era_verdicts)
             else:
                 session.adopt(self.prior_discover or _synthesize_discover(self.mode))
 
+            if self.cache is not None and self.cache.stale_while_revalidate_ms:
+                # Background refreshes of stale entries; cancelled before the session closes.
+                self._revalidations = await exit_stack.enter_async_context(anyio.create_task_group())
+                exit_stack.callback(self._revalidations.cancel_scope.cancel)
+
             # Only publish the session after the handshake succeeds, so `_session is not None`
             # implies the protocol_version/server_capabilities are populated (server_info
             # stays optional: 2026-era servers may not identify themselves). If the
@@ -479,6 +578,7 @@ class Client:
         if self._exit_stack:  # pragma: no branch
             await self._exit_stack.__aexit__(exc_type, exc_val, exc_tb)
         self._session = None
+        self._revalidations = None
 
     @property
     def session(self) -> ClientSession:
@@ -568,6 +668,8 @@ class Client:
         """Serve one of the four list verbs through the response cache.
 
         `absorb` (tools/list only) re-applies session-side derived state to a served cache hit.
+        Concurrent misses share one fetch, and an entry in its stale-while-revalidate window is
+        served while one background fetch refreshes it.
         """
         cache = self._response_cache
         if cache is None or cache_mode == "bypass":
@@ -585,14 +687,49 @@ class Client:
                 if e.code == INVALID_PARAMS:
                     await cache.evict_method(method)
                 raise
-        if cache_mode == "use" and (hit := await cache.read(method, "")) is not None:
-            # The hit is a private deep copy, so absorption may mutate it freely.
-            served = cast(_CacheableT, hit)
-            return served if absorb is None else absorb(served)
-        gen = cache.capture(method, "")
-        result = await send()
-        await cache.write(method, "", result, gen, cache_mode)
-        return result
+
+        async def fetch(
+            mode: Literal["use", "refresh"], *, task_status: anyio.abc.TaskStatus[None] = anyio.TASK_STATUS_IGNORED
+        ) -> _CacheableT:
+            with cache.fetching(method, "") as flight:
+                task_status.started()
+                gen = cache.capture(method, "")
+                result = await send()
+                await cache.write(method, "", result, gen, mode)
+                flight.share(result)
+            return result
+
+        if cache_mode == "use":
+            hit, stale = await cache.read_stale(method, "")
+            if hit is None:
+                hit = await cache.follow(method, "")
+            elif stale:
+                await self._revalidate(method, "", partial(fetch, "refresh"))
+            if hit is not None:
+                # Hits and shared results are private copies, so absorption may mutate them freely.
+                served = cast(_CacheableT, hit)
+                return served if absorb is None else absorb(served)
+        return await fetch(cache_mode)
+
+    async def _revalidate(self, method: str, params_key: str, refresh: Callable[..., Awaitable[object]]) -> None:
+        """Start one background `refresh` of a stale entry, unless a fetch of it is already in flight.
+
+        Returns once the refresh holds the key's flight, so a second stale hit cannot start another.
+        """
+        cache, revalidations = self._response_cache, self._revalidations
+        # Entries are served stale only with a revalidation window, which enters the task group.
+        assert cache is not None and revalidations is not None
+        if not cache.in_flight(method, params_key):
+            await revalidations.start(self._refresh_in_background, method, refresh)
+
+    @staticmethod
+    async def _refresh_in_background(
+        method: str, refresh: Callable[..., Awaitable[object]], *, task_status: anyio.abc.TaskStatus[None]
+    ) -> None:
+        try:
+            await refresh(task_status=task_status)
+        except Exception:  # boundary: nobody awaits a background refresh; the stale entry ages out instead
+            logger.warning("Refreshing a stale %s cache entry failed", method, exc_info=True)
 
     async def list_resources(
         self,
@@ -642,6 +779,11 @@ class Client:
         callbacks and the read is retried automatically (up to
         `input_required_max_rounds`).
 
+        Connected by URL to a server with `blob_offload`, large binary contents
+        come as raw bytes from the server's blob endpoint instead of as base64
+        inside the JSON result; they are put back in `blob` before this returns.
+        `read_resource_bytes` skips even that re-encoding.
+
         Args:
             uri: The URI of the resource to read.
             input_responses: Responses to seed the first call with (e.g. when
@@ -662,9 +804,18 @@ class Client:
         """
 
         async def retry(r: InputResponses | None, s: str | None) -> ReadResourceResult | InputRequiredResult:
-            return await self.session.read_resource(
-                uri, input_responses=r, request_state=s, meta=meta, allow_input_required=True
+            result = await self.session.read_resource(
+                uri, input_responses=r, request_state=s, meta=self._blob_offload_meta(meta), allow_input_required=True
             )
+            if self._blob_fetcher is None or isinstance(result, InputRequiredResult):
+                return result
+            inlined = await self._blob_fetcher.inline(result)
+            if inlined is None:
+                # A reference expired before it was fetched: read again with every blob inline.
+                return await self.session.read_resource(
+                    uri, input_responses=r, request_state=s, meta=meta, allow_input_required=True
+                )
+            return inlined
 
         # Seeded calls resume a specific exchange and must never be cached (spec MUST).
         seeded = input_responses is not None or request_state is not None
@@ -676,19 +827,80 @@ class Client:
         if meta is not None and cache_mode == "use":
             # Calls carrying meta always reach the server (mirrors `_cached_fetch`).
             cache_mode = "refresh"
-        if cache_mode == "use" and (hit := await cache.read("resources/read", uri)) is not None:
-            # Only terminal first-round results are stored, so a hit legitimately skips the driver.
-            return cast(ReadResourceResult, hit)
-        gen = cache.capture("resources/read", uri)
-        first = await retry(None, None)
-        if not isinstance(first, InputRequiredResult):
-            await cache.write("resources/read", uri, first, gen, cache_mode)
-        elif cache_mode == "refresh":
-            # The refresh superseded whatever was cached, but an input_required resolution
-            # cannot be stored: purge the warm entry so it cannot be served again.
-            await cache.evict_key("resources/read", uri)
+
+        async def fetch(
+            mode: Literal["use", "refresh"], *, task_status: anyio.abc.TaskStatus[None] = anyio.TASK_STATUS_IGNORED
+        ) -> ReadResourceResult | InputRequiredResult:
+            with cache.fetching("resources/read", uri) as flight:
+                task_status.started()
+                gen = cache.capture("resources/read", uri)
+                first = await retry(None, None)
+                if not isinstance(first, InputRequiredResult):
+                    await cache.write("resources/read", uri, first, gen, mode)
+                    flight.share(first)
+                elif mode == "refresh":
+                    # The refresh superseded whatever was cached, but an input_required resolution
+                    # cannot be stored: purge the warm entry so it cannot be served again.
+                    await cache.evict_key("resources/read", uri)
+            return first
+
+        if cache_mode == "use":
+            hit, stale = await cache.read_stale("resources/read", uri)
+            if hit is None:
+                # An input_required first round is not shared: each waiter then drives its own.
+                hit = await cache.follow("resources/read", uri)
+            elif stale:
+                await self._revalidate("resources/read", uri, partial(fetch, "refresh"))
+            if hit is not None:
+                # Only terminal first-round results are stored or shared, so a hit legitimately skips the driver.
+                return cast(ReadResourceResult, hit)
         # Driver rounds carry inputResponses, so a terminal result reached through them is never cached (spec MUST).
-        return await self._drive_input_required(first, retry)
+        return await self._drive_input_required(await fetch(cache_mode), retry)
+
+    async def read_resource_bytes(
+        self, uri: str, *, start: int = 0, end: int | None = None, meta: RequestParamsMeta | None = None
+    ) -> bytes:
+        """Read the bytes of a binary resource, or the `[start, end)` slice of them.
+
+        Connected by URL to a server with `blob_offload`, a large blob is fetched
+        raw from the server's blob endpoint, and only the requested range is
+        transferred: no base64 on either side. Otherwise the resource is read
+        like `read_resource` (uncached) and its inline blob decoded and sliced.
+        The first binary contents of the resource are the ones read.
+
+        Raises:
+            ValueError: `start` or `end` is negative, or the resource has no binary contents.
+            InputRequiredRoundsExceededError: `input_required_max_rounds` exhausted.
+        """
+        if start < 0 or (end is not None and end < 0):
+            raise ValueError(f"start and end must be >= 0, got {start} and {end}")
+
+        def read(offload: bool) -> Callable[[InputResponses | None, str | None], Awaitable[Any]]:
+            async def retry(r: InputResponses | None, s: str | None) -> ReadResourceResult | InputRequiredResult:
+                return await self.session.read_resource(
+                    uri,
+                    input_responses=r,
+                    request_state=s,
+                    meta=self._blob_offload_meta(meta) if offload else meta,
+                    allow_input_required=True,
+                )
+
+            return retry
+
+        offload = self._blob_fetcher is not None
+        while True:
+            retry = read(offload)
+            result: ReadResourceResult = await self._drive_input_required(await retry(None, None), retry)
+            blob = next((item for item in result.contents if isinstance(item, BlobResourceContents)), None)
+            if blob is None:
+                raise ValueError(f"resource {uri!r} has no binary contents")
+            if self._blob_fetcher is None or (ref := blob_ref(blob)) is None:
+                return base64.b64decode(blob.blob)[start:end]
+            data = await self._blob_fetcher.fetch(ref, start, end)
+            if data is not None:
+                return data
+            # The reference expired before it was fetched: read again with the blob inline.
+            offload = False
 
     def listen(
         self,
@@ -828,6 +1040,157 @@ class Client:
             await self.session.validate_tool_result(name, final)
         return final
 
+    async def call_tool_stream(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+        read_timeout_seconds: float | None = None,
+        progress_callback: ProgressFnT | None = None,
+        *,
+        meta: RequestParamsMeta | None = None,
+    ) -> AsyncGenerator[ContentBlock]:
+        """Call a tool and yield its content blocks as the server produces them.
+
+        The call opts in to partial content (`mcp.shared.partial_content`): a
+        server that streams the tool's output sends each chunk ahead of the
+        result, and those blocks are yielded as they arrive, followed by the
+        content the result itself carries. Against a server that does not
+        stream, or over a transport that answers with a single JSON body, the
+        whole content arrives with the result and is yielded then. Either way
+        the blocks are the same, in the same order, as `call_tool` returns.
+
+        The call goes through `call_tool`, so input-required rounds and claimed
+        results behave the same. Closing the generator early cancels the call.
+
+        Args:
+            name: The name of the tool to call.
+            arguments: Arguments to pass to the tool.
+            read_timeout_seconds: Timeout for each underlying `tools/call` round.
+            progress_callback: Callback for progress updates.
+            meta: Additional metadata for the request.
+
+        Raises:
+            ToolStreamError: The tool returned an error result, after its content was yielded.
+            MCPError: The call failed, or the consumer fell thousands of blocks behind.
+        """
+
+        def call(stream_meta: RequestParamsMeta) -> Awaitable[CallToolResult]:
+            return self.call_tool(
+                name,
+                arguments,
+                read_timeout_seconds=read_timeout_seconds,
+                progress_callback=progress_callback,
+                meta=stream_meta,
+            )
+
+        async with aclosing(stream_tool_call(self.session, name, call, meta)) as blocks:
+            async for block in blocks:
+                yield block
+
+    @overload
+    async def call_tools(
+        self,
+        calls: Iterable[ToolCall],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        return_exceptions: Literal[True] = True,
+        read_timeout_seconds: float | None = None,
+        progress_callback: ToolCallProgressFnT | None = None,
+    ) -> list[CallToolResult | Exception]: ...
+
+    @overload
+    async def call_tools(
+        self,
+        calls: Iterable[ToolCall],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        return_exceptions: Literal[False],
+        read_timeout_seconds: float | None = None,
+        progress_callback: ToolCallProgressFnT | None = None,
+    ) -> list[CallToolResult]: ...
+
+    async def call_tools(
+        self,
+        calls: Iterable[ToolCall],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        return_exceptions: bool = True,
+        read_timeout_seconds: float | None = None,
+        progress_callback: ToolCallProgressFnT | None = None,
+    ) -> list[CallToolResult | Exception] | list[CallToolResult]:
+        """Call many tools concurrently over this session and return their results in the order of `calls`.
+
+        Each call goes through `call_tool`, so input-required rounds, claimed results and
+        output-schema validation behave exactly as they do for a single call. At most
+        `max_concurrency` calls are in flight at once. Cancelling the caller cancels every call
+        still in flight.
+
+        Args:
+            calls: The calls to make.
+            max_concurrency: Most calls in flight at once.
+            return_exceptions: When `True` (default), a call that raises puts its exception in
+                the returned list at its position. When `False`, the first failure to complete
+                is raised and the calls still in flight are cancelled.
+            read_timeout_seconds: Timeout for each underlying `tools/call` round.
+            progress_callback: Receives every call's progress updates, with the call's index.
+
+        Raises:
+            ValueError: If `max_concurrency` is below 1.
+        """
+        async with self.call_tools_as_completed(
+            calls,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+            read_timeout_seconds=read_timeout_seconds,
+            progress_callback=progress_callback,
+        ) as results:
+            outcomes = {index: outcome async for index, outcome in results}
+        return [outcomes[index] for index in range(len(outcomes))]
+
+    def call_tools_as_completed(
+        self,
+        calls: Iterable[ToolCall],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        return_exceptions: bool = True,
+        read_timeout_seconds: float | None = None,
+        progress_callback: ToolCallProgressFnT | None = None,
+    ) -> AbstractAsyncContextManager[ToolCallResults]:
+        """Like `call_tools`, but stream `(index, result)` pairs as the calls complete:
+
+            calls = [ToolCall("lookup", {"isbn": isbn}) for isbn in isbns]
+            async with client.call_tools_as_completed(calls, max_concurrency=16) as results:
+                async for index, result in results:
+                    ...
+
+        A consumer slower than the server holds back new calls rather than buffering results.
+        Leaving the block early cancels the calls still in flight.
+
+        Raises:
+            ValueError: If `max_concurrency` is below 1.
+        """
+        session = self.session
+        task_group = session._task_group  # pyright: ignore[reportPrivateUsage]
+        assert task_group is not None  # an entered client's session is always entered
+
+        async def call_one(call: ToolCall, progress_callback: ProgressFnT | None) -> CallToolResult:
+            return await self.call_tool(
+                call.name,
+                call.arguments,
+                read_timeout_seconds=read_timeout_seconds,
+                progress_callback=progress_callback,
+                meta=call.meta,
+            )
+
+        return call_tool_results(
+            task_group,
+            call_one,
+            list(calls),
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+            progress_callback=progress_callback,
+        )
+
     async def list_prompts(
         self,
         *,
@@ -885,6 +1248,12 @@ class Client:
 
         return await self._drive_input_required(await retry(input_responses, request_state), retry)
 
+    def _blob_offload_meta(self, meta: RequestParamsMeta | None) -> RequestParamsMeta | None:
+        """`meta`, opted in to offloaded blobs when this client can fetch them."""
+        if self._blob_fetcher is None:
+            return meta
+        return {**(meta or {}), BLOB_OFFLOAD_META_KEY: True}
+
     async def _drive_input_required(
         self,
         first: _ResultT | InputRequiredResult,
@@ -948,6 +1317,57 @@ class Client:
             ),
         )
 
+    async def iter_tools(self, *, cache_mode: CacheMode = "use", prefetch: bool = True) -> AsyncGenerator[Tool]:
+        """Yield every tool the server lists, following `next_cursor` from page to page.
+
+        The first page is served through the response cache like `list_tools()`;
+        continuation pages always reach the server. With `prefetch` (the default), the
+        next page is requested while the caller works through the current one.
+
+        Raises:
+            PaginationCycleError: The server returned the same cursor twice.
+        """
+        async with aclosing(self._pages("tools/list", self.list_tools, cache_mode, prefetch)) as pages:
+            async for page in pages:
+                for tool in page.tools:
+                    yield tool
+
+    async def iter_resources(self, *, cache_mode: CacheMode = "use", prefetch: bool = True) -> AsyncGenerator[Resource]:
+        """Yield every resource the server lists; paged like `iter_tools()`."""
+        async with aclosing(self._pages("resources/list", self.list_resources, cache_mode, prefetch)) as pages:
+            async for page in pages:
+                for resource in page.resources:
+                    yield resource
+
+    async def iter_resource_templates(
+        self, *, cache_mode: CacheMode = "use", prefetch: bool = True
+    ) -> AsyncGenerator[ResourceTemplate]:
+        """Yield every resource template the server lists; paged like `iter_tools()`."""
+        async with aclosing(
+            self._pages("resources/templates/list", self.list_resource_templates, cache_mode, prefetch)
+        ) as pages:
+            async for page in pages:
+                for template in page.resource_templates:
+                    yield template
+
+    async def iter_prompts(self, *, cache_mode: CacheMode = "use", prefetch: bool = True) -> AsyncGenerator[Prompt]:
+        """Yield every prompt the server lists; paged like `iter_tools()`."""
+        async with aclosing(self._pages("prompts/list", self.list_prompts, cache_mode, prefetch)) as pages:
+            async for page in pages:
+                for prompt in page.prompts:
+                    yield prompt
+
+    def _pages(
+        self, method: str, list_page: Callable[..., Awaitable[_PageT]], cache_mode: CacheMode, prefetch: bool
+    ) -> AsyncGenerator[_PageT]:
+        """The pages of one list verb, prefetched in the session's task group when `prefetch` is set."""
+        task_group = self.session._task_group if prefetch else None  # pyright: ignore[reportPrivateUsage]
+
+        async def fetch(cursor: str | None) -> _PageT:
+            return await list_page(cursor=cursor, cache_mode=cache_mode)
+
+        return paginate(method, fetch, task_group)
+
     @deprecated("The roots capability is deprecated as of 2026-07-28 (SEP-2577).", category=MCPDeprecationWarning)
     async def send_roots_list_changed(self) -> None:
         """Send a notification that the roots list has changed."""
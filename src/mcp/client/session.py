@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import logging
 from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
@@ -38,10 +37,15 @@ from mcp_types.version import (
 from pydantic import BaseModel, Discriminator, Tag, TypeAdapter, ValidationError
 from typing_extensions import Self, TypeVar, deprecated
 
+from mcp.client._tool_stream import ContentRoute
 from mcp.client._transport import ReadStream, WriteStream
+from mcp.client.caching import Flight
 from mcp.client.extension import NotificationBinding, ResultClaim, UnexpectedClaimedResult
 from mcp.client.subscriptions import ListenRoute
+from mcp.client.validation import OutputValidation
 from mcp.shared._compat import resync_tracer
+from mcp.shared._json import canonical_dumps
+from mcp.shared.direct_dispatcher import DirectDispatcher, ObjectResult
 from mcp.shared.dispatcher import CallOptions, DispatchContext, Dispatcher, ProgressFnT, as_request_id
 from mcp.shared.exceptions import MCPDeprecationWarning, MCPError
 from mcp.shared.inbound import (
@@ -55,7 +59,9 @@ from mcp.shared.inbound import (
     x_mcp_header_map,
 )
 from mcp.shared.jsonrpc_dispatcher import JSONRPCDispatcher, cancelled_request_id_from_params
+from mcp.shared.log_batch import log_batch_entries
 from mcp.shared.message import ClientMessageMetadata, SessionMessage
+from mcp.shared.partial_content import PARTIAL_CONTENT_METHOD, partial_content_from_wire
 from mcp.shared.subscriptions import SUBSCRIPTION_ID_META_KEY, event_from_wire
 from mcp.shared.transport_context import TransportContext
 
@@ -117,6 +123,36 @@ def _later_revision_fields(method: str, version: str) -> frozenset[str]:
     return frozenset(later) - _wire_fields(current)
 
 
+@cache
+def _later_revision_attributes(model_type: type[BaseModel], method: str, version: str) -> tuple[str, ...]:
+    """`_later_revision_fields` as the attribute names `model_type` stores them under."""
+    foreign = _later_revision_fields(method, version)
+    return tuple(name for name, field in model_type.model_fields.items() if (field.alias or name) in foreign)
+
+
+def _inbound_model(model: types.Result, method: str, version: str) -> types.Result | None:
+    """A handed-over result model as its wire form would parse, or None to take the wire path.
+
+    The object path's `_clamp_inbound_ttl` and later-revision sieve: a negative
+    `ttl_ms` is floored to 0 and a newer revision's field goes back to its
+    default, on a copy. A required field from a newer revision cannot be
+    dropped, so that model takes the wire path and fails there as it would
+    have on the wire.
+    """
+    fields = type(model).model_fields
+    update: dict[str, Any] = {}
+    for name in _later_revision_attributes(type(model), method, version):
+        if fields[name].is_required():
+            return None
+        default = fields[name].get_default(call_default_factory=True)
+        if getattr(model, name) != default:
+            update[name] = default
+    ttl = getattr(model, "ttl_ms", None)
+    if "ttl_ms" not in update and isinstance(ttl, int | float) and not isinstance(ttl, bool) and ttl < 0:
+        update["ttl_ms"] = 0
+    return model.model_copy(update=update) if update else model
+
+
 def _same_schema(a: dict[str, Any] | None, b: dict[str, Any] | None) -> bool:
     """JSON equality for two output schemas.
 
@@ -125,7 +161,7 @@ def _same_schema(a: dict[str, Any] | None, b: dict[str, Any] | None) -> bool:
     JSON does; where it is stricter (`1` vs `1.0`), erring toward "changed" only costs a
     recompile, never a stale validator.
     """
-    return json.dumps(a, sort_keys=True) == json.dumps(b, sort_keys=True)
+    return canonical_dumps(a, sort_keys=True) == canonical_dumps(b, sort_keys=True)
 
 
 def _preconnect_stamp(data: dict[str, Any], opts: CallOptions) -> None:
@@ -201,6 +237,12 @@ def _make_modern_stamp(
 ReceiveResultT = TypeVar("ReceiveResultT", bound=BaseModel)
 
 
+def _parse_result(result_type: type[ReceiveResultT] | TypeAdapter[ReceiveResultT], raw: Any) -> ReceiveResultT:
+    if isinstance(result_type, TypeAdapter):
+        return result_type.validate_python(raw, by_name=False)
+    return result_type.model_validate(raw, by_name=False)
+
+
 @dataclass(kw_only=True)
 class ClientRequestContext:
     """Context for a server-initiated request, passed to the sampling/elicitation/list-roots callbacks."""
@@ -426,6 +468,7 @@ class ClientSession:
         result_claims: Mapping[str, Sequence[ResultClaim[Any]]] | None = None,
         notification_bindings: Sequence[NotificationBinding[Any]] | None = None,
         dispatcher: Dispatcher[Any] | None = None,
+        output_validation: OutputValidation | None = None,
     ) -> None:
         self._session_read_timeout_seconds = read_timeout_seconds
         self._client_info = client_info or DEFAULT_CLIENT_INFO
@@ -448,6 +491,11 @@ class ClientSession:
         # Compiled output-schema validators, derived from `_tool_output_schemas` and owned by
         # `_absorb_tool_listing`, which evicts a tool's entry whenever its schema changes.
         self._tool_output_validators: dict[str, Validator] = {}
+        self._output_validation = output_validation or OutputValidation()
+        # Results checked per tool, for `OutputValidation(mode="first")`; reset with the validator.
+        self._tool_validation_counts: dict[str, int] = {}
+        # Set while one `tools/list` refreshes the schemas for callers that met an unknown tool.
+        self._tool_schema_refresh: Flight | None = None
         self._x_mcp_header_maps: dict[str, dict[tuple[str, ...], str]] = {}
         self._initialize_result: types.InitializeResult | None = None
         self._discover_result: types.DiscoverResult | None = None
@@ -457,6 +505,8 @@ class ClientSession:
         self._task_group: anyio.abc.TaskGroup | None = None
         # subscriptions/listen demux routes; membership decides ack consumption (raw listens are never registered)
         self._listen_routes: dict[RequestId, ListenRoute] = {}
+        # call_tool_stream demux routes, keyed by the partial-content token each call opted in with
+        self._content_routes: dict[types.ProgressToken, ContentRoute] = {}
         if dispatcher is not None:
             if read_stream is not None or write_stream is not None:
                 raise ValueError("pass read_stream/write_stream or dispatcher, not both")
@@ -522,6 +572,7 @@ class ClientSession:
         finally:
             self._close_binding_queues()
             self._settle_listen_routes_closed()
+            self._settle_content_routes_closed()
         await resync_tracer()
         return result
 
@@ -590,10 +641,23 @@ class ClientSession:
                 opts["resumption_token"] = metadata.resumption_token
             if metadata.on_resumption_token_update is not None:
                 opts["on_resumption_token"] = metadata.on_resumption_token_update
-        raw = await self._dispatcher.send_raw_request(method, data.get("params"), opts)
-        _clamp_inbound_ttl(raw)
+        dispatcher = self._dispatcher
+        if isinstance(dispatcher, DirectDispatcher):
+            raw = await dispatcher.send_request_object(method, data.get("params"), opts)
+        else:
+            raw = await dispatcher.send_raw_request(method, data.get("params"), opts)
         # Literal fallback covers pre-handshake and stateless; matches runner.py.
         version = self._negotiated_version or "2025-11-25"
+        if isinstance(raw, ObjectResult):
+            # A trusted in-process server's own model: an instance of an expected type is taken as-is.
+            model = _inbound_model(raw.model, method, version)
+            try:
+                if model is not None:
+                    return _parse_result(result_type, model)
+            except ValidationError:
+                pass
+            raw = raw.to_wire()
+        _clamp_inbound_ttl(raw)
         try:
             _methods.validate_server_result(method, version, raw)
         except KeyError:
@@ -603,9 +667,7 @@ class ClientSession:
         # result type would otherwise apply that revision's constraints to them.
         if not (foreign := _later_revision_fields(method, version)).isdisjoint(raw):
             raw = {key: value for key, value in raw.items() if key not in foreign}
-        if isinstance(result_type, TypeAdapter):
-            return result_type.validate_python(raw, by_name=False)
-        return result_type.model_validate(raw, by_name=False)
+        return _parse_result(result_type, raw)
 
     async def send_notification(self, notification: types.ClientNotification) -> None:
         """Send a one-way notification. Usable before entering the context manager.
@@ -1125,12 +1187,16 @@ class ClientSession:
     async def validate_tool_result(self, name: str, result: types.CallToolResult) -> None:
         """Revalidate a `CallToolResult` against the tool's declared output schema.
 
+        The session's `OutputValidation` decides whether this result is checked at all; an
+        unchecked result returns at once, without listing tools for an unknown name.
+
         Raises:
             RuntimeError: Structured content is missing or does not conform to the schema.
         """
+        if not self._output_validation.checks(self._tool_validation_counts.get(name, 0)):
+            return
         if name not in self._tool_output_schemas:
-            # refresh output schema cache
-            await self.list_tools()
+            await self._refresh_tool_schemas()
 
         output_schema = None
         if name in self._tool_output_schemas:
@@ -1141,6 +1207,7 @@ class ClientSession:
         if output_schema is not None:
             from jsonschema import exceptions as jsonschema_exceptions
 
+            self._tool_validation_counts[name] = self._tool_validation_counts.get(name, 0) + 1
             if result.structured_content is None:
                 raise RuntimeError(f"Tool {name} has an output schema but did not return structured content")
             validator = self._output_schema_validator(name, output_schema)
@@ -1154,6 +1221,28 @@ class ClientSession:
             if error is not None:
                 raise RuntimeError(f"Invalid structured content returned by tool {name}: {error}") from error
 
+    async def _refresh_tool_schemas(self) -> None:
+        """List tools once for every concurrent caller that met a tool missing from the schema cache.
+
+        Callers arriving while a refresh runs wait for it rather than sending their own
+        `tools/list`. If it fails, each of them raises its error too; if it is cancelled,
+        they refresh again rather than validate against a schema that never arrived.
+        """
+        while (flight := self._tool_schema_refresh) is not None:
+            await flight.done.wait()
+            flight.raise_error()
+            if flight.result is not None:
+                return
+        self._tool_schema_refresh = flight = Flight()
+        try:
+            flight.result = await self.list_tools()
+        except Exception as exc:
+            flight.error = exc
+            raise
+        finally:
+            self._tool_schema_refresh = None
+            flight.done.set()
+
     def _output_schema_validator(self, name: str, output_schema: dict[str, Any]) -> Validator:
         """Compiled validator for the tool's cached output schema, built once per schema value.
 
@@ -1311,13 +1400,15 @@ class ClientSession:
             result.tools = kept
 
         # Cache tool output schemas for future validation; cursor pages only ever add. A
-        # changed schema evicts its compiled validator; an unchanged one (a re-listing, or the
-        # response cache re-absorbing a served hit) keeps it. Only validated tools pay the check.
+        # changed schema evicts its compiled validator and restarts its validation count; an
+        # unchanged one (a re-listing, or the response cache re-absorbing a served hit) keeps
+        # both. Only validated tools pay the check.
         for tool in result.tools:
-            if tool.name in self._tool_output_validators and not _same_schema(
+            if tool.name in self._tool_validation_counts and not _same_schema(
                 self._tool_output_schemas.get(tool.name), tool.output_schema
             ):
-                del self._tool_output_validators[tool.name]
+                self._tool_output_validators.pop(tool.name, None)
+                del self._tool_validation_counts[tool.name]
             self._tool_output_schemas[tool.name] = tool.output_schema
 
         if complete:
@@ -1327,6 +1418,7 @@ class ClientSession:
             self._x_mcp_header_maps = {k: v for k, v in self._x_mcp_header_maps.items() if k in names}
             self._tool_output_schemas = {k: v for k, v in self._tool_output_schemas.items() if k in names}
             self._tool_output_validators = {k: v for k, v in self._tool_output_validators.items() if k in names}
+            self._tool_validation_counts = {k: v for k, v in self._tool_validation_counts.items() if k in names}
 
         return result
 
@@ -1405,13 +1497,37 @@ class ClientSession:
             route.settle("lost", error=closed)
         self._listen_routes.clear()
 
+    def _register_content_route(self, token: types.ProgressToken) -> ContentRoute:
+        """Create the demux route for a streamed call's token; the caller registers BEFORE sending."""
+        route = ContentRoute()
+        self._content_routes[token] = route
+        return route
+
+    def _unregister_content_route(self, token: types.ProgressToken) -> None:
+        """Drop a streamed call's route; a missing key is a no-op."""
+        self._content_routes.pop(token, None)
+
+    def _settle_content_routes_closed(self) -> None:
+        """Fail all open streamed calls on session exit; their cancelled driver tasks cannot."""
+        closed = MCPError(code=CONNECTION_CLOSED, message="Connection closed")
+        for route in self._content_routes.values():
+            route.settle(closed)
+        self._content_routes.clear()
+
     def _intercept_notification(self, method: str, params: Mapping[str, Any] | None) -> bool:
-        """Wire-order listen demux, run synchronously on the dispatcher's receive path.
+        """Wire-order listen and streamed-call demux, run synchronously on the dispatcher's receive path.
 
         Bookkeeping must advance in receive order with the listen result (resolved on
         this same path); the spawned `_on_notify` path would race it and drop events.
-        Returns True to consume the frame: a live route's ack is driver state, never surfaced.
+        Returns True to consume the frame: a live route's ack is driver state, never surfaced,
+        and a streamed call's chunk belongs to that call alone.
         """
+        if method == PARTIAL_CONTENT_METHOD and self._content_routes:
+            chunk = partial_content_from_wire(params)
+            if chunk is None or (content_route := self._content_routes.get(chunk[0])) is None:
+                return False
+            content_route.deliver(chunk[1])
+            return True
         if not self._listen_routes:
             return False
         if method == "notifications/cancelled":
@@ -1482,7 +1598,8 @@ class ClientSession:
             return
         try:
             if isinstance(notification, types.LoggingMessageNotification):
-                await self._logging_callback(notification.params)
+                for entry in log_batch_entries(notification.params):
+                    await self._logging_callback(entry)
             await self._message_handler(notification)
         except Exception:
             # Contain here, not in the dispatcher: DirectDispatcher awaits this
@@ -4,23 +4,36 @@ Tools, resources, and prompts are aggregated across servers. Servers may
 be connected to or disconnected from at any point after initialization.
 
 This abstraction can handle naming collisions using a custom user-provided hook.
+Identical servers can be grouped into replica sets, across which tool calls are
+load-balanced and, for read-only or idempotent tools, optionally hedged.
 """
 
 import contextlib
+import itertools
 import logging
-from collections.abc import Callable
+import math
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass
 from types import TracebackType
-from typing import Any, Literal, TypeAlias, overload
+from typing import Any, Literal, Protocol, TypeAlias, overload
 
 import anyio
+import anyio.abc
 import httpx2
 import mcp_types as types
 from pydantic import BaseModel, Field
 from typing_extensions import Self
 
 import mcp
-from mcp.client.session import ElicitationFnT, ListRootsFnT, LoggingFnT, MessageHandlerFnT, SamplingFnT
+from mcp.client.session import (
+    ElicitationFnT,
+    IncomingMessage,
+    ListRootsFnT,
+    LoggingFnT,
+    MessageHandlerFnT,
+    SamplingFnT,
+)
 from mcp.client.sse import sse_client
 from mcp.client.stdio import StdioServerParameters
 from mcp.client.streamable_http import streamable_http_client
@@ -66,6 +79,92 @@ class StreamableHttpParameters(BaseModel):
 
 ServerParameters: TypeAlias = StdioServerParameters | SseServerParameters | StreamableHttpParameters
 
+ComponentKind: TypeAlias = Literal["prompts", "resources", "tools"]
+
+_COMPONENT_KINDS: tuple[ComponentKind, ...] = ("prompts", "resources", "tools")
+
+# The server notifications that invalidate one kind of aggregated component.
+_LIST_CHANGED_KINDS: dict[type[object], ComponentKind] = {
+    types.PromptListChangedNotification: "prompts",
+    types.ResourceListChangedNotification: "resources",
+    types.ToolListChangedNotification: "tools",
+}
+
+
+@dataclass(eq=False)
+class Replica:
+    """One member of a replica set, with the live load signals balancers choose by."""
+
+    session: mcp.ClientSession
+
+    in_flight: int = 0
+    """Tool calls currently outstanding on this replica."""
+
+    latency_ewma: float | None = None
+    """Exponentially weighted moving average of successful call latency, in seconds; `None` until measured."""
+
+    calls: int = 0
+    """Tool calls completed successfully on this replica."""
+
+
+class ReplicaBalancer(Protocol):
+    """Picks the replica that serves the next tool call; `replicas` is never empty."""
+
+    def choose(self, replicas: Sequence[Replica]) -> Replica: ...
+
+
+class RoundRobinBalancer:
+    """Cycles through the replicas in turn."""
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+
+    def choose(self, replicas: Sequence[Replica]) -> Replica:
+        return replicas[next(self._counter) % len(replicas)]
+
+
+class LeastInFlightBalancer:
+    """Sends each call to the replica with the fewest outstanding calls."""
+
+    def choose(self, replicas: Sequence[Replica]) -> Replica:
+        return min(replicas, key=lambda replica: (replica.in_flight, replica.calls))
+
+
+class LatencyEWMABalancer:
+    """Prefers the replica with the lowest latency EWMA, scaled by its outstanding calls.
+
+    Unmeasured replicas are tried first, so a newly joined replica gets probed
+    rather than starved.
+    """
+
+    def choose(self, replicas: Sequence[Replica]) -> Replica:
+        return min(
+            replicas,
+            key=lambda r: (r.latency_ewma is not None, (r.latency_ewma or 0.0) * (r.in_flight + 1)),
+        )
+
+
+@dataclass
+class HedgingPolicy:
+    """When to send a backup call to a second replica.
+
+    Only tools annotated `read_only_hint` or `idempotent_hint` are hedged,
+    and only when their replica set has more than one member. The backup is
+    sent once the first call has been outstanding for the tool's observed
+    `quantile` latency (or `initial_delay` until `min_samples` calls have
+    completed); whichever call succeeds first wins and the other is cancelled.
+    """
+
+    quantile: float = 0.95
+    initial_delay: float = 0.1
+    min_samples: int = 20
+    window: int = 256
+    """How many recent latencies per tool the quantile is computed over."""
+
+
+# Smoothing factor for `Replica.latency_ewma`: the weight of the newest sample.
+_EWMA_ALPHA = 0.2
+
 
 # Use dataclass instead of Pydantic BaseModel
 # because Pydantic BaseModel cannot handle Protocol fields.
@@ -86,17 +185,24 @@ class ClientSessionGroup:
     """Client for managing connections to multiple MCP servers.
 
     This class is responsible for encapsulating management of server connections.
-    It aggregates tools, resources, and prompts from all connected servers.
+    It aggregates tools, resources, and prompts from all connected servers,
+    and keeps that aggregate current: a `list_changed` notification from a
+    server the group connected re-lists just that server's components of
+    the changed kind.
 
     For auxiliary handlers, such as resource subscription, this is delegated to
     the client and can be accessed via the session.
 
+    Servers connected under the same `replica_set` name are treated as
+    interchangeable: the first contributes the catalog, and every tool call
+    for it is spread across all members by `balancer` (round-robin by
+    default), with optional `hedging` for read-only or idempotent tools.
+
     Example:
         ```python
         name_fn = lambda name, server_info: f"{(server_info.name)}_{name}"
         async with ClientSessionGroup(component_name_hook=name_fn) as group:
-            for server_param in server_params:
-                await group.connect_to_server(server_param)
+            await group.connect_all(server_params, timeout=10)
             ...
         ```
     """
@@ -115,9 +221,24 @@ class ClientSessionGroup:
 
     # Client-server connection management.
     _sessions: dict[mcp.ClientSession, _ComponentNames]
+    _server_infos: dict[mcp.ClientSession, types.Implementation]
     _tool_to_session: dict[str, mcp.ClientSession]
     _exit_stack: contextlib.AsyncExitStack
     _session_exit_stacks: dict[mcp.ClientSession, contextlib.AsyncExitStack]
+    # Hosts the per-connection tasks `connect_all` starts, while the group is entered.
+    _connection_task_group: anyio.abc.TaskGroup | None
+    # Serializes catalog refreshes so an older listing never overwrites a newer one.
+    _refresh_lock: anyio.Lock
+
+    # Replica sets: members by set name, and each member's set.
+    _replica_sets: dict[str, list[Replica]]
+    _session_replica_set: dict[mcp.ClientSession, str]
+    # Set while a replica set's first member aggregates its catalog; later members wait on it.
+    _replica_pending: dict[str, anyio.Event]
+    _balancer: ReplicaBalancer
+    _hedging: HedgingPolicy | None
+    # Recent successful call latencies per group tool name, for the hedging delay.
+    _tool_latencies: dict[str, deque[float]]
 
     # Optional fn consuming (component_name, server_info) for custom names.
     # This is to provide a means to mitigate naming conflicts across servers.
@@ -129,6 +250,9 @@ class ClientSessionGroup:
         self,
         exit_stack: contextlib.AsyncExitStack | None = None,
         component_name_hook: _ComponentNameHook | None = None,
+        *,
+        balancer: ReplicaBalancer | None = None,
+        hedging: HedgingPolicy | None = None,
     ) -> None:
         """Initializes the MCP client."""
 
@@ -137,6 +261,7 @@ class ClientSessionGroup:
         self._prompts = {}
 
         self._sessions = {}
+        self._server_infos = {}
         self._tool_to_session = {}
         if exit_stack is None:
             self._exit_stack = contextlib.AsyncExitStack()
@@ -145,12 +270,23 @@ class ClientSessionGroup:
             self._exit_stack = exit_stack
             self._owns_exit_stack = False
         self._session_exit_stacks = {}
+        self._connection_task_group = None
+        self._refresh_lock = anyio.Lock()
         self._component_name_hook = component_name_hook
-
-    async def __aenter__(self) -> Self:  # pragma: no cover
+        self._replica_sets = {}
+        self._session_replica_set = {}
+        self._replica_pending = {}
+        self._balancer = balancer or RoundRobinBalancer()
+        self._hedging = hedging
+        self._tool_latencies = {}
+
+    async def __aenter__(self) -> Self:
         # Enter the exit stack only if we created it ourselves
         if self._owns_exit_stack:
             await self._exit_stack.__aenter__()
+        # Hosts the connections `connect_all` opens, one task each.
+        self._connection_task_group = anyio.create_task_group()
+        await self._connection_task_group.__aenter__()
         return self
 
     async def __aexit__(
@@ -158,7 +294,7 @@ class ClientSessionGroup:
         _exc_type: type[BaseException] | None,
         _exc_val: BaseException | None,
         _exc_tb: TracebackType | None,
-    ) -> bool | None:  # pragma: no cover
+    ) -> bool | None:
         """Closes session exit stacks and main exit stack upon completion."""
 
         # Only close the main exit stack if we created it
@@ -170,10 +306,21 @@ class ClientSessionGroup:
             for exit_stack in self._session_exit_stacks.values():
                 tg.start_soon(exit_stack.aclose)
 
+        # Every connection task has stopped with its session stack; join them.
+        if self._connection_task_group is not None:  # pragma: no branch
+            task_group, self._connection_task_group = self._connection_task_group, None
+            await task_group.__aexit__(None, None, None)
+
     @property
     def sessions(self) -> list[mcp.ClientSession]:
-        """Returns the list of sessions being managed."""
-        return list(self._sessions.keys())  # pragma: no cover
+        """Returns the list of sessions being managed, replicas included."""
+        replicas = [r.session for members in self._replica_sets.values() for r in members]
+        return [*self._sessions, *(session for session in replicas if session not in self._sessions)]
+
+    @property
+    def replica_sets(self) -> dict[str, list[Replica]]:
+        """Returns each replica set's members, with their load signals."""
+        return {name: list(members) for name, members in self._replica_sets.items()}
 
     @property
     def prompts(self) -> dict[str, types.Prompt]:
@@ -232,37 +379,138 @@ class ClientSessionGroup:
     ) -> types.CallToolResult | types.InputRequiredResult:
         """Executes a tool given its name and arguments.
 
+        A tool served by a replica set runs on the replica the balancer
+        picks, hedged onto a second one when `hedging` allows it.
+
         Raises:
             RuntimeError: If the server returns an `InputRequiredResult` and
                 ``allow_input_required`` is ``False``.
         """
         session = self._tool_to_session[name]
-        session_tool_name = self.tools[name].name
-        return await session.call_tool(
-            session_tool_name,
-            arguments=arguments,
-            read_timeout_seconds=read_timeout_seconds,
-            progress_callback=progress_callback,
-            input_responses=input_responses,
-            request_state=request_state,
-            meta=meta,
-            allow_input_required=allow_input_required,
-        )
+        tool = self.tools[name]
+
+        async def call(target: mcp.ClientSession) -> types.CallToolResult | types.InputRequiredResult:
+            return await target.call_tool(
+                tool.name,
+                arguments=arguments,
+                read_timeout_seconds=read_timeout_seconds,
+                progress_callback=progress_callback,
+                input_responses=input_responses,
+                request_state=request_state,
+                meta=meta,
+                allow_input_required=allow_input_required,
+            )
+
+        replica_set = self._session_replica_set.get(session)
+        if replica_set is None:
+            return await call(session)
+        replicas = self._replica_sets[replica_set]
+        annotations = tool.annotations
+        if (
+            self._hedging is not None
+            and len(replicas) > 1
+            and annotations is not None
+            and (annotations.read_only_hint or annotations.idempotent_hint)
+            # A multi-round-trip continuation is bound to the round it answers; never duplicate it.
+            and input_responses is None
+            and request_state is None
+        ):
+            return await self._hedged_call(name, replicas, self._hedging, call)
+        return await self._call_replica(name, self._balancer.choose(replicas), call)
+
+    async def _call_replica(
+        self,
+        name: str,
+        replica: Replica,
+        call: Callable[[mcp.ClientSession], Awaitable[types.CallToolResult | types.InputRequiredResult]],
+    ) -> types.CallToolResult | types.InputRequiredResult:
+        """Run one call on `replica`, keeping its load signals current."""
+        replica.in_flight += 1
+        started = anyio.current_time()
+        try:
+            result = await call(replica.session)
+        finally:
+            replica.in_flight -= 1
+        latency = anyio.current_time() - started
+        replica.calls += 1
+        previous = replica.latency_ewma
+        replica.latency_ewma = latency if previous is None else previous + _EWMA_ALPHA * (latency - previous)
+        if self._hedging is not None:
+            samples = self._tool_latencies.get(name)
+            if samples is None:
+                samples = self._tool_latencies[name] = deque(maxlen=self._hedging.window)
+            samples.append(latency)
+        return result
+
+    async def _hedged_call(
+        self,
+        name: str,
+        replicas: Sequence[Replica],
+        hedging: HedgingPolicy,
+        call: Callable[[mcp.ClientSession], Awaitable[types.CallToolResult | types.InputRequiredResult]],
+    ) -> types.CallToolResult | types.InputRequiredResult:
+        """First success wins across a primary call and, if it is slow, one backup on another replica."""
+        primary = self._balancer.choose(replicas)
+        results: list[types.CallToolResult | types.InputRequiredResult] = []
+        failures: list[Exception] = []
+        launched = 1
+        settled = anyio.Event()
+
+        async def attempt(replica: Replica) -> None:
+            try:
+                results.append(await self._call_replica(name, replica, call))
+            except Exception as exc:
+                failures.append(exc)
+                if len(failures) < launched:
+                    return
+            settled.set()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(attempt, primary)
+            with anyio.move_on_after(self._hedge_delay(name, hedging)):
+                await settled.wait()
+            if not settled.is_set():
+                launched = 2
+                tg.start_soon(attempt, self._balancer.choose([r for r in replicas if r is not primary]))
+                await settled.wait()
+            tg.cancel_scope.cancel()
+        if results:
+            return results[0]
+        raise failures[0]
+
+    def _hedge_delay(self, name: str, hedging: HedgingPolicy) -> float:
+        samples = self._tool_latencies.get(name)
+        if samples is None or len(samples) < hedging.min_samples:
+            return hedging.initial_delay
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, math.ceil(hedging.quantile * len(ordered)) - 1)]
 
     async def disconnect_from_server(self, session: mcp.ClientSession) -> None:
         """Disconnects from a single MCP server."""
 
         session_known_for_components = session in self._sessions
         session_known_for_stack = session in self._session_exit_stacks
+        replica_set = self._session_replica_set.pop(session, None)
 
-        if not session_known_for_components and not session_known_for_stack:
+        if not session_known_for_components and not session_known_for_stack and replica_set is None:
             raise MCPError(
                 code=types.INVALID_PARAMS,
                 message="Provided session is not managed or already disconnected.",
             )
 
-        if session_known_for_components:  # pragma: no branch
+        if replica_set is not None:
+            members = self._replica_sets[replica_set]
+            members[:] = [r for r in members if r.session is not session]
+            if not members:
+                del self._replica_sets[replica_set]
+            elif session_known_for_components:
+                # The departing member contributed the catalog; hand it to a survivor.
+                self._adopt_catalog(session, members[0].session)
+                session_known_for_components = False
+
+        if session_known_for_components:
             component_names = self._sessions.pop(session)  # Pop from _sessions tracking
+            self._server_infos.pop(session, None)
 
             # Remove prompts associated with the session.
             for name in component_names.prompts:
@@ -281,24 +529,158 @@ class ClientSessionGroup:
 
         # Clean up the session's resources via its dedicated exit stack
         if session_known_for_stack:
-            session_stack_to_close = self._session_exit_stacks.pop(session)  # pragma: no cover
-            await session_stack_to_close.aclose()  # pragma: no cover
+            session_stack_to_close = self._session_exit_stacks.pop(session)
+            await session_stack_to_close.aclose()
 
     async def connect_with_session(
-        self, server_info: types.Implementation, session: mcp.ClientSession
+        self, server_info: types.Implementation, session: mcp.ClientSession, *, replica_set: str | None = None
     ) -> mcp.ClientSession:
-        """Connects to a single MCP server."""
-        await self._aggregate_components(server_info, session)
+        """Connects to a single MCP server.
+
+        With `replica_set`, the session joins that set: the first member's
+        components are aggregated, and later members only add capacity.
+        """
+        if replica_set is None:
+            await self._aggregate_components(server_info, session)
+        else:
+            await self._join_replica_set(server_info, session, replica_set)
         return session
 
     async def connect_to_server(
         self,
         server_params: ServerParameters,
         session_params: ClientSessionParameters | None = None,
+        *,
+        replica_set: str | None = None,
     ) -> mcp.ClientSession:
         """Connects to a single MCP server."""
         server_info, session = await self._establish_session(server_params, session_params or ClientSessionParameters())
-        return await self.connect_with_session(server_info, session)
+        return await self.connect_with_session(server_info, session, replica_set=replica_set)
+
+    async def connect_all(
+        self,
+        servers: Sequence[ServerParameters],
+        session_params: ClientSessionParameters | None = None,
+        *,
+        timeout: float | None = 30.0,
+        replica_set: str | None = None,
+    ) -> list[mcp.ClientSession | Exception]:
+        """Connects to many MCP servers concurrently.
+
+        Every handshake runs at once, each bounded by `timeout` seconds, so a
+        cold start costs the slowest server rather than the sum of all of
+        them. Each connection lives in its own task on the group, which
+        closes it on exit or `disconnect_from_server`; the group must be
+        entered with `async with` first.
+
+        Returns:
+            One entry per server, in order: its session, or the exception
+            that kept it out of the group (a failed or timed-out handshake,
+            or components whose names clash with the group's). A failure
+            never disturbs the other servers. With `replica_set`, every
+            server joins that one set.
+        """
+        connections = self._connection_task_group
+        if connections is None:
+            raise RuntimeError("connect_all requires the ClientSessionGroup to be entered with `async with`")
+        params = session_params or ClientSessionParameters()
+        results: dict[int, mcp.ClientSession | Exception] = {}
+
+        async def connect(index: int, server_params: ServerParameters) -> None:
+            try:
+                # Cancelling `start` also cancels the half-open connection task.
+                with anyio.fail_after(timeout):
+                    server_info, session = await connections.start(self._run_session, server_params, params)
+            except Exception as exc:
+                results[index] = exc
+                return
+            try:
+                results[index] = await self.connect_with_session(server_info, session, replica_set=replica_set)
+            except Exception as exc:
+                await self.disconnect_from_server(session)
+                results[index] = exc
+
+        async with anyio.create_task_group() as tg:
+            for index, server_params in enumerate(servers):
+                tg.start_soon(connect, index, server_params)
+        return [results[index] for index in range(len(servers))]
+
+    async def refresh_components(self, session: mcp.ClientSession, *kinds: ComponentKind) -> None:
+        """Re-lists a connected server's components and updates the aggregate in place.
+
+        Only the named kinds (all three when none are given) are replaced, and
+        only this server's entries change. The group does this itself on
+        `list_changed` for sessions it opened; call it for sessions added with
+        `connect_with_session`.
+
+        Raises:
+            MCPError: If the session is not managed, a list call fails, or a
+                re-listed name clashes with another server's; the aggregate
+                is then unchanged.
+        """
+        if session not in self._sessions:
+            raise MCPError(
+                code=types.INVALID_PARAMS,
+                message="Provided session is not managed or already disconnected.",
+            )
+        server_info = self._server_infos[session]
+        async with self._refresh_lock:
+            fetched = await self._fetch_all(session, server_info, kinds or _COMPONENT_KINDS)
+            owned = self._sessions.get(session)
+            if owned is None:  # pragma: no cover
+                return  # Disconnected while listing.
+            for kind, components in fetched.items():
+                matching = (components.keys() & self._registry(kind).keys()) - getattr(owned, kind)
+                if matching:
+                    raise MCPError(code=types.INVALID_PARAMS, message=f"{matching} already exist in group {kind}.")
+            for kind, components in fetched.items():
+                registry = self._registry(kind)
+                for name in getattr(owned, kind):
+                    del registry[name]
+                    if kind == "tools":
+                        del self._tool_to_session[name]
+                registry.update(components)
+                if kind == "tools":
+                    self._tool_to_session.update(dict.fromkeys(components, session))
+                setattr(owned, kind, set(components))
+
+    async def _run_session(
+        self,
+        server_params: ServerParameters,
+        session_params: ClientSessionParameters,
+        *,
+        task_status: anyio.abc.TaskStatus[tuple[types.Implementation, mcp.ClientSession]] = anyio.TASK_STATUS_IGNORED,
+    ) -> None:
+        """Own one `connect_all` connection for its lifetime.
+
+        A transport's task groups must be exited by the task that entered
+        them, so the session stays open in this task until its handle (the
+        exit stack the group closes on disconnect or exit) asks it to stop.
+        """
+        stop = anyio.Event()
+        stopped = anyio.Event()
+
+        async def close() -> None:
+            stop.set()
+            await stopped.wait()
+
+        started = False
+        try:
+            async with contextlib.AsyncExitStack() as session_stack:
+                server_info, session = await self._open_session(session_stack, server_params, session_params)
+                handle = contextlib.AsyncExitStack()
+                handle.push_async_callback(close)
+                self._session_exit_stacks[session] = handle
+                started = True
+                task_status.started((server_info, session))
+                await stop.wait()
+        except Exception:
+            if not started:
+                raise
+            # The connection failed after joining the group; never take the group down with it.
+            logging.exception("MCP server connection closed with an error")
+        finally:
+            stopped.set()
 
     async def _establish_session(
         self,
@@ -309,50 +691,7 @@ class ClientSessionGroup:
 
         session_stack = contextlib.AsyncExitStack()
         try:
-            # Create read and write streams that facilitate io with the server.
-            if isinstance(server_params, StdioServerParameters):
-                client = mcp.stdio_client(server_params)
-                read, write = await session_stack.enter_async_context(client)
-            elif isinstance(server_params, SseServerParameters):
-                client = sse_client(
-                    url=server_params.url,
-                    headers=server_params.headers,
-                    timeout=server_params.timeout,
-                    sse_read_timeout=server_params.sse_read_timeout,
-                )
-                read, write = await session_stack.enter_async_context(client)
-            else:
-                httpx_client = create_mcp_http_client(
-                    headers=server_params.headers,
-                    timeout=httpx2.Timeout(
-                        server_params.timeout,
-                        read=server_params.sse_read_timeout,
-                    ),
-                )
-                await session_stack.enter_async_context(httpx_client)
-
-                client = streamable_http_client(
-                    url=server_params.url,
-                    http_client=httpx_client,
-                    terminate_on_close=server_params.terminate_on_close,
-                )
-                read, write = await session_stack.enter_async_context(client)
-
-            session = await session_stack.enter_async_context(
-                mcp.ClientSession(
-                    read,
-                    write,
-                    read_timeout_seconds=session_params.read_timeout_seconds,
-                    sampling_callback=session_params.sampling_callback,
-                    elicitation_callback=session_params.elicitation_callback,
-                    list_roots_callback=session_params.list_roots_callback,
-                    logging_callback=session_params.logging_callback,
-                    message_handler=session_params.message_handler,
-                    client_info=session_params.client_info,
-                )
-            )
-
-            result = await session.initialize()
+            server_info, session = await self._open_session(session_stack, server_params, session_params)
 
             # Session successfully initialized.
             # Store its stack and register the stack with the main group stack.
@@ -361,87 +700,209 @@ class ClientSessionGroup:
             # main _exit_stack.
             await self._exit_stack.enter_async_context(session_stack)
 
-            return result.server_info, session
+            return server_info, session
         except Exception:  # pragma: no cover
             # If anything during this setup fails, ensure the session-specific
             # stack is closed.
             await session_stack.aclose()
             raise
 
+    async def _open_session(
+        self,
+        session_stack: contextlib.AsyncExitStack,
+        server_params: ServerParameters,
+        session_params: ClientSessionParameters,
+    ) -> tuple[types.Implementation, mcp.ClientSession]:
+        """Open the transport and an initialized session on `session_stack`."""
+
+        # Create read and write streams that facilitate io with the server.
+        if isinstance(server_params, StdioServerParameters):
+            client = mcp.stdio_client(server_params)
+            read, write = await session_stack.enter_async_context(client)
+        elif isinstance(server_params, SseServerParameters):
+            client = sse_client(
+                url=server_params.url,
+                headers=server_params.headers,
+                timeout=server_params.timeout,
+                sse_read_timeout=server_params.sse_read_timeout,
+            )
+            read, write = await session_stack.enter_async_context(client)
+        else:
+            httpx_client = create_mcp_http_client(
+                headers=server_params.headers,
+                timeout=httpx2.Timeout(
+                    server_params.timeout,
+                    read=server_params.sse_read_timeout,
+                ),
+            )
+            await session_stack.enter_async_context(httpx_client)
+
+            client = streamable_http_client(
+                url=server_params.url,
+                http_client=httpx_client,
+                terminate_on_close=server_params.terminate_on_close,
+            )
+            read, write = await session_stack.enter_async_context(client)
+
+        session = await session_stack.enter_async_context(
+            mcp.ClientSession(
+                read,
+                write,
+                read_timeout_seconds=session_params.read_timeout_seconds,
+                sampling_callback=session_params.sampling_callback,
+                elicitation_callback=session_params.elicitation_callback,
+                list_roots_callback=session_params.list_roots_callback,
+                logging_callback=session_params.logging_callback,
+                message_handler=self._catalog_message_handler(lambda: session, session_params.message_handler),
+                client_info=session_params.client_info,
+            )
+        )
+
+        result = await session.initialize()
+        return result.server_info, session
+
+    def _catalog_message_handler(
+        self, get_session: Callable[[], mcp.ClientSession], user_handler: MessageHandlerFnT | None
+    ) -> MessageHandlerFnT:
+        """Wrap `user_handler` so `list_changed` notifications refresh the session's catalog first.
+
+        The session is read lazily: it is only bound once constructed, and
+        notifications only flow once it is.
+        """
+
+        async def message_handler(message: IncomingMessage) -> None:
+            kind = _LIST_CHANGED_KINDS.get(type(message))
+            session = get_session()
+            if kind is not None and session in self._sessions:
+                try:
+                    await self.refresh_components(session, kind)
+                except MCPError as err:
+                    logging.warning(f"Could not refresh {kind}: {err}")
+            if user_handler is not None:
+                await user_handler(message)
+
+        return message_handler
+
+    async def _join_replica_set(self, server_info: types.Implementation, session: mcp.ClientSession, name: str) -> None:
+        """Add `session` to replica set `name`, aggregating its catalog if it is the first member."""
+        while (pending := self._replica_pending.get(name)) is not None:
+            await pending.wait()
+        members = self._replica_sets.get(name)
+        if members is not None:
+            members.append(Replica(session))
+            self._session_replica_set[session] = name
+            return
+        # First member: later joiners wait, and try in turn if this aggregation fails.
+        pending = self._replica_pending[name] = anyio.Event()
+        try:
+            await self._aggregate_components(server_info, session)
+            self._replica_sets[name] = [Replica(session)]
+            self._session_replica_set[session] = name
+        finally:
+            del self._replica_pending[name]
+            pending.set()
+
+    def _adopt_catalog(self, old: mcp.ClientSession, new: mcp.ClientSession) -> None:
+        """Move the components `old` contributed to `new`, a member of the same replica set."""
+        self._sessions[new] = self._sessions.pop(old)
+        self._server_infos[new] = self._server_infos.pop(old)
+        for name in self._sessions[new].tools:
+            self._tool_to_session[name] = new
+
     async def _aggregate_components(self, server_info: types.Implementation, session: mcp.ClientSession) -> None:
         """Aggregates prompts, resources, and tools from a given session."""
 
+        # Temporary components dicts, listed concurrently. We do not want to
+        # modify the aggregate lists in case of an intermediate failure.
+        # A kind the server cannot list counts as empty here, so it still joins.
+        fetched = await self._fetch_all(session, server_info, _COMPONENT_KINDS, tolerate_errors=True)
+
+        # Check for duplicates.
+        for kind in _COMPONENT_KINDS:
+            matching = fetched[kind].keys() & self._registry(kind).keys()
+            if matching:
+                raise MCPError(code=types.INVALID_PARAMS, message=f"{matching} already exist in group {kind}.")
+
         # Create a reverse index so we can find all prompts, resources, and
         # tools belonging to this session. Used for removing components from
         # the session group via self.disconnect_from_server.
-        component_names = self._ComponentNames()
+        self._sessions[session] = self._ComponentNames(
+            prompts=set(fetched["prompts"]),
+            resources=set(fetched["resources"]),
+            tools=set(fetched["tools"]),
+        )
+        self._server_infos[session] = server_info
 
-        # Temporary components dicts. We do not want to modify the aggregate
-        # lists in case of an intermediate failure.
-        prompts_temp: dict[str, types.Prompt] = {}
-        resources_temp: dict[str, types.Resource] = {}
-        tools_temp: dict[str, types.Tool] = {}
-        tool_to_session_temp: dict[str, mcp.ClientSession] = {}
+        # Aggregate components.
+        self._prompts.update(fetched["prompts"])
+        self._resources.update(fetched["resources"])
+        self._tools.update(fetched["tools"])
+        self._tool_to_session.update(dict.fromkeys(fetched["tools"], session))
 
-        # Query the server for its prompts and aggregate to list.
-        try:
-            prompts = (await session.list_prompts()).prompts
-            for prompt in prompts:
-                name = self._component_name(prompt.name, server_info)
-                prompts_temp[name] = prompt
-                component_names.prompts.add(name)
-        except MCPError as err:  # pragma: no cover
-            logging.warning(f"Could not fetch prompts: {err}")
-
-        # Query the server for its resources and aggregate to list.
-        try:
-            resources = (await session.list_resources()).resources
-            for resource in resources:
-                name = self._component_name(resource.name, server_info)
-                resources_temp[name] = resource
-                component_names.resources.add(name)
-        except MCPError as err:  # pragma: no cover
-            logging.warning(f"Could not fetch resources: {err}")
-
-        # Query the server for its tools and aggregate to list.
-        try:
-            tools = (await session.list_tools()).tools
-            for tool in tools:
-                name = self._component_name(tool.name, server_info)
-                tools_temp[name] = tool
-                tool_to_session_temp[name] = session
-                component_names.tools.add(name)
-        except MCPError as err:  # pragma: no cover
-            logging.warning(f"Could not fetch tools: {err}")
-
-        # Clean up exit stack for session if we couldn't retrieve anything
-        # from the server.
-        if not any((prompts_temp, resources_temp, tools_temp)):
-            del self._session_exit_stacks[session]  # pragma: no cover
+    async def _fetch_all(
+        self,
+        session: mcp.ClientSession,
+        server_info: types.Implementation,
+        kinds: Sequence[ComponentKind],
+        *,
+        tolerate_errors: bool = False,
+    ) -> dict[ComponentKind, dict[str, Any]]:
+        """List several component kinds from one session concurrently.
 
-        # Check for duplicates.
-        matching_prompts = prompts_temp.keys() & self._prompts.keys()
-        if matching_prompts:
-            raise MCPError(  # pragma: no cover
-                code=types.INVALID_PARAMS,
-                message=f"{matching_prompts} already exist in group prompts.",
-            )
-        matching_resources = resources_temp.keys() & self._resources.keys()
-        if matching_resources:
-            raise MCPError(  # pragma: no cover
-                code=types.INVALID_PARAMS,
-                message=f"{matching_resources} already exist in group resources.",
-            )
-        matching_tools = tools_temp.keys() & self._tools.keys()
-        if matching_tools:
-            raise MCPError(code=types.INVALID_PARAMS, message=f"{matching_tools} already exist in group tools.")
+        Raises:
+            MCPError: The first list call that failed, unless `tolerate_errors`.
+        """
+        fetched: dict[ComponentKind, dict[str, Any]] = {}
+        errors: list[MCPError] = []
 
-        # Aggregate components.
-        self._sessions[session] = component_names
-        self._prompts.update(prompts_temp)
-        self._resources.update(resources_temp)
-        self._tools.update(tools_temp)
-        self._tool_to_session.update(tool_to_session_temp)
+        async def fetch(kind: ComponentKind) -> None:
+            try:
+                fetched[kind] = await self._fetch_components(
+                    session, server_info, kind, tolerate_errors=tolerate_errors
+                )
+            except MCPError as err:
+                errors.append(err)  # Raised bare below rather than in the task group's ExceptionGroup.
+
+        async with anyio.create_task_group() as tg:
+            for kind in kinds:
+                tg.start_soon(fetch, kind)
+        if errors:
+            raise errors[0]
+        return fetched
+
+    async def _fetch_components(
+        self,
+        session: mcp.ClientSession,
+        server_info: types.Implementation,
+        kind: ComponentKind,
+        *,
+        tolerate_errors: bool = False,
+    ) -> dict[str, Any]:
+        """Query the server for one kind of component, keyed by group name.
+
+        A failed list raises, unless `tolerate_errors` makes it count as empty.
+        """
+        items: Sequence[types.Prompt | types.Resource | types.Tool]
+        try:
+            if kind == "prompts":
+                items = (await session.list_prompts()).prompts
+            elif kind == "resources":
+                items = (await session.list_resources()).resources
+            else:
+                items = (await session.list_tools()).tools
+        except MCPError as err:
+            if not tolerate_errors:
+                raise
+            logging.warning(f"Could not fetch {kind}: {err}")
+            return {}
+        return {self._component_name(item.name, server_info): item for item in items}
+
+    def _registry(self, kind: ComponentKind) -> dict[str, Any]:
+        if kind == "prompts":
+            return self._prompts
+        if kind == "resources":
+            return self._resources
+        return self._tools
 
     def _component_name(self, name: str, server_info: types.Implementation) -> str:
         if self._component_name_hook:
@@ -6,13 +6,13 @@ from urllib.parse import parse_qs, urljoin, urlparse
 
 import anyio
 import httpx2
-import mcp_types as types
 from anyio.abc import TaskStatus
 from httpx2 import SSEError
 
 from mcp.shared._compat import resync_tracer
 from mcp.shared._context_streams import create_context_streams
 from mcp.shared._httpx_utils import McpHttpClientFactory, create_mcp_http_client
+from mcp.shared._json import decode_message
 from mcp.shared.message import SessionMessage
 
 logger = logging.getLogger(__name__)
@@ -95,7 +95,7 @@ async def sse_client(
                                 if not sse.data:
                                     continue
                                 try:
-                                    message = types.jsonrpc_message_adapter.validate_json(sse.data, by_name=False)
+                                    message = decode_message(sse.data)
                                     logger.debug(f"Received server message: {message}")
                                 except Exception as exc:  # pragma: no cover
                                     logger.exception("Error parsing server message")  # pragma: no cover
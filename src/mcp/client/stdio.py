@@ -18,7 +18,6 @@ from typing import Literal, TextIO
 
 import anyio
 import anyio.lowlevel
-import mcp_types as types
 from anyio.abc import AsyncResource, Process
 from anyio.streams.text import TextReceiveStream
 from pydantic import BaseModel, Field
@@ -32,6 +31,7 @@ from mcp.os.win32.utilities import (
     get_windows_executable_command,
     terminate_windows_process_tree,
 )
+from mcp.shared._json import decode_message, encode_message
 from mcp.shared.message import SessionMessage
 
 logger = logging.getLogger(__name__)
@@ -171,7 +171,7 @@ async def stdio_client(
         try:
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
-                    json = session_message.message.model_dump_json(by_alias=True, exclude_unset=True)
+                    json = encode_message(session_message.message).decode()
                     data = (json + "\n").encode(encoding=server.encoding, errors=server.encoding_error_handler)
                     await process.stdin.send(data)
         except (anyio.ClosedResourceError, anyio.BrokenResourceError, OSError):
@@ -218,7 +218,7 @@ async def stdio_client(
 def _parse_line(line: str) -> SessionMessage | Exception:
     """Parses one stdout line, returning parse errors as values for the session to surface."""
     try:
-        message = types.jsonrpc_message_adapter.validate_json(line, by_name=False)
+        message = decode_message(line)
     except ValueError as exc:
         logger.exception("Failed to parse JSONRPC message from server")
         return exc
@@ -25,7 +25,6 @@ from mcp_types import (
     JSONRPCRequest,
     JSONRPCResponse,
     RequestId,
-    jsonrpc_message_adapter,
 )
 from mcp_types.version import MODERN_PROTOCOL_VERSIONS
 from pydantic import ValidationError
@@ -34,6 +33,7 @@ from mcp.client._transport import TransportStreams
 from mcp.shared._compat import resync_tracer
 from mcp.shared._context_streams import ContextReceiveStream, ContextSendStream, create_context_streams
 from mcp.shared._httpx_utils import create_mcp_http_client
+from mcp.shared._json import decode_message
 from mcp.shared.inbound import MCP_PROTOCOL_VERSION_HEADER
 from mcp.shared.jsonrpc_dispatcher import cancelled_request_id_from_params
 from mcp.shared.message import ClientMessageMetadata, SessionMessage
@@ -161,7 +161,7 @@ class StreamableHTTPTransport:
                     await resumption_callback(sse.id)
                 return False
             try:
-                message = jsonrpc_message_adapter.validate_json(sse.data, by_name=False)
+                message = decode_message(sse.data)
                 logger.debug(f"SSE message: {message}")
 
                 # If this is a response and we have original_request_id, replace it
@@ -348,7 +348,7 @@ class StreamableHTTPTransport:
                     if response.headers.get("content-type", "").lower().startswith("application/json"):
                         try:
                             body = await response.aread()
-                            parsed = jsonrpc_message_adapter.validate_json(body, by_name=False)
+                            parsed = decode_message(body)
                             if isinstance(parsed, JSONRPCError):
                                 # The server may have set `id: null` (request rejected before its
                                 # id was parsed); use this request's id so correlation works.
@@ -399,7 +399,7 @@ class StreamableHTTPTransport:
         """Handle JSON response from the server."""
         try:
             content = await response.aread()
-            message = jsonrpc_message_adapter.validate_json(content, by_name=False)
+            message = decode_message(content)
             session_message = SessionMessage(message)
             await read_stream_writer.send(session_message)
         except (httpx2.StreamError, ValidationError) as exc:
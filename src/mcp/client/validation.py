@@ -0,0 +1,56 @@
+"""How often the client checks structured tool results against their output schemas."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal
+
+__all__ = ["OutputValidation", "OutputValidationMode"]
+
+OutputValidationMode = Literal["always", "sampled", "first", "off"]
+"""`"always"` checks every result, `"sampled"` a random `sample_rate` share of them,
+`"first"` the first `first_n` results of each tool, and `"off"` none."""
+
+
+@dataclass(frozen=True, slots=True)
+class OutputValidation:
+    """Client-side output-schema validation policy for `tools/call` results.
+
+    Validation is the client's defense against a server returning structured
+    content that breaks its own declared schema. Against a trusted server at
+    high call volume that check is mostly overhead; the cheaper modes keep some
+    of the signal for a fraction of the cost. A result that is not checked is
+    also never the reason for a `tools/list` refresh of an unknown tool.
+
+    Raises:
+        ValueError: If `sample_rate` is outside (0, 1] or `first_n` is below 1.
+    """
+
+    mode: OutputValidationMode = "always"
+
+    sample_rate: float = 0.1
+    """Share of results checked in `"sampled"` mode."""
+
+    first_n: int = 100
+    """Results checked per tool in `"first"` mode; the count restarts when the tool's schema changes."""
+
+    rng: Callable[[], float] = random.random
+    """Uniform source in [0, 1) for `"sampled"` mode; injectable for tests."""
+
+    def __post_init__(self) -> None:
+        if not 0 < self.sample_rate <= 1:
+            raise ValueError(f"sample_rate must be in (0, 1], got {self.sample_rate}")
+        if self.first_n < 1:
+            raise ValueError(f"first_n must be >= 1, got {self.first_n}")
+
+    def checks(self, validated: int) -> bool:
+        """Whether to check the next result of a tool that has had `validated` results checked so far."""
+        if self.mode == "always":
+            return True
+        if self.mode == "sampled":
+            return self.rng() < self.sample_rate
+        if self.mode == "first":
+            return validated < self.first_n
+        return False
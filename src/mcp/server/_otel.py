@@ -7,12 +7,16 @@ from opentelemetry.trace import SpanKind, StatusCode
 from pydantic import ValidationError
 
 from mcp.server.context import CallNext, HandlerResult, ServerMiddleware, ServerRequestContext
+from mcp.shared import _metrics
 from mcp.shared._otel import extract_trace_context, otel_span
 from mcp.shared.exceptions import MCPError
 
 
 class OpenTelemetryMiddleware(ServerMiddleware[Any]):
-    """Context-tier middleware that wraps each inbound message in an OpenTelemetry span."""
+    """Context-tier middleware that wraps each inbound message in an OpenTelemetry span.
+
+    It also records the message's handling time on `mcp.server.operation.duration`.
+    """
 
     async def __call__(self, ctx: ServerRequestContext[Any, Any], call_next: CallNext) -> HandlerResult:
         name = ctx.params.get("name") if ctx.params else None
@@ -32,14 +36,19 @@ class OpenTelemetryMiddleware(ServerMiddleware[Any]):
         elif ctx.method == "prompts/get" and target is not None:
             attributes["gen_ai.prompt.name"] = target
 
-        with otel_span(
-            name=f"{ctx.method}{f' {target}' if target else ''}",
-            kind=SpanKind.SERVER,
-            attributes=attributes,
-            context=extract_trace_context(ctx.meta),
-            record_exception=False,
-            set_status_on_exception=False,
-        ) as span:
+        with (
+            otel_span(
+                name=f"{ctx.method}{f' {target}' if target else ''}",
+                kind=SpanKind.SERVER,
+                attributes=attributes,
+                context=extract_trace_context(ctx.meta),
+                record_exception=False,
+                set_status_on_exception=False,
+            ) as span,
+            _metrics.Duration(
+                _metrics.server_operation_duration, _metrics.operation_attributes(ctx.method, ctx.params)
+            ) as measured,
+        ):
             try:
                 result = await call_next(ctx)
             except MCPError as e:
@@ -52,6 +61,7 @@ class OpenTelemetryMiddleware(ServerMiddleware[Any]):
                 code = str(INVALID_PARAMS)
                 span.set_attributes({"error.type": code, "rpc.response.status_code": code})
                 span.set_status(StatusCode.ERROR, "Invalid request parameters")
+                measured["error.type"] = code
                 raise
             except Exception as e:
                 span.set_attribute("error.type", type(e).__qualname__)
@@ -67,6 +77,7 @@ class OpenTelemetryMiddleware(ServerMiddleware[Any]):
                     case CallToolResult(is_error=True) | {"isError": True}:
                         span.set_attribute("error.type", "tool_error")
                         span.set_status(StatusCode.ERROR)
+                        measured["error.type"] = "tool_error"
                     case _:
                         pass
             return result
@@ -0,0 +1,40 @@
+"""Server-Sent Events framing shared by the streamable-HTTP transports.
+
+Private module. Frames are built as bytes around JSON that
+`mcp.shared._json.encode_message` has already serialised to bytes, so a
+message is encoded exactly once on its way to the socket: sse-starlette hands
+`bytes` items to the ASGI `send` untouched, and the 2026-07-28 path sends
+them itself.
+
+Field order and separators match `sse_starlette.ServerSentEvent.encode`
+(`id`, `event`, `data`, `retry`, then a blank line, all `\\r\\n`), so the
+wire is byte-for-byte what the dict events it replaces produced.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Final
+
+_SEP: Final = b"\r\n"
+_LINE_BREAK: Final = re.compile(r"\r\n|\r|\n")
+
+
+def frame(
+    data: bytes, *, event_id: str | None = None, event: bytes | None = b"message", retry: int | None = None
+) -> bytes:
+    """One SSE event around a single line of `data`.
+
+    `data` must not contain a line break; compact JSON never does. Line
+    breaks are stripped from `event_id`, as sse-starlette does.
+    """
+    parts: list[bytes] = []
+    if event_id is not None:
+        parts += (b"id: ", _LINE_BREAK.sub("", event_id).encode(), _SEP)
+    if event is not None:
+        parts += (b"event: ", event, _SEP)
+    parts += (b"data: ", data, _SEP)
+    if retry is not None:
+        parts += (b"retry: ", b"%d" % retry, _SEP)
+    parts.append(_SEP)
+    return b"".join(parts)
@@ -21,7 +21,6 @@ connection open behind a proxy idle-read timeout.
 
 from __future__ import annotations
 
-import json
 import logging
 from collections.abc import Awaitable, Mapping
 from dataclasses import dataclass, field
@@ -50,10 +49,13 @@ from starlette.requests import Request
 from starlette.responses import Response
 from starlette.types import Receive, Scope, Send
 
+from mcp.server._sse_frame import frame
 from mcp.server.connection import Connection
 from mcp.server.runner import modern_error_data, serve_one
 from mcp.server.streamable_http import check_accept_headers
 from mcp.server.transport_security import TransportSecurityMiddleware, TransportSecuritySettings
+from mcp.shared import _metrics
+from mcp.shared._json import dump_bytes, encode_message, loads
 from mcp.shared.dispatcher import CallOptions
 from mcp.shared.exceptions import NoBackChannelError
 from mcp.shared.inbound import (
@@ -160,9 +162,9 @@ def _sse_event(msg: JSONRPCResponse | JSONRPCError | JSONRPCNotification) -> byt
     SSE mode begins after the handler has emitted, so a `JSONRPCError` here
     always carries the request's id; the `id: null` case lives in `_write`.
     """
-    body = msg.model_dump(mode="json", by_alias=True, exclude_none=True)
-    data = json.dumps(body, separators=(",", ":"))
-    return f"event: message\r\ndata: {data}\r\n\r\n".encode()
+    event = frame(encode_message(msg, exclude_none=True))
+    _metrics.server_http_io.add(len(event), _metrics.IO_TRANSMIT)
+    return event
 
 
 async def _write_rejection(
@@ -194,11 +196,9 @@ async def _write(
         # JSON-RPC requires `id: null` to appear on the wire when the request
         # id couldn't be parsed; `exclude_none` would otherwise drop it.
         body["id"] = None
-    await Response(
-        json.dumps(body, separators=(",", ":")),
-        status_code=status,
-        media_type="application/json",
-    )(scope, receive, send)
+    response = Response(dump_bytes(body), status_code=status, media_type="application/json")
+    _metrics.server_http_io.add(len(response.body), _metrics.IO_TRANSMIT)
+    await response(scope, receive, send)
 
 
 _INVALID_BODY: Final = JSONRPCError(
@@ -398,10 +398,10 @@ async def handle_modern_request(
         return
 
     body = await request.body()
+    _metrics.server_http_io.add(len(body), _metrics.IO_RECEIVE)
     try:
-        decoded = json.loads(body)
-    except (ValueError, RecursionError):
-        # Not just JSONDecodeError: oversized integer literals raise bare ValueError, deep nesting RecursionError.
+        decoded = loads(body)
+    except ValueError:
         rej = JSONRPCError(jsonrpc="2.0", id=None, error=ErrorData(code=PARSE_ERROR, message="Parse error"))
         await _write(rej, scope, receive, send)
         return
@@ -445,17 +445,20 @@ async def handle_modern_request(
         verdict.client_info,
         verdict.client_capabilities,
     )
+    # A listen response IS a notification stream, so it always takes the SSE
+    # path below regardless of the JSON-response preference (the TypeScript
+    # and Go SDKs route it the same way).
+    single_body = json_response and req.method != "subscriptions/listen"
     dctx = _SingleExchangeDispatchContext(
-        transport=TransportContext(kind="streamable-http", can_send_request=False, headers=request.headers),
+        transport=TransportContext(
+            kind="streamable-http", can_send_request=False, can_notify=not single_body, headers=request.headers
+        ),
         request_id=req.id,
         message_metadata=ServerMessageMetadata(request_context=request),
         progress_token=progress_token_from_params(req.params),
     )
 
-    if json_response and req.method != "subscriptions/listen":
-        # A listen response IS a notification stream, so it always takes the
-        # SSE path below regardless of the JSON-response preference (the
-        # TypeScript and Go SDKs route it the same way).
+    if single_body:
         msg = await _to_jsonrpc_response(
             req.id, serve_one(app, dctx, req.method, req.params, connection=connection, lifespan_state=lifespan_state)
         )
@@ -1,4 +1,3 @@
-import json
 import time
 from typing import Any, TypedDict
 
@@ -8,6 +7,7 @@ from starlette.requests import HTTPConnection
 from starlette.types import Receive, Scope, Send
 
 from mcp.server.auth.provider import AccessToken, TokenVerifier, principal_components
+from mcp.shared._json import dump_bytes
 
 
 class AuthenticatedUser(SimpleUser):
@@ -121,7 +121,7 @@ class RequireAuthMiddleware:
 
         # Send response
         body = {"error": error, "error_description": description}
-        body_bytes = json.dumps(body).encode()
+        body_bytes = dump_bytes(body)
 
         await send(
             {
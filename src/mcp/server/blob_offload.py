@@ -0,0 +1,200 @@
+"""Serving large binary resource contents beside the streamable HTTP endpoint.
+
+`MCPServer(blob_offload=BlobOffload())` turns this on. A `resources/read`
+that opted in (`mcp.shared.blob_offload`) over streamable HTTP then gets each
+binary item of at least `BlobOffload.min_size` bytes as a `BlobRef` rather
+than as base64 text in the JSON result. The bytes wait in the server's
+`BlobStore` for `BlobOffload.ttl` seconds and are served raw, with `Range`
+support, at `<endpoint>/blobs/<token>` on the same app. That route sits
+behind the endpoint's own authentication and DNS-rebinding checks.
+
+A reference is bound to what minted it. The token is unguessable, the
+caller must be the same authenticated principal (or unauthenticated, when
+the read was), and a reference minted in a stateful session stops working
+when that session ends.
+"""
+
+from __future__ import annotations
+
+import re
+import secrets
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+from mcp.server.auth.middleware.bearer_auth import AuthenticatedUser
+from mcp.server.auth.provider import principal_components
+from mcp.server.streamable_http import MCP_SESSION_ID_HEADER
+from mcp.server.transport_security import TransportSecurityMiddleware, TransportSecuritySettings
+from mcp.shared.blob_offload import BlobRef
+
+__all__ = ["BlobEndpoint", "BlobOffload", "BlobStore"]
+
+_Principal = tuple[str, str | None, str | None]
+
+_RANGE = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+@dataclass(frozen=True, slots=True)
+class BlobOffload:
+    """Limits for the binary resource contents served by reference on streamable HTTP.
+
+    Raises:
+        ValueError: If `min_size` or `max_bytes` is below 1, or `ttl` is not positive.
+    """
+
+    min_size: int = 64 * 1024
+    """Smallest blob, in bytes, served by reference; smaller ones stay inline."""
+
+    ttl: float = 60.0
+    """Seconds a reference stays fetchable."""
+
+    max_bytes: int = 64 * 1024 * 1024
+    """Bytes held across all live references. The oldest are dropped to make room; a larger blob stays inline."""
+
+    clock: Callable[[], float] = time.monotonic
+    """Monotonic time source in seconds; injectable for tests."""
+
+    def __post_init__(self) -> None:
+        if self.min_size < 1:
+            raise ValueError(f"min_size must be >= 1, got {self.min_size}")
+        if self.ttl <= 0:
+            raise ValueError(f"ttl must be > 0 seconds, got {self.ttl}")
+        if self.max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {self.max_bytes}")
+
+
+def _principal(scope: Scope) -> _Principal | None:
+    """Who authenticated the request in `scope`, or `None` when nobody did."""
+    user = scope.get("user")
+    return principal_components(user.access_token) if isinstance(user, AuthenticatedUser) else None
+
+
+@dataclass(frozen=True, slots=True)
+class _Blob:
+    data: bytes
+    mime_type: str
+    expires: float
+    principal: _Principal | None
+    session_id: str | None
+
+
+class BlobStore:
+    """The offloaded blobs of one server, oldest first.
+
+    Mint references with `offload` from a `resources/read` handler; the
+    `BlobEndpoint` mounted by `streamable_http_app` serves them. Until it is
+    mounted, `offload` declines, so a server not on streamable HTTP keeps
+    every blob inline.
+    """
+
+    __slots__ = ("_limits", "_entries", "_held", "route_path")
+
+    def __init__(self, limits: BlobOffload | None = None) -> None:
+        self._limits = limits or BlobOffload()
+        self._entries: dict[str, _Blob] = {}
+        self._held = 0
+        self.route_path: str | None = None
+        """The path the `BlobEndpoint` is mounted at, relative to the app; set by `streamable_http_app`."""
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def offload(self, request: Any, data: bytes, mime_type: str) -> BlobRef | None:
+        """Hold `data` for the caller of `request` and return its reference.
+
+        Returns `None`, leaving the blob inline, when `request` is not an
+        HTTP request to this server's streamable HTTP endpoint or `data` is
+        outside the configured size bounds.
+        """
+        limits = self._limits
+        if self.route_path is None or not isinstance(request, Request):
+            return None
+        if not limits.min_size <= len(data) <= limits.max_bytes:
+            return None
+        now = limits.clock()
+        self._evict(now, room=len(data))
+        token = secrets.token_urlsafe(32)
+        self._entries[token] = _Blob(
+            data=data,
+            mime_type=mime_type,
+            expires=now + limits.ttl,
+            principal=_principal(request.scope),
+            session_id=request.headers.get(MCP_SESSION_ID_HEADER),
+        )
+        self._held += len(data)
+        # The endpoint's route shares this request's path, so the blob's URL
+        # extends it (mount prefixes included) rather than being rebuilt.
+        return BlobRef(url=f"{request.url.path.rstrip('/')}/blobs/{token}", size=len(data))
+
+    def get(self, token: str) -> _Blob | None:
+        """The live blob under `token`, or `None`."""
+        blob = self._entries.get(token)
+        if blob is None or blob.expires <= self._limits.clock():
+            return None
+        return blob
+
+    def _evict(self, now: float, room: int) -> None:
+        """Drop expired blobs, then the oldest live ones until `room` more bytes fit."""
+        for token, blob in list(self._entries.items()):
+            if blob.expires > now and self._held + room <= self._limits.max_bytes:
+                break
+            del self._entries[token]
+            self._held -= len(blob.data)
+
+
+class BlobEndpoint:
+    """ASGI endpoint serving a `BlobStore`'s blobs raw, with single-range `Range` support."""
+
+    def __init__(
+        self,
+        store: BlobStore,
+        security_settings: TransportSecuritySettings | None = None,
+        live_session: Callable[[str], bool] | None = None,
+    ) -> None:
+        self._store = store
+        self._security = TransportSecurityMiddleware(security_settings)
+        self._live_session = live_session
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request = Request(scope, receive)
+        response = await self._security.validate_request(request) or self._respond(request)
+        await response(scope, receive, send)
+
+    def _respond(self, request: Request) -> Response:
+        if request.method not in ("GET", "HEAD"):
+            return Response("Method not allowed", status_code=405, headers={"Allow": "GET, HEAD"})
+        blob = self._store.get(request.path_params["token"])
+        if (
+            blob is None
+            or blob.principal != _principal(request.scope)
+            or (
+                blob.session_id is not None
+                and self._live_session is not None
+                and not self._live_session(blob.session_id)
+            )
+        ):
+            # Expired, someone else's, or its session is gone: all look the same from outside.
+            return Response("Blob not found", status_code=404)
+        headers = {"Accept-Ranges": "bytes", "Cache-Control": "no-store"}
+        size = len(blob.data)
+        requested = request.headers.get("range")
+        if requested is None or (match := _RANGE.fullmatch(requested.strip())) is None:
+            # No range, or one this endpoint does not serve (several ranges): the whole blob.
+            return Response(blob.data, media_type=blob.mime_type, headers=headers)
+        first, last = match.groups()
+        if first:
+            start, end = int(first), min(int(last) + 1, size) if last else size
+        elif last:
+            start, end = max(size - int(last), 0), size
+        else:
+            start = end = 0
+        if start >= end:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+        headers["Content-Range"] = f"bytes {start}-{end - 1}/{size}"
+        return Response(blob.data[start:end], status_code=206, media_type=blob.mime_type, headers=headers)
@@ -60,6 +60,7 @@ from mcp.server.auth.middleware.bearer_auth import BearerAuthBackend, RequireAut
 from mcp.server.auth.provider import OAuthAuthorizationServerProvider, TokenVerifier
 from mcp.server.auth.routes import build_resource_metadata_url, create_auth_routes, create_protected_resource_routes
 from mcp.server.auth.settings import AuthSettings
+from mcp.server.blob_offload import BlobEndpoint, BlobStore
 from mcp.server.caching import CacheableMethod, CacheHint, validate_cache_hints
 from mcp.server.context import HandlerResult, ServerMiddleware, ServerRequestContext
 from mcp.server.models import InitializationOptions
@@ -721,6 +722,7 @@ class Server(Generic[LifespanResultT]):
         stateless_http: bool = False,
         event_store: EventStore | None = None,
         retry_interval: int | None = None,
+        max_replay_events: int | None = None,
         max_request_body_size: int = DEFAULT_MAX_REQUEST_BODY_SIZE,
         transport_security: TransportSecuritySettings | None = None,
         host: str = "127.0.0.1",
@@ -729,8 +731,14 @@ class Server(Generic[LifespanResultT]):
         auth_server_provider: OAuthAuthorizationServerProvider[Any, Any, Any] | None = None,
         custom_starlette_routes: list[Route] | None = None,
         debug: bool = False,
+        blob_store: BlobStore | None = None,
     ) -> Starlette:
-        """Return an instance of the StreamableHTTP server app."""
+        """Return an instance of the StreamableHTTP server app.
+
+        With a `blob_store`, the store's blobs are served at
+        `<streamable_http_path>/blobs/<token>`, behind the same authentication
+        and transport security as the endpoint.
+        """
         # Auto-enable DNS rebinding protection for localhost (IPv4 and IPv6)
         if transport_security is None and host in ("127.0.0.1", "localhost", "::1"):
             transport_security = TransportSecuritySettings(
@@ -743,6 +751,7 @@ class Server(Generic[LifespanResultT]):
             app=self,
             event_store=event_store,
             retry_interval=retry_interval,
+            max_replay_events=max_replay_events,
             json_response=json_response,
             stateless=stateless_http,
             security_settings=transport_security,
@@ -786,9 +795,9 @@ class Server(Generic[LifespanResultT]):
                 )
 
         # Set up routes with or without auth
+        resource_metadata_url = None
         if token_verifier:
             # Determine resource metadata URL
-            resource_metadata_url = None
             if auth and auth.resource_server_url:  # pragma: no branch
                 # Build compliant metadata URL for WWW-Authenticate header
                 resource_metadata_url = build_resource_metadata_url(auth.resource_server_url)
@@ -808,6 +817,15 @@ class Server(Generic[LifespanResultT]):
                 )
             )
 
+        if blob_store is not None:
+            blob_store.route_path = f"{streamable_http_path.rstrip('/')}/blobs/{{token}}"
+            blob_endpoint: Any = BlobEndpoint(
+                blob_store, transport_security, None if stateless_http else session_manager.has_session
+            )
+            if token_verifier:
+                blob_endpoint = RequireAuthMiddleware(blob_endpoint, required_scopes, resource_metadata_url)
+            routes.append(Route(blob_store.route_path, endpoint=blob_endpoint))
+
         # Add protected resource metadata endpoint if configured as RS
         if auth and auth.resource_server_url:
             routes.extend(
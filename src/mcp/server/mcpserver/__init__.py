@@ -2,6 +2,7 @@
 
 from mcp_types import Icon
 
+from mcp.server.blob_offload import BlobOffload
 from mcp.server.extension import Extension, MethodBinding, ResourceBinding, ToolBinding
 from mcp.server.request_state import (
     AESGCMRequestStateCodec,
@@ -9,10 +10,14 @@ from mcp.server.request_state import (
     RequestStateBoundary,
     RequestStateCodec,
     RequestStateSecurity,
+    ServerSideRequestStateCodec,
     authenticated_principal,
 )
 
 from .context import Context
+from .log_buffer import LogBuffer
+from .memo import Memoization
+from .progress import ProgressThrottle
 from .prompts.base import AssistantMessage, Message, UserMessage
 from .resolve import (
     AcceptedElicitation,
@@ -41,6 +46,10 @@ __all__ = [
     "Elicit",
     "Sample",
     "ListRoots",
+    "ProgressThrottle",
+    "LogBuffer",
+    "Memoization",
+    "BlobOffload",
     "ElicitationResult",
     "AcceptedElicitation",
     "DeclinedElicitation",
@@ -57,5 +66,6 @@ __all__ = [
     "RequestStateBoundary",
     "AESGCMRequestStateCodec",
     "InvalidRequestState",
+    "ServerSideRequestStateCodec",
     "authenticated_principal",
 ]
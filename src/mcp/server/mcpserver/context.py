@@ -1,9 +1,18 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import AsyncGenerator, Iterable, Mapping, Sequence
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any, Generic, cast
 
-from mcp_types import ClientCapabilities, InputRequiredResult, InputResponseRequestParams, InputResponses, LoggingLevel
+import anyio
+from mcp_types import (
+    ClientCapabilities,
+    ContentBlock,
+    InputRequiredResult,
+    InputResponseRequestParams,
+    InputResponses,
+    LoggingLevel,
+)
 from pydantic import AnyUrl, BaseModel
 from typing_extensions import deprecated
 
@@ -16,8 +25,11 @@ from mcp.server.elicitation import (
     elicit_with_validation,
 )
 from mcp.server.lowlevel.helper_types import ReadResourceContents
+from mcp.server.mcpserver.log_buffer import BufferedLog, LogBuffer
+from mcp.server.mcpserver.progress import ProgressThrottle, ThrottledProgress
 from mcp.server.subscriptions import SubscriptionBus
 from mcp.shared.exceptions import MCPDeprecationWarning
+from mcp.shared.log_batch import LOG_BATCH_META_KEY
 from mcp.shared.subscriptions import (
     PromptsListChanged,
     ResourcesListChanged,
@@ -66,6 +78,8 @@ class Context(BaseModel, Generic[LifespanContextT, RequestT]):
     _mcp_server: MCPServer | None
     _input_params: InputResponseRequestParams | None
     _subscriptions: SubscriptionBus | None
+    _progress: ThrottledProgress
+    _log: BufferedLog | None
 
     # TODO(maxisbey): Consider making request_context/mcp_server required, or refactor Context entirely.
     def __init__(
@@ -75,14 +89,31 @@ class Context(BaseModel, Generic[LifespanContextT, RequestT]):
         mcp_server: MCPServer | None = None,
         input_params: InputResponseRequestParams | None = None,
         subscriptions: SubscriptionBus | None = None,
+        progress_throttle: ProgressThrottle | None = None,
+        log_buffer: LogBuffer | None = None,
         # TODO(Marcelo): We should drop this kwargs parameter.
         **kwargs: Any,
     ):
-        super().__init__(**kwargs)
-        self._request_context = request_context
-        self._mcp_server = mcp_server
-        self._input_params = input_params
-        self._subscriptions = subscriptions
+        private: dict[str, Any] = {
+            "_request_context": request_context,
+            "_mcp_server": mcp_server,
+            "_input_params": input_params,
+            "_subscriptions": subscriptions,
+            "_progress": ThrottledProgress(progress_throttle),
+            "_log": BufferedLog(log_buffer) if log_buffer is not None else None,
+        }
+        cls = type(self)
+        if kwargs or cls.model_fields or cls.__private_attributes__.keys() != private.keys():
+            super().__init__(**kwargs)
+            for name, value in private.items():
+                setattr(self, name, value)
+            return
+        # Built once per request: with no fields to validate, lay the instance
+        # out as `model_construct` does, minus the validator round-trip.
+        object.__setattr__(self, "__dict__", {})
+        object.__setattr__(self, "__pydantic_fields_set__", set())
+        object.__setattr__(self, "__pydantic_extra__", None)
+        object.__setattr__(self, "__pydantic_private__", private)
 
     @property
     def mcp_server(self) -> MCPServer:
@@ -106,19 +137,64 @@ class Context(BaseModel, Generic[LifespanContextT, RequestT]):
         request's own target — their keys are ones that handler minted — so a nested
         invocation always starts on round one.
         """
-        return Context(
+        nested = Context(
             request_context=self._request_context, mcp_server=self._mcp_server, subscriptions=self._subscriptions
         )
+        # Same progress token and log stream, so the same throttle and buffer.
+        nested._progress = self._progress
+        nested._log = self._log
+        return nested
 
-    async def report_progress(self, progress: float, total: float | None = None, message: str | None = None) -> None:
+    async def report_progress(
+        self,
+        progress: float,
+        total: float | None = None,
+        message: str | None = None,
+        *,
+        throttle: ProgressThrottle | None = None,
+    ) -> None:
         """Report progress for the current operation.
 
+        Under a throttle an update may be held back; the latest held-back one
+        is sent when the handler returns, and a final update
+        (`progress >= total`) is always sent at once.
+
         Args:
             progress: Current progress value (e.g., 24)
             total: Optional total value (e.g., 100)
             message: Optional message (e.g., "Starting render...")
+            throttle: Limits for this call, overriding the server's `progress_throttle`;
+                `ProgressThrottle()` sends it unconditionally.
+        """
+        if self._progress.admit(progress, total, message, throttle):
+            await self.request_context.session.report_progress(progress, total, message)
+
+    @property
+    def progress_suppressed(self) -> int:
+        """How many `report_progress` updates the throttle has held back in this request."""
+        return self._progress.suppressed
+
+    async def flush_progress(self) -> None:
+        """Send the latest held-back progress update, if any.
+
+        `MCPServer` calls this when a tool, resource or prompt handler returns or fails.
+        """
+        pending = self._progress.take_pending()
+        if pending is not None:
+            await self.request_context.session.report_progress(*pending)
+
+    async def send_partial_content(self, content: Sequence[ContentBlock]) -> bool:
+        """Send content of this tool call's result to the caller before the result.
+
+        An async-generator tool does this for every chunk it yields. Returns
+        whether the content was sent: only a caller that asked for partial
+        content (`Client.call_tool_stream`) receives it, and only over a
+        transport that can deliver it ahead of the response. Content that was
+        not sent belongs in the result.
         """
-        await self.request_context.session.report_progress(progress, total, message)
+        if self._request_context is None:
+            return False
+        return await self._request_context.session.send_partial_content(content)
 
     @property
     def _bus(self) -> SubscriptionBus:
@@ -127,7 +203,12 @@ class Context(BaseModel, Generic[LifespanContextT, RequestT]):
         return self._subscriptions
 
     async def notify_tools_changed(self) -> None:
-        """Publish a tools list-changed event to `subscriptions/listen` subscribers."""
+        """Publish a tools list-changed event to `subscriptions/listen` subscribers.
+
+        Also drops every result memoized for a `memoize=` tool.
+        """
+        if self._mcp_server is not None:
+            self._mcp_server.memo.forget("tools/call")
         await self._bus.publish(ToolsListChanged())
 
     async def notify_prompts_changed(self) -> None:
@@ -135,7 +216,12 @@ class Context(BaseModel, Generic[LifespanContextT, RequestT]):
         await self._bus.publish(PromptsListChanged())
 
     async def notify_resources_changed(self) -> None:
-        """Publish a resources list-changed event to `subscriptions/listen` subscribers."""
+        """Publish a resources list-changed event to `subscriptions/listen` subscribers.
+
+        Also drops every read memoized for a `memoize=` resource template.
+        """
+        if self._mcp_server is not None:
+            self._mcp_server.memo.forget("resources/read")
         await self._bus.publish(ResourcesListChanged())
 
     async def notify_resource_updated(self, uri: str | AnyUrl) -> None:
@@ -144,8 +230,11 @@ class Context(BaseModel, Generic[LifespanContextT, RequestT]):
         The URI is matched as an exact string against each stream's filter.
         Reaches `subscriptions/listen` streams only; clients on earlier
         protocol versions that used `resources/subscribe` are notified via
-        `ctx.session.send_resource_updated(uri)` instead.
+        `ctx.session.send_resource_updated(uri)` instead. Also drops the
+        reads of `uri` memoized for a `memoize=` resource template.
         """
+        if self._mcp_server is not None:
+            self._mcp_server.memo.forget("resources/read", str(uri))
         await self._bus.publish(ResourceUpdated(uri=str(uri)))
 
     async def read_resource(self, uri: str | AnyUrl) -> Iterable[ReadResourceContents]:
@@ -267,13 +356,56 @@ class Context(BaseModel, Generic[LifespanContextT, RequestT]):
                 (string, dict, list, number, bool, etc.) per the MCP specification.
             logger_name: Optional logger name
         """
+        if self._log is None:
+            await self._send_log(level, data, logger_name)
+        elif self._log.add(level, data, logger_name):
+            await self._log.flush(self._send_log)
+
+    async def _send_log(self, level: LoggingLevel, data: Any, logger_name: str | None, batch: bool = False) -> None:
         await self.request_context.session.send_log_message(  # pyright: ignore[reportDeprecated]
             level=level,
             data=data,
             logger=logger_name,
             related_request_id=self.request_id,
+            meta={LOG_BATCH_META_KEY: True} if batch else None,
         )
 
+    @property
+    def log_dropped(self) -> int:
+        """How many `log` messages the server's log buffer has dropped in this request."""
+        return self._log.dropped if self._log is not None else 0
+
+    async def flush_log(self) -> None:
+        """Send every buffered log message now.
+
+        `MCPServer` calls this when a tool, resource or prompt handler returns or fails.
+        """
+        if self._log is not None:
+            await self._log.flush(self._send_log)
+
+    @asynccontextmanager
+    async def _handling(self) -> AsyncGenerator[None]:
+        """Scope of one handler call: runs the log buffer's `max_delay` timer, then flushes progress and log."""
+        try:
+            if self._log is None:
+                yield
+                return
+            failure: Exception | None = None
+            async with anyio.create_task_group() as timer:
+                timer.start_soon(self._log.run_timer, self._send_log)
+                try:
+                    yield
+                except Exception as exc:
+                    # Re-raised outside the task group so callers see the handler's own exception.
+                    failure = exc
+                finally:
+                    timer.cancel_scope.cancel()
+            if failure is not None:
+                raise failure
+        finally:
+            await self.flush_progress()
+            await self.flush_log()
+
     @property
     def headers(self) -> Mapping[str, str] | None:
         """Request headers carried by this message, when the transport has them.
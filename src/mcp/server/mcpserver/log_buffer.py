@@ -0,0 +1,148 @@
+"""Buffered delivery for `Context.log`.
+
+Without a buffer every `ctx.log` call is one `notifications/message` frame
+(and, on a resumable SSE stream, one stored event). With
+`MCPServer(log_buffer=LogBuffer(...))` a request's messages are held and sent
+in batches: consecutive messages sharing a level and logger become one
+notification whose `data` is the list of their `data`, oldest first, marked
+as a batch (`mcp.shared.log_batch`); a lone message goes out as it was
+logged. A batch goes out once `max_messages` are held, once the oldest has
+waited `max_delay` seconds (on a timer running beside the handler), or when
+the handler returns or fails.
+
+While a batch is being sent, further messages keep buffering. Past `capacity`
+the least severe message held (or arriving) is dropped; drops are counted,
+reported to the client as one `warning` ahead of the next batch, and recorded
+on the `mcp.server.log.dropped` metric.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, get_args
+
+import anyio
+from mcp_types import LoggingLevel
+
+from mcp.shared import _metrics
+
+__all__ = ["LogBuffer"]
+
+DROPPED_LOGGER = "mcp.log_buffer"
+"""Logger name on the notification reporting dropped messages."""
+
+_SEVERITY: dict[str, int] = {level: rank for rank, level in enumerate(get_args(LoggingLevel))}
+
+SendLog = Callable[[LoggingLevel, Any, str | None, bool], Awaitable[None]]
+"""Sends one notification: level, data, logger, and whether `data` is a batch's list."""
+
+
+@dataclass(frozen=True, slots=True)
+class LogBuffer:
+    """Per-request batching limits for `Context.log`.
+
+    Raises:
+        ValueError: If `max_messages` or `capacity` is below 1, `capacity` is
+            below `max_messages`, or `max_delay` is negative.
+    """
+
+    max_messages: int = 64
+    """Send a batch once this many messages are held."""
+
+    max_delay: float = 0.25
+    """Send a batch once the oldest held message has waited this many seconds, even while the handler is idle."""
+
+    capacity: int = 1024
+    """Messages held while a batch is in flight before the least severe are dropped."""
+
+    clock: Callable[[], float] = time.monotonic
+    """Monotonic time source in seconds for message ages; injectable for tests. The timer sleeps in real seconds."""
+
+    def __post_init__(self) -> None:
+        if self.max_messages < 1:
+            raise ValueError(f"max_messages must be >= 1, got {self.max_messages}")
+        if self.capacity < self.max_messages:
+            raise ValueError(f"capacity must be >= max_messages, got {self.capacity} < {self.max_messages}")
+        if self.max_delay < 0:
+            raise ValueError(f"max_delay must be >= 0, got {self.max_delay}")
+
+
+class BufferedLog:
+    """One request's held log messages; `dropped` counts what it has dropped so far."""
+
+    __slots__ = ("_limits", "_held", "_since", "_dropped", "_flushing", "_armed", "dropped")
+
+    def __init__(self, limits: LogBuffer) -> None:
+        self._limits = limits
+        self._held: list[tuple[LoggingLevel, Any, str | None]] = []
+        self._since = 0.0
+        self._dropped: dict[str, int] = {}
+        self._flushing = False
+        self._armed: anyio.Event | None = None
+        self.dropped = 0
+
+    def add(self, level: LoggingLevel, data: Any, logger: str | None) -> bool:
+        """Hold one message; whether a batch is now due."""
+        if not self._held:
+            self._since = self._limits.clock()
+            if self._armed is not None:
+                self._armed.set()
+        if len(self._held) >= self._limits.capacity:
+            weakest = min(range(len(self._held)), key=lambda i: _SEVERITY[self._held[i][0]])
+            if _SEVERITY[level] <= _SEVERITY[self._held[weakest][0]]:
+                self._drop(level)
+                return False
+            self._drop(self._held.pop(weakest)[0])
+        self._held.append((level, data, logger))
+        return (
+            len(self._held) >= self._limits.max_messages or self._limits.clock() - self._since >= self._limits.max_delay
+        )
+
+    def _drop(self, level: LoggingLevel) -> None:
+        self._dropped[level] = self._dropped.get(level, 0) + 1
+        self.dropped += 1
+        _metrics.server_log_dropped.add(1, {"mcp.log.level": level})
+
+    async def flush(self, send: SendLog) -> None:
+        """Send everything held, batched; a no-op while another flush is sending."""
+        if self._flushing:
+            return
+        self._flushing = True
+        try:
+            while self._held or self._dropped:
+                held, self._held = self._held, []
+                dropped, self._dropped = self._dropped, {}
+                if dropped:
+                    await send("warning", {"dropped": dropped}, DROPPED_LOGGER, False)
+                start = 0
+                for end in range(1, len(held) + 1):
+                    if end == len(held) or held[end][0] != held[start][0] or held[end][2] != held[start][2]:
+                        level, data, logger = held[start]
+                        if end - start == 1:
+                            await send(level, data, logger, False)
+                        else:
+                            await send(level, [data for _, data, _ in held[start:end]], logger, True)
+                        start = end
+        finally:
+            self._flushing = False
+
+    async def run_timer(self, send: SendLog) -> None:
+        """Send each batch once its oldest message has waited `max_delay`; runs beside the handler until cancelled.
+
+        A batch the timer has started sending is finished even if the timer
+        is cancelled meanwhile, so nothing it took is lost.
+        """
+        while True:
+            if not self._held or self._flushing:
+                # Nothing held, or a flush in progress that drains whatever is: wait for the next first message.
+                self._armed = anyio.Event()
+                await self._armed.wait()
+                continue
+            remaining = self._since + self._limits.max_delay - self._limits.clock()
+            if remaining > 0:
+                await anyio.sleep(remaining)
+                continue
+            with anyio.CancelScope(shield=True):
+                await self.flush(send)
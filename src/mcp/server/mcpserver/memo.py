@@ -0,0 +1,118 @@
+"""Server-side result memoization for `@mcp.tool(memoize=...)` and resource templates.
+
+A tool or resource template registered with `memoize=<seconds>` has its
+results kept in the server's `ResultMemo` for that long. A tool result is
+keyed on the tool name and its *validated* arguments (so `{"n": "3"}` and
+`{"n": 3}` share an entry when `n: int`); a template read is keyed on the
+URI. Both are further keyed on the caller's authorization partition, the
+authenticated (client, issuer, subject) identity, so one principal is never
+served another's result; unauthenticated callers share one partition.
+
+The memo holds at most `Memoization.max_entries` results across all tools and
+templates, evicting the least recently used first. `Context.notify_tools_changed`
+drops every memoized tool result, `Context.notify_resources_changed` every
+memoized read, and `Context.notify_resource_updated(uri)` the reads of `uri`.
+Lookups are recorded on the `mcp.server.memo.lookups` metric.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from mcp.server.auth.middleware.auth_context import get_access_token
+from mcp.server.auth.provider import principal_components
+from mcp.shared import _metrics
+from mcp.shared._json import canonical_dumps
+
+__all__ = ["Memoization", "ResultMemo"]
+
+MemoKind = Literal["tools/call", "resources/read"]
+
+MemoKey = tuple[MemoKind, str, str | None, str, bool]
+"""(method, tool name or URI, partition, canonical validated arguments, whether a tool result has its text mirror)."""
+
+
+@dataclass(frozen=True, slots=True)
+class Memoization:
+    """Limits for the results memoized by `memoize=` tools and resource templates.
+
+    Raises:
+        ValueError: If `max_entries` is below 1.
+    """
+
+    max_entries: int = 1024
+    """Results held across all tools and templates before the least recently used is evicted."""
+
+    clock: Callable[[], float] = time.monotonic
+    """Monotonic time source in seconds; injectable for tests."""
+
+    def __post_init__(self) -> None:
+        if self.max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {self.max_entries}")
+
+
+def validate_memoize(memoize: float | None) -> float | None:
+    """Check a `memoize=` TTL at registration time."""
+    if memoize is not None and memoize <= 0:
+        raise ValueError(f"memoize must be > 0 seconds, got {memoize}")
+    return memoize
+
+
+def memo_partition() -> str | None:
+    """The calling principal, as `authenticated_principal` binds request state; `None` when unauthenticated."""
+    token = get_access_token()
+    if token is None:
+        return None
+    return canonical_dumps(principal_components(token))
+
+
+class ResultMemo:
+    """The memoized results of one `MCPServer`, least recently used first."""
+
+    __slots__ = ("_limits", "_entries")
+
+    def __init__(self, limits: Memoization | None = None) -> None:
+        self._limits = limits or Memoization()
+        self._entries: dict[MemoKey, tuple[float, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, kind: MemoKind, name: str, arguments: str = "", *, text_mirror: bool = True) -> MemoKey:
+        """The key for a result of `name` under the calling principal's partition."""
+        return (kind, name, memo_partition(), arguments, text_mirror)
+
+    def get(self, key: MemoKey) -> Any | None:
+        """The live result under `key`, or `None`; a hit becomes the most recently used."""
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry[0] > self._limits.clock():
+            self._entries[key] = entry
+            _metrics.server_memo_lookups.add(1, {"mcp.method.name": key[0], "mcp.memo.result": "hit"})
+            return entry[1]
+        _metrics.server_memo_lookups.add(1, {"mcp.method.name": key[0], "mcp.memo.result": "miss"})
+        return None
+
+    def put(self, key: MemoKey, value: Any, ttl: float) -> None:
+        """Hold `value` under `key` for `ttl` seconds, evicting the least recently used past the bound."""
+        self._entries.pop(key, None)
+        self._entries[key] = (self._limits.clock() + ttl, value)
+        while len(self._entries) > self._limits.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def forget(self, kind: MemoKind, name: str | None = None) -> int:
+        """Drop the results of `name` (every tool or URI when `None`) for all partitions.
+
+        Returns:
+            How many results were dropped.
+        """
+        doomed = [key for key in self._entries if key[0] == kind and (name is None or key[1] == name)]
+        for key in doomed:
+            del self._entries[key]
+        return len(doomed)
+
+    def clear(self) -> None:
+        """Drop every memoized result."""
+        self._entries.clear()
@@ -0,0 +1,89 @@
+"""Throttling for `Context.report_progress`.
+
+A tool reporting progress from a tight loop would otherwise send one
+`notifications/progress` frame per iteration. `ProgressThrottle` bounds that
+per request: an update is sent only once `min_interval` seconds have passed
+and `progress` has advanced by `min_delta` since the last one sent. The first
+update and the final one (`progress >= total`) are always sent. Suppressed
+updates coalesce: the latest is held and sent when the handler returns or
+fails, so the client always ends up with the last state reported.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from mcp.shared import _metrics
+
+__all__ = ["ProgressThrottle"]
+
+
+@dataclass(frozen=True, slots=True)
+class ProgressThrottle:
+    """Per-request limits on progress notifications.
+
+    The defaults limit nothing. Set one on the server with
+    `MCPServer(progress_throttle=...)`, or pass one to a single
+    `ctx.report_progress(..., throttle=...)` call to override it.
+
+    Raises:
+        ValueError: If `min_interval` or `min_delta` is negative.
+    """
+
+    min_interval: float = 0.0
+    """Seconds that must pass after a sent update before the next is sent."""
+
+    min_delta: float = 0.0
+    """How far `progress` must advance past the last sent update before the next is sent."""
+
+    clock: Callable[[], float] = time.monotonic
+    """Monotonic time source in seconds; injectable for tests."""
+
+    def __post_init__(self) -> None:
+        if self.min_interval < 0:
+            raise ValueError(f"min_interval must be >= 0, got {self.min_interval}")
+        if self.min_delta < 0:
+            raise ValueError(f"min_delta must be >= 0, got {self.min_delta}")
+
+
+class ThrottledProgress:
+    """One request's progress stream: what was last sent and what is held back.
+
+    `suppressed` counts the updates refused when reported; the latest of them
+    may still go out later through `take_pending`.
+    """
+
+    __slots__ = ("_default", "_sent_at", "_sent_progress", "_pending", "suppressed")
+
+    def __init__(self, default: ProgressThrottle | None = None) -> None:
+        self._default = default
+        self._sent_at: float | None = None
+        self._sent_progress = 0.0
+        self._pending: tuple[float, float | None, str | None] | None = None
+        self.suppressed = 0
+
+    def admit(
+        self, progress: float, total: float | None, message: str | None, throttle: ProgressThrottle | None
+    ) -> bool:
+        """Whether to send this update now; a refused update is held as the pending one."""
+        limits = throttle if throttle is not None else self._default
+        if limits is not None and self._sent_at is not None and (total is None or progress < total):
+            now = limits.clock()
+            if now - self._sent_at < limits.min_interval or progress - self._sent_progress < limits.min_delta:
+                self._pending = (progress, total, message)
+                self.suppressed += 1
+                _metrics.server_progress_suppressed.add(1)
+                return False
+            self._sent_at = now
+        else:
+            self._sent_at = (limits.clock if limits is not None else time.monotonic)()
+        self._sent_progress = progress
+        self._pending = None
+        return True
+
+    def take_pending(self) -> tuple[float, float | None, str | None] | None:
+        """The latest held-back update, if any; it is handed out once."""
+        pending, self._pending = self._pending, None
+        return pending
@@ -7,7 +7,6 @@ from collections.abc import Awaitable, Callable, Sequence
 from typing import TYPE_CHECKING, Annotated, Any, Literal
 
 import anyio.to_thread
-import pydantic_core
 from mcp_types import ContentBlock, Icon, InputRequiredResult, TextContent
 from pydantic import BaseModel, Field, TypeAdapter, validate_call
 
@@ -15,6 +14,7 @@ from mcp.server.mcpserver.utilities.context_injection import find_context_parame
 from mcp.server.mcpserver.utilities.func_metadata import func_metadata
 from mcp.server.mcpserver.utilities.types import Audio, Image
 from mcp.shared._callable_inspection import is_async_callable
+from mcp.shared._json import dumps
 from mcp.shared.exceptions import MCPError
 
 if TYPE_CHECKING:
@@ -203,7 +203,7 @@ class Prompt(BaseModel):
                 elif isinstance(msg, str | ContentBlock | Image | Audio):  # bare content is one user message
                     messages.append(UserMessage(msg))
                 else:  # pragma: no cover
-                    content = pydantic_core.to_json(msg, fallback=str, indent=2).decode()
+                    content = dumps(msg, fallback=str, indent=2)
                     messages.append(Message(role="user", content=content))
 
             return messages
@@ -30,7 +30,6 @@ from __future__ import annotations
 import base64
 import hashlib
 import inspect
-import json
 import logging
 import types
 import typing
@@ -79,9 +78,9 @@ from mcp.server.elicitation import (
 )
 from mcp.server.mcpserver.context import Context
 from mcp.server.mcpserver.exceptions import InvalidSignature, ToolError
-from mcp.server.request_state import compact_json
 from mcp.server.validation import validate_tool_use_result_messages, wants_sampling_tools
 from mcp.shared._callable_inspection import is_async_callable
+from mcp.shared._json import canonical_dumps, canonical_loads
 from mcp.shared.exceptions import MCPError
 from mcp.shared.message import ServerMessageMetadata
 
@@ -738,7 +737,7 @@ def _request_digest(request: InputRequest) -> str:
     A redeploy that rewords or reshapes a question re-asks it instead of reusing the recorded answer.
     """
     params = request.params
-    rendered = compact_json(params.model_dump(mode="json", by_alias=True, exclude_none=True) if params else None)
+    rendered = canonical_dumps(params.model_dump(mode="json", by_alias=True, exclude_none=True) if params else None)
     digest = hashlib.sha256(rendered.encode()).digest()[:16]
     return base64.urlsafe_b64encode(digest).decode().rstrip("=")
 
@@ -755,8 +754,8 @@ class _State(BaseModel):
 def _decode_state(request_state: str | None) -> _State:
     """Decode the per-call resolution progress from `request_state`.
 
-    Parsed with stdlib `json.loads` because `_encode_state` may emit escaped
-    lone surrogates, which pydantic's JSON parser rejects. The string arrives
+    Parsed with `canonical_loads` because `_encode_state` may emit escaped
+    lone surrogates, which the wire parser rejects. The string arrives
     boundary-authenticated, so malformed content or a version mismatch is
     drift within the operator's own fleet (e.g. a rolling upgrade) and is
     treated as "no progress yet".
@@ -765,7 +764,7 @@ def _decode_state(request_state: str | None) -> _State:
     if not request_state:
         return empty
     try:
-        state = _State.model_validate(json.loads(request_state))
+        state = _State.model_validate(canonical_loads(request_state))
     except ValueError:
         return empty
     return state if state.v == _STATE_VERSION else empty
@@ -777,7 +776,7 @@ def _encode_state(outcomes: Mapping[str, _StateEntry], asked: Mapping[str, str])
     Outcome entries are already wire-shaped, so encoding is pure wrapping.
     """
     state = _State(v=_STATE_VERSION, outcomes=dict(outcomes), asked=dict(asked))
-    return compact_json(state.model_dump(mode="json"))
+    return canonical_dumps(state.model_dump(mode="json"))
 
 
 def _outcome_from_state(entry: _StateEntry, marker: _Marker) -> ElicitationResult[Any]:
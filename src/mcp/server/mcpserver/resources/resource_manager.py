@@ -9,6 +9,7 @@ from mcp_types import Annotations, Icon, InputRequiredResult
 from pydantic import AnyUrl
 
 from mcp.server.mcpserver.exceptions import ResourceNotFoundError
+from mcp.server.mcpserver.memo import ResultMemo
 from mcp.server.mcpserver.resources.base import Resource
 from mcp.server.mcpserver.resources.templates import (
     DEFAULT_RESOURCE_SECURITY,
@@ -28,9 +29,16 @@ logger = get_logger(__name__)
 class ResourceManager:
     """Manages MCPServer resources."""
 
-    def __init__(self, warn_on_duplicate_resources: bool = True, *, resources: list[Resource] | None = None):
+    def __init__(
+        self,
+        warn_on_duplicate_resources: bool = True,
+        *,
+        resources: list[Resource] | None = None,
+        memo: ResultMemo | None = None,
+    ):
         self._resources: dict[str, Resource] = {}
         self._templates: dict[str, ResourceTemplate] = {}
+        self._memo = memo
         self.warn_on_duplicate_resources = warn_on_duplicate_resources
 
         for resource in resources or ():
@@ -69,6 +77,7 @@ class ResourceManager:
         annotations: Annotations | None = None,
         meta: dict[str, Any] | None = None,
         security: ResourceSecurity = DEFAULT_RESOURCE_SECURITY,
+        memoize: float | None = None,
     ) -> ResourceTemplate:
         """Add a template from a function."""
         template = ResourceTemplate.from_function(
@@ -82,6 +91,7 @@ class ResourceManager:
             annotations=annotations,
             meta=meta,
             security=security,
+            memoize=memoize,
         )
         self._templates[template.uri_template] = template
         return template
@@ -93,7 +103,8 @@ class ResourceManager:
 
         A template function may return an `InputRequiredResult` instead of
         resource content (the 2026-07-28 multi-round-trip flow); it is passed
-        through unchanged.
+        through unchanged. A template registered with `memoize` answers from
+        the memo when it holds a live resource for the same URI and caller.
 
         Raises:
             ResourceNotFoundError: If no resource or template matches the URI.
@@ -122,7 +133,15 @@ class ResourceManager:
             except ResourceSecurityError as e:
                 raise ResourceNotFoundError(f"Unknown resource: {uri}") from e
             if params is not None:
-                return await template.create_resource(uri_str, params, context=context)
+                if template.memoize is None or self._memo is None:
+                    return await template.create_resource(uri_str, params, context=context)
+                key = self._memo.key("resources/read", uri_str)
+                if (memoized := self._memo.get(key)) is not None:
+                    return memoized
+                resource = await template.create_resource(uri_str, params, context=context)
+                if not isinstance(resource, InputRequiredResult):
+                    self._memo.put(key, resource, template.memoize)
+                return resource
 
         raise ResourceNotFoundError(f"Unknown resource: {uri}")
 
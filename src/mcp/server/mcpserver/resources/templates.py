@@ -12,6 +12,7 @@ from mcp_types import Annotations, Icon, InputRequiredResult
 from pydantic import BaseModel, Field, validate_call
 
 from mcp.server.mcpserver.exceptions import ResourceError
+from mcp.server.mcpserver.memo import validate_memoize
 from mcp.server.mcpserver.resources.types import FunctionResource, Resource
 from mcp.server.mcpserver.utilities.context_injection import find_context_parameter, inject_context
 from mcp.server.mcpserver.utilities.func_metadata import func_metadata
@@ -120,6 +121,9 @@ class ResourceTemplate(BaseModel):
     context_kwarg: str | None = Field(None, description="Name of the kwarg that should receive context")
     parsed_template: UriTemplate = Field(exclude=True, description="Parsed RFC 6570 template")
     security: ResourceSecurity = Field(exclude=True, description="Path-safety policy for extracted parameters")
+    memoize: float | None = Field(
+        default=None, exclude=True, description="Seconds a read is memoized for, per URI and caller"
+    )
 
     @classmethod
     def from_function(
@@ -135,6 +139,7 @@ class ResourceTemplate(BaseModel):
         meta: dict[str, Any] | None = None,
         context_kwarg: str | None = None,
         security: ResourceSecurity = DEFAULT_RESOURCE_SECURITY,
+        memoize: float | None = None,
     ) -> ResourceTemplate:
         """Create a template from a function.
 
@@ -147,6 +152,7 @@ class ResourceTemplate(BaseModel):
             raise ValueError("You must provide a name for lambda functions")  # pragma: no cover
 
         parsed = UriTemplate.parse(uri_template)
+        validate_memoize(memoize)
 
         # Find context parameter if it exists
         if context_kwarg is None:  # pragma: no branch
@@ -175,6 +181,7 @@ class ResourceTemplate(BaseModel):
             context_kwarg=context_kwarg,
             parsed_template=parsed,
             security=security,
+            memoize=memoize,
         )
 
     def matches(self, uri: str) -> dict[str, str | list[str]] | None:
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Callable
 from functools import partial
 from pathlib import Path
@@ -12,12 +11,12 @@ import anyio
 import anyio.to_thread
 import httpx2
 import pydantic
-import pydantic_core
 from mcp_types import Annotations, Icon, InputRequiredResult
 from pydantic import Field, validate_call
 
 from mcp.server.mcpserver.resources.base import Resource
 from mcp.shared._callable_inspection import is_async_callable
+from mcp.shared._json import dumps
 from mcp.shared.exceptions import MCPError
 
 # `application/*` types that are textual but predate the `+json`/`+xml`
@@ -102,7 +101,7 @@ class FunctionResource(Resource):
             elif isinstance(result, str):
                 return result
             else:
-                return pydantic_core.to_json(result, fallback=str, indent=2).decode()
+                return dumps(result, fallback=str, indent=2)
         except MCPError:
             raise
         except Exception as e:
@@ -240,6 +239,6 @@ class DirectoryResource(Resource):
         try:
             files = await anyio.to_thread.run_sync(self.list_files)
             file_list = [str(f.relative_to(self.path)) for f in files if f.is_file()]
-            return json.dumps({"files": file_list}, indent=2)
+            return dumps({"files": file_list}, indent=2)
         except Exception as e:
             raise ValueError(f"Error reading directory {self.path}: {e}")
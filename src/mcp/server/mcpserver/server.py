@@ -44,6 +44,7 @@ from mcp_types import PromptArgument as MCPPromptArgument
 from mcp_types import Resource as MCPResource
 from mcp_types import ResourceTemplate as MCPResourceTemplate
 from mcp_types import Tool as MCPTool
+from mcp_types.version import is_version_at_least
 from pydantic import BaseModel
 from pydantic.networks import AnyUrl
 from starlette.applications import Starlette
@@ -58,6 +59,7 @@ from mcp.server.auth.middleware.auth_context import AuthContextMiddleware
 from mcp.server.auth.middleware.bearer_auth import BearerAuthBackend, RequireAuthMiddleware
 from mcp.server.auth.provider import OAuthAuthorizationServerProvider, ProviderTokenVerifier, TokenVerifier
 from mcp.server.auth.settings import AuthSettings
+from mcp.server.blob_offload import BlobOffload, BlobStore
 from mcp.server.caching import CacheableMethod, CacheHint
 from mcp.server.context import HandlerResult, ServerMiddleware, ServerRequestContext
 from mcp.server.extension import (
@@ -72,6 +74,9 @@ from mcp.server.lowlevel.server import LifespanResultT, Server
 from mcp.server.lowlevel.server import lifespan as default_lifespan
 from mcp.server.mcpserver.context import Context
 from mcp.server.mcpserver.exceptions import ResourceError, ResourceNotFoundError
+from mcp.server.mcpserver.log_buffer import LogBuffer
+from mcp.server.mcpserver.memo import Memoization, ResultMemo
+from mcp.server.mcpserver.progress import ProgressThrottle
 from mcp.server.mcpserver.prompts import Prompt, PromptManager
 from mcp.server.mcpserver.resources import (
     DEFAULT_RESOURCE_SECURITY,
@@ -90,6 +95,7 @@ from mcp.server.streamable_http import EventStore
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from mcp.server.subscriptions import InMemorySubscriptionBus, ListenHandler, SubscriptionBus
 from mcp.server.transport_security import DEFAULT_MAX_REQUEST_BODY_SIZE, TransportSecuritySettings
+from mcp.shared.blob_offload import BLOB_OFFLOAD_META_KEY
 from mcp.shared.exceptions import MCPError
 from mcp.shared.uri_template import UriTemplate
 
@@ -132,6 +138,11 @@ _MISSING_AUDIENCE = (
 )
 
 
+def _reads_structured_content(protocol_version: str | None) -> bool:
+    """Whether a client on `protocol_version` reads `structuredContent` (2025-06-18 and later)."""
+    return protocol_version is not None and is_version_at_least(protocol_version, "2025-06-18")
+
+
 def lifespan_wrapper(
     app: MCPServer[LifespanResultT],
     lifespan: Callable[[MCPServer[LifespanResultT]], AbstractAsyncContextManager[LifespanResultT]],
@@ -173,8 +184,16 @@ class MCPServer(Generic[LifespanResultT]):
         cache_hints: Mapping[CacheableMethod, CacheHint] | None = None,
         subscriptions: SubscriptionBus | None = None,
         middleware: Sequence[ServerMiddleware[Any]] | None = None,
+        progress_throttle: ProgressThrottle | None = None,
+        log_buffer: LogBuffer | None = None,
+        memoization: Memoization | None = None,
+        structured_text_mirror: bool = True,
+        blob_offload: BlobOffload | None = None,
     ):
         self._resource_security = resource_security
+        self._structured_text_mirror = structured_text_mirror
+        self._progress_throttle = progress_throttle
+        self._log_buffer = log_buffer
         self.settings = Settings(
             debug=debug,
             log_level=log_level,
@@ -187,9 +206,15 @@ class MCPServer(Generic[LifespanResultT]):
         )
         self.dependencies = self.settings.dependencies
 
-        self._tool_manager = ToolManager(tools=tools, warn_on_duplicate_tools=self.settings.warn_on_duplicate_tools)
+        # Results of `memoize=` tools and resource templates, shared across sessions.
+        self._memo = ResultMemo(memoization)
+        # Large binary reads served beside the streamable HTTP endpoint, for clients that opt in.
+        self._blob_store = BlobStore(blob_offload) if blob_offload is not None else None
+        self._tool_manager = ToolManager(
+            tools=tools, warn_on_duplicate_tools=self.settings.warn_on_duplicate_tools, memo=self._memo
+        )
         self._resource_manager = ResourceManager(
-            resources=resources, warn_on_duplicate_resources=self.settings.warn_on_duplicate_resources
+            resources=resources, warn_on_duplicate_resources=self.settings.warn_on_duplicate_resources, memo=self._memo
         )
         self._prompt_manager = PromptManager(warn_on_duplicate_prompts=self.settings.warn_on_duplicate_prompts)
         # The subscriptions/listen fan-out seam (2026-07-28). The default bus is
@@ -272,6 +297,16 @@ class MCPServer(Generic[LifespanResultT]):
         """
         return self._lowlevel_server.middleware
 
+    @property
+    def memo(self) -> ResultMemo:
+        """The results held for `memoize=` tools and resource templates.
+
+        `Context.notify_tools_changed`, `notify_resources_changed` and
+        `notify_resource_updated` drop the affected entries; call
+        `memo.forget(...)` or `memo.clear()` to invalidate from outside a request.
+        """
+        return self._memo
+
     @property
     def title(self) -> str | None:
         return self._lowlevel_server.title
@@ -381,6 +416,7 @@ class MCPServer(Generic[LifespanResultT]):
         stateless_http: bool = ...,
         event_store: EventStore | None = ...,
         retry_interval: int | None = ...,
+        max_replay_events: int | None = ...,
         max_request_body_size: int = ...,
         transport_security: TransportSecuritySettings | None = ...,
     ) -> None: ...
@@ -416,13 +452,22 @@ class MCPServer(Generic[LifespanResultT]):
     async def _handle_call_tool(
         self, ctx: ServerRequestContext[LifespanResultT], params: CallToolRequestParams
     ) -> CallToolResult | InputRequiredResult:
-        context = Context(request_context=ctx, mcp_server=self, input_params=params, subscriptions=self._subscriptions)
-        try:
-            return await self.call_tool(params.name, params.arguments or {}, context)
-        except MCPError:
-            raise
-        except Exception as e:
-            return CallToolResult(content=[TextContent(type="text", text=str(e))], is_error=True)
+        context = Context(
+            request_context=ctx,
+            mcp_server=self,
+            input_params=params,
+            subscriptions=self._subscriptions,
+            progress_throttle=self._progress_throttle,
+            log_buffer=self._log_buffer,
+        )
+        async with context._handling():  # pyright: ignore[reportPrivateUsage]
+            try:
+                result = await self.call_tool(params.name, params.arguments or {}, context)
+            except MCPError:
+                raise
+            except Exception as e:
+                result = CallToolResult(content=[TextContent(type="text", text=str(e))], is_error=True)
+        return result
 
     async def _handle_list_resources(
         self, ctx: ServerRequestContext[LifespanResultT], params: PaginatedRequestParams | None
@@ -432,24 +477,36 @@ class MCPServer(Generic[LifespanResultT]):
     async def _handle_read_resource(
         self, ctx: ServerRequestContext[LifespanResultT], params: ReadResourceRequestParams
     ) -> ReadResourceResult | InputRequiredResult:
-        context = Context(request_context=ctx, mcp_server=self, input_params=params, subscriptions=self._subscriptions)
-        try:
-            results = await self.read_resource(params.uri, context)
-        except ResourceNotFoundError as err:
-            raise MCPError(code=INVALID_PARAMS, message=str(err), data={"uri": str(params.uri)})
-        except ResourceError as err:
-            raise MCPError(code=INTERNAL_ERROR, message=str(err), data={"uri": str(params.uri)})
+        context = Context(
+            request_context=ctx,
+            mcp_server=self,
+            input_params=params,
+            subscriptions=self._subscriptions,
+            progress_throttle=self._progress_throttle,
+            log_buffer=self._log_buffer,
+        )
+        async with context._handling():  # pyright: ignore[reportPrivateUsage]
+            try:
+                results = await self.read_resource(params.uri, context)
+            except ResourceNotFoundError as err:
+                raise MCPError(code=INVALID_PARAMS, message=str(err), data={"uri": str(params.uri)})
+            except ResourceError as err:
+                raise MCPError(code=INTERNAL_ERROR, message=str(err), data={"uri": str(params.uri)})
         if isinstance(results, InputRequiredResult):
             return results
+        # Only a read that opted in may get references: any other client would see an empty blob.
+        store = self._blob_store if (ctx.meta or {}).get(BLOB_OFFLOAD_META_KEY) is True else None
         contents: list[TextResourceContents | BlobResourceContents] = []
         for item in results:
             if isinstance(item.content, bytes):
+                mime_type = item.mime_type or "application/octet-stream"
+                ref = store.offload(ctx.request, item.content, mime_type) if store is not None else None
                 contents.append(
                     BlobResourceContents(
                         uri=params.uri,
-                        blob=base64.b64encode(item.content).decode(),
-                        mime_type=item.mime_type or "application/octet-stream",
-                        _meta=item.meta,
+                        blob=base64.b64encode(item.content).decode() if ref is None else "",
+                        mime_type=mime_type,
+                        _meta=item.meta if ref is None else {**(item.meta or {}), BLOB_OFFLOAD_META_KEY: ref},
                     )
                 )
             else:
@@ -476,8 +533,16 @@ class MCPServer(Generic[LifespanResultT]):
     async def _handle_get_prompt(
         self, ctx: ServerRequestContext[LifespanResultT], params: GetPromptRequestParams
     ) -> GetPromptResult | InputRequiredResult:
-        context = Context(request_context=ctx, mcp_server=self, input_params=params, subscriptions=self._subscriptions)
-        return await self.get_prompt(params.name, params.arguments, context)
+        context = Context(
+            request_context=ctx,
+            mcp_server=self,
+            input_params=params,
+            subscriptions=self._subscriptions,
+            progress_throttle=self._progress_throttle,
+            log_buffer=self._log_buffer,
+        )
+        async with context._handling():  # pyright: ignore[reportPrivateUsage]
+            return await self.get_prompt(params.name, params.arguments, context)
 
     async def list_tools(self) -> list[MCPTool]:
         """List all available tools."""
@@ -499,10 +564,19 @@ class MCPServer(Generic[LifespanResultT]):
     async def call_tool(
         self, name: str, arguments: dict[str, Any], context: Context[LifespanResultT, Any] | None = None
     ) -> CallToolResult | InputRequiredResult:
-        """Call a tool by name with arguments."""
+        """Call a tool by name with arguments.
+
+        With `structured_text_mirror=False`, structured output reaches a client
+        whose protocol version defines `structuredContent` without the text block
+        that mirrors it; older clients, and direct calls outside a request, still
+        get the mirror.
+        """
         if context is None:
             context = Context(mcp_server=self, subscriptions=self._subscriptions)
-        return await self._tool_manager.call_tool(name, arguments, context, convert_result=True)
+        text_mirror = self._structured_text_mirror or not _reads_structured_content(context.protocol_version)
+        return await self._tool_manager.call_tool(
+            name, arguments, context, convert_result=True, text_mirror=text_mirror
+        )
 
     async def list_resources(self) -> list[MCPResource]:
         """List all available resources."""
@@ -578,6 +652,7 @@ class MCPServer(Generic[LifespanResultT]):
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        memoize: float | None = None,
     ) -> None:
         """Add a tool to the server.
 
@@ -596,6 +671,9 @@ class MCPServer(Generic[LifespanResultT]):
                 - If None, auto-detects based on the function's return type annotation
                 - If True, creates a structured tool (return type annotation permitting)
                 - If False, unconditionally creates an unstructured tool
+            memoize: Seconds to keep each result for, keyed on the validated
+                arguments and the caller's authenticated identity. Only for
+                read-only, idempotent tools; see `MCPServer.memo`.
         """
         self._tool_manager.add_tool(
             fn,
@@ -606,6 +684,7 @@ class MCPServer(Generic[LifespanResultT]):
             icons=icons,
             meta=meta,
             structured_output=structured_output,
+            memoize=memoize,
         )
 
     def remove_tool(self, name: str) -> None:
@@ -628,6 +707,7 @@ class MCPServer(Generic[LifespanResultT]):
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        memoize: float | None = None,
     ) -> Callable[[_CallableT], _CallableT]:
         """Decorator to register a tool.
 
@@ -646,6 +726,9 @@ class MCPServer(Generic[LifespanResultT]):
                 - If None, auto-detects based on the function's return type annotation
                 - If True, creates a structured tool (return type annotation permitting)
                 - If False, unconditionally creates an unstructured tool
+            memoize: Seconds to keep each result for, keyed on the validated
+                arguments and the caller's authenticated identity. Only for
+                read-only, idempotent tools; see `MCPServer.memo`.
 
         Example:
             ```python
@@ -684,6 +767,7 @@ class MCPServer(Generic[LifespanResultT]):
                 icons=icons,
                 meta=meta,
                 structured_output=structured_output,
+                memoize=memoize,
             )
             return fn
 
@@ -742,6 +826,7 @@ class MCPServer(Generic[LifespanResultT]):
         annotations: Annotations | None = None,
         meta: dict[str, Any] | None = None,
         security: ResourceSecurity | None = None,
+        memoize: float | None = None,
     ) -> Callable[[_CallableT], _CallableT]:
         """Decorator to register a function as a resource.
 
@@ -770,6 +855,9 @@ class MCPServer(Generic[LifespanResultT]):
             security: Path-safety policy for extracted template parameters.
                 Defaults to the server's ``resource_security`` setting.
                 Only applies to template resources.
+            memoize: Seconds to keep each read for, keyed on the URI and the
+                caller's authenticated identity. Only applies to template
+                resources; see `MCPServer.memo`.
 
         Example:
             ```python
@@ -795,9 +883,10 @@ class MCPServer(Generic[LifespanResultT]):
         Raises:
             InvalidUriTemplate: If ``uri`` is not a valid RFC 6570 template.
             ValueError: If URI template parameters don't match the
-                function's parameters, or if a parameter bound to a
+                function's parameters, if a parameter bound to a
                 ``{?...}``/``{&...}`` query variable has no default
-                (the client may omit it).
+                (the client may omit it), or if ``memoize`` is given for
+                a static resource.
             TypeError: If the decorator is applied without being called
                 (``@resource`` instead of ``@resource("uri")``).
         """
@@ -858,6 +947,7 @@ class MCPServer(Generic[LifespanResultT]):
                     annotations=annotations,
                     security=security if security is not None else self._resource_security,
                     meta=meta,
+                    memoize=memoize,
                 )
             else:
                 if func_params:
@@ -874,6 +964,10 @@ class MCPServer(Generic[LifespanResultT]):
                         f"Add a template variable to the URI or remove the "
                         f"Context parameter."
                     )
+                if memoize is not None:
+                    raise ValueError(
+                        f"Resource {uri!r} has no URI template variables; memoize applies to resource templates only."
+                    )
                 # Register as regular resource
                 resource = FunctionResource.from_function(
                     fn=fn,
@@ -1065,6 +1159,7 @@ class MCPServer(Generic[LifespanResultT]):
         stateless_http: bool = False,
         event_store: EventStore | None = None,
         retry_interval: int | None = None,
+        max_replay_events: int | None = None,
         max_request_body_size: int = DEFAULT_MAX_REQUEST_BODY_SIZE,
         transport_security: TransportSecuritySettings | None = None,
     ) -> None:
@@ -1077,6 +1172,7 @@ class MCPServer(Generic[LifespanResultT]):
             stateless_http=stateless_http,
             event_store=event_store,
             retry_interval=retry_interval,
+            max_replay_events=max_replay_events,
             max_request_body_size=max_request_body_size,
             transport_security=transport_security,
             host=host,
@@ -1229,6 +1325,7 @@ class MCPServer(Generic[LifespanResultT]):
         stateless_http: bool = False,
         event_store: EventStore | None = None,
         retry_interval: int | None = None,
+        max_replay_events: int | None = None,
         max_request_body_size: int = DEFAULT_MAX_REQUEST_BODY_SIZE,
         transport_security: TransportSecuritySettings | None = None,
         host: str = "127.0.0.1",
@@ -1240,6 +1337,7 @@ class MCPServer(Generic[LifespanResultT]):
             stateless_http=stateless_http,
             event_store=event_store,
             retry_interval=retry_interval,
+            max_replay_events=max_replay_events,
             max_request_body_size=max_request_body_size,
             transport_security=transport_security,
             host=host,
@@ -1248,6 +1346,7 @@ class MCPServer(Generic[LifespanResultT]):
             auth_server_provider=self._auth_server_provider,
             custom_starlette_routes=self._custom_starlette_routes,
             debug=self.settings.debug,
+            blob_store=self._blob_store,
         )
 
     async def list_prompts(self) -> list[MCPPrompt]:
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+from collections.abc import AsyncGenerator, Callable, Hashable
+from contextlib import aclosing
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
-from mcp_types import Icon, InputRequiredResult, ToolAnnotations
+from mcp_types import CallToolResult, Icon, InputRequiredResult, ToolAnnotations
 from pydantic import BaseModel, Field
 
 from mcp.server.mcpserver.exceptions import InvalidSignature, ToolError
+from mcp.server.mcpserver.memo import MemoKey, ResultMemo, validate_memoize
 from mcp.server.mcpserver.resolve import (
     build_resolver_plans,
     find_resolved_parameters,
@@ -16,7 +18,7 @@ from mcp.server.mcpserver.resolve import (
 )
 from mcp.server.mcpserver.utilities.context_injection import find_context_parameter
 from mcp.server.mcpserver.utilities.func_metadata import FuncMetadata, func_metadata
-from mcp.shared._callable_inspection import is_async_callable
+from mcp.shared._callable_inspection import is_async_callable, is_async_generator_callable
 from mcp.shared.exceptions import MCPError
 from mcp.shared.tool_name_validation import validate_and_warn_tool_name
 
@@ -37,6 +39,9 @@ class Tool(BaseModel):
         description="Metadata about the function including a pydantic model for tool arguments"
     )
     is_async: bool = Field(description="Whether the tool is async")
+    streams: bool = Field(
+        default=False, description="Whether the tool is an async generator whose chunks stream to the caller"
+    )
     context_kwarg: str | None = Field(None, description="Name of the kwarg that should receive context")
     resolved_params: dict[str, Any] = Field(
         default_factory=lambda: {},
@@ -49,6 +54,9 @@ class Tool(BaseModel):
     annotations: ToolAnnotations | None = Field(None, description="Optional annotations for the tool")
     icons: list[Icon] | None = Field(default=None, description="Optional list of icons for this tool")
     meta: dict[str, Any] | None = Field(default=None, description="Optional metadata for this tool")
+    memoize: float | None = Field(
+        default=None, exclude=True, description="Seconds a result is memoized for, per validated arguments and caller"
+    )
 
     @cached_property
     def output_schema(self) -> dict[str, Any] | None:
@@ -66,9 +74,11 @@ class Tool(BaseModel):
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        memoize: float | None = None,
     ) -> Tool:
         """Create a Tool from a function."""
         func_name = name or fn.__name__
+        validate_memoize(memoize)
 
         validate_and_warn_tool_name(func_name)
 
@@ -77,6 +87,17 @@ class Tool(BaseModel):
 
         func_doc = description or fn.__doc__ or ""
         is_async = is_async_callable(fn)
+        streams = is_async_generator_callable(fn)
+        if streams and structured_output:
+            raise InvalidSignature(
+                f"Tool {func_name!r} is an async generator; its chunks stream as unstructured "
+                "content, so it cannot have structured output"
+            )
+        if streams and memoize is not None:
+            raise InvalidSignature(
+                f"Tool {func_name!r} is an async generator and cannot be memoized; its content "
+                "is streamed to the caller as it is produced, not kept as one result"
+            )
 
         if context_kwarg is None:  # pragma: no branch
             context_kwarg = find_context_parameter(fn)
@@ -88,6 +109,11 @@ class Tool(BaseModel):
                 "return; a call has one input_required channel, so the multi-round flow is driven "
                 "either by resolvers or by the tool body, not both"
             )
+        if resolved_params and memoize is not None:
+            raise InvalidSignature(
+                f"Tool {func_name!r} combines Resolve(...) parameters with memoize; a memoized "
+                "result is keyed on the call's arguments, not on what its resolvers would return"
+            )
 
         skip_names = [context_kwarg] if context_kwarg is not None else []
         skip_names.extend(resolved_params)
@@ -95,7 +121,7 @@ class Tool(BaseModel):
         func_arg_metadata = func_metadata(
             fn,
             skip_names=skip_names,
-            structured_output=structured_output,
+            structured_output=False if streams else structured_output,
         )
         parameters = func_arg_metadata.arg_model.model_json_schema(by_alias=True)
 
@@ -112,12 +138,14 @@ class Tool(BaseModel):
             parameters=parameters,
             fn_metadata=func_arg_metadata,
             is_async=is_async,
+            streams=streams,
             context_kwarg=context_kwarg,
             resolved_params=dict(resolved_params),
             resolver_plans=resolver_plans,
             annotations=annotations,
             icons=icons,
             meta=meta,
+            memoize=memoize,
         )
 
     async def run(
@@ -125,9 +153,18 @@ class Tool(BaseModel):
         arguments: dict[str, Any],
         context: Context[LifespanContextT, RequestT],
         convert_result: bool = False,
+        *,
+        memo: ResultMemo | None = None,
+        text_mirror: bool = True,
     ) -> Any:
         """Run the tool with arguments.
 
+        A tool registered with `memoize` answers from `memo` when it holds a
+        live converted result for the same validated arguments and caller.
+        `text_mirror=False` converts structured output without its text block.
+        An async-generator tool's chunks are streamed as they come (see
+        `_stream`); unconverted, they are returned as a list.
+
         Raises:
             ToolError: If the tool function raises during execution.
         """
@@ -140,7 +177,16 @@ class Tool(BaseModel):
             # validate once and reuse it, so a `default_factory`/stateful validator
             # can't hand a by-name resolver a different value than the body.
             pre_validated: dict[str, Any] | None = None
-            if self.resolved_params:
+            memo_key: MemoKey | None = None
+            if memo is not None and self.memoize is not None and convert_result:
+                parsed = self.fn_metadata.parse_arguments(arguments)
+                # Without its text mirror the converted result is a different result.
+                memo_key = memo.key("tools/call", self.name, parsed.model_dump_json(), text_mirror=text_mirror)
+                if (memoized := memo.get(memo_key)) is not None:
+                    # Every hit gets its own copy, so a caller that edits its result leaves the memo intact.
+                    return memoized.model_copy(deep=True)
+                pre_validated = parsed.model_dump_one_level()
+            elif self.resolved_params:
                 pre_validated = self.fn_metadata.validate_arguments(arguments)
                 resolved = await resolve_arguments(self.resolved_params, self.resolver_plans, pre_validated, context)
                 if isinstance(resolved, InputRequiredResult):
@@ -149,6 +195,11 @@ class Tool(BaseModel):
                     return self.fn_metadata.convert_result(resolved) if convert_result else resolved
                 pass_directly |= resolved
 
+            if self.streams:
+                if pre_validated is None:
+                    pre_validated = self.fn_metadata.validate_arguments(arguments)
+                return await self._stream(self.fn(**pre_validated, **pass_directly), context, convert_result)
+
             result = await self.fn_metadata.call_fn_with_arg_validation(
                 self.fn,
                 self.is_async,
@@ -167,7 +218,10 @@ class Tool(BaseModel):
                 )
 
             if convert_result:
-                result = self.fn_metadata.convert_result(result)
+                result = self.fn_metadata.convert_result(result, text_mirror=text_mirror)
+                if memo_key is not None and not isinstance(result, InputRequiredResult):
+                    assert memo is not None and self.memoize is not None
+                    memo.put(memo_key, result.model_copy(deep=True), self.memoize)
 
             return result
         except MCPError:
@@ -179,3 +233,23 @@ class Tool(BaseModel):
             raise
         except Exception as e:
             raise ToolError(f"Error executing tool {self.name}: {e}") from e
+
+    async def _stream(
+        self, chunks: AsyncGenerator[Any], context: Context[LifespanContextT, RequestT], convert_result: bool
+    ) -> Any:
+        """Drain an async-generator tool, sending each chunk on as soon as it is yielded.
+
+        A converted chunk goes to the caller as partial content when it opted
+        in and the transport can carry it; otherwise it is kept for the
+        result, which then holds only what was not streamed.
+        """
+        kept: list[Any] = []
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                if not convert_result:
+                    kept.append(chunk)
+                    continue
+                content = self.fn_metadata.convert_chunk(chunk)
+                if not await context.send_partial_content(content):
+                    kept.extend(content)
+        return CallToolResult(content=kept) if convert_result else kept
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 from mcp_types import Icon, ToolAnnotations
 
 from mcp.server.mcpserver.exceptions import ToolError
+from mcp.server.mcpserver.memo import ResultMemo
 from mcp.server.mcpserver.tools.base import Tool
 from mcp.server.mcpserver.utilities.logging import get_logger
 
@@ -19,8 +20,15 @@ logger = get_logger(__name__)
 class ToolManager:
     """Manages MCPServer tools."""
 
-    def __init__(self, warn_on_duplicate_tools: bool = True, *, tools: list[Tool] | None = None):
+    def __init__(
+        self,
+        warn_on_duplicate_tools: bool = True,
+        *,
+        tools: list[Tool] | None = None,
+        memo: ResultMemo | None = None,
+    ):
         self._tools: dict[str, Tool] = {}
+        self._memo = memo
         for tool in tools or ():
             if warn_on_duplicate_tools and tool.name in self._tools:
                 logger.warning(f"Tool already exists: {tool.name}")
@@ -46,6 +54,7 @@ class ToolManager:
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        memoize: float | None = None,
     ) -> Tool:
         """Add a tool to the server."""
         tool = Tool.from_function(
@@ -57,6 +66,7 @@ class ToolManager:
             icons=icons,
             meta=meta,
             structured_output=structured_output,
+            memoize=memoize,
         )
         existing = self._tools.get(tool.name)
         if existing:
@@ -71,6 +81,8 @@ class ToolManager:
         if name not in self._tools:
             raise ToolError(f"Unknown tool: {name}")
         del self._tools[name]
+        if self._memo is not None:
+            self._memo.forget("tools/call", name)
 
     async def call_tool(
         self,
@@ -78,10 +90,13 @@ class ToolManager:
         arguments: dict[str, Any],
         context: Context[LifespanContextT, RequestT],
         convert_result: bool = False,
+        text_mirror: bool = True,
     ) -> Any:
         """Call a tool by name with arguments."""
         tool = self.get_tool(name)
         if not tool:
             raise ToolError(f"Unknown tool: {name}")
 
-        return await tool.run(arguments, context, convert_result=convert_result)
+        return await tool.run(
+            arguments, context, convert_result=convert_result, memo=self._memo, text_mirror=text_mirror
+        )
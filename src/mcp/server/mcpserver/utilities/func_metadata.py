@@ -1,6 +1,5 @@
 import functools
 import inspect
-import json
 import sys
 from collections.abc import Awaitable, Callable, Sequence
 from itertools import chain
@@ -35,6 +34,7 @@ from typing_inspection.introspection import (
 from mcp.server.mcpserver.exceptions import InvalidSignature
 from mcp.server.mcpserver.utilities.logging import get_logger
 from mcp.server.mcpserver.utilities.types import Audio, Image
+from mcp.shared._json import dumps, loads
 
 logger = get_logger(__name__)
 
@@ -115,15 +115,18 @@ class FuncMetadata(BaseModel):
             self._adapter = (output_model, TypeAdapter(_pydantic_readable_typeddict(output_model)))
         return self._adapter[1]
 
+    def parse_arguments(self, arguments_to_validate: dict[str, Any]) -> ArgModelBase:
+        """Validate raw arguments into the argument model (no function call)."""
+        arguments_pre_parsed = self.pre_parse_json(arguments_to_validate)
+        return self.arg_model.model_validate(arguments_pre_parsed)
+
     def validate_arguments(self, arguments_to_validate: dict[str, Any]) -> dict[str, Any]:
         """Validate raw arguments into a one-level kwargs dict (no function call).
 
         Used to feed resolver dependency injection the validated tool arguments
         before the tool function itself runs.
         """
-        arguments_pre_parsed = self.pre_parse_json(arguments_to_validate)
-        arguments_parsed_model = self.arg_model.model_validate(arguments_pre_parsed)
-        return arguments_parsed_model.model_dump_one_level()
+        return self.parse_arguments(arguments_to_validate).model_dump_one_level()
 
     async def call_fn_with_arg_validation(
         self,
@@ -153,7 +156,7 @@ class FuncMetadata(BaseModel):
         else:
             return await anyio.to_thread.run_sync(functools.partial(fn, **arguments_parsed_dict))
 
-    def convert_result(self, result: Any) -> CallToolResult | InputRequiredResult:
+    def convert_result(self, result: Any, *, text_mirror: bool = True) -> CallToolResult | InputRequiredResult:
         """Convert a function call result into a `CallToolResult`.
 
         An `InputRequiredResult` is passed through unchanged so the multi-round
@@ -166,6 +169,12 @@ class FuncMetadata(BaseModel):
         retain MCPServer's ad hoc conversion logic for constructing unstructured output
         from function return values, whereas the lowlevel server simply serializes
         the structured output.
+
+        Structured output is dumped once, and the text content mirrors that dump
+        as compact JSON (a wrapped `{"result": ...}` mirrors just the value, a
+        string value is sent as is, and a list is one block per item). Pass `text_mirror=False` to leave the mirror
+        out for clients that read `structuredContent`; content blocks a tool
+        returns are kept.
         """
         if isinstance(result, InputRequiredResult):
             return result
@@ -176,10 +185,11 @@ class FuncMetadata(BaseModel):
                 self._output_adapter(output_model).validate_python(result.structured_content)
             return result
 
-        unstructured_content = _convert_to_content(result)
-
         if output_model is None:
-            return CallToolResult(content=unstructured_content)
+            return CallToolResult(content=_convert_to_content(result))
+
+        # Content blocks forced into structured output (`structured_output=True`) stay blocks.
+        content: list[ContentBlock] | None = _convert_to_content(result) if _holds_content(result) else None
 
         if self.wrap_output:
             result = {"result": result}
@@ -193,7 +203,18 @@ class FuncMetadata(BaseModel):
         else:
             structured_content = adapter.dump_python(validated, mode="json", by_alias=True)
 
-        return CallToolResult(content=unstructured_content, structured_content=structured_content)
+        if content is None:
+            value = structured_content["result"] if self.wrap_output else structured_content
+            content = _json_mirror(value) if text_mirror else []
+        return CallToolResult(content=content, structured_content=structured_content)
+
+    def convert_chunk(self, chunk: Any) -> list[ContentBlock]:
+        """Convert one chunk an async-generator tool yields into the content blocks it streams as.
+
+        Chunks are converted as an unstructured return value is: strings become
+        text blocks, content blocks stay as they are, anything else is dumped as JSON.
+        """
+        return _convert_to_content(chunk)
 
     def pre_parse_json(self, data: dict[str, Any]) -> dict[str, Any]:
         """Pre-parse data from JSON.
@@ -223,8 +244,8 @@ class FuncMetadata(BaseModel):
             field_info = key_to_field_info[data_key]
             if isinstance(data_value, str) and field_info.annotation is not str:
                 try:
-                    pre_parsed = json.loads(data_value)
-                except json.JSONDecodeError:
+                    pre_parsed = loads(data_value)
+                except ValueError:
                     continue  # Not JSON - skip
                 if isinstance(pre_parsed, str | int | float):
                     # This is likely that the raw value is e.g. `"hello"` which we
@@ -605,6 +626,26 @@ def _create_dict_model(func_name: str, dict_annotation: Any) -> type[BaseModel]:
     return DictModel
 
 
+def _holds_content(result: Any) -> bool:
+    """Whether `_convert_to_content` would render `result` as blocks it carries rather than as data."""
+    if isinstance(result, list | tuple):
+        return any(_holds_content(item) for item in result)  # type: ignore
+    return isinstance(result, _CONTENT_TYPES)
+
+
+def _json_mirror(value: Any) -> list[ContentBlock]:
+    """The text blocks mirroring structured output, from its already JSON-ready dump.
+
+    A list is mirrored one block per item, as `_convert_to_content` flattens
+    it; any other value is one block of compact JSON, or the string as is.
+    """
+    if isinstance(value, list):
+        return [block for item in cast(list[Any], value) for block in _json_mirror(item)]
+    if isinstance(value, str):
+        return [TextContent(type="text", text=value)]
+    return [TextContent(type="text", text=dumps(value))]
+
+
 def _convert_to_content(result: Any) -> list[ContentBlock]:
     """Convert a result to a sequence of content objects.
 
@@ -634,6 +675,6 @@ def _convert_to_content(result: Any) -> list[ContentBlock]:
         )
 
     if not isinstance(result, str):
-        result = pydantic_core.to_json(result, fallback=str, indent=2).decode()
+        result = dumps(result, fallback=str, indent=2)
 
     return [TextContent(type="text", text=result)]
@@ -10,11 +10,12 @@ from __future__ import annotations
 import base64
 import hashlib
 import hmac
-import json
 import logging
 import math
 import os
 import time
+import zlib
+from collections import OrderedDict
 from collections.abc import Callable, Mapping, Sequence
 from dataclasses import replace
 from typing import Any, NoReturn, Protocol, cast
@@ -29,6 +30,7 @@ from mcp_types.methods import INPUT_REQUIRED_METHODS, is_input_required
 from mcp.server.auth.middleware.auth_context import get_access_token
 from mcp.server.auth.provider import principal_components
 from mcp.server.context import CallNext, HandlerResult, ServerRequestContext
+from mcp.shared._json import canonical_dumps, canonical_loads
 from mcp.shared.exceptions import MCPError
 
 __all__ = [
@@ -37,6 +39,7 @@ __all__ = [
     "RequestStateBoundary",
     "RequestStateCodec",
     "RequestStateSecurity",
+    "ServerSideRequestStateCodec",
     "authenticated_principal",
 ]
 
@@ -88,7 +91,7 @@ def authenticated_principal(ctx: ServerRequestContext[Any, Any]) -> str | None:
     token = get_access_token()
     if token is None:
         return None
-    return compact_json(principal_components(token))
+    return canonical_dumps(principal_components(token))
 
 
 class RequestStateSecurity:
@@ -100,6 +103,10 @@ class RequestStateSecurity:
         RequestStateSecurity(codec=MyKmsCodec()) # bring your own crypto
         RequestStateSecurity.ephemeral()         # process-local key
 
+    `server_side=True` wraps the codec in a `ServerSideRequestStateCodec`
+    (TTL-bound to `ttl`), so tokens stay a short sealed handle however many
+    rounds the state accumulates; the state itself is then process-local.
+
     `keys` is the rotation ring: `keys[0]` seals, every key unseals.
     Zero-downtime rotation, each phase fully rolled out before the next:
     `keys=[old, new]`, then `keys=[new, old]`, then `keys=[new]` after one TTL.
@@ -122,6 +129,7 @@ class RequestStateSecurity:
         ttl: float = 600.0,
         bind_principal: Callable[[ServerRequestContext[Any, Any]], str | None] | None = authenticated_principal,
         audience: str | None = None,
+        server_side: bool = False,
     ) -> None:
         if (keys is None) == (codec is None):
             raise ValueError("RequestStateSecurity takes exactly one of keys= or codec=")
@@ -132,6 +140,8 @@ class RequestStateSecurity:
         else:
             assert codec is not None
             self.codec = codec
+        if server_side:
+            self.codec = ServerSideRequestStateCodec(self.codec, ttl=ttl)
         self.ttl = ttl
         self.bind_principal = bind_principal
         self.audience = audience
@@ -152,21 +162,11 @@ class RequestStateSecurity:
 _KDF_INFO = b"mcp/request-state/v1/aes-256-gcm"
 _KID_INFO = b"mcp/request-state/v1/kid:"
 _TOKEN_PREFIX = "v1."
+_COMPRESSED_TOKEN_PREFIX = "v1z."
 _KID_LEN = 4
 _NONCE_LEN = 12
 
 
-def compact_json(value: Any, *, sort_keys: bool = False) -> str:
-    """Canonical JSON for everything the state path digests or seals.
-
-    ASCII output keeps the encode total: a lone surrogate in client-supplied
-    text escapes instead of raising. Anything consuming this must parse with
-    stdlib `json.loads`, which accepts those escapes (pydantic's JSON parser
-    does not).
-    """
-    return json.dumps(value, sort_keys=sort_keys, separators=(",", ":"))
-
-
 def _b64u(data: bytes) -> str:
     return base64.urlsafe_b64encode(data).decode().rstrip("=")
 
@@ -193,9 +193,19 @@ class AESGCMRequestStateCodec:
     lookup, and the "v1." prefix and fingerprint are bound into the GCM
     associated data, so a token cannot be replayed into another format version
     or ring slot. Key bytes are copied at construction.
+
+    With `compress_threshold` set, payloads of at least that many bytes are
+    zlib-compressed before sealing when that shrinks them, under the distinct
+    "v1z." prefix (also bound into the associated data). It is off (`None`) by
+    default: a payload mixes client-chosen values (arguments, elicitation
+    answers) with server-private handler state, and the client sees each
+    token's length, so compressing before encrypting leaks how well its input
+    matches the secret parts (a CRIME-style length oracle). Enable it only
+    when the state holds nothing a client must not learn, or prefer
+    `ServerSideRequestStateCodec` to keep large state off the wire.
     """
 
-    def __init__(self, keys: Sequence[bytes | bytearray | str]) -> None:
+    def __init__(self, keys: Sequence[bytes | bytearray | str], *, compress_threshold: int | None = None) -> None:
         for i, key in enumerate(cast("Sequence[object]", keys)):
             if not isinstance(key, bytes | bytearray | str):
                 # Never coerce: bytes(32) would silently build an all-zero key.
@@ -222,18 +232,28 @@ class AESGCMRequestStateCodec:
             self._ring[kid] = AESGCM(key)
             if i == 0:
                 self._mint_kid = kid
+        self._compress_threshold = compress_threshold
 
     def seal(self, payload: bytes) -> str:
         kid = self._mint_kid
+        prefix = _TOKEN_PREFIX
+        if self._compress_threshold is not None and len(payload) >= self._compress_threshold:
+            compressed = zlib.compress(payload)
+            if len(compressed) < len(payload):
+                prefix, payload = _COMPRESSED_TOKEN_PREFIX, compressed
         nonce = os.urandom(_NONCE_LEN)
-        sealed = self._ring[kid].encrypt(nonce, payload, _TOKEN_PREFIX.encode() + kid)
-        return _TOKEN_PREFIX + _b64u(kid + nonce + sealed)
+        sealed = self._ring[kid].encrypt(nonce, payload, prefix.encode() + kid)
+        return prefix + _b64u(kid + nonce + sealed)
 
     def unseal(self, token: str) -> bytes:
-        if not token.startswith(_TOKEN_PREFIX):
+        if token.startswith(_TOKEN_PREFIX):
+            prefix = _TOKEN_PREFIX
+        elif token.startswith(_COMPRESSED_TOKEN_PREFIX):
+            prefix = _COMPRESSED_TOKEN_PREFIX
+        else:
             raise InvalidRequestState("malformed")
         try:
-            raw = _b64u_decode(token[len(_TOKEN_PREFIX) :])
+            raw = _b64u_decode(token[len(prefix) :])
         except ValueError as exc:
             raise InvalidRequestState("malformed") from exc
         if len(raw) < _KID_LEN + _NONCE_LEN + 16:
@@ -243,9 +263,85 @@ class AESGCMRequestStateCodec:
         if aead is None:
             raise InvalidRequestState("unknown key")
         try:
-            return aead.decrypt(nonce, sealed, _TOKEN_PREFIX.encode() + kid)
+            payload = aead.decrypt(nonce, sealed, prefix.encode() + kid)
         except InvalidTag:
             raise InvalidRequestState("seal") from None
+        if prefix == _COMPRESSED_TOKEN_PREFIX:
+            # Authentic, so this server compressed it: decompression cannot be attacker-driven.
+            return zlib.decompress(payload)
+        return payload
+
+
+_HANDLE_LEN = 16
+
+
+class ServerSideRequestStateCodec:
+    """Keeps payloads in a bounded in-process store and seals only a short handle.
+
+    The multi-round-trip state grows with every round; with this codec the
+    token the client echoes stays a fixed-size handle sealed by the wrapped
+    `codec`, and `unseal` is a dictionary lookup. Entries expire `ttl` seconds
+    after sealing and the oldest are evicted first once `max_entries` or
+    `max_bytes` is exceeded; a handle whose entry is gone fails as
+    `InvalidRequestState("evicted")`, so size the store for the concurrent
+    multi-round-trip calls you expect.
+
+    The store lives in this process: like `RequestStateSecurity.ephemeral()`,
+    it suits single-process deployments or sticky-session routing only.
+    """
+
+    def __init__(
+        self,
+        codec: RequestStateCodec,
+        *,
+        ttl: float = 600.0,
+        max_entries: int = 4096,
+        max_bytes: int = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not (math.isfinite(ttl) and ttl > 0):
+            raise ValueError(f"request-state ttl must be a positive finite number, got {ttl!r}")
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("ServerSideRequestStateCodec requires positive max_entries and max_bytes")
+        self._codec = codec
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._clock = clock
+        # Every entry shares one TTL, so insertion order is also expiry order.
+        self._entries: OrderedDict[bytes, tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def seal(self, payload: bytes) -> str:
+        now = self._clock()
+        self._evict(now)
+        handle = os.urandom(_HANDLE_LEN)
+        self._entries[handle] = (now + self._ttl, payload)
+        self._bytes += len(payload)
+        while len(self._entries) > self._max_entries or (self._bytes > self._max_bytes and len(self._entries) > 1):
+            self._pop_oldest()
+        return self._codec.seal(handle)
+
+    def unseal(self, token: str) -> bytes:
+        handle = self._codec.unseal(token)
+        if len(handle) != _HANDLE_LEN:
+            raise InvalidRequestState("malformed")
+        self._evict(self._clock())
+        entry = self._entries.get(handle)
+        if entry is None:
+            raise InvalidRequestState("evicted")
+        return entry[1]
+
+    def _evict(self, now: float) -> None:
+        while self._entries and next(iter(self._entries.values()))[0] <= now:
+            self._pop_oldest()
+
+    def _pop_oldest(self) -> None:
+        _, (_, payload) = self._entries.popitem(last=False)
+        self._bytes -= len(payload)
 
 
 # The multi-round-trip carriers: the only methods whose results may carry `requestState`.
@@ -279,7 +375,7 @@ def _request_identity(method: str, params: Mapping[str, Any] | None) -> tuple[st
         target = str(p.get("uri", ""))
     else:
         target, args = str(p.get("name", "")), p.get("arguments") or args
-    return target, _b64u(hashlib.sha256(compact_json(args, sort_keys=True).encode()).digest()[:16])
+    return target, _b64u(hashlib.sha256(canonical_dumps(args, sort_keys=True).encode()).digest()[:16])
 
 
 def _principal_claim(principal: str) -> str:
@@ -375,7 +471,7 @@ class RequestStateBoundary:
             logger.exception("requestState codec raised during unseal on %s", ctx.method)
             _reject(ctx.method, "codec error")
         try:
-            claims = json.loads(payload)
+            claims = canonical_loads(payload)
             version, iat, exp, inner = claims["v"], claims["iat"], claims["exp"], claims["s"]
         except (ValueError, KeyError, TypeError):
             _reject(ctx.method, "malformed")
@@ -446,7 +542,7 @@ class RequestStateBoundary:
             claims["aud"] = self._audience
         if principal is not None:
             claims["p"] = _principal_claim(principal)
-        payload = compact_json(claims).encode()
+        payload = canonical_dumps(claims).encode()
         try:
             return security.codec.seal(payload)
         except Exception:  # deny-on-error: a raising custom codec must not leak its failure
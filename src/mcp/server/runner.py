@@ -43,6 +43,7 @@ from mcp_types import (
     RequestId,
     RequestParams,
     RequestParamsMeta,
+    Result,
     UnsupportedProtocolVersionErrorData,
 )
 from mcp_types import methods as _methods
@@ -62,6 +63,7 @@ from mcp.server.models import InitializationOptions
 from mcp.server.session import ServerSession
 from mcp.shared._context_streams import ContextReceiveStream
 from mcp.shared._stream_protocols import ReadStream, WriteStream
+from mcp.shared.direct_dispatcher import DirectTransportContext, ObjectResult, OnObjectRequest
 from mcp.shared.dispatcher import CallOptions, DispatchContext, Dispatcher, OnNotify, OnRequest
 from mcp.shared.exceptions import MCPError, NoBackChannelError
 from mcp.shared.inbound import InboundLadderRejection, classify_inbound_request
@@ -168,6 +170,11 @@ class ServerRunner(Generic[LifespanT]):
     def on_request(self) -> OnRequest:
         return self._on_request
 
+    @cached_property
+    def on_object_request(self) -> OnObjectRequest:
+        """`on_request` for a `DirectDispatcher`, answering a `pass_objects` peer with an `ObjectResult`."""
+        return self._on_object_request
+
     @cached_property
     def on_notify(self) -> OnNotify:
         return self._on_notify
@@ -178,21 +185,39 @@ class ServerRunner(Generic[LifespanT]):
         method: str,
         params: Mapping[str, Any] | None,
     ) -> dict[str, Any]:
+        result = await self._on_object_request(dctx, method, params)
+        return result.to_wire() if isinstance(result, ObjectResult) else result
+
+    async def _on_object_request(
+        self,
+        dctx: DispatchContext[TransportContext],
+        method: str,
+        params: Mapping[str, Any] | None,
+    ) -> dict[str, Any] | ObjectResult:
         meta = _extract_meta(params)
         version = self.connection.protocol_version
         ctx = self._make_context(dctx, method, params, meta, version)
+        transport = dctx.transport
+        pass_objects = isinstance(transport, DirectTransportContext) and transport.pass_objects
 
         async def _inner(ctx: ServerRequestContext[LifespanT, Any]) -> HandlerResult:
             # Read method/params off `ctx` so a middleware that rewrote them via
             # `call_next(replace(ctx, ...))` reaches lookup and the handler.
             method, params = ctx.method, ctx.params
+            entry = None if method == "initialize" else self.server.get_request_handler(method)
+            admitted = self.connection.initialize_accepted or method in _INIT_EXEMPT
+            typed_params: Any = None
             # Pinned compat: spec methods are surface-validated before lookup,
             # so malformed params are INVALID_PARAMS even with no handler
             # registered. Custom methods miss the monolith map and fall through
             # to `entry.params_type` exactly as before.
             if method in _methods.SPEC_CLIENT_METHODS:
                 try:
-                    _methods.validate_client_request(method, version, params)
+                    if entry is not None and admitted:
+                        # The hot path: version gate, surface check and typed parse in one validator call.
+                        typed_params = _methods.parse_client_request_params(method, version, params, entry.params_type)
+                    else:
+                        _methods.validate_client_request(method, version, params)
                 except KeyError:
                     raise MCPError(code=METHOD_NOT_FOUND, message="Method not found", data=method) from None
             # TODO(L29): the 2026-07-28 spec drops the handshake; this branch and
@@ -205,29 +230,35 @@ class ServerRunner(Generic[LifespanT]):
             # available on this server", and clients probing a server before
             # the handshake key off that code. The init gate below therefore
             # only ever applies to methods the server actually serves.
-            entry = self.server.get_request_handler(method)
             if entry is None:
                 raise MCPError(code=METHOD_NOT_FOUND, message="Method not found", data=method)
-            if not self.connection.initialize_accepted and method not in _INIT_EXEMPT:
+            if not admitted:
                 # Pinned compat: the same error shape the union validation produced.
                 raise MCPError(code=INVALID_PARAMS, message="Invalid request parameters", data="")
-            # Absent params validate as {} (required fields still reject), so
-            # the handler receives the model with its defaults, never None.
-            typed_params = entry.params_type.model_validate({} if params is None else params, by_name=False)
+            if typed_params is None:
+                # Absent params validate as {} (required fields still reject), so
+                # the handler receives the model with its defaults, never None.
+                typed_params = entry.params_type.model_validate({} if params is None else params, by_name=False)
             result = await entry.handler(ctx, typed_params)
             if isinstance(result, ErrorData):
                 # Raise inside the chain so middleware observes the failure.
                 raise MCPError.from_error_data(result)
+            if pass_objects and isinstance(result, Result):
+                return self._hand_over(method, version, result)
             # Shape for the wire inside the chain so the OpenTelemetry span (the
             # outermost middleware) records a failing handler return shape too.
             return self._serialize(method, version, result)
 
         call = self._compose_server_middleware(_inner)
-        # `_inner` already produced the wire dict; a middleware that short-circuited
-        # without `call_next` is trusted to return its own well-formed result -
-        # including its response envelope. The pipeline never patches it up after
-        # the fact.
-        result = _dump_result(await call(ctx))
+        # `_inner` already produced the wire dict (or, for a `pass_objects` peer,
+        # the enveloped model); a middleware that short-circuited without
+        # `call_next` is trusted to return its own well-formed result - including
+        # its response envelope. The pipeline never patches it up after the fact.
+        handled = await call(ctx)
+        if pass_objects and isinstance(handled, Result):
+            result: dict[str, Any] | ObjectResult = ObjectResult(handled)
+        else:
+            result = _dump_result(handled)
         if method == "initialize":
             # Commit only on chain success, so a middleware veto leaves no state.
             # Race-free: the read loop is parked until this call returns.
@@ -393,6 +424,26 @@ class ServerRunner(Generic[LifespanT]):
             dumped["resultType"] = "complete"
         return self._stamp_server_info(version, dumped)
 
+    def _hand_over(self, method: str, version: str, result: Result) -> Result:
+        """`_serialize` for a `pass_objects` peer: the same cache hints and
+        `serverInfo` stamp, applied to a copy of the result model with no dump
+        and no per-version sieve. Other handler returns still take `_serialize`.
+
+        The copy is shallow: the caller can rebind the result's fields without
+        reaching the object the handler returned (and may still hold), while
+        nested values stay shared - whoever mutates one copies it first.
+        """
+        if (hint := self.server.cache_hints.get(method)) is not None and isinstance(result, CacheableResult):
+            result = apply_cache_hint(result, hint)
+        update: dict[str, Any] = {}
+        if version in MODERN_PROTOCOL_VERSIONS:
+            meta = result.meta
+            if meta is None:
+                update["meta"] = {SERVER_INFO_META_KEY: self.server.server_info_stamp}
+            elif meta.get(SERVER_INFO_META_KEY) is None:
+                update["meta"] = {**meta, SERVER_INFO_META_KEY: self.server.server_info_stamp}
+        return result.model_copy(update=update)
+
     def _stamp_server_info(self, version: str, result: dict[str, Any]) -> dict[str, Any]:
         """Fill the `serverInfo` `_meta` stamp on a 2026-era result (spec #3002).
 
@@ -838,8 +889,8 @@ async def serve_one(
         await aclose_shielded(connection)
 
 
-def modern_on_request(server: Server[LifespanT], lifespan_state: LifespanT) -> OnRequest:
-    """Return an `OnRequest` callback that serves each call via `serve_one` with a fresh per-request `Connection`.
+def modern_on_request(server: Server[LifespanT], lifespan_state: LifespanT) -> OnObjectRequest:
+    """Return an `OnObjectRequest` that serves each call like `serve_one`, with a fresh per-request `Connection`.
 
     Wire this into the server side of a `DirectDispatcher` peer-pair to drive an
     in-process server on the modern per-request-envelope path (each request
@@ -848,25 +899,23 @@ def modern_on_request(server: Server[LifespanT], lifespan_state: LifespanT) -> O
     server-requests denial, so the modern prohibition on server-initiated
     JSON-RPC requests holds on this entry like on the others. Like `serve_one`,
     this raises whatever the handler chain raises - the dispatcher owns the
-    exception-to-error mapping.
+    exception-to-error mapping. A pair created with `pass_objects` is answered
+    with `ObjectResult`s.
     """
 
     async def handle(
         dctx: DispatchContext[TransportContext], method: str, params: Mapping[str, Any] | None
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | ObjectResult:
         meta = (params or {}).get("_meta", {})
         connection = Connection.from_envelope(
             meta.get(PROTOCOL_VERSION_META_KEY, LATEST_MODERN_VERSION),
             meta.get(CLIENT_INFO_META_KEY),
             meta.get(CLIENT_CAPABILITIES_META_KEY),
         )
-        return await serve_one(
-            server,
-            _NoServerRequestsDispatchContext(dctx),
-            method,
-            params,
-            connection=connection,
-            lifespan_state=lifespan_state,
-        )
+        runner = ServerRunner(server, connection, lifespan_state)
+        try:
+            return await runner.on_object_request(_NoServerRequestsDispatchContext(dctx), method, params)
+        finally:
+            await aclose_shielded(connection)
 
     return handle
@@ -7,6 +7,7 @@ Handlers reach it as `ctx.session` and use the typed helpers (`elicit_form`,
 """
 
 import logging
+from collections.abc import Sequence
 from typing import Any, TypeVar, overload
 
 import mcp_types as types
@@ -20,6 +21,7 @@ from mcp.server.validation import validate_sampling_tools, validate_tool_use_res
 from mcp.shared.dispatcher import CallOptions, DispatchContext, ProgressFnT
 from mcp.shared.exceptions import MCPDeprecationWarning
 from mcp.shared.message import ServerMessageMetadata
+from mcp.shared.partial_content import PARTIAL_CONTENT_METHOD, partial_content_params, partial_content_token
 
 __all__ = ["ServerSession"]
 
@@ -44,6 +46,8 @@ class ServerSession:
     never crosses the `Outbound` Protocol.
     """
 
+    __slots__ = ("_request_outbound", "_connection", "_protocol_version", "_request_meta", "_log_levels")
+
     def __init__(
         self,
         request_outbound: DispatchContext[Any],
@@ -53,13 +57,21 @@ class ServerSession:
     ) -> None:
         self._request_outbound = request_outbound
         self._connection = connection
-        # The per-request log-delivery contract, fixed at construction: on
-        # 2026-07-28+ the inbound request's `_meta` log-level opt-in decides
-        # which `notifications/message` levels may be sent for this request
-        # (and they ride this request's stream only); on handshake versions
-        # every level may be sent (`logging/setLevel`-era semantics).
-        self._log_is_request_scoped = connection.protocol_version in MODERN_PROTOCOL_VERSIONS
-        self._allowed_log_levels = allowed_log_levels(connection.protocol_version, request_meta)
+        # The per-request log-delivery contract, fixed by what holds at
+        # construction: on 2026-07-28+ the inbound request's `_meta` log-level
+        # opt-in decides which `notifications/message` levels may be sent for
+        # this request (and they ride this request's stream only); on
+        # handshake versions every level may be sent (`logging/setLevel`-era
+        # semantics). Most requests never log, so the level set is resolved
+        # on the first `send_log_message`.
+        self._protocol_version = connection.protocol_version
+        self._request_meta = request_meta
+        self._log_levels: frozenset[types.LoggingLevel] | None = None
+
+    def _allowed_log_levels(self) -> frozenset[types.LoggingLevel]:
+        if self._log_levels is None:
+            self._log_levels = allowed_log_levels(self._protocol_version, self._request_meta)
+        return self._log_levels
 
     @property
     def client_params(self) -> types.InitializeRequestParams | None:
@@ -145,8 +157,9 @@ class ServerSession:
         data: Any,
         logger: str | None = None,
         related_request_id: types.RequestId | None = None,
+        meta: dict[str, Any] | None = None,
     ) -> None:
-        """Send a log message notification.
+        """Send a log message notification, with `meta` as its `_meta`.
 
         On 2026-07-28+ delivery is a per-request opt-in: nothing is sent
         unless this request's `_meta` carried the reserved log-level key, and
@@ -156,7 +169,7 @@ class ServerSession:
         carrying the response. Handshake versions send unconditionally on the
         channel `related_request_id` selects, as before.
         """
-        if level not in self._allowed_log_levels:
+        if level not in self._allowed_log_levels():
             _logger.debug("dropped notifications/message at %r: not opted in at that level on this request", level)
             return
         await self._notify(
@@ -165,9 +178,10 @@ class ServerSession:
                     level=level,
                     data=data,
                     logger=logger,
+                    _meta=meta,
                 ),
             ),
-            request_scoped=self._log_is_request_scoped or related_request_id is not None,
+            request_scoped=self._protocol_version in MODERN_PROTOCOL_VERSIONS or related_request_id is not None,
         )
 
     async def send_resource_updated(self, uri: str | AnyUrl) -> None:
@@ -454,6 +468,20 @@ class ServerSession:
             related_request_id,
         )
 
+    async def send_partial_content(self, content: Sequence[types.ContentBlock]) -> bool:
+        """Send content of this request's `tools/call` result ahead of the result.
+
+        Delivered only when the caller opted in through the request's `_meta`
+        (`mcp.shared.partial_content`) and the transport can deliver
+        notifications before the response. Returns whether it was sent; when
+        it was not, the content belongs in the result instead.
+        """
+        token = partial_content_token(self._request_meta)
+        if token is None or not self._request_outbound.transport.can_notify:
+            return False
+        await self._request_outbound.notify(PARTIAL_CONTENT_METHOD, partial_content_params(token, content))
+        return True
+
     async def send_resource_list_changed(self) -> None:
         """Send a resource list changed notification."""
         await self.send_notification(types.ResourceListChangedNotification())
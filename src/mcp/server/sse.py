@@ -43,7 +43,6 @@ from urllib.parse import quote
 from uuid import UUID, uuid4
 
 import anyio
-import mcp_types as types
 from pydantic import ValidationError
 from sse_starlette import EventSourceResponse
 from starlette.requests import Request
@@ -58,6 +57,7 @@ from mcp.server.transport_security import (
     TransportSecuritySettings,
 )
 from mcp.shared._context_streams import ContextSendStream, create_context_streams
+from mcp.shared._json import decode_message, encode_message
 from mcp.shared.message import ServerMessageMetadata, SessionMessage
 
 logger = logging.getLogger(__name__)
@@ -187,7 +187,7 @@ class SseServerTransport:
                     await sse_stream_writer.send(
                         {
                             "event": "message",
-                            "data": session_message.message.model_dump_json(by_alias=True, exclude_unset=True),
+                            "data": encode_message(session_message.message).decode(),
                         }
                     )
 
@@ -269,7 +269,7 @@ class SseServerTransport:
         logger.debug(f"Received JSON: {body}")
 
         try:
-            message = types.jsonrpc_message_adapter.validate_json(body, by_name=False)
+            message = decode_message(body)
             logger.debug(f"Validated client message: {message}")
         except ValidationError as err:
             logger.exception("Failed to parse message")
@@ -22,10 +22,10 @@ from typing import BinaryIO, Literal, TextIO
 
 import anyio
 import anyio.lowlevel
-import mcp_types as types
 
 from mcp.os.win32.utilities import rebind_std_handle_to_fd
 from mcp.shared._context_streams import create_context_streams
+from mcp.shared._json import decode_message, encode_message
 from mcp.shared.message import SessionMessage
 
 if sys.platform != "win32":  # pragma: no branch
@@ -186,7 +186,7 @@ async def stdio_server(stdin: anyio.AsyncFile[str] | None = None, stdout: anyio.
                 async with read_stream_writer:
                     async for line in stdin:
                         try:
-                            message = types.jsonrpc_message_adapter.validate_json(line, by_name=False)
+                            message = decode_message(line)
                         except Exception as exc:
                             await read_stream_writer.send(exc)
                             continue
@@ -200,7 +200,7 @@ async def stdio_server(stdin: anyio.AsyncFile[str] | None = None, stdout: anyio.
             try:
                 async with write_stream_reader:
                     async for session_message in write_stream_reader:
-                        json = session_message.message.model_dump_json(by_alias=True, exclude_unset=True)
+                        json = encode_message(session_message.message).decode()
                         await stdout.write(json + "\n")
                         await stdout.flush()
             except anyio.ClosedResourceError:  # pragma: no cover
@@ -9,15 +9,14 @@ responses, with streaming support for long-running operations.
 import logging
 import re
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator, Awaitable, Callable
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from functools import partial
 from http import HTTPStatus
-from typing import Any, Final
+from typing import Final
 
 import anyio
-import pydantic_core
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from mcp_types import (
     DEFAULT_NEGOTIATED_VERSION,
@@ -40,8 +39,11 @@ from starlette.requests import Request
 from starlette.responses import Response
 from starlette.types import Receive, Scope, Send
 
+from mcp.server._sse_frame import frame
 from mcp.server.transport_security import TransportSecurityMiddleware, TransportSecuritySettings
+from mcp.shared import _metrics
 from mcp.shared._context_streams import ContextReceiveStream, ContextSendStream, create_context_streams
+from mcp.shared._json import encode_message, loads
 from mcp.shared._stream_protocols import ReadStream, WriteStream
 from mcp.shared.inbound import MCP_PROTOCOL_VERSION_HEADER
 from mcp.shared.message import CloseSSEStreamCallback, ServerMessageMetadata, SessionMessage
@@ -65,6 +67,12 @@ GET_STREAM_KEY = "_GET_stream"
 # whole session on a lazily-started `sse_writer`. See #1764.
 REQUEST_STREAM_BUFFER_SIZE: Final = 16
 
+_SSE_BACKLOG = _metrics.LiveGauge(
+    "mcp.server.sse.backlog",
+    unit="{message}",
+    description="Messages buffered for streamable HTTP response streams, not yet written to the wire.",
+)
+
 # Error code answering a request that settled without a response (e.g. it was
 # cancelled) on this 2025-era wire, which ends a request's stream only with a
 # response. Mirrors LSP's RequestCancelled; not sent by the 2026 transports, where
@@ -79,8 +87,8 @@ SESSION_ID_PATTERN = re.compile(r"^[\x21-\x7E]+$")
 # Type aliases
 StreamId = str
 EventId = str
-# An SSE event-dict as accepted by sse-starlette (`event`, `data`, `id`, `retry`).
-SSEEvent = dict[str, Any]
+# One or more complete SSE events, pre-framed by `mcp.server._sse_frame`.
+SSEEvent = bytes
 
 
 def check_accept_headers(request: Request) -> tuple[bool, bool]:
@@ -111,6 +119,27 @@ class EventMessage:
 
 EventCallback = Callable[[EventMessage], Awaitable[None]]
 
+REPLAY_BATCH_SIZE: Final = 256
+"""Events per batch in `EventStore.replay_batches_after`'s default implementation."""
+
+
+@dataclass(slots=True)
+class EventReplay:
+    """The events a store resends after a `Last-Event-ID`, in order and in batches.
+
+    `batches` should be lazy (an async generator paging through storage) so a
+    long backlog is never held in memory at once: the transport pulls the next
+    batch only after the previous one has been written to the client, and stops
+    pulling when its replay window is full.
+
+    The transport reads `stream_id` only once `batches` is exhausted, so a
+    store that learns the stream while paging may fill it in then; `None`
+    there means the event ID was unknown after all.
+    """
+
+    stream_id: StreamId | None
+    batches: AsyncIterator[Sequence[EventMessage]]
+
 
 class EventStore(ABC):
     """Interface for resumability support via event storage."""
@@ -145,6 +174,66 @@ class EventStore(ABC):
         """
         pass  # pragma: no cover
 
+    async def replay_batches_after(self, last_event_id: EventId, *, limit: int | None = None) -> EventReplay | None:
+        """Returns the events after the specified event ID as batches.
+
+        The transport replays through this method. The default runs
+        `replay_events_after` alongside the transport, handing each
+        `REPLAY_BATCH_SIZE` events over as soon as they are collected and
+        holding the store back until the transport asks for more; override it
+        to page through storage instead.
+
+        Args:
+            last_event_id: The ID of the last event the client received
+            limit: The most events the transport will take, or None for all;
+                a store may stop reading once it has produced that many
+
+        Returns:
+            The replay, or None if the event ID is unknown.
+        """
+        send_stream, receive_stream = anyio.create_memory_object_stream[EventMessage]()
+        failure: Exception | None = None
+
+        async def produce() -> None:
+            nonlocal failure
+            async with send_stream:
+                try:
+                    replay.stream_id = await self.replay_events_after(last_event_id, send_stream.send)
+                except Exception as exc:
+                    # Raised from the batches, not the task group, which must not cancel while suspended.
+                    failure = exc
+
+        async def batches() -> AsyncGenerator[Sequence[EventMessage], None]:
+            batch: list[EventMessage] = []
+            remaining = limit
+            closed = False
+            async with anyio.create_task_group() as tg, receive_stream:
+                tg.start_soon(produce)
+                async for event in receive_stream:
+                    batch.append(event)
+                    if remaining is not None:
+                        remaining -= 1
+                    if len(batch) == REPLAY_BATCH_SIZE or remaining == 0:
+                        try:
+                            yield batch
+                        except GeneratorExit:
+                            # Closed by the transport: leave the task group normally, not with GeneratorExit.
+                            closed = True
+                        batch = []
+                    if closed or remaining == 0:
+                        break
+                # Stop the store rather than collect what will not be sent.
+                tg.cancel_scope.cancel()
+            if closed:
+                return
+            if batch:
+                yield batch
+            if failure is not None:
+                raise failure
+
+        replay = EventReplay(None, batches())
+        return replay
+
 
 class StreamableHTTPServerTransport:
     """HTTP server transport with event streaming support for MCP.
@@ -167,6 +256,7 @@ class StreamableHTTPServerTransport:
         event_store: EventStore | None = None,
         security_settings: TransportSecuritySettings | None = None,
         retry_interval: int | None = None,
+        max_replay_events: int | None = None,
     ) -> None:
         """Initialize a new StreamableHTTP server transport.
 
@@ -187,18 +277,27 @@ class StreamableHTTPServerTransport:
                            retry field. When set, the server will send a retry field in
                            SSE priming events to control client reconnection timing for
                            polling behavior. Only used when event_store is provided.
+            max_replay_events: Most events replayed on one resuming GET. A longer
+                              backlog is cut off there and the response ends; the
+                              client reconnects from the last event it received and
+                              gets the next window. None (the default) replays
+                              everything. Only used when event_store is provided.
 
         Raises:
-            ValueError: If the session ID contains invalid characters.
+            ValueError: If the session ID contains invalid characters, or
+                max_replay_events is below 1.
         """
         if mcp_session_id is not None and not SESSION_ID_PATTERN.fullmatch(mcp_session_id):
             raise ValueError("Session ID must only contain visible ASCII characters (0x21-0x7E)")
+        if max_replay_events is not None and max_replay_events < 1:
+            raise ValueError(f"max_replay_events must be >= 1, got {max_replay_events}")
 
         self.mcp_session_id = mcp_session_id
         self.is_json_response_enabled = is_json_response_enabled
         self._event_store = event_store
         self._security = TransportSecurityMiddleware(security_settings)
         self._retry_interval = retry_interval
+        self._max_replay_events = max_replay_events
         self._request_streams: dict[
             RequestId,
             tuple[
@@ -210,12 +309,18 @@ class StreamableHTTPServerTransport:
         self._terminated = False
         # Idle timeout cancel scope; managed by the session manager.
         self.idle_scope: anyio.CancelScope | None = None
+        _SSE_BACKLOG.track(self, lambda transport: transport.buffered_messages)
 
     @property
     def is_terminated(self) -> bool:
         """Check if this transport has been explicitly terminated."""
         return self._terminated
 
+    @property
+    def buffered_messages(self) -> int:
+        """Messages queued for this transport's response streams, not yet written to the wire."""
+        return sum(send.statistics().current_buffer_used for send, _ in self._request_streams.values())
+
     def _message_metadata(
         self,
         request: Request,
@@ -226,10 +331,10 @@ class StreamableHTTPServerTransport:
     ) -> ServerMessageMetadata:
         """The metadata this transport frames every inbound message with.
 
-        The one place `can_send_request` is stamped, so no construction site can
-        forget it: a JSON body carries only the response, so in JSON-response mode
-        the request-scoped channel cannot carry a server-initiated request (see
-        `TransportContext.can_send_request`).
+        The one place `can_send_request` and `can_notify` are stamped, so no
+        construction site can forget them: a JSON body carries only the response,
+        so in JSON-response mode the request-scoped channel can carry neither a
+        server-initiated request nor a notification (see `TransportContext`).
         """
         return ServerMessageMetadata(
             request_context=request,
@@ -237,6 +342,7 @@ class StreamableHTTPServerTransport:
             close_standalone_sse_stream=close_standalone_sse_stream,
             on_request_unanswered=on_request_unanswered,
             can_send_request=not self.is_json_response_enabled,
+            can_notify=not self.is_json_response_enabled,
         )
 
     def close_sse_stream(self, request_id: RequestId) -> None:
@@ -333,10 +439,7 @@ class StreamableHTTPServerTransport:
         if not is_version_at_least(protocol_version, "2025-11-25"):
             return None
         priming_event_id = await self._event_store.store_event(stream_id, None)
-        priming_event: SSEEvent = {"id": priming_event_id, "data": ""}
-        if self._retry_interval is not None:
-            priming_event["retry"] = self._retry_interval
-        return priming_event
+        return frame(b"", event_id=priming_event_id, event=None, retry=self._retry_interval)
 
     async def _run_sse_writer(
         self,
@@ -351,8 +454,9 @@ class StreamableHTTPServerTransport:
                 if priming_event is not None:
                     await sse_stream_writer.send(priming_event)
                 async for event_message in request_stream_reader:
-                    await sse_stream_writer.send(self._create_event_data(event_message))
-                    if isinstance(event_message.message, JSONRPCResponse | JSONRPCError):
+                    chunk, answered = self._coalesce_events(event_message, request_stream_reader)
+                    await sse_stream_writer.send(chunk)
+                    if answered:
                         break
         except anyio.ClosedResourceError:  # pragma: lax no cover
             logger.debug("SSE stream closed by close_sse_stream()")
@@ -405,28 +509,43 @@ class StreamableHTTPServerTransport:
         if self.mcp_session_id:
             response_headers[MCP_SESSION_ID_HEADER] = self.mcp_session_id
 
-        return Response(
+        response = Response(
             response_message.model_dump_json(by_alias=True, exclude_unset=True) if response_message else None,
             status_code=status_code,
             headers=response_headers,
         )
+        _metrics.server_http_io.add(len(response.body), _metrics.IO_TRANSMIT)
+        return response
 
     def _get_session_id(self, request: Request) -> str | None:
         """Extract the session ID from request headers."""
         return request.headers.get(MCP_SESSION_ID_HEADER)
 
     def _create_event_data(self, event_message: EventMessage) -> SSEEvent:
-        """Create event data dictionary from an EventMessage."""
-        event_data = {
-            "event": "message",
-            "data": event_message.message.model_dump_json(by_alias=True, exclude_unset=True),
-        }
-
-        # If an event ID was provided, include it
-        if event_message.event_id:
-            event_data["id"] = event_message.event_id
-
-        return event_data
+        """Frame an EventMessage as one SSE `message` event."""
+        data = encode_message(event_message.message)
+        _metrics.server_http_io.add(len(data), _metrics.IO_TRANSMIT)
+        return frame(data, event_id=event_message.event_id or None)
+
+    def _coalesce_events(
+        self, first: EventMessage, reader: MemoryObjectReceiveStream[EventMessage]
+    ) -> tuple[SSEEvent, bool]:
+        """Frame `first` and every event already queued behind it as one chunk.
+
+        A burst of notifications then costs one `http.response.body` write
+        instead of one per event. Stops after a response or error, which ends
+        a request stream; the flag reports whether one was framed.
+        """
+        frames = [self._create_event_data(first)]
+        answered = isinstance(first.message, JSONRPCResponse | JSONRPCError)
+        while not answered:
+            try:
+                event_message = reader.receive_nowait()
+            except (anyio.WouldBlock, anyio.EndOfStream, anyio.ClosedResourceError):
+                break
+            frames.append(self._create_event_data(event_message))
+            answered = isinstance(event_message.message, JSONRPCResponse | JSONRPCError)
+        return (frames[0] if len(frames) == 1 else b"".join(frames)), answered
 
     async def _terminate_unanswered_request(self, request_id: RequestId) -> None:
         """Terminate a request that settled without a response (e.g. cancelled).
@@ -535,9 +654,10 @@ class StreamableHTTPServerTransport:
 
             # Parse the body - only read it once
             body = await request.body()
+            _metrics.server_http_io.add(len(body), _metrics.IO_RECEIVE)
 
             try:
-                raw_message = pydantic_core.from_json(body)
+                raw_message = loads(body)
             except ValueError as e:
                 response = self._create_error_response(f"Parse error: {str(e)}", HTTPStatus.BAD_REQUEST, PARSE_ERROR)
                 await response(scope, receive, send)
@@ -752,9 +872,9 @@ class StreamableHTTPServerTransport:
                         # - JSONRPCRequest (server sends requests to client)
                         # We should NOT receive JSONRPCResponse
 
-                        # Send the message via SSE
-                        event_data = self._create_event_data(event_message)
-                        await sse_stream_writer.send(event_data)
+                        # Send the message, and any queued behind it, via SSE
+                        chunk, _ = self._coalesce_events(event_message, standalone_stream_reader)
+                        await sse_stream_writer.send(chunk)
             except anyio.ClosedResourceError:
                 # Session teardown can close the stream while the writer is between dequeues.
                 pass
@@ -886,6 +1006,43 @@ class StreamableHTTPServerTransport:
 
         return True
 
+    async def _send_replay(
+        self, event_store: EventStore, last_event_id: EventId, sse_stream_writer: MemoryObjectSendStream[SSEEvent]
+    ) -> tuple[StreamId | None, bool]:
+        """Write the events after `last_event_id`, one chunk per batch, up to the replay window.
+
+        Each chunk waits for the previous one to reach the client (the SSE
+        stream has no buffer), and the next batch is pulled only then. Returns
+        the replayed stream's ID and whether the whole backlog was sent.
+        """
+        window = self._max_replay_events
+        attributes: dict[str, str] = {}
+        sent = 0
+        truncated = False
+        with _metrics.Duration(_metrics.server_replay_duration, attributes):
+            # One event past the window tells a cut-off backlog from one that exactly fills it.
+            limit = None if window is None else window + 1
+            replay = await event_store.replay_batches_after(last_event_id, limit=limit)
+            if replay is None:
+                return None, True
+            try:
+                async for batch in replay.batches:
+                    if window is not None and len(batch) > window - sent:
+                        batch, truncated = batch[: window - sent], True
+                    if batch:
+                        await sse_stream_writer.send(b"".join(self._create_event_data(event) for event in batch))
+                        sent += len(batch)
+                    if truncated:
+                        break
+            finally:
+                # Release a store's cursor promptly when the window cut the replay short.
+                aclose = getattr(replay.batches, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+                attributes["mcp.replay.truncated"] = str(truncated).lower()
+                _metrics.server_replay_events.record(sent, attributes)
+        return replay.stream_id, not truncated
+
     async def _replay_events(self, last_event_id: str, request: Request, send: Send) -> None:
         """Replays events that would have been sent after the specified event ID.
 
@@ -914,16 +1071,12 @@ class StreamableHTTPServerTransport:
             async def replay_sender():
                 try:
                     async with sse_stream_writer:
-                        # Define an async callback for sending events
-                        async def send_event(event_message: EventMessage) -> None:
-                            event_data = self._create_event_data(event_message)
-                            await sse_stream_writer.send(event_data)
-
-                        # Replay past events and get the stream ID
-                        stream_id = await event_store.replay_events_after(last_event_id, send_event)
+                        stream_id, complete = await self._send_replay(event_store, last_event_id, sse_stream_writer)
 
+                        # A replay cut off at the window ends here: the client resumes
+                        # from its last event rather than tailing live messages past a gap.
                         # If stream ID not in mapping, create it
-                        if stream_id and stream_id not in self._request_streams:  # pragma: no branch
+                        if complete and stream_id and stream_id not in self._request_streams:  # pragma: no branch
                             try:
                                 # Register SSE writer so close_sse_stream() can close it
                                 self._sse_stream_writers[stream_id] = sse_stream_writer
@@ -944,9 +1097,8 @@ class StreamableHTTPServerTransport:
                                 # Forward messages to SSE
                                 async with msg_reader:
                                     async for event_message in msg_reader:
-                                        event_data = self._create_event_data(event_message)
-
-                                        await sse_stream_writer.send(event_data)
+                                        chunk, _ = self._coalesce_events(event_message, msg_reader)
+                                        await sse_stream_writer.send(chunk)
                             finally:
                                 self._sse_stream_writers.pop(stream_id, None)
                                 await self._clean_up_memory_streams(stream_id)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import contextlib
 import logging
 from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
@@ -24,6 +25,7 @@ from mcp.server.streamable_http import MCP_SESSION_ID_HEADER, EventStore, Stream
 from mcp.server.transport_security import DEFAULT_MAX_REQUEST_BODY_SIZE as DEFAULT_MAX_REQUEST_BODY_SIZE
 from mcp.server.transport_security import RequestBodyLimitMiddleware as RequestBodyLimitMiddleware
 from mcp.server.transport_security import TransportSecuritySettings
+from mcp.shared import _metrics
 from mcp.shared._compat import resync_tracer
 from mcp.shared.inbound import MCP_PROTOCOL_VERSION_HEADER
 from mcp.shared.jsonrpc_dispatcher import JSONRPCDispatcher
@@ -34,6 +36,38 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_ACTIVE_SESSIONS = _metrics.LiveGauge(
+    "mcp.server.sessions.active", unit="{session}", description="Open stateful streamable HTTP sessions."
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SessionInfo:
+    """A snapshot of one stateful session, as listed by `StreamableHTTPSessionManager.sessions()`."""
+
+    session_id: str
+    client_id: str | None
+    """The OAuth client that created the session; `None` when it was created unauthenticated."""
+    age: float
+    """Seconds since the session was created."""
+    idle: float
+    """Seconds since its last HTTP request finished; `0.0` while one is in flight."""
+    active_requests: int
+    """HTTP requests in flight on the session, open SSE streams included."""
+    buffered_messages: int
+    """Messages queued for the session's response streams, not yet written to the wire."""
+
+
+class _Activity:
+    """When a session was created and last used, and how many of its requests are in flight."""
+
+    __slots__ = ("created", "last_active", "in_flight")
+
+    def __init__(self, now: float) -> None:
+        self.created = now
+        self.last_active = now
+        self.in_flight = 0
+
 
 class StreamableHTTPSessionManager:
     """Manages StreamableHTTP sessions with optional resumability via event store.
@@ -69,6 +103,19 @@ class StreamableHTTPSessionManager:
             (30 minutes) is recommended for most deployments.
         max_request_body_size: Maximum size in bytes for Streamable HTTP request bodies. Requests that
             exceed this limit receive a 413 response before parsing or session creation. Defaults to 4 MiB.
+        max_replay_events: Most stored events replayed on one resuming GET; a longer backlog ends the
+            response there and the client resumes from its last event. Default is None (no cap). Only
+            used with an event_store.
+        max_sessions: Most stateful sessions held at once. A new session at the cap evicts the least
+            recently used idle one (no request or SSE stream open); with none idle it is refused with 503.
+            Default is None (no cap).
+        max_sessions_per_principal: Most sessions one authenticated principal may hold, enforced the same
+            way but refused with 429. Unauthenticated sessions count only towards max_sessions. Default is
+            None (no quota).
+        session_reap_interval: Seconds between sweeps of a background reaper that drops terminated sessions
+            and, with session_idle_timeout, terminates sessions idle that long. With a reaper the idle timeout
+            counts from when a session's last request or stream finished, so an open stream or a long call
+            keeps it alive; without one it counts from the last request's arrival. Default is None (no reaper).
     """
 
     def __init__(
@@ -81,6 +128,10 @@ class StreamableHTTPSessionManager:
         retry_interval: int | None = None,
         session_idle_timeout: float | None = None,
         max_request_body_size: int = DEFAULT_MAX_REQUEST_BODY_SIZE,
+        max_replay_events: int | None = None,
+        max_sessions: int | None = None,
+        max_sessions_per_principal: int | None = None,
+        session_reap_interval: float | None = None,
     ):
         if session_idle_timeout is not None and session_idle_timeout <= 0:
             raise ValueError("session_idle_timeout must be a positive number of seconds")
@@ -88,6 +139,16 @@ class StreamableHTTPSessionManager:
             raise RuntimeError("session_idle_timeout is not supported in stateless mode")
         if max_request_body_size <= 0:
             raise ValueError("max_request_body_size must be a positive number of bytes")
+        if max_replay_events is not None and max_replay_events < 1:
+            raise ValueError(f"max_replay_events must be >= 1, got {max_replay_events}")
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError(f"max_sessions must be >= 1, got {max_sessions}")
+        if max_sessions_per_principal is not None and max_sessions_per_principal < 1:
+            raise ValueError(f"max_sessions_per_principal must be >= 1, got {max_sessions_per_principal}")
+        if session_reap_interval is not None and session_reap_interval <= 0:
+            raise ValueError("session_reap_interval must be a positive number of seconds")
+        if stateless and (max_sessions, max_sessions_per_principal, session_reap_interval) != (None, None, None):
+            raise RuntimeError("session limits are not supported in stateless mode")
 
         self.app = app
         self.event_store = event_store
@@ -95,8 +156,12 @@ class StreamableHTTPSessionManager:
         self.stateless = stateless
         self.security_settings = security_settings
         self.retry_interval = retry_interval
+        self.max_replay_events = max_replay_events
         self.session_idle_timeout = session_idle_timeout
         self.max_request_body_size = max_request_body_size
+        self.max_sessions = max_sessions
+        self.max_sessions_per_principal = max_sessions_per_principal
+        self.session_reap_interval = session_reap_interval
         self.asgi_app = RequestBodyLimitMiddleware(self._handle_request, max_request_body_size)
 
         # Session tracking (only used if not stateless)
@@ -105,6 +170,9 @@ class StreamableHTTPSessionManager:
         # Identity of the credential that created each session; requests for a
         # session must present the same credential.
         self._session_owners: dict[str, AuthorizationContext] = {}
+        # Least recently used first: a session moves to the end as each request starts.
+        self._session_activity: dict[str, _Activity] = {}
+        _ACTIVE_SESSIONS.track(self, lambda manager: len(manager._server_instances))
 
         # The task group and lifespan state are set during run()
         self._task_group = None
@@ -145,6 +213,8 @@ class StreamableHTTPSessionManager:
             # belongs on `connection.exit_stack`).
             self._lifespan_state = lifespan_state
             self._task_group = tg
+            if self.session_reap_interval is not None:
+                tg.start_soon(self._reap_sessions, self.session_reap_interval)
             logger.info("StreamableHTTP session manager started")
             try:
                 yield  # Let the application run
@@ -157,8 +227,109 @@ class StreamableHTTPSessionManager:
                 # Clear any remaining server instances
                 self._server_instances.clear()
                 self._session_owners.clear()
+                self._session_activity.clear()
         await resync_tracer()
 
+    def sessions(self) -> list[SessionInfo]:
+        """List the live stateful sessions, least recently used first."""
+        now = anyio.current_time()
+        listed: list[SessionInfo] = []
+        for session_id, activity in self._session_activity.items():
+            transport = self._server_instances.get(session_id)
+            if transport is None:
+                continue
+            owner = self._session_owners.get(session_id)
+            listed.append(
+                SessionInfo(
+                    session_id=session_id,
+                    client_id=owner["client_id"] if owner is not None else None,
+                    age=now - activity.created,
+                    idle=0.0 if activity.in_flight else now - activity.last_active,
+                    active_requests=activity.in_flight,
+                    buffered_messages=transport.buffered_messages,
+                )
+            )
+        return listed
+
+    def has_session(self, session_id: str) -> bool:
+        """Whether `session_id` names a live session this manager is serving."""
+        transport = self._server_instances.get(session_id)
+        return transport is not None and not transport.is_terminated
+
+    def _forget_session(self, session_id: str) -> None:
+        self._server_instances.pop(session_id, None)
+        self._session_owners.pop(session_id, None)
+        self._session_activity.pop(session_id, None)
+
+    async def _evict(self, session_id: str, reason: str) -> None:
+        transport = self._server_instances.get(session_id)
+        if transport is None:
+            # Forgotten while the caller's snapshot was in hand: it ended, or was evicted, meanwhile.
+            return
+        logger.info(f"Evicting session {session_id} ({reason})")
+        self._forget_session(session_id)
+        _metrics.server_sessions_evicted.add(1, {"mcp.session.eviction.reason": reason})
+        await transport.terminate()
+
+    def _least_recently_used_idle(self, owner: AuthorizationContext | None = None) -> str | None:
+        for session_id, activity in self._session_activity.items():
+            if activity.in_flight == 0 and (owner is None or self._session_owners.get(session_id) == owner):
+                return session_id
+        return None
+
+    async def _admit_session(self, requestor: AuthorizationContext | None) -> tuple[int, str] | None:
+        """Make room for one more session; the refusal's HTTP status and message when there is none."""
+        quota = self.max_sessions_per_principal
+        if quota is not None and requestor is not None:
+            held = sum(1 for owner in self._session_owners.values() if owner == requestor)
+            if held >= quota:
+                victim = self._least_recently_used_idle(requestor)
+                if victim is None:
+                    return 429, "Too many sessions for this principal"
+                await self._evict(victim, "principal_quota")
+        if self.max_sessions is not None and len(self._server_instances) >= self.max_sessions:
+            victim = self._least_recently_used_idle()
+            if victim is None:
+                return 503, "Too many sessions"
+            await self._evict(victim, "capacity")
+        return None
+
+    async def _reap_sessions(self, interval: float) -> None:
+        """Every `interval` seconds, drop terminated sessions and terminate idle ones."""
+        while True:
+            await anyio.sleep(interval)
+            now = anyio.current_time()
+            for session_id, activity in list(self._session_activity.items()):
+                transport = self._server_instances.get(session_id)
+                if transport is None:
+                    # Forgotten while an earlier eviction in this sweep was terminating its session.
+                    continue
+                if transport.is_terminated:
+                    self._forget_session(session_id)
+                elif (
+                    self.session_idle_timeout is not None
+                    and activity.in_flight == 0
+                    and now - activity.last_active >= self.session_idle_timeout
+                ):
+                    await self._evict(session_id, "idle")
+
+    async def _handle_in_session(
+        self, session_id: str, transport: StreamableHTTPServerTransport, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Serve one request on a session, recording it as the session's latest activity."""
+        activity = self._session_activity.pop(session_id, None)
+        if activity is None:
+            # The session ended (crashed) between being looked up and served.
+            await transport.handle_request(scope, receive, send)
+            return
+        self._session_activity[session_id] = activity
+        activity.in_flight += 1
+        try:
+            await transport.handle_request(scope, receive, send)
+        finally:
+            activity.in_flight -= 1
+            activity.last_active = anyio.current_time()
+
     async def handle_request(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process ASGI request with proper session handling and transport setup.
 
@@ -216,7 +387,9 @@ class StreamableHTTPSessionManager:
                     # reply has nowhere to land — `can_send_request=False`
                     # makes the per-request channel raise `NoBackChannelError`
                     # for requests while still allowing notifications.
-                    transport_builder=lambda _md: TransportContext(kind="streamable-http", can_send_request=False),
+                    transport_builder=lambda _md: TransportContext(
+                        kind="streamable-http", can_send_request=False, can_notify=not self.json_response
+                    ),
                 )
                 # Born-ready, no standalone channel: the legacy stateless path
                 # never opens a GET stream and need not see `initialize`. The
@@ -263,27 +436,25 @@ class StreamableHTTPSessionManager:
                     "Rejecting request for session %s: credential does not match the one that created the session",
                     request_mcp_session_id[:64],
                 )
-                body = JSONRPCError(
-                    jsonrpc="2.0", id=None, error=ErrorData(code=INVALID_REQUEST, message="Session not found")
-                )
-                response = Response(
-                    body.model_dump_json(by_alias=True, exclude_unset=True),
-                    status_code=404,
-                    media_type="application/json",
-                )
-                await response(scope, receive, send)
+                await _error_response(404, "Session not found")(scope, receive, send)
                 return
             logger.debug("Session already exists, handling request directly")
             # Push back idle deadline on activity
             if transport.idle_scope is not None and self.session_idle_timeout is not None:
                 transport.idle_scope.deadline = anyio.current_time() + self.session_idle_timeout  # pragma: no cover
-            await transport.handle_request(scope, receive, send)
+            await self._handle_in_session(request_mcp_session_id, transport, scope, receive, send)
             return
 
         if request_mcp_session_id is None:
             # New session case
             logger.debug("Creating new transport")
             async with self._session_creation_lock:
+                refusal = await self._admit_session(requestor)
+                if refusal is not None:
+                    status, message = refusal
+                    logger.warning(f"Refusing new session: {message}")
+                    await _error_response(status, message)(scope, receive, send)
+                    return
                 new_session_id = uuid4().hex
                 http_transport = StreamableHTTPServerTransport(
                     mcp_session_id=new_session_id,
@@ -291,16 +462,19 @@ class StreamableHTTPSessionManager:
                     event_store=self.event_store,  # May be None (no resumability)
                     security_settings=self.security_settings,
                     retry_interval=self.retry_interval,
+                    max_replay_events=self.max_replay_events,
                 )
 
                 assert http_transport.mcp_session_id is not None
                 if requestor is not None:
                     self._session_owners[http_transport.mcp_session_id] = requestor
                 self._server_instances[http_transport.mcp_session_id] = http_transport
+                self._session_activity[http_transport.mcp_session_id] = _Activity(anyio.current_time())
                 logger.info(f"Created new transport with session ID: {new_session_id}")
 
                 # Define the server runner
                 async def run_server(*, task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED) -> None:
+                    started = anyio.current_time()
                     async with http_transport.connect() as streams:
                         read_stream, write_stream = streams
                         task_status.started()
@@ -310,7 +484,8 @@ class StreamableHTTPSessionManager:
                             # execution continues after the ``with`` block.
                             # Incoming requests push the deadline forward.
                             idle_scope = anyio.CancelScope()
-                            if self.session_idle_timeout is not None:
+                            # The reaper, when running, enforces the idle timeout instead.
+                            if self.session_idle_timeout is not None and self.session_reap_interval is None:
                                 idle_scope.deadline = anyio.current_time() + self.session_idle_timeout
                                 http_transport.idle_scope = idle_scope
 
@@ -329,8 +504,7 @@ class StreamableHTTPSessionManager:
                             if idle_scope.cancelled_caught:
                                 assert http_transport.mcp_session_id is not None
                                 logger.info(f"Session {http_transport.mcp_session_id} idle timeout")
-                                self._server_instances.pop(http_transport.mcp_session_id, None)
-                                self._session_owners.pop(http_transport.mcp_session_id, None)
+                                self._forget_session(http_transport.mcp_session_id)
                                 await http_transport.terminate()
                         except Exception:
                             logger.exception(f"Session {http_transport.mcp_session_id} crashed")
@@ -344,8 +518,8 @@ class StreamableHTTPSessionManager:
                                     "Cleaning up crashed session "
                                     f"{http_transport.mcp_session_id} from active instances."
                                 )
-                                del self._server_instances[http_transport.mcp_session_id]
-                                self._session_owners.pop(http_transport.mcp_session_id, None)
+                                self._forget_session(http_transport.mcp_session_id)
+                            _metrics.server_session_duration.record(anyio.current_time() - started)
 
                 # Assert task group is not None for type checking
                 assert self._task_group is not None
@@ -353,19 +527,20 @@ class StreamableHTTPSessionManager:
                 await self._task_group.start(run_server)
 
                 # Handle the HTTP request and return the response
-                await http_transport.handle_request(scope, receive, send)
+                await self._handle_in_session(new_session_id, http_transport, scope, receive, send)
         else:
             # Unknown or expired session ID - return 404 per MCP spec
             # TODO(L62): Align error code once spec clarifies
             # See: https://github.com/modelcontextprotocol/python-sdk/issues/1821
             logger.info(f"Rejected request with unknown or expired session ID: {request_mcp_session_id[:64]}")
-            body = JSONRPCError(
-                jsonrpc="2.0", id=None, error=ErrorData(code=INVALID_REQUEST, message="Session not found")
-            )
-            response = Response(
-                body.model_dump_json(by_alias=True, exclude_unset=True), status_code=404, media_type="application/json"
-            )
-            await response(scope, receive, send)
+            await _error_response(404, "Session not found")(scope, receive, send)
+
+
+def _error_response(status_code: int, message: str) -> Response:
+    body = JSONRPCError(jsonrpc="2.0", id=None, error=ErrorData(code=INVALID_REQUEST, message=message))
+    return Response(
+        body.model_dump_json(by_alias=True, exclude_unset=True), status_code=status_code, media_type="application/json"
+    )
 
 
 class StreamableHTTPASGIApp:
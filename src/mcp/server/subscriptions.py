@@ -42,6 +42,7 @@ from mcp_types import (
 )
 
 from mcp.server.context import ServerRequestContext
+from mcp.shared import _metrics
 from mcp.shared.exceptions import MCPError
 from mcp.shared.subscriptions import (
     SUBSCRIPTION_ID_META_KEY,
@@ -68,6 +69,13 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+_LISTEN_STREAMS = _metrics.LiveGauge(
+    "mcp.server.listen.streams.active", unit="{stream}", description="Open subscriptions/listen streams."
+)
+_LISTEN_BACKLOG = _metrics.LiveGauge(
+    "mcp.server.listen.backlog", unit="{event}", description="Events buffered on listen streams, not yet sent."
+)
+
 
 class SubscriptionBus(Protocol):
     """Fan-out seam between event publishers and open listen streams.
@@ -180,6 +188,10 @@ class ListenHandler:
         self._max_subscriptions = max_subscriptions
         self._max_buffered_events = max_buffered_events
         self._streams: set[anyio.streams.memory.MemoryObjectSendStream[ServerEvent]] = set()
+        _LISTEN_STREAMS.track(self, lambda handler: len(handler._streams))
+        _LISTEN_BACKLOG.track(
+            self, lambda handler: sum(stream.statistics().current_buffer_used for stream in handler._streams)
+        )
 
     async def __call__(
         self,
@@ -31,3 +31,13 @@ def is_async_callable(obj: Any) -> Any:
     return inspect.iscoroutinefunction(obj) or (
         callable(obj) and inspect.iscoroutinefunction(getattr(obj, "__call__", None))
     )
+
+
+def is_async_generator_callable(obj: Any) -> bool:
+    """Whether calling `obj` returns an async generator (an `async def` that `yield`s)."""
+    while isinstance(obj, functools.partial):  # pragma: lax no cover
+        obj = obj.func
+
+    return inspect.isasyncgenfunction(obj) or (
+        callable(obj) and inspect.isasyncgenfunction(getattr(obj, "__call__", None))
+    )
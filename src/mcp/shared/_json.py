@@ -0,0 +1,131 @@
+"""The SDK's JSON codec: every place the SDK parses or produces JSON text goes through here.
+
+Two registers, because the SDK needs JSON for two different jobs:
+
+* **Wire** (`loads`, `dumps`, `dump_bytes`, `encode_message`, `decode_message`):
+  JSON-RPC frames, HTTP bodies, tool arguments and results. Backed by
+  pydantic-core's Rust parser and serializer, which every SDK install already
+  has through pydantic. Output is compact UTF-8.
+* **Canonical** (`canonical_dumps`, `canonical_loads`): text that is hashed,
+  sealed, compared or used as a store key. Stays on the stdlib encoder, so the
+  bytes are the same in every process that runs this SDK version, whatever
+  else is installed: a `requestState` token sealed by one replica must open on
+  another, and a shared cache store must see the same keys from every client.
+  ASCII output keeps the encode total (a lone surrogate escapes instead of
+  raising), which is why the matching parser is stdlib too.
+
+No optional backend (orjson, msgspec) is picked up at import time. The wire
+register already runs at their speed (`scripts/benchmarks/json_codec.py`
+measures all of them when installed). The canonical register cannot switch
+encoders without changing its bytes.
+
+Private module.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pydantic_core
+from mcp_types import JSONRPCMessage, jsonrpc_message_adapter
+from pydantic import ValidationError
+
+__all__ = [
+    "canonical_dumps",
+    "canonical_loads",
+    "decode_message",
+    "dump_bytes",
+    "dumps",
+    "encode_message",
+    "loads",
+]
+
+
+def loads(data: str | bytes | bytearray) -> Any:
+    """Parse wire JSON.
+
+    What pydantic-core refuses is retried on the stdlib parser, which accepts
+    escaped lone surrogates (`"\\ud800"`): valid JSON that peers produced
+    with stdlib `json.dumps` send, and that the SDK parsed before this codec.
+
+    Raises:
+        ValueError: Malformed JSON, nesting too deep, or an integer too large to parse.
+    """
+    try:
+        return pydantic_core.from_json(data)
+    except ValueError:
+        try:
+            return json.loads(data)
+        except (ValueError, RecursionError):
+            pass
+        raise
+
+
+def dump_bytes(value: Any, *, indent: int | None = None, fallback: Any = None) -> bytes:
+    """Serialize `value` as wire JSON: compact (unless `indent` is given) UTF-8 bytes.
+
+    Besides plain JSON values this takes anything pydantic can serialize
+    (models, dataclasses, datetimes); `fallback` converts whatever is left,
+    which otherwise raises `pydantic_core.PydanticSerializationError`.
+    """
+    return pydantic_core.to_json(value, indent=indent, fallback=fallback)
+
+
+def dumps(value: Any, *, indent: int | None = None, fallback: Any = None) -> str:
+    """`dump_bytes`, as text."""
+    return pydantic_core.to_json(value, indent=indent, fallback=fallback).decode()
+
+
+def encode_message(message: JSONRPCMessage, *, exclude_none: bool = False) -> bytes:
+    """Serialize a JSON-RPC message straight to compact JSON bytes.
+
+    The handshake-era transports drop unset fields (`exclude_unset`), the
+    2026-07-28 path drops `None` ones (`exclude_none=True`), matching what
+    each sent before.
+    """
+    return type(message).__pydantic_serializer__.to_json(
+        message, by_alias=True, exclude_unset=not exclude_none, exclude_none=exclude_none
+    )
+
+
+def decode_message(data: str | bytes | bytearray) -> JSONRPCMessage:
+    """Parse and validate one JSON-RPC message in a single pass.
+
+    JSON pydantic-core refuses is parsed with `loads`, so a message carrying
+    an escaped lone surrogate decodes as it does there.
+
+    Raises:
+        pydantic.ValidationError: Malformed JSON or not a JSON-RPC message.
+    """
+    try:
+        return jsonrpc_message_adapter.validate_json(data, by_name=False)
+    except ValidationError as exc:
+        if exc.errors()[0]["type"] != "json_invalid":
+            raise
+        try:
+            value = loads(data)
+        except ValueError:
+            raise exc from None
+        return jsonrpc_message_adapter.validate_python(value, by_name=False)
+
+
+def canonical_dumps(value: Any, *, sort_keys: bool = False, compact: bool = True) -> str:
+    """Canonical JSON for everything the SDK digests, seals, compares or keys on.
+
+    ASCII, and compact unless `compact=False` asks for stdlib's default
+    `", "`/`": "` separators, the framing of keys already persisted in
+    response-cache stores. Anything consuming it must parse with
+    `canonical_loads`, which accepts the escaped lone surrogates this may emit.
+    """
+    return json.dumps(value, sort_keys=sort_keys, separators=(",", ":") if compact else None)
+
+
+def canonical_loads(text: str | bytes) -> Any:
+    """Parse `canonical_dumps` output.
+
+    Raises:
+        ValueError: Malformed JSON, or an integer too large to parse.
+        RecursionError: Nesting too deep.
+    """
+    return json.loads(text)
@@ -0,0 +1,176 @@
+"""OpenTelemetry metrics for MCP.
+
+Instruments are created once against the global meter provider. Until an
+application installs one they are the API's proxies, so recording costs a
+method call and nothing is kept. Gauges are read from live objects when a
+reader collects, so they cost nothing between collections.
+
+Attributes stay low-cardinality: method, tool and prompt names come off the
+wire, so each is capped at `_NAME_CAP` distinct values per process, after
+which it reads `_OTHER`.
+"""
+
+from __future__ import annotations
+
+import time
+import weakref
+from collections.abc import Callable, Iterable, Mapping
+from types import TracebackType
+from typing import Any, TypeVar
+
+from opentelemetry.metrics import CallbackOptions, Histogram, Observation, get_meter
+
+from mcp.shared.exceptions import MCPError
+
+_meter = get_meter("mcp-python-sdk")
+
+_NAME_CAP = 256
+OTHER = "_OTHER"
+
+IO_RECEIVE: Mapping[str, str] = {"network.io.direction": "receive"}
+IO_TRANSMIT: Mapping[str, str] = {"network.io.direction": "transmit"}
+
+T = TypeVar("T")
+
+
+class _BoundedValues:
+    """Admits the first `_NAME_CAP` distinct values of one attribute; later ones map to `_OTHER`."""
+
+    def __init__(self) -> None:
+        self._seen: set[str] = set()
+
+    def __call__(self, value: str) -> str:
+        if value in self._seen:
+            return value
+        if len(self._seen) >= _NAME_CAP:
+            return OTHER
+        self._seen.add(value)
+        return value
+
+
+_method_names = _BoundedValues()
+_target_names = _BoundedValues()
+
+
+def operation_attributes(method: str, params: Mapping[str, Any] | None) -> dict[str, str]:
+    """Attributes for one request's duration: the method, plus the tool or prompt it targets."""
+    attributes = {"mcp.method.name": _method_names(method)}
+    target = params.get("name") if params else None
+    if isinstance(target, str):
+        if method == "tools/call":
+            attributes["gen_ai.tool.name"] = _target_names(target)
+        elif method == "prompts/get":
+            attributes["gen_ai.prompt.name"] = _target_names(target)
+    return attributes
+
+
+class Duration:
+    """Context manager recording its block's wall time on `histogram` when the block exits.
+
+    `attributes` is recorded as it stands at exit, so the block may add to it;
+    an escaping exception adds `error.type` (the JSON-RPC code for an
+    `MCPError`, else the exception's type name) unless the block already set it.
+    """
+
+    __slots__ = ("_histogram", "attributes", "_started")
+
+    def __init__(self, histogram: Histogram, attributes: dict[str, str]) -> None:
+        self._histogram = histogram
+        self.attributes = attributes
+        self._started = 0.0
+
+    def __enter__(self) -> dict[str, str]:
+        self._started = time.perf_counter()
+        return self.attributes
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None
+    ) -> None:
+        if exc is not None and "error.type" not in self.attributes:
+            self.attributes["error.type"] = str(exc.error.code) if isinstance(exc, MCPError) else type(exc).__qualname__
+        self._histogram.record(time.perf_counter() - self._started, self.attributes)
+
+
+class LiveGauge:
+    """An up-down counter observed at collection time as the sum over tracked objects.
+
+    Owners register themselves with a measure of their own state; the gauge
+    holds them weakly, so a collected owner simply stops counting.
+    """
+
+    def __init__(self, name: str, *, unit: str, description: str) -> None:
+        self._sources: weakref.WeakKeyDictionary[Any, Callable[[Any], int]] = weakref.WeakKeyDictionary()
+        _meter.create_observable_up_down_counter(name, callbacks=[self._observe], unit=unit, description=description)
+
+    def track(self, source: T, measure: Callable[[T], int]) -> None:
+        self._sources[source] = measure
+
+    def _observe(self, options: CallbackOptions) -> Iterable[Observation]:
+        yield Observation(sum(measure(source) for source, measure in list(self._sources.items())))
+
+
+client_operation_duration = _meter.create_histogram(
+    "mcp.client.operation.duration",
+    unit="s",
+    description="Time from sending an MCP request to receiving its response.",
+)
+server_operation_duration = _meter.create_histogram(
+    "mcp.server.operation.duration",
+    unit="s",
+    description="Time spent handling an inbound MCP message.",
+)
+server_session_duration = _meter.create_histogram(
+    "mcp.server.session.duration",
+    unit="s",
+    description="Lifetime of a streamable HTTP session.",
+)
+server_http_io = _meter.create_counter(
+    "mcp.server.http.io",
+    unit="By",
+    description="Streamable HTTP JSON-RPC payload bytes, by network.io.direction.",
+)
+client_cache_lookups = _meter.create_counter(
+    "mcp.client.cache.lookups",
+    unit="{lookup}",
+    description="Response cache lookups, by outcome (mcp.cache.result: hit, stale, miss or error).",
+)
+client_cache_evictions = _meter.create_counter(
+    "mcp.client.cache.evictions",
+    unit="{eviction}",
+    description="Response cache keys evicted by a server notification or an explicit invalidation.",
+)
+server_progress_suppressed = _meter.create_counter(
+    "mcp.server.progress.suppressed",
+    unit="{notification}",
+    description="Progress updates held back by an MCPServer progress throttle.",
+)
+server_log_dropped = _meter.create_counter(
+    "mcp.server.log.dropped",
+    unit="{message}",
+    description="Log messages dropped by an MCPServer log buffer past its capacity, by mcp.log.level.",
+)
+server_replay_events = _meter.create_histogram(
+    "mcp.server.replay.events",
+    unit="{event}",
+    description="Events resent on one resumed streamable HTTP stream, by mcp.replay.truncated.",
+)
+server_replay_duration = _meter.create_histogram(
+    "mcp.server.replay.duration",
+    unit="s",
+    description="Time spent replaying stored events to a resuming streamable HTTP client.",
+)
+server_sessions_evicted = _meter.create_counter(
+    "mcp.server.sessions.evicted",
+    unit="{session}",
+    description="Stateful streamable HTTP sessions evicted, by mcp.session.eviction.reason.",
+)
+client_cache_coalesced = _meter.create_counter(
+    "mcp.client.cache.coalesced",
+    unit="{request}",
+    description="Response cache misses served by another caller's in-flight fetch of the same key.",
+)
+server_memo_lookups = _meter.create_counter(
+    "mcp.server.memo.lookups",
+    unit="{lookup}",
+    description="MCPServer result memo lookups for memoized tools and resource templates, by mcp.memo.result.",
+)
@@ -0,0 +1,41 @@
+"""Binary resource contents fetched over HTTP instead of inlined as base64.
+
+An SDK convention layered on the protocol, not part of the spec. A client
+on streamable HTTP opts a `resources/read` in by setting
+`BLOB_OFFLOAD_META_KEY` to `true` in the request's `_meta`. A server that
+offloads blobs (`mcp.server.blob_offload`) may then answer a large binary
+item with an empty `blob` and a `BlobRef` under the same key in that
+contents' `_meta`: a short-lived URL on the server's own HTTP app where the
+raw bytes can be fetched, ranges included. A client that never opts in, or
+a server that does not know the convention, sees ordinary inline blobs.
+"""
+
+from __future__ import annotations
+
+from typing import TypedDict
+
+from mcp_types import BlobResourceContents
+
+__all__ = ["BLOB_OFFLOAD_META_KEY", "BlobRef", "blob_ref"]
+
+BLOB_OFFLOAD_META_KEY = "io.modelcontextprotocol.python-sdk/blobOffload"
+"""The `_meta` key that opts a `resources/read` in (request) and carries a `BlobRef` (contents)."""
+
+
+class BlobRef(TypedDict):
+    """Where an offloaded blob's raw bytes can be fetched."""
+
+    url: str
+    """The blob's URL: an absolute path on the server the MCP endpoint is on."""
+
+    size: int
+    """The blob's length in bytes."""
+
+
+def blob_ref(contents: BlobResourceContents) -> BlobRef | None:
+    """The reference replacing `contents`' inline blob, or `None` when the blob is inline."""
+    match (contents.meta or {}).get(BLOB_OFFLOAD_META_KEY):
+        case {"url": str() as url, "size": int() as size}:
+            return BlobRef(url=url, size=size)
+        case _:
+            return None
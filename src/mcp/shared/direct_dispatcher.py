@@ -13,6 +13,11 @@ Like `JSONRPCDispatcher`, this is an exception-to-error boundary: a handler
 exception surfaces to the caller as `MCPError`. The `raise_handler_exceptions`
 knob controls whether unmapped exceptions are sanitized (matching the wire
 path) or chained as ``__cause__`` for in-process debugging.
+
+A pair created with `pass_objects=True` also lets a result skip the wire form:
+the server side's `OnObjectRequest` may answer with an `ObjectResult` carrying
+the handler's result model, and `send_request_object` hands it over as-is.
+`send_raw_request` always returns the wire dict.
 """
 
 from __future__ import annotations
@@ -24,15 +29,15 @@ from typing import Any
 
 import anyio
 import anyio.abc
-from mcp_types import CONNECTION_CLOSED, INTERNAL_ERROR, INVALID_PARAMS, REQUEST_TIMEOUT, RequestId
+from mcp_types import CONNECTION_CLOSED, INTERNAL_ERROR, INVALID_PARAMS, REQUEST_TIMEOUT, RequestId, Result
 from pydantic import ValidationError
 
 from mcp.shared._compat import resync_tracer
 from mcp.shared.dispatcher import (
     CallOptions,
+    DispatchContext,
     OnNotify,
     OnNotifyIntercept,
-    OnRequest,
     ProgressFnT,
     coerce_request_id,
     run_notify_intercept,
@@ -43,11 +48,47 @@ from mcp.shared.transport_context import TransportContext
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["DirectDispatcher", "create_direct_dispatcher_pair"]
+__all__ = [
+    "DirectDispatcher",
+    "DirectTransportContext",
+    "ObjectResult",
+    "OnObjectRequest",
+    "create_direct_dispatcher_pair",
+]
 
 DIRECT_TRANSPORT_KIND = "direct"
 
 
+@dataclass(kw_only=True, frozen=True)
+class DirectTransportContext(TransportContext):
+    """`TransportContext` for both sides of a `DirectDispatcher` pair."""
+
+    pass_objects: bool = False
+    """Whether a handler's result model may cross to the caller as an `ObjectResult`.
+
+    Only for a trusted peer in the same process: the caller sees the server's
+    objects without the wire form's validation or copying.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class ObjectResult:
+    """A request's result handed across a `DirectDispatcher` pair as a model instead of a wire dict.
+
+    `DirectDispatcher` only returns one from `send_request_object`.
+    """
+
+    model: Result
+
+    def to_wire(self) -> dict[str, Any]:
+        return self.model.model_dump(by_alias=True, mode="json", exclude_none=True)
+
+
+OnObjectRequest = Callable[
+    [DispatchContext[TransportContext], str, Mapping[str, Any] | None], Awaitable[dict[str, Any] | ObjectResult]
+]
+"""`OnRequest` for a `DirectDispatcher`: it may answer with an `ObjectResult` instead of the wire dict."""
+
 _Request = Callable[[str, Mapping[str, Any] | None, CallOptions | None], Awaitable[dict[str, Any]]]
 _Notify = Callable[[str, Mapping[str, Any] | None], Awaitable[None]]
 
@@ -112,7 +153,7 @@ class DirectDispatcher:
         self._transport_ctx = transport_ctx
         self._raise_handler_exceptions = raise_handler_exceptions
         self._peer: DirectDispatcher | None = None
-        self._on_request: OnRequest | None = None
+        self._on_request: OnObjectRequest | None = None
         self._on_notify: OnNotify | None = None
         self._on_notify_intercept: OnNotifyIntercept | None = None
         self._next_id = 0
@@ -139,6 +180,21 @@ class DirectDispatcher:
                 side has closed.
             RuntimeError: Called before `run()`.
         """
+        result = await self.send_request_object(method, params, opts)
+        return result.to_wire() if isinstance(result, ObjectResult) else result
+
+    async def send_request_object(
+        self,
+        method: str,
+        params: Mapping[str, Any] | None,
+        opts: CallOptions | None = None,
+    ) -> dict[str, Any] | ObjectResult:
+        """`send_raw_request`, except that a `pass_objects` peer's result model comes back as an `ObjectResult`.
+
+        Raises:
+            MCPError: As `send_raw_request`.
+            RuntimeError: Called before `run()`.
+        """
         if self._peer is None:
             raise RuntimeError("DirectDispatcher has no peer; use create_direct_dispatcher_pair()")
         # Post-close sends get the same CONNECTION_CLOSED contract as JSONRPCDispatcher.
@@ -165,7 +221,7 @@ class DirectDispatcher:
 
     async def run(
         self,
-        on_request: OnRequest,
+        on_request: OnObjectRequest,
         on_notify: OnNotify,
         on_notify_intercept: OnNotifyIntercept | None = None,
         *,
@@ -203,7 +259,7 @@ class DirectDispatcher:
         peer = self._peer
         return _DirectDispatchContext(
             transport=self._transport_ctx,
-            _back_request=lambda m, p, o: peer._dispatch_request(m, p, o),
+            _back_request=lambda m, p, o: peer._dispatch_wire_request(m, p, o),
             _back_notify=lambda m, p: peer._dispatch_notify(m, p),
             request_id=request_id,
             _on_progress=on_progress,
@@ -227,12 +283,21 @@ class DirectDispatcher:
         if self._closed:
             raise MCPError(code=CONNECTION_CLOSED, message="Connection closed")
 
-    async def _dispatch_request(
+    async def _dispatch_wire_request(
         self,
         method: str,
         params: Mapping[str, Any] | None,
         opts: CallOptions | None,
     ) -> dict[str, Any]:
+        result = await self._dispatch_request(method, params, opts)
+        return result.to_wire() if isinstance(result, ObjectResult) else result
+
+    async def _dispatch_request(
+        self,
+        method: str,
+        params: Mapping[str, Any] | None,
+        opts: CallOptions | None,
+    ) -> dict[str, Any] | ObjectResult:
         opts = opts or {}
         try:
             with anyio.fail_after(opts.get("timeout")):
@@ -309,6 +374,7 @@ def create_direct_dispatcher_pair(
     can_send_request: bool = True,
     headers: Mapping[str, str] | None = None,
     raise_handler_exceptions: bool = True,
+    pass_objects: bool = False,
 ) -> tuple[DirectDispatcher, DirectDispatcher]:
     """Create two `DirectDispatcher` instances wired to each other.
 
@@ -321,12 +387,17 @@ def create_direct_dispatcher_pair(
             reaches the caller as `MCPError` with the original chained as
             ``__cause__``. When `False` it is sanitized to an opaque
             `INTERNAL_ERROR` so the in-process path matches the wire.
+        pass_objects: Sets `DirectTransportContext.pass_objects` on both
+            sides, letting the server answer with `ObjectResult`s. Only for
+            a peer trusted with the server's own result objects.
 
     Returns:
         A `(client, server)` pair. The wiring is symmetric, so the roles
         are conventional only.
     """
-    ctx = TransportContext(kind=DIRECT_TRANSPORT_KIND, can_send_request=can_send_request, headers=headers)
+    ctx = DirectTransportContext(
+        kind=DIRECT_TRANSPORT_KIND, can_send_request=can_send_request, headers=headers, pass_objects=pass_objects
+    )
     client = DirectDispatcher(ctx, raise_handler_exceptions=raise_handler_exceptions)
     server = DirectDispatcher(ctx, raise_handler_exceptions=raise_handler_exceptions)
     client.connect_to(server)
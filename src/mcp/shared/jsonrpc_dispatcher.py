@@ -36,6 +36,7 @@ from opentelemetry.trace import SpanKind
 from pydantic import ValidationError
 from typing_extensions import TypeVar
 
+from mcp.shared import _metrics
 from mcp.shared._compat import resync_tracer
 from mcp.shared._otel import inject_trace_context, otel_span
 from mcp.shared._stream_protocols import ReadStream, WriteStream
@@ -76,6 +77,13 @@ arm shields its write, so a wedged transport would otherwise hang it uncancellab
 _SHUTDOWN_WRITE_TIMEOUT: float = 1
 """Tighter bound for the shutdown-arm error write so a wedged transport can't hold session close."""
 
+_ACTIVE_REQUESTS = _metrics.LiveGauge(
+    "mcp.dispatcher.requests.active", unit="{request}", description="Inbound requests whose handler is running."
+)
+_PENDING_REQUESTS = _metrics.LiveGauge(
+    "mcp.dispatcher.requests.pending", unit="{request}", description="Outbound requests awaiting their response."
+)
+
 TransportT = TypeVar("TransportT", bound=TransportContext, default=TransportContext)
 
 PeerCancelMode = Literal["interrupt", "signal"]
@@ -193,8 +201,11 @@ def _default_transport_builder(metadata: MessageMetadata) -> TransportContext:
     (streamable HTTP in JSON-response mode) needs no wiring from whoever drives
     its streams.
     """
-    can_send_request = metadata.can_send_request if isinstance(metadata, ServerMessageMetadata) else True
-    return TransportContext(kind="jsonrpc", can_send_request=can_send_request)
+    if isinstance(metadata, ServerMessageMetadata):
+        return TransportContext(
+            kind="jsonrpc", can_send_request=metadata.can_send_request, can_notify=metadata.can_notify
+        )
+    return TransportContext(kind="jsonrpc", can_send_request=True)
 
 
 def _shielded_progress(fn: ProgressFnT) -> ProgressFnT:
@@ -311,6 +322,8 @@ class JSONRPCDispatcher(Dispatcher[TransportT]):
         self._tg: anyio.abc.TaskGroup | None = None
         self._running = False
         self._closed = False
+        _ACTIVE_REQUESTS.track(self, lambda dispatcher: len(dispatcher._in_flight))
+        _PENDING_REQUESTS.track(self, lambda dispatcher: len(dispatcher._pending))
 
     async def send_raw_request(
         self,
@@ -378,71 +391,72 @@ class JSONRPCDispatcher(Dispatcher[TransportT]):
 
         target = out_params.get("name")
         span_name = f"MCP send {method}{f' {target}' if isinstance(target, str) else ''}"
-        # TODO(maxisbey): move the otel span + inject into an outbound
-        # middleware once that seam exists; the dispatcher should not own otel.
-        try:
-            with otel_span(
-                span_name,
-                kind=SpanKind.CLIENT,
-                attributes={"mcp.method.name": method, "jsonrpc.request.id": str(request_id)},
-            ):
-                # SEP-414: inject W3C trace context; `_meta` stays on the wire even with a no-op tracer.
-                inject_trace_context(out_meta)
-                msg = JSONRPCRequest(jsonrpc="2.0", id=request_id, method=method, params=out_params)
-                # Surface a pre-existing cancellation while the request provably
-                # never started; past this point a cancelled write counts as issued.
-                await anyio.lowlevel.checkpoint_if_cancelled()
-                request_write_started = True
-                try:
-                    await self._write(msg, plan.metadata)
-                except (anyio.BrokenResourceError, anyio.ClosedResourceError):
-                    # Transport tore down before run() noticed EOF; surface the documented contract.
-                    raise MCPError(code=CONNECTION_CLOSED, message="Connection closed") from None
-                with anyio.fail_after(opts.get("timeout")):
-                    timeout_armed = True
-                    outcome = await receive.receive()
-        except TimeoutError:
-            if not timeout_armed:
-                # `fail_after` arms only after the write, so this TimeoutError is the
-                # transport's own bounded send() failing - a transport error, not
-                # `opts["timeout"]` elapsing. Propagate it raw (v1 kept the write
-                # outside the timeout-catching try and did the same).
+        with _metrics.Duration(_metrics.client_operation_duration, _metrics.operation_attributes(method, out_params)):
+            # TODO(maxisbey): move the otel span + inject into an outbound
+            # middleware once that seam exists; the dispatcher should not own otel.
+            try:
+                with otel_span(
+                    span_name,
+                    kind=SpanKind.CLIENT,
+                    attributes={"mcp.method.name": method, "jsonrpc.request.id": str(request_id)},
+                ):
+                    # SEP-414: inject W3C trace context; `_meta` stays on the wire even with a no-op tracer.
+                    inject_trace_context(out_meta)
+                    msg = JSONRPCRequest(jsonrpc="2.0", id=request_id, method=method, params=out_params)
+                    # Surface a pre-existing cancellation while the request provably
+                    # never started; past this point a cancelled write counts as issued.
+                    await anyio.lowlevel.checkpoint_if_cancelled()
+                    request_write_started = True
+                    try:
+                        await self._write(msg, plan.metadata)
+                    except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+                        # Transport tore down before run() noticed EOF; surface the documented contract.
+                        raise MCPError(code=CONNECTION_CLOSED, message="Connection closed") from None
+                    with anyio.fail_after(opts.get("timeout")):
+                        timeout_armed = True
+                        outcome = await receive.receive()
+            except TimeoutError:
+                if not timeout_armed:
+                    # `fail_after` arms only after the write, so this TimeoutError is the
+                    # transport's own bounded send() failing - a transport error, not
+                    # `opts["timeout"]` elapsing. Propagate it raw (v1 kept the write
+                    # outside the timeout-catching try and did the same).
+                    raise
+                # Courtesy cancel (spec-recommended, new vs v1) so the peer stops work;
+                # unshielded so an outer caller cancellation can still interrupt the write.
+                if plan.cancel_on_abandon:
+                    await self._final_write(
+                        partial(
+                            self._cancel_outbound,
+                            request_id,
+                            f"timed out after {opts.get('timeout')}s",
+                            _related_request_id,
+                        ),
+                        shield=False,
+                        timeout=_ABANDON_WRITE_TIMEOUT,
+                        describe=f"courtesy cancel for timed-out request {request_id!r}",
+                    )
+                raise MCPError(code=REQUEST_TIMEOUT, message=f"Request {method!r} timed out") from None
+            except anyio.get_cancelled_exc_class():
+                # Caller cancelled: bare awaits re-raise here, so the shielded helper
+                # lets the courtesy cancel go out before we propagate.
+                if plan.cancel_on_abandon and request_write_started:
+                    await self._final_write(
+                        partial(self._cancel_outbound, request_id, "caller cancelled", _related_request_id),
+                        shield=True,
+                        timeout=_ABANDON_WRITE_TIMEOUT,
+                        describe=f"courtesy cancel for caller-cancelled request {request_id!r}",
+                    )
                 raise
-            # Courtesy cancel (spec-recommended, new vs v1) so the peer stops work;
-            # unshielded so an outer caller cancellation can still interrupt the write.
-            if plan.cancel_on_abandon:
-                await self._final_write(
-                    partial(
-                        self._cancel_outbound,
-                        request_id,
-                        f"timed out after {opts.get('timeout')}s",
-                        _related_request_id,
-                    ),
-                    shield=False,
-                    timeout=_ABANDON_WRITE_TIMEOUT,
-                    describe=f"courtesy cancel for timed-out request {request_id!r}",
-                )
-            raise MCPError(code=REQUEST_TIMEOUT, message=f"Request {method!r} timed out") from None
-        except anyio.get_cancelled_exc_class():
-            # Caller cancelled: bare awaits re-raise here, so the shielded helper
-            # lets the courtesy cancel go out before we propagate.
-            if plan.cancel_on_abandon and request_write_started:
-                await self._final_write(
-                    partial(self._cancel_outbound, request_id, "caller cancelled", _related_request_id),
-                    shield=True,
-                    timeout=_ABANDON_WRITE_TIMEOUT,
-                    describe=f"courtesy cancel for caller-cancelled request {request_id!r}",
-                )
-            raise
-        finally:
-            # Remove the waiter on every path so a late response is dropped, not leaked.
-            self._pending.pop(pending_key, None)
-            send.close()
-            receive.close()
-
-        if isinstance(outcome, ErrorData):
-            raise MCPError(code=outcome.code, message=outcome.message, data=outcome.data)
-        return outcome
+            finally:
+                # Remove the waiter on every path so a late response is dropped, not leaked.
+                self._pending.pop(pending_key, None)
+                send.close()
+                receive.close()
+
+            if isinstance(outcome, ErrorData):
+                raise MCPError(code=outcome.code, message=outcome.message, data=outcome.data)
+            return outcome
 
     async def notify(
         self,
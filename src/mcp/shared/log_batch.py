@@ -0,0 +1,31 @@
+"""Batched `notifications/message`: several log messages in one notification.
+
+An SDK convention layered on the protocol, not part of the spec. A server
+buffering its log (`mcp.server.mcpserver.LogBuffer`) may send consecutive
+messages sharing a level and logger as one notification whose `data` is the
+list of their `data`, oldest first, marked with `LOG_BATCH_META_KEY` in the
+notification's `_meta`. An unmarked notification carries one message, so a
+message whose data is itself a list stays distinguishable from a batch. The
+SDK client hands a batch to its `logging_callback` one message at a time.
+"""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from mcp_types import LoggingMessageNotificationParams
+
+__all__ = ["LOG_BATCH_META_KEY", "log_batch_entries"]
+
+LOG_BATCH_META_KEY = "io.modelcontextprotocol.python-sdk/logBatch"
+"""The `_meta` key marking a `notifications/message` whose `data` lists several messages' data."""
+
+
+def log_batch_entries(params: LoggingMessageNotificationParams) -> list[LoggingMessageNotificationParams]:
+    """The messages `params` carries: one per entry of a marked batch, otherwise `params` itself."""
+    meta = params.meta or {}
+    batch: Any = params.data
+    if meta.get(LOG_BATCH_META_KEY) is not True or not isinstance(batch, list):
+        return [params]
+    rest = {key: value for key, value in meta.items() if key != LOG_BATCH_META_KEY}
+    return [params.model_copy(update={"data": data, "meta": rest or None}) for data in cast(list[Any], batch)]
@@ -50,6 +50,9 @@ class ServerMessageMetadata:
     # `TransportContext.can_send_request`); a transport that says nothing leaves
     # it True.
     can_send_request: bool = True
+    # Whether request-scoped notifications reach the client before the
+    # response (see `TransportContext.can_notify`).
+    can_notify: bool = True
 
 
 MessageMetadata = ClientMessageMetadata | ServerMessageMetadata | None
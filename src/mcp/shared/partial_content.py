@@ -0,0 +1,62 @@
+"""Partial `tools/call` content: result blocks a server sends ahead of the result itself.
+
+An SDK convention layered on the protocol, not part of the spec. A client
+opts in per request by setting `PARTIAL_CONTENT_META_KEY` in the
+`tools/call` request's `_meta` to a token of its choosing. The server may
+then send each chunk of the tool's content as a `PARTIAL_CONTENT_METHOD`
+notification on that request's stream, stamped with the same token, and
+answers with a `CallToolResult` holding only the content it did not send
+that way. A client that never opts in, or a server that does not know the
+convention, sees an ordinary call.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from mcp_types import ContentBlock, ProgressToken
+from pydantic import TypeAdapter, ValidationError
+
+from mcp.shared.dispatcher import as_request_id
+
+__all__ = [
+    "PARTIAL_CONTENT_META_KEY",
+    "PARTIAL_CONTENT_METHOD",
+    "partial_content_from_wire",
+    "partial_content_params",
+    "partial_content_token",
+]
+
+PARTIAL_CONTENT_META_KEY = "io.modelcontextprotocol.python-sdk/partialContent"
+"""The `_meta` key that opts a `tools/call` into partial content (request) and correlates each chunk (notification)."""
+
+PARTIAL_CONTENT_METHOD = "notifications/tools/partial_content"
+"""The notification carrying one chunk of a `tools/call` result's content."""
+
+_content_adapter: TypeAdapter[list[ContentBlock]] = TypeAdapter(list[ContentBlock])
+
+
+def partial_content_token(meta: Mapping[str, Any] | None) -> ProgressToken | None:
+    """The token a request's `_meta` opted in with, or `None` when it did not opt in."""
+    return as_request_id((meta or {}).get(PARTIAL_CONTENT_META_KEY))
+
+
+def partial_content_params(token: ProgressToken, content: Sequence[ContentBlock]) -> dict[str, Any]:
+    """The params of one chunk notification (the server's direction)."""
+    return {
+        "content": _content_adapter.dump_python(list(content), by_alias=True, mode="json", exclude_none=True),
+        "_meta": {PARTIAL_CONTENT_META_KEY: token},
+    }
+
+
+def partial_content_from_wire(params: Mapping[str, Any] | None) -> tuple[ProgressToken, list[ContentBlock]] | None:
+    """The token and content of a chunk notification, or `None` when `params` is not one (the client's direction)."""
+    match params:
+        case {"content": list(), "_meta": {**meta}} if (token := partial_content_token(meta)) is not None:
+            try:
+                return token, _content_adapter.validate_python(params["content"], by_name=False)
+            except ValidationError:
+                return None
+        case _:
+            return None
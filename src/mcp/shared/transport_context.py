@@ -37,6 +37,16 @@ class TransportContext:
     standalone channel, which refuses separately.
     """
 
+    can_notify: bool = True
+    """Whether request-scoped notifications reach the client before the response.
+
+    `False` where the response is a single JSON body with no room for anything
+    else: streamable HTTP in JSON-response mode, legacy or 2026-07-28. Such a
+    transport drops those notifications, so a handler with content it would
+    otherwise send ahead (`ServerSession.send_partial_content`) keeps it for
+    its result instead.
+    """
+
     headers: Mapping[str, str] | None = None
     """Request headers carried by this message, when the transport has them.
 
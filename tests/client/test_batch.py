@@ -0,0 +1,118 @@
+"""Bulk tool calls: `Client.call_tools` and `Client.call_tools_as_completed` (`mcp.client.batch`)."""
+
+import anyio
+import pytest
+from mcp_types import INVALID_PARAMS, CallToolResult, TextContent
+
+from mcp.client import Client, ToolCall
+from mcp.server.mcpserver import Context, MCPServer
+from mcp.shared.exceptions import MCPError
+
+pytestmark = pytest.mark.anyio
+
+
+def _server() -> tuple[MCPServer, list[int]]:
+    """`double` doubles `n` after a yield, recording the peak number of calls in flight; `n < 0` is refused."""
+    server = MCPServer("batch")
+    in_flight: list[int] = [0]
+    peaks: list[int] = []
+
+    @server.tool()
+    async def double(n: int, ctx: Context) -> int:
+        in_flight[0] += 1
+        peaks.append(in_flight[0])
+        try:
+            await ctx.report_progress(1, 2, f"doubling {n}")
+            await anyio.sleep(0.01)
+            if n < 0:
+                raise MCPError(INVALID_PARAMS, f"negative: {n}")
+            return 2 * n
+        finally:
+            in_flight[0] -= 1
+
+    return server, peaks
+
+
+def _text(result: CallToolResult | Exception) -> str:
+    assert isinstance(result, CallToolResult)
+    assert isinstance(result.content[0], TextContent)
+    return result.content[0].text
+
+
+async def test_results_come_back_in_call_order_under_the_concurrency_bound():
+    server, peaks = _server()
+
+    async with Client(server) as client:
+        results = await client.call_tools((ToolCall("double", {"n": n}) for n in range(6)), max_concurrency=2)
+
+    assert [_text(result) for result in results] == ["0", "2", "4", "6", "8", "10"]
+    assert max(peaks) == 2
+
+
+async def test_a_failed_call_is_returned_in_place_or_raised():
+    server, _ = _server()
+    calls = [ToolCall("double", {"n": 1}), ToolCall("double", {"n": -1}), ToolCall("double", {"n": 3})]
+
+    async with Client(server) as client:
+        ok, failed, also_ok = await client.call_tools(calls)
+        with pytest.raises(MCPError, match="negative: -1"):
+            await client.call_tools(calls, return_exceptions=False)
+        # The session outlives the failed batch.
+        assert _text(await client.call_tool("double", {"n": 4})) == "8"
+
+    assert (_text(ok), _text(also_ok)) == ("2", "6")
+    assert isinstance(failed, MCPError)
+
+
+async def test_progress_is_reported_with_the_index_of_each_call():
+    server, _ = _server()
+    seen: list[tuple[int, float, float | None, str | None]] = []
+
+    async def on_progress(index: int, progress: float, total: float | None, message: str | None) -> None:
+        seen.append((index, progress, total, message))
+
+    async with Client(server) as client:
+        await client.call_tools([ToolCall("double", {"n": n}) for n in (5, 7)], progress_callback=on_progress)
+
+    assert sorted(seen) == [(0, 1, 2, "doubling 5"), (1, 1, 2, "doubling 7")]
+
+
+async def test_leaving_the_stream_early_cancels_the_calls_still_in_flight():
+    server = MCPServer("batch")
+    started: list[str] = []
+    cancelled: list[str] = []
+    all_cancelled = anyio.Event()
+
+    @server.tool()
+    async def wait(name: str) -> str:
+        started.append(name)
+        if name == "fast":
+            return name
+        try:
+            await anyio.sleep_forever()
+        finally:
+            cancelled.append(name)
+            if len(cancelled) == 3:
+                all_cancelled.set()
+        raise NotImplementedError
+
+    calls = [ToolCall("wait", {"name": name}) for name in ("slow-1", "fast", "slow-2", "slow-3")]
+    async with Client(server) as client:
+        with anyio.fail_after(5):
+            async with client.call_tools_as_completed(calls, max_concurrency=3) as results:
+                async for index, result in results:
+                    assert (index, _text(result)) == (1, "fast")
+                    break
+            # The server hears of each cancellation asynchronously.
+            await all_cancelled.wait()
+
+    # "fast" freed its slot for "slow-3" before the consumer left.
+    assert sorted(started) == sorted(cancelled + ["fast"]) == ["fast", "slow-1", "slow-2", "slow-3"]
+
+
+async def test_max_concurrency_must_be_positive():
+    server, _ = _server()
+
+    async with Client(server) as client:
+        with pytest.raises(ValueError, match="max_concurrency must be >= 1, got 0"):
+            await client.call_tools([ToolCall("double", {"n": 1})], max_concurrency=0)
@@ -4,8 +4,10 @@ contract by adding its factory."""
 
 import json
 import logging
+import sqlite3
 import time
 from collections.abc import Awaitable, Callable
+from pathlib import Path
 from typing import Any
 
 import anyio
@@ -32,15 +34,23 @@ from mcp.client.caching import (
     CacheEntry,
     CacheKey,
     ClientResponseCache,
+    EraVerdict,
+    InMemoryEraVerdictStore,
     InMemoryResponseCacheStore,
     ResponseCacheStore,
+    SQLiteResponseCacheStore,
 )
 
 pytestmark = pytest.mark.anyio
 
-STORE_FACTORIES: list[Callable[[], ResponseCacheStore]] = [InMemoryResponseCacheStore]
+STORE_FACTORIES: list[Callable[[], ResponseCacheStore]] = [
+    InMemoryResponseCacheStore,
+    lambda: SQLiteResponseCacheStore(":memory:"),
+]
 
-store_contract = pytest.mark.parametrize("make_store", STORE_FACTORIES, ids=["InMemoryResponseCacheStore"])
+store_contract = pytest.mark.parametrize(
+    "make_store", STORE_FACTORIES, ids=["InMemoryResponseCacheStore", "SQLiteResponseCacheStore"]
+)
 
 
 def _entry(value: Any = "cached") -> CacheEntry:
@@ -214,6 +224,12 @@ def test_a_negative_default_ttl_is_rejected_at_construction() -> None:
     assert str(exc.value) == snapshot("default_ttl_ms must be >= 0, got -1")
 
 
+def test_a_negative_era_ttl_is_rejected_at_construction() -> None:
+    with pytest.raises(ValueError) as exc:
+        CacheConfig(era_ttl_ms=-1)
+    assert str(exc.value) == snapshot("era_ttl_ms must be >= 0, got -1")
+
+
 # --- InMemoryResponseCacheStore LRU cap ---
 
 
@@ -284,6 +300,219 @@ def test_a_negative_cap_is_rejected_at_construction() -> None:
     assert str(exc.value) == snapshot("max_entries must be >= 0, got -1")
 
 
+# --- InMemoryEraVerdictStore ---
+
+
+async def test_the_era_verdict_store_evicts_the_least_recently_used_verdict_past_its_cap() -> None:
+    store = InMemoryEraVerdictStore(max_entries=2)
+    legacy = EraVerdict(discover=None, expires_at=1.0)
+    await store.set("a", legacy)
+    await store.set("b", legacy)
+    assert await store.get("a") == legacy  # a is now the most recent
+    await store.set("b", legacy)  # replacing refreshes b without evicting
+    await store.set("c", legacy)  # evicts a
+    assert await store.get("a") is None
+    assert await store.get("b") == legacy
+    await store.delete("b")
+    assert await store.get("b") is None
+
+
+def test_the_era_verdict_store_rejects_a_negative_cap() -> None:
+    with pytest.raises(ValueError) as exc:
+        InMemoryEraVerdictStore(max_entries=-1)
+    assert str(exc.value) == snapshot("max_entries must be >= 0, got -1")
+
+
+class _Rejected(Exception):
+    def __init__(self, status: int) -> None:
+        super().__init__(f"rejected with {status}")
+        self.status = status
+
+
+def _invalid_listing() -> Exception:
+    try:
+        ListToolsResult.model_validate({"tools": 1})
+    except ValueError as exc:
+        return exc
+    raise AssertionError("the listing validated")  # pragma: no cover
+
+
+@pytest.mark.parametrize("error", [_Rejected(503), _invalid_listing()], ids=["custom-init", "validation"])
+async def test_each_waiter_on_a_failed_fetch_raises_its_own_copy_of_the_error(error: Exception) -> None:
+    coordinator = _coordinator(InMemoryResponseCacheStore())
+    raised: list[Exception] = []
+
+    async def wait() -> None:
+        try:
+            await coordinator.follow("tools/list", "")
+        except type(error) as exc:
+            raised.append(exc)
+
+    async with anyio.create_task_group() as tg:
+        with pytest.raises(type(error)), coordinator.fetching("tools/list", ""):
+            tg.start_soon(wait)
+            tg.start_soon(wait)
+            await anyio.wait_all_tasks_blocked()
+            raise error
+
+    assert len(raised) == 2 and raised[0] is not raised[1]
+    assert all(exc is not error and exc.__cause__ is error for exc in raised)
+    assert [str(exc) for exc in raised] == [str(error)] * 2
+    assert [exc.__dict__ for exc in raised] == [error.__dict__] * 2
+
+
+# --- SQLiteResponseCacheStore ---
+
+
+def _expiring(expires_at: float, value: Any = "cached") -> CacheEntry:
+    return CacheEntry(value=value, scope="private", expires_at=expires_at)
+
+
+async def test_processes_sharing_a_database_file_share_public_entries_but_not_private_ones(tmp_path: Path) -> None:
+    """Each store stands in for one process; the coordinator's arms keep private entries per partition."""
+    path = tmp_path / "cache.db"
+    clock = _ManualClock()
+    tenant_a = _coordinator(SQLiteResponseCacheStore(path), partition="tenant-a", share_public=True, clock=clock)
+    tenant_b = _coordinator(SQLiteResponseCacheStore(path), partition="tenant-b", share_public=True, clock=clock)
+
+    public_result = _wire_result(ttl_ms=60_000, cache_scope="public")
+    gen = tenant_a.capture("tools/list", "")
+    await tenant_a.write("tools/list", "", public_result, gen, "use")
+    private_result = ListPromptsResult.model_validate({"prompts": [], "ttlMs": 60_000})
+    gen = tenant_a.capture("prompts/list", "")
+    await tenant_a.write("prompts/list", "", private_result, gen, "use")
+
+    served = await tenant_b.read("tools/list", "")
+    assert isinstance(served, ListToolsResult)
+    assert served == public_result
+    assert await tenant_b.read("prompts/list", "") is None
+    assert await tenant_a.read("prompts/list", "") == private_result
+
+
+async def test_entries_survive_closing_and_reopening_the_database(tmp_path: Path) -> None:
+    store = SQLiteResponseCacheStore(tmp_path / "cache.db")
+    entry = _expiring(2_000_000.0, ReadResourceResult.model_validate({"contents": [], "ttlMs": 1}))
+    await store.set(_read_key("file:///a"), entry)
+    store.close()
+    store.close()
+    assert await store.get(_read_key("file:///a")) == entry
+    assert await SQLiteResponseCacheStore(tmp_path / "cache.db").get(_read_key("file:///a")) == entry
+
+
+async def test_past_the_entry_cap_the_soonest_expiring_entries_are_evicted_first() -> None:
+    store = SQLiteResponseCacheStore(":memory:", max_entries=2, clock=lambda: 1_000.0)
+    await store.set(_read_key("file:///late"), _expiring(3_000.0))
+    await store.set(_read_key("file:///never-fresh"), CacheEntry(value="x", scope="private", expires_at=None))
+    await store.set(_read_key("file:///soon"), _expiring(2_000.0))
+    await store.set(_read_key("file:///later"), _expiring(4_000.0))
+    assert await store.get(_read_key("file:///never-fresh")) is None
+    assert await store.get(_read_key("file:///soon")) is None
+    assert await store.get(_read_key("file:///late")) == _expiring(3_000.0)
+    assert await store.get(_read_key("file:///later")) == _expiring(4_000.0)
+
+
+async def test_past_the_byte_cap_entries_are_evicted_until_the_stored_json_fits() -> None:
+    store = SQLiteResponseCacheStore(":memory:", max_entries=0, max_bytes=250, clock=lambda: 0.0)
+    for i in range(3):
+        await store.set(_read_key(f"file:///{i}"), _expiring(1_000.0 + i, "x" * 100))
+    assert await store.get(_read_key("file:///0")) is None
+    assert await store.get(_read_key("file:///1")) is not None
+    assert await store.get(_read_key("file:///2")) is not None
+
+
+async def test_past_a_cap_every_stale_entry_is_dropped_before_fresh_ones_are_evicted() -> None:
+    store = SQLiteResponseCacheStore(":memory:", max_entries=3, clock=lambda: 2_500.0)
+    for uri, expires_at in [("stale", 2_000.0), ("staler", 1_500.0), ("fresh", 3_000.0), ("fresher", 4_000.0)]:
+        await store.set(_read_key(f"file:///{uri}"), _expiring(expires_at))
+    assert await store.get(_read_key("file:///stale")) is None
+    assert await store.get(_read_key("file:///staler")) is None
+    assert await store.get(_read_key("file:///fresh")) == _expiring(3_000.0)
+    assert await store.get(_read_key("file:///fresher")) == _expiring(4_000.0)
+
+
+async def test_the_running_totals_track_stored_bytes_through_every_kind_of_write(tmp_path: Path) -> None:
+    """The caps read the totals row, so it must match the table, counting UTF-8 bytes rather than characters."""
+    path = tmp_path / "cache.db"
+    store = SQLiteResponseCacheStore(path)
+
+    def totals() -> tuple[tuple[int, int], tuple[int, int]]:
+        with sqlite3.connect(path) as connection:
+            kept = connection.execute("SELECT value FROM mcp_response_cache").fetchall()
+            (tracked,) = connection.execute("SELECT entries, bytes FROM mcp_response_cache_totals").fetchall()
+        return tracked, (len(kept), sum(len(value.encode()) for (value,) in kept))
+
+    def text(body: str) -> CacheEntry:
+        result = ReadResourceResult.model_validate({"contents": [{"uri": "file:///a", "text": body}], "ttlMs": 1})
+        return _expiring(2_000_000.0, result)
+
+    await store.set(_read_key("file:///a"), text("é" * 50))
+    await store.set(_read_key("file:///b"), text("ü"))
+    tracked, actual = totals()
+    assert tracked == actual
+    assert actual[1] > len("é" * 50) * 2
+    await store.set(_read_key("file:///a"), text("short"))
+    tracked, actual = totals()
+    assert tracked == actual
+    assert actual[0] == 2
+    await store.delete(_read_key("file:///b"))
+    tracked, actual = totals()
+    assert tracked == actual
+    assert actual[0] == 1
+    await store.clear()
+    assert totals() == ((0, 0), (0, 0))
+
+
+async def test_a_database_written_before_the_schema_had_a_version_is_started_over(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "CREATE TABLE mcp_response_cache (method TEXT NOT NULL, params_key TEXT NOT NULL, partition TEXT NOT NULL,"
+            " scope TEXT NOT NULL, expires_at REAL, value_type TEXT NOT NULL, value TEXT NOT NULL,"
+            " PRIMARY KEY (method, params_key, partition))"
+        )
+        connection.execute(
+            "INSERT INTO mcp_response_cache VALUES ('resources/read', 'file:///old', '', 'private', 1, '', '1')"
+        )
+    store = SQLiteResponseCacheStore(path, max_entries=1)
+    assert await store.get(_read_key("file:///old")) is None
+    await store.set(_read_key("file:///a"), _expiring(2_000_000.0))
+    assert await store.get(_read_key("file:///a")) == _expiring(2_000_000.0)
+
+
+async def test_an_entry_larger_than_the_byte_cap_is_not_kept() -> None:
+    store = SQLiteResponseCacheStore(":memory:", max_bytes=10, clock=lambda: 0.0)
+    await store.set(_read_key("file:///huge"), _expiring(1_000.0, "x" * 100))
+    assert await store.get(_read_key("file:///huge")) is None
+
+
+async def test_a_stored_entry_that_no_longer_decodes_is_dropped_as_a_miss(tmp_path: Path) -> None:
+    """A row written by another SDK version must read as a miss, never an error, and not linger."""
+    path = tmp_path / "cache.db"
+    store = SQLiteResponseCacheStore(path)
+    await store.set(_read_key("file:///warm"), _expiring(2_000.0))
+    with sqlite3.connect(path) as connection:
+        connection.executemany(
+            "INSERT INTO mcp_response_cache VALUES (?, ?, ?, 'private', 2000.0, ?, ?)",
+            [
+                ("resources/read", "file:///renamed", "", "RenamedResult", "{}"),
+                ("resources/read", "file:///reshaped", "", "ListToolsResult", '{"tools": 1}'),
+                ("resources/read", "file:///garbled", "", "", "{"),
+            ],
+        )
+    for uri in ("file:///renamed", "file:///reshaped", "file:///garbled"):
+        assert await store.get(_read_key(uri)) is None
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT params_key FROM mcp_response_cache").fetchall() == [("file:///warm",)]
+
+
+@pytest.mark.parametrize("cap", ["max_entries", "max_bytes"])
+def test_a_negative_sqlite_cap_is_rejected_at_construction(cap: str) -> None:
+    caps: dict[str, Any] = {cap: -1}
+    with pytest.raises(ValueError) as exc:
+        SQLiteResponseCacheStore(":memory:", **caps)
+    assert str(exc.value) == f"{cap} must be >= 0, got -1"
+
+
 # --- ClientResponseCache coordinator ---
 
 MODERN_VERSION = "2026-07-28"
@@ -692,6 +921,34 @@ async def test_an_entry_without_an_expiry_is_never_fresh() -> None:
     assert await cache.read("tools/list", "") is None
 
 
+# --- Coordinator: copy isolation ---
+
+
+async def test_cached_results_share_no_mutable_state_with_the_caller_in_either_direction() -> None:
+    """Free-form JSON (an input schema) is copied too, and unset fields stay unset so hints resolve the same."""
+    store = InMemoryResponseCacheStore()
+    cache = _coordinator(store)
+    result = ListToolsResult.model_validate(
+        {
+            "tools": [{"name": "t", "inputSchema": {"type": "object", "properties": {"q": {"type": "string"}}}}],
+            "ttlMs": 60_000,
+        }
+    )
+    gen = cache.capture("tools/list", "")
+    await cache.write("tools/list", "", result, gen, "use")
+    result.tools[0].input_schema["properties"]["q"]["type"] = "tampered-after-fetch"
+
+    served = await cache.read("tools/list", "")
+    assert isinstance(served, ListToolsResult)
+    assert served.tools[0].input_schema["properties"]["q"]["type"] == "string"
+    assert served.model_fields_set == {"tools", "ttl_ms"}
+    served.tools[0].input_schema["properties"]["q"]["type"] = "tampered-after-serve"
+
+    again = await cache.read("tools/list", "")
+    assert isinstance(again, ListToolsResult)
+    assert again.tools[0].input_schema["properties"]["q"]["type"] == "string"
+
+
 # --- Coordinator: write ordering ---
 
 
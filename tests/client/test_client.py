@@ -9,6 +9,7 @@ from contextlib import asynccontextmanager, contextmanager
 from unittest.mock import patch
 
 import anyio
+import httpx2
 import mcp_types as types
 import pytest
 from inline_snapshot import snapshot
@@ -397,10 +398,13 @@ async def test_complete_with_prompt_reference(simple_server: Server):
         )
 
 
-def test_client_with_url_initializes_streamable_http_transport():
-    with patch("mcp.client.client.streamable_http_client") as mock:
-        _ = Client("http://localhost:8000/mcp")
-    mock.assert_called_once_with("http://localhost:8000/mcp")
+async def test_client_with_url_initializes_streamable_http_transport():
+    async with httpx2.AsyncClient() as http:
+        with patch("mcp.client.client.streamable_http_client", side_effect=RuntimeError("stop")) as mock:
+            with pytest.raises(RuntimeError, match="stop"):
+                async with Client("http://localhost:8000/mcp", http_client=http):
+                    pass  # pragma: no cover
+    mock.assert_called_once_with("http://localhost:8000/mcp", http_client=http)
 
 
 async def test_client_uses_transport_directly(app: MCPServer):
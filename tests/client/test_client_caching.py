@@ -16,6 +16,7 @@ import httpx2
 import mcp_types as types
 import pytest
 from inline_snapshot import snapshot
+from logfire.testing import CaptureLogfire
 from mcp_types import (
     INTERNAL_ERROR,
     INVALID_PARAMS,
@@ -49,6 +50,7 @@ from mcp.client.caching import (
     CacheEntry,
     CacheKey,
     ClientResponseCache,
+    InMemoryEraVerdictStore,
     InMemoryResponseCacheStore,
 )
 from mcp.client.streamable_http import streamable_http_client
@@ -195,6 +197,31 @@ def test_a_custom_store_without_a_url_or_target_id_is_rejected(make_server: Any)
     )
 
 
+def test_an_era_store_without_a_url_or_target_id_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        Client(Server("plain"), cache=CacheConfig(era_store=InMemoryEraVerdictStore()))
+
+
+async def test_a_reconnect_adopts_the_remembered_discover_result_without_probing() -> None:
+    probes: list[str] = []
+
+    async def on_discover(ctx: ServerRequestContext, params: types.RequestParams | None) -> DiscoverResult:
+        probes.append(ctx.protocol_version)
+        return DiscoverResult(supported_versions=[LATEST_MODERN_VERSION], capabilities=ServerCapabilities())
+
+    server = Server("plain")
+    server.add_request_handler("server/discover", types.RequestParams, on_discover)
+    config = CacheConfig(era_store=InMemoryEraVerdictStore(), target_id="svc")
+
+    async with Client(server, cache=config) as first:
+        remembered = first.session.discover_result
+        assert remembered is not None
+    async with Client(server, cache=config) as second:
+        assert second.session.discover_result == remembered
+        assert second.session.protocol_version == LATEST_MODERN_VERSION
+    assert len(probes) == 1
+
+
 def test_a_custom_store_with_a_url_server_constructs_and_is_used() -> None:
     store = InMemoryResponseCacheStore()
     client = Client("https://example.com/mcp", cache=CacheConfig(store=store, partition="p"))
@@ -1310,7 +1337,7 @@ async def test_same_partition_clients_share_read_entries_through_the_store() ->
 
 
 async def test_mutating_returned_results_never_corrupts_the_cached_entry() -> None:
-    """Deep-copy isolation in both directions: write-side (the fetched result) and
+    """Copy isolation in both directions: write-side (the fetched result) and
     serve-side (the served hit)."""
     server, fetches = _varying_tools_server()
 
@@ -1572,3 +1599,251 @@ async def test_a_closed_client_raises_on_every_cacheable_verb_instead_of_serving
         await client.read_resource("memo://a")
 
     assert len(fetched) == 5  # nothing was served from the cache and nothing reached the server
+
+
+# --- Coalescing and stale-while-revalidate ---
+
+
+class _Gate:
+    """Holds every tools/list fetch until opened; `close` makes the next ones wait again."""
+
+    def __init__(self) -> None:
+        self._event = anyio.Event()
+        self.fail = False
+
+    def open(self) -> None:
+        self._event.set()
+
+    def close(self) -> None:
+        self._event = anyio.Event()
+
+    async def wait(self) -> None:
+        await self._event.wait()
+
+
+def _gated_tools_server(gate: _Gate, *, ttl_ms: int = 60_000) -> tuple[Server[Any], list[str | None]]:
+    """`_varying_tools_server`, but every fetch waits for `gate` before answering."""
+    fetches: list[str | None] = []
+
+    async def list_tools(ctx: ServerRequestContext, params: types.PaginatedRequestParams | None) -> ListToolsResult:
+        fetches.append(None)
+        name = f"t{len(fetches) - 1}"
+        await gate.wait()
+        if gate.fail:
+            raise MCPError(code=INTERNAL_ERROR, message="listing failed")
+        return ListToolsResult(tools=[Tool(name=name, input_schema={"type": "object"})])
+
+    server = Server("gated", on_list_tools=list_tools, cache_hints={"tools/list": CacheHint(ttl_ms=ttl_ms)})
+    return server, fetches
+
+
+async def test_concurrent_misses_share_one_fetch_and_each_get_a_private_copy(capfire: CaptureLogfire) -> None:
+    gate = _Gate()
+    server, fetches = _gated_tools_server(gate)
+    results: list[ListToolsResult] = []
+
+    async def list_tools(client: Client) -> None:
+        results.append(await client.list_tools())
+
+    async with Client(server, cache=CacheConfig(clock=_ManualClock())) as client:
+        async with anyio.create_task_group() as tg:
+            for _ in range(4):
+                tg.start_soon(list_tools, client)
+            await anyio.wait_all_tasks_blocked()
+            gate.open()
+
+    assert fetches == [None]
+    assert [_tool_names(result) for result in results] == [["t0"]] * 4
+    results[0].tools[0].name = "tampered"
+    results[1].tools[0].name = "tampered"
+    assert [_tool_names(result) for result in results[2:]] == [["t0"]] * 2
+    coalesced = [
+        point["value"]
+        for metric in capfire.get_collected_metrics()
+        if metric["name"] == "mcp.client.cache.coalesced"
+        for point in metric["data"]["data_points"]
+    ]
+    assert coalesced == [3]
+
+
+async def test_a_failed_shared_fetch_raises_in_every_waiting_caller() -> None:
+    gate = _Gate()
+    gate.fail = True
+    server, fetches = _gated_tools_server(gate)
+    errors: list[MCPError] = []
+
+    async def list_tools(client: Client) -> None:
+        with pytest.raises(MCPError) as exc:
+            await client.list_tools()
+        errors.append(exc.value)
+
+    async with Client(server, cache=CacheConfig(clock=_ManualClock())) as client:
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(list_tools, client)
+            await anyio.wait_all_tasks_blocked()
+            gate.open()
+
+    assert fetches == [None]
+    assert [error.error.message for error in errors] == ["listing failed"] * 3
+    # The leader raises the original; each waiter raises its own copy, chained to it.
+    assert len({id(error) for error in errors}) == 3
+    assert sum(error.__cause__ in errors for error in errors) == 2
+
+
+async def test_a_cancelled_shared_fetch_releases_its_waiters_to_fetch_for_themselves() -> None:
+    gate = _Gate()
+    server, fetches = _gated_tools_server(gate)
+    leader = anyio.CancelScope()
+    served: list[list[str]] = []
+
+    async def lead(client: Client) -> None:
+        with leader:
+            await client.list_tools()
+
+    async def follow(client: Client) -> None:
+        served.append(_tool_names(await client.list_tools()))
+
+    async with Client(server, cache=CacheConfig(clock=_ManualClock())) as client:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(lead, client)
+            await anyio.wait_all_tasks_blocked()
+            tg.start_soon(follow, client)
+            await anyio.wait_all_tasks_blocked()
+            leader.cancel()
+            await anyio.wait_all_tasks_blocked()
+            gate.open()
+
+    assert fetches == [None, None]
+    assert served == [["t1"]]
+
+
+async def test_a_refresh_racing_an_in_flight_fetch_fetches_again_unshared() -> None:
+    gate = _Gate()
+    server, fetches = _gated_tools_server(gate)
+    served: list[list[str]] = []
+
+    async def list_tools(client: Client, mode: Literal["use", "refresh"]) -> None:
+        served.append(_tool_names(await client.list_tools(cache_mode=mode)))
+
+    async with Client(server, cache=CacheConfig(clock=_ManualClock())) as client:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(list_tools, client, "use")
+            await anyio.wait_all_tasks_blocked()
+            tg.start_soon(list_tools, client, "refresh")
+            await anyio.wait_all_tasks_blocked()
+            gate.open()
+
+    assert fetches == [None, None]
+    assert sorted(served) == [["t0"], ["t1"]]
+
+
+async def test_concurrent_reads_of_one_uri_share_one_fetch() -> None:
+    gate = anyio.Event()
+    reads: list[str] = []
+
+    async def read(ctx: ServerRequestContext, params: types.ReadResourceRequestParams) -> ReadResourceResult:
+        reads.append(params.uri)
+        await gate.wait()
+        return ReadResourceResult(contents=[TextResourceContents(uri=params.uri, text="body")])
+
+    server = Server("res", on_read_resource=read, cache_hints={"resources/read": CacheHint(ttl_ms=60_000)})
+    results: list[ReadResourceResult] = []
+
+    async def read_resource(client: Client) -> None:
+        results.append(await client.read_resource("memo://a"))
+
+    async with Client(server, cache=CacheConfig(clock=_ManualClock())) as client:
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(read_resource, client)
+            await anyio.wait_all_tasks_blocked()
+            gate.set()
+
+    assert reads == ["memo://a"]
+    assert len(results) == 3 and results[0] == results[1] == results[2]
+
+
+async def test_an_entry_in_its_stale_window_is_served_while_one_background_fetch_refreshes_it(
+    capfire: CaptureLogfire,
+) -> None:
+    clock = _ManualClock()
+    gate = _Gate()
+    gate.open()
+    server, fetches = _gated_tools_server(gate, ttl_ms=10_000)
+
+    async with Client(server, cache=CacheConfig(clock=clock, stale_while_revalidate_ms=5_000)) as client:
+        assert _tool_names(await client.list_tools()) == ["t0"]
+        clock.now += 12.0
+        gate.close()
+        # The refresh holds the key while the server keeps it waiting; later stale hits start no other.
+        assert _tool_names(await client.list_tools()) == ["t0"]
+        assert _tool_names(await client.list_tools()) == ["t0"]
+        await anyio.wait_all_tasks_blocked()
+        assert fetches == [None, None]
+        gate.open()
+        await anyio.wait_all_tasks_blocked()
+        assert _tool_names(await client.list_tools()) == ["t1"]
+        # Past the window an expired entry is a plain miss.
+        clock.now += 16.0
+        assert _tool_names(await client.list_tools()) == ["t2"]
+
+    assert fetches == [None, None, None]
+    lookups = {
+        point["attributes"]["mcp.cache.result"]: point["value"]
+        for metric in capfire.get_collected_metrics()
+        if metric["name"] == "mcp.client.cache.lookups"
+        for point in metric["data"]["data_points"]
+    }
+    assert lookups == {"miss": 2, "stale": 2, "hit": 1}
+
+
+async def test_a_failed_background_refresh_is_logged_and_the_stale_entry_still_served(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    clock = _ManualClock()
+    gate = _Gate()
+    gate.open()
+    server, fetches = _gated_tools_server(gate, ttl_ms=10_000)
+
+    async with Client(server, cache=CacheConfig(clock=clock, stale_while_revalidate_ms=5_000)) as client:
+        assert _tool_names(await client.list_tools()) == ["t0"]
+        clock.now += 12.0
+        gate.fail = True
+        assert _tool_names(await client.list_tools()) == ["t0"]
+        await anyio.wait_all_tasks_blocked()
+        assert _tool_names(await client.list_tools()) == ["t0"]
+        await anyio.wait_all_tasks_blocked()
+
+    assert fetches == [None, None, None]
+    assert [record.getMessage() for record in caplog.records if record.name == "mcp.client.client"] == [
+        "Refreshing a stale tools/list cache entry failed"
+    ] * 2
+
+
+async def test_a_stale_read_is_served_and_refreshed_and_a_pending_refresh_is_cancelled_on_close() -> None:
+    clock = _ManualClock()
+    gate = anyio.Event()
+    reads: list[str] = []
+
+    async def read(ctx: ServerRequestContext, params: types.ReadResourceRequestParams) -> ReadResourceResult:
+        reads.append(params.uri)
+        if len(reads) > 1:
+            await gate.wait()
+        return ReadResourceResult(contents=[TextResourceContents(uri=params.uri, text=f"v{len(reads)}")])
+
+    server = Server("res", on_read_resource=read, cache_hints={"resources/read": CacheHint(ttl_ms=10_000)})
+
+    async with Client(server, cache=CacheConfig(clock=clock, stale_while_revalidate_ms=5_000)) as client:
+        assert _resource_text(await client.read_resource("memo://a")) == "v1"
+        clock.now += 11.0
+        assert _resource_text(await client.read_resource("memo://a")) == "v1"
+        await anyio.wait_all_tasks_blocked()
+        assert reads == ["memo://a"] * 2
+    # Leaving the client cancelled the refresh still waiting on the server.
+
+
+def test_a_negative_stale_window_is_rejected() -> None:
+    with pytest.raises(ValueError) as exc:
+        CacheConfig(stale_while_revalidate_ms=-1)
+    assert str(exc.value) == "stale_while_revalidate_ms must be >= 0, got -1"
@@ -1,8 +1,10 @@
 import logging
 from typing import Any
 
+import anyio
 import pytest
 from mcp_types import (
+    INTERNAL_ERROR,
     CallToolRequestParams,
     CallToolResult,
     ListToolsResult,
@@ -11,7 +13,8 @@ from mcp_types import (
     Tool,
 )
 
-from mcp import Client
+from mcp import Client, MCPError
+from mcp.client import OutputValidation
 from mcp.server import Server, ServerRequestContext
 
 
@@ -163,3 +166,172 @@ async def test_tool_not_listed_warning(caplog: pytest.LogCaptureFixture):
         assert result.is_error is False
 
         assert "Tool mystery_tool not listed" in caplog.text
+
+
+_INTEGER_RESULT = {"type": "object", "properties": {"result": {"type": "integer"}}, "required": ["result"]}
+
+
+def _counting_server(schemas: list[dict[str, Any]], listings: list[str]) -> Server:
+    """`count` declares the next of `schemas` on each listing (the last one repeats) and returns a string result."""
+
+    async def on_list_tools(ctx: ServerRequestContext, params: PaginatedRequestParams | None) -> ListToolsResult:
+        listings.append("tools/list")
+        schema = schemas.pop(0) if len(schemas) > 1 else schemas[0]
+        return ListToolsResult(tools=[Tool(name="count", input_schema={"type": "object"}, output_schema=schema)])
+
+    async def on_call_tool(ctx: ServerRequestContext, params: CallToolRequestParams) -> CallToolResult:
+        return CallToolResult(content=[], structured_content={"result": "not an integer"})
+
+    return Server("test-server", on_list_tools=on_list_tools, on_call_tool=on_call_tool)
+
+
+@pytest.mark.anyio
+async def test_output_validation_off_skips_the_check_and_the_schema_refresh():
+    listings: list[str] = []
+    server = _counting_server([_INTEGER_RESULT], listings)
+
+    async with Client(server, output_validation=OutputValidation(mode="off")) as client:
+        result = await client.call_tool("count", {})
+
+    assert result.structured_content == {"result": "not an integer"}
+    assert listings == []
+
+
+@pytest.mark.anyio
+async def test_output_validation_sampled_checks_only_the_sampled_share():
+    draws = iter([0.5, 0.05, 0.9])
+    server = _counting_server([_INTEGER_RESULT], [])
+    validation = OutputValidation(mode="sampled", sample_rate=0.1, rng=lambda: next(draws))
+
+    async with Client(server, output_validation=validation) as client:
+        await client.call_tool("count", {})
+        with pytest.raises(RuntimeError, match="Invalid structured content returned by tool count"):
+            await client.call_tool("count", {})
+        await client.call_tool("count", {})
+
+
+@pytest.mark.anyio
+async def test_output_validation_first_checks_n_results_per_schema():
+    listings: list[str] = []
+    lenient = {"type": "object"}
+    server = _counting_server([lenient, lenient, _INTEGER_RESULT], listings)
+
+    async with Client(server, output_validation=OutputValidation(mode="first", first_n=2)) as client:
+        for _ in range(3):
+            await client.call_tool("count", {})
+        assert listings == ["tools/list"]
+
+        await client.session.list_tools()  # an unchanged schema keeps the count
+        await client.call_tool("count", {})
+        await client.session.list_tools()  # a changed schema restarts it
+        with pytest.raises(RuntimeError, match="Invalid structured content returned by tool count"):
+            await client.call_tool("count", {})
+
+
+@pytest.mark.anyio
+async def test_concurrent_results_for_an_unknown_tool_share_one_schema_refresh():
+    listings: list[str] = []
+    release = anyio.Event()
+
+    async def on_list_tools(ctx: ServerRequestContext, params: PaginatedRequestParams | None) -> ListToolsResult:
+        listings.append("tools/list")
+        await release.wait()
+        return ListToolsResult(
+            tools=[Tool(name="count", input_schema={"type": "object"}, output_schema=_INTEGER_RESULT)]
+        )
+
+    server = Server("test-server", on_list_tools=on_list_tools)
+    result = CallToolResult(content=[], structured_content={"result": 1})
+
+    async with Client(server) as client:
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+                tg.start_soon(client.session.validate_tool_result, "count", result)
+            await anyio.wait_all_tasks_blocked()
+            release.set()
+
+        assert listings == ["tools/list"]
+        assert client.session._tool_validation_counts == {"count": 5}
+
+
+@pytest.mark.anyio
+async def test_a_failed_schema_refresh_raises_in_every_waiting_caller():
+    release = anyio.Event()
+
+    async def on_list_tools(ctx: ServerRequestContext, params: PaginatedRequestParams | None) -> ListToolsResult:
+        await release.wait()
+        raise MCPError(INTERNAL_ERROR, "listing is down")
+
+    server = Server("test-server", on_list_tools=on_list_tools)
+    result = CallToolResult(content=[], structured_content={"result": 1})
+    errors: list[BaseException] = []
+
+    async def validate() -> None:
+        try:
+            await client.session.validate_tool_result("count", result)
+        except MCPError as exc:
+            errors.append(exc)
+
+    async with Client(server) as client:
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(validate)
+            await anyio.wait_all_tasks_blocked()
+            release.set()
+
+    assert [str(error) for error in errors] == ["listing is down"] * 3
+    assert len({id(error) for error in errors}) == 3
+
+
+@pytest.mark.anyio
+async def test_callers_waiting_on_a_cancelled_schema_refresh_refresh_again():
+    listings: list[str] = []
+    first_listing = anyio.Event()
+
+    async def on_list_tools(ctx: ServerRequestContext, params: PaginatedRequestParams | None) -> ListToolsResult:
+        listings.append("tools/list")
+        if len(listings) == 1:
+            first_listing.set()
+            await anyio.sleep_forever()
+        return ListToolsResult(
+            tools=[Tool(name="count", input_schema={"type": "object"}, output_schema=_INTEGER_RESULT)]
+        )
+
+    server = Server("test-server", on_list_tools=on_list_tools)
+    invalid = CallToolResult(content=[], structured_content={"result": "not an integer"})
+
+    leader = anyio.CancelScope()
+    errors: list[RuntimeError] = []
+
+    async def lead() -> None:
+        with leader:
+            await client.session.validate_tool_result("count", invalid)
+
+    async def wait() -> None:
+        with pytest.raises(RuntimeError, match="Invalid structured content returned by tool count") as raised:
+            await client.session.validate_tool_result("count", invalid)
+        errors.append(raised.value)
+
+    async with Client(server) as client:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(lead)
+            await first_listing.wait()
+            tg.start_soon(wait)
+            await anyio.wait_all_tasks_blocked()
+            leader.cancel()
+
+    assert listings == ["tools/list", "tools/list"]
+    assert len(errors) == 1
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"sample_rate": 0}, "sample_rate must be in \\(0, 1\\], got 0"),
+        ({"sample_rate": 1.5}, "sample_rate must be in \\(0, 1\\], got 1.5"),
+        ({"first_n": 0}, "first_n must be >= 1, got 0"),
+    ],
+)
+def test_output_validation_rejects_out_of_range_settings(kwargs: dict[str, Any], message: str):
+    with pytest.raises(ValueError, match=message):
+        OutputValidation(**kwargs)
@@ -0,0 +1,178 @@
+"""`Client.iter_tools` and the other paginated iterators (`mcp.client._pagination`)."""
+
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from typing import Any
+
+import anyio
+import mcp_types as types
+import pytest
+from mcp_types import INTERNAL_ERROR, ListToolsResult, PaginatedRequestParams, Tool
+
+from mcp.client import Client, PaginationCycleError
+from mcp.client._pagination import paginate
+from mcp.server import Server, ServerRequestContext
+from mcp.shared.exceptions import MCPError
+
+pytestmark = pytest.mark.anyio
+
+_PAGES: dict[str | None, tuple[list[str], str | None]] = {
+    None: (["a", "b"], "page-2"),
+    "page-2": (["c"], "page-3"),
+    "page-3": (["d", "e"], None),
+}
+
+
+def _paged_server(cursors: list[str | None], pages: dict[str | None, tuple[list[str], str | None]] = _PAGES) -> Server:
+    """Serves `pages` for every list verb, recording each requested cursor in `cursors`."""
+
+    def page(params: PaginatedRequestParams | None) -> tuple[list[str], str | None]:
+        cursor = params.cursor if params is not None else None
+        cursors.append(cursor)
+        return pages[cursor]
+
+    async def on_list_tools(ctx: ServerRequestContext, params: PaginatedRequestParams | None) -> ListToolsResult:
+        names, next_cursor = page(params)
+        return ListToolsResult(
+            tools=[Tool(name=name, input_schema={"type": "object"}) for name in names], next_cursor=next_cursor
+        )
+
+    async def on_list_resources(
+        ctx: ServerRequestContext, params: PaginatedRequestParams | None
+    ) -> types.ListResourcesResult:
+        names, next_cursor = page(params)
+        return types.ListResourcesResult(
+            resources=[types.Resource(name=name, uri=f"test://{name}") for name in names], next_cursor=next_cursor
+        )
+
+    async def on_list_resource_templates(
+        ctx: ServerRequestContext, params: PaginatedRequestParams | None
+    ) -> types.ListResourceTemplatesResult:
+        names, next_cursor = page(params)
+        return types.ListResourceTemplatesResult(
+            resource_templates=[
+                types.ResourceTemplate(name=name, uri_template=f"test://{name}/{{id}}") for name in names
+            ],
+            next_cursor=next_cursor,
+        )
+
+    async def on_list_prompts(
+        ctx: ServerRequestContext, params: PaginatedRequestParams | None
+    ) -> types.ListPromptsResult:
+        names, next_cursor = page(params)
+        return types.ListPromptsResult(
+            prompts=[types.Prompt(name=name) for name in names], next_cursor=next_cursor, ttl_ms=60_000
+        )
+
+    return Server(
+        "paged",
+        on_list_tools=on_list_tools,
+        on_list_resources=on_list_resources,
+        on_list_resource_templates=on_list_resource_templates,
+        on_list_prompts=on_list_prompts,
+    )
+
+
+async def _names(items: AsyncGenerator[Any]) -> list[str]:
+    return [item.name async for item in items]
+
+
+@pytest.mark.parametrize("verb", ["iter_tools", "iter_resources", "iter_resource_templates", "iter_prompts"])
+async def test_every_page_is_followed_to_the_end(verb: str):
+    cursors: list[str | None] = []
+
+    async with Client(_paged_server(cursors)) as client:
+        assert await _names(getattr(client, verb)()) == ["a", "b", "c", "d", "e"]
+
+    assert cursors == [None, "page-2", "page-3"]
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+async def test_the_next_page_is_prefetched_while_the_current_one_is_consumed(prefetch: bool):
+    cursors: list[str | None] = []
+
+    async with Client(_paged_server(cursors)) as client:
+        async with aclosing(client.iter_tools(prefetch=prefetch)) as tools:
+            assert (await anext(tools)).name == "a"
+            await anyio.wait_all_tasks_blocked()
+            assert cursors == ([None, "page-2"] if prefetch else [None])
+            assert [tool.name async for tool in tools] == ["b", "c", "d", "e"]
+
+
+async def test_a_repeated_cursor_stops_the_walk():
+    pages: dict[str | None, tuple[list[str], str | None]] = {None: (["a"], "loop"), "loop": (["b"], "loop")}
+
+    async with Client(_paged_server([], pages)) as client:
+        with pytest.raises(PaginationCycleError, match="tools/list returned cursor 'loop' twice"):
+            await _names(client.iter_tools())
+
+
+async def test_only_the_first_page_is_served_from_the_response_cache():
+    cursors: list[str | None] = []
+
+    async with Client(_paged_server(cursors)) as client:
+        for _ in range(2):
+            assert await _names(client.iter_prompts()) == ["a", "b", "c", "d", "e"]
+
+    assert cursors == [None, "page-2", "page-3", "page-2", "page-3"]
+
+
+async def test_leaving_early_cancels_the_prefetch():
+    cancelled = anyio.Event()
+
+    async def on_list_tools(ctx: ServerRequestContext, params: PaginatedRequestParams | None) -> ListToolsResult:
+        if params is None or params.cursor is None:
+            return ListToolsResult(tools=[Tool(name="a", input_schema={"type": "object"})], next_cursor="slow")
+        try:
+            await anyio.sleep_forever()
+        finally:
+            cancelled.set()
+        raise NotImplementedError
+
+    async with Client(Server("paged", on_list_tools=on_list_tools)) as client:
+        async with aclosing(client.iter_tools()) as tools:
+            assert (await anext(tools)).name == "a"
+        with anyio.fail_after(5):
+            await cancelled.wait()
+
+
+async def test_a_failed_page_raises_from_the_iteration():
+    async def on_list_prompts(
+        ctx: ServerRequestContext, params: PaginatedRequestParams | None
+    ) -> types.ListPromptsResult:
+        if params is None or params.cursor is None:
+            return types.ListPromptsResult(prompts=[types.Prompt(name="a")], next_cursor="broken")
+        raise MCPError(INTERNAL_ERROR, "page store offline")
+
+    async with Client(Server("paged", on_list_prompts=on_list_prompts)) as client:
+        with pytest.raises(MCPError, match="page store offline"):
+            await _names(client.iter_prompts())
+
+
+async def test_a_prefetch_cancelled_with_its_task_group_is_fetched_by_the_caller():
+    fetched: list[str | None] = []
+    release = anyio.Event()
+
+    async def fetch(cursor: str | None) -> ListToolsResult:
+        fetched.append(cursor)
+        if cursor is None:
+            return ListToolsResult(tools=[], next_cursor="next")
+        if len(fetched) == 2:
+            await release.wait()
+        return ListToolsResult(tools=[])
+
+    async def hold_open(*, task_status: anyio.abc.TaskStatus[anyio.abc.TaskGroup]) -> None:
+        async with anyio.create_task_group() as background:
+            task_status.started(background)
+            await anyio.sleep_forever()
+
+    # Cancelling `background` also ends `hold_open`, so the outer group exits on its own.
+    async with anyio.create_task_group() as tg:
+        background = await tg.start(hold_open)
+        async with aclosing(paginate("tools/list", fetch, background)) as pages:
+            await anext(pages)
+            await anyio.wait_all_tasks_blocked()
+            background.cancel_scope.cancel()
+            assert (await anext(pages)).next_cursor is None
+
+    assert fetched == [None, "next", "next"]
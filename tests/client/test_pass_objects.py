@@ -0,0 +1,181 @@
+"""`Client(server, pass_objects=True)`: in-process results handed across as model objects."""
+
+from typing import Any
+
+import anyio
+import pytest
+from mcp_types import (
+    SERVER_INFO_META_KEY,
+    CallToolRequestParams,
+    CallToolResult,
+    CompleteRequestParams,
+    CompleteResult,
+    Completion,
+    ListToolsResult,
+    PaginatedRequestParams,
+    PromptReference,
+    Result,
+    TextContent,
+    Tool,
+)
+from pydantic import Field
+
+from mcp.client import Client
+from mcp.client.session import ClientSession
+from mcp.server import Server, ServerRequestContext
+from mcp.server.caching import CacheHint
+from mcp.shared.direct_dispatcher import ObjectResult, create_direct_dispatcher_pair
+from mcp.shared.dispatcher import DispatchContext
+from mcp.shared.transport_context import TransportContext
+
+pytestmark = pytest.mark.anyio
+
+
+def _tool_server(listing: ListToolsResult, **kwargs: Any) -> Server:
+    async def on_list_tools(ctx: ServerRequestContext, params: PaginatedRequestParams | None) -> ListToolsResult:
+        return listing
+
+    return Server("objects", on_list_tools=on_list_tools, **kwargs)
+
+
+async def test_the_result_is_a_copy_sharing_the_handlers_values():
+    listing = ListToolsResult(tools=[Tool(name="add", input_schema={"type": "object"})])
+
+    async with Client(_tool_server(listing), pass_objects=True, cache=None) as client:
+        result = await client.list_tools()
+        result.tools = []
+
+    assert result is not listing
+    assert [tool.name for tool in listing.tools] == ["add"]
+    assert result.meta == {SERVER_INFO_META_KEY: {"name": "objects", "version": ""}}
+    assert listing.meta is None
+
+
+async def test_cache_hints_and_the_server_info_stamp_are_applied_as_on_the_wire():
+    listing = ListToolsResult(tools=[], _meta={"trace": "t-1"})
+    server = _tool_server(listing, cache_hints={"tools/list": CacheHint(ttl_ms=5_000)})
+
+    async with Client(server, pass_objects=True) as client:
+        result = await client.list_tools()
+
+    assert (result.ttl_ms, result.cache_scope) == (5_000, "private")
+    assert result.meta == {"trace": "t-1", SERVER_INFO_META_KEY: {"name": "objects", "version": ""}}
+
+
+async def test_a_handler_supplied_server_info_is_kept():
+    listing = ListToolsResult(tools=[], _meta={SERVER_INFO_META_KEY: {"name": "custom", "version": "1"}})
+
+    async with Client(_tool_server(listing), pass_objects=True, cache=None) as client:
+        result = await client.list_tools()
+
+    assert result.meta == {SERVER_INFO_META_KEY: {"name": "custom", "version": "1"}}
+
+
+def _call_server(answer: CallToolResult | dict[str, Any]) -> Server:
+    async def on_list_tools(ctx: ServerRequestContext, params: PaginatedRequestParams | None) -> ListToolsResult:
+        return ListToolsResult(tools=[])
+
+    async def on_call_tool(ctx: ServerRequestContext, params: CallToolRequestParams) -> CallToolResult | dict[str, Any]:
+        return answer
+
+    server = Server("objects", on_list_tools=on_list_tools)
+    server.add_request_handler("tools/call", CallToolRequestParams, on_call_tool)
+    return server
+
+
+async def test_a_tool_call_returns_the_handlers_model():
+    answer = CallToolResult(content=[TextContent(text="3")], structured_content={"result": 3})
+
+    async with Client(_call_server(answer), pass_objects=True) as client:
+        result = await client.call_tool("add", {"a": 1, "b": 2})
+
+    assert result is not answer
+    assert result.structured_content is answer.structured_content
+
+
+async def test_a_result_of_another_type_takes_the_wire_path():
+    class Completed(Result):
+        completion: Completion
+        result_type: str = Field(default="complete", alias="resultType")
+
+    async def on_completion(ctx: ServerRequestContext, params: CompleteRequestParams) -> Completed:
+        return Completed(completion=Completion(values=["poetry"]))
+
+    server = Server("objects")
+    server.add_request_handler("completion/complete", CompleteRequestParams, on_completion)
+
+    async with Client(server, pass_objects=True) as client:
+        result = await client.complete(PromptReference(name="books"), {"name": "genre", "value": "p"})
+
+    assert isinstance(result, CompleteResult)
+    assert result.completion == Completion(values=["poetry"])
+
+
+async def test_a_handler_returning_a_dict_is_served_as_usual():
+    answer = {"content": [{"type": "text", "text": "3"}], "resultType": "complete"}
+
+    async with Client(_call_server(answer), pass_objects=True) as client:
+        result = await client.call_tool("add", {})
+
+    assert result.content == [TextContent(text="3")]
+
+
+async def test_a_negative_ttl_on_the_handed_over_model_is_floored_as_on_the_wire():
+    listing = ListToolsResult.model_construct(tools=[], ttl_ms=-5)
+
+    async with Client(_tool_server(listing), pass_objects=True, cache=None) as client:
+        result = await client.list_tools()
+
+    assert result.ttl_ms == 0
+    assert listing.ttl_ms == -5
+
+
+async def _list_tools_over_a_handshake_era_session(model: Result) -> ListToolsResult:
+    """A session that never negotiated reads results at the handshake-era fallback version."""
+    client_side, server_side = create_direct_dispatcher_pair(pass_objects=True)
+
+    async def on_request(
+        ctx: DispatchContext[TransportContext], method: str, params: dict[str, Any] | None
+    ) -> ObjectResult:
+        return ObjectResult(model)
+
+    async def on_notify(ctx: DispatchContext[TransportContext], method: str, params: dict[str, Any] | None) -> None:
+        raise NotImplementedError
+
+    results: list[ListToolsResult] = []
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            await tg.start(server_side.run, on_request, on_notify)
+            async with ClientSession(dispatcher=client_side) as session:
+                results.append(await session.list_tools())
+            server_side.close()
+    return results[0]
+
+
+async def test_a_later_revisions_fields_are_dropped_from_the_model_on_an_older_session():
+    tools = [Tool(name="add", input_schema={"type": "object"})]
+    listing = ListToolsResult(tools=tools, ttl_ms=5_000, cache_scope="public")
+
+    result = await _list_tools_over_a_handshake_era_session(listing)
+
+    assert (result.ttl_ms, result.cache_scope) == (0, "private")
+    assert result.tools is listing.tools
+    assert (listing.ttl_ms, listing.cache_scope) == (5_000, "public")
+
+
+async def test_a_model_requiring_a_later_revisions_field_takes_the_wire_path():
+    class PinnedTtl(ListToolsResult):
+        ttl_ms: int = Field(alias="ttlMs")
+
+    result = await _list_tools_over_a_handshake_era_session(PinnedTtl(tools=[], ttlMs=5_000))
+
+    assert type(result) is ListToolsResult
+    assert result.ttl_ms == 0
+
+
+@pytest.mark.parametrize(
+    ("server", "mode"), [("http://localhost:8000/mcp", "auto"), (Server("objects"), "legacy")], ids=["url", "legacy"]
+)
+async def test_pass_objects_needs_a_modern_in_process_server(server: Any, mode: str):
+    with pytest.raises(ValueError, match="pass_objects requires an in-process Server"):
+        Client(server, pass_objects=True, mode=mode)
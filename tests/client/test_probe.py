@@ -36,6 +36,7 @@ from mcp_types.version import (
 )
 
 from mcp.client._probe import _parse_supported, negotiate_auto
+from mcp.client.caching import ClientEraVerdicts, EraVerdict, InMemoryEraVerdictStore
 from mcp.client.session import ClientSession
 from mcp.shared.exceptions import MCPError
 
@@ -73,12 +74,14 @@ class _StubSession:
         self.initialized = True
 
     def adopt(self, result: types.DiscoverResult) -> None:
+        if not any(v in result.supported_versions for v in MODERN_PROTOCOL_VERSIONS):
+            raise RuntimeError("No mutually supported modern protocol version")
         self.adopted = result
 
 
-async def _negotiate(session: _StubSession) -> None:
+async def _negotiate(session: _StubSession, verdicts: ClientEraVerdicts | None = None) -> None:
     """Drive `negotiate_auto` against the stub; cast at one seam so the tests stay suppression-free."""
-    await negotiate_auto(cast("ClientSession", session))
+    await negotiate_auto(cast("ClientSession", session), verdicts)
 
 
 def _discover_dict(versions: list[str] | None = None) -> dict[str, Any]:
@@ -312,6 +315,152 @@ async def test_a_network_or_resource_error_from_the_probe_propagates_unchanged(e
     assert session.adopted is None
 
 
+# --- remembered verdicts ---
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _BrokenStore:
+    async def get(self, key: str) -> EraVerdict | None:
+        raise OSError("store down")
+
+    async def set(self, key: str, verdict: EraVerdict) -> None:
+        raise OSError("store down")
+
+    async def delete(self, key: str) -> None:
+        raise OSError("store down")
+
+
+def _verdicts(store: Any, clock: _Clock, *, ttl_ms: int = 60_000) -> ClientEraVerdicts:
+    return ClientEraVerdicts(store, arm_id="target", partition="", ttl_ms=ttl_ms, clock=clock)
+
+
+async def test_a_remembered_modern_verdict_is_adopted_without_probing() -> None:
+    store, clock = InMemoryEraVerdictStore(), _Clock()
+    await _negotiate(_StubSession(_discover_dict()), _verdicts(store, clock))
+
+    session = _StubSession()
+    await _negotiate(session, _verdicts(store, clock))
+    assert session.probed_at == []
+    assert session.adopted is not None
+    assert session.adopted.meta is not None
+    assert session.adopted.meta[SERVER_INFO_META_KEY] == {"name": "stub", "version": "0"}
+
+
+async def test_a_remembered_legacy_verdict_goes_straight_to_initialize() -> None:
+    store, clock = InMemoryEraVerdictStore(), _Clock()
+    await _negotiate(_StubSession(MCPError(code=METHOD_NOT_FOUND, message="nope")), _verdicts(store, clock))
+
+    session = _StubSession()
+    await _negotiate(session, _verdicts(store, clock))
+    assert session.probed_at == []
+    assert session.initialized
+
+
+async def test_an_expired_verdict_probes_again() -> None:
+    store, clock = InMemoryEraVerdictStore(), _Clock()
+    await _negotiate(_StubSession(MCPError(code=METHOD_NOT_FOUND, message="nope")), _verdicts(store, clock))
+    clock.now += 61
+
+    session = _StubSession(_discover_dict())
+    await _negotiate(session, _verdicts(store, clock))
+    assert session.probed_at == [LATEST_MODERN_VERSION]
+    assert session.adopted is not None
+
+
+async def test_a_legacy_verdict_the_server_contradicts_is_forgotten_and_reprobed() -> None:
+    """The server went modern since: its -32022 answer to `initialize` drops the
+    verdict, and the probe's outcome replaces it."""
+    store, clock = InMemoryEraVerdictStore(), _Clock()
+    await store.set('["target", ""]', EraVerdict(discover=None, expires_at=clock.now + 60))
+
+    session = _StubSession(_discover_dict(), handshake=[_err_32022(list(MODERN_PROTOCOL_VERSIONS))])
+    await _negotiate(session, _verdicts(store, clock))
+    assert session.probed_at == [LATEST_MODERN_VERSION]
+    assert session.adopted is not None
+    remembered = await store.get('["target", ""]')
+    assert remembered is not None and remembered.discover == session.adopted
+
+
+async def test_a_remembered_legacy_verdict_propagates_other_handshake_errors() -> None:
+    store, clock = InMemoryEraVerdictStore(), _Clock()
+    await store.set('["target", ""]', EraVerdict(discover=None, expires_at=clock.now + 60))
+
+    session = _StubSession(handshake=[MCPError(code=INTERNAL_ERROR, message="handshake broke")])
+    with pytest.raises(MCPError):
+        await _negotiate(session, _verdicts(store, clock))
+    assert session.probed_at == []
+
+
+async def test_a_remembered_modern_verdict_with_no_mutual_version_is_reprobed() -> None:
+    store, clock = InMemoryEraVerdictStore(), _Clock()
+    foreign = types.DiscoverResult.model_validate(_discover_dict(["2099-01-01"]))
+    await store.set('["target", ""]', EraVerdict(discover=foreign, expires_at=clock.now + 60))
+
+    session = _StubSession(_discover_dict())
+    await _negotiate(session, _verdicts(store, clock))
+    assert session.probed_at == [LATEST_MODERN_VERSION]
+    remembered = await store.get('["target", ""]')
+    assert remembered is not None and remembered.discover == session.adopted
+
+
+async def test_remembered_results_are_copied_in_and_out_of_the_store() -> None:
+    store, clock = InMemoryEraVerdictStore(), _Clock()
+    first = _StubSession(_discover_dict())
+    await _negotiate(first, _verdicts(store, clock))
+    second = _StubSession()
+    await _negotiate(second, _verdicts(store, clock))
+
+    assert first.adopted is not None and second.adopted is not None
+    assert second.adopted == first.adopted
+    assert second.adopted is not first.adopted
+    remembered = await store.get('["target", ""]')
+    assert remembered is not None
+    assert remembered.discover is not first.adopted and remembered.discover is not second.adopted
+
+
+async def test_a_zero_ttl_remembers_nothing() -> None:
+    store, clock = InMemoryEraVerdictStore(), _Clock()
+    await _negotiate(_StubSession(_discover_dict()), _verdicts(store, clock, ttl_ms=0))
+    assert await store.get('["target", ""]') is None
+
+
+class _ReadOnlyStore(_BrokenStore):
+    """Reads from a real store; every write fails."""
+
+    def __init__(self, store: InMemoryEraVerdictStore) -> None:
+        self._inner = store
+
+    async def get(self, key: str) -> EraVerdict | None:
+        return await self._inner.get(key)
+
+
+async def test_a_failing_store_costs_the_probe_never_the_connect(caplog: pytest.LogCaptureFixture) -> None:
+    clock = _Clock()
+    session = _StubSession(_discover_dict())
+    await _negotiate(session, _verdicts(_BrokenStore(), clock))
+    assert session.adopted is not None
+
+    store = InMemoryEraVerdictStore()
+    await store.set('["target", ""]', EraVerdict(discover=None, expires_at=clock.now + 60))
+    session = _StubSession(_discover_dict(), handshake=[_err_32022(list(MODERN_PROTOCOL_VERSIONS))])
+    await _negotiate(session, _verdicts(_ReadOnlyStore(store), clock))
+    assert session.adopted is not None
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "Era verdict store get failed; probing instead",
+        "Era verdict store set failed; the next connect will probe",
+        "Era verdict store delete failed",
+        "Era verdict store set failed; the next connect will probe",
+    ]
+
+
 # --- helper ---
 
 
@@ -1,18 +1,35 @@
 import contextlib
+import math
+from collections import deque
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
 from unittest import mock
 
+import anyio
 import httpx2
 import mcp_types as types
 import pytest
 
 import mcp
+from mcp import Client
+from mcp.client._memory import InMemoryTransport
+from mcp.client._transport import TransportStreams
+from mcp.client.session import IncomingMessage
 from mcp.client.session_group import (
     ClientSessionGroup,
     ClientSessionParameters,
+    HedgingPolicy,
+    LatencyEWMABalancer,
+    LeastInFlightBalancer,
+    Replica,
     SseServerParameters,
     StreamableHttpParameters,
 )
 from mcp.client.stdio import StdioServerParameters
+from mcp.server import Server, ServerRequestContext
+from mcp.server.mcpserver import Context, MCPServer
+from mcp.server.mcpserver.prompts import Prompt
+from mcp.server.mcpserver.resources import TextResource
 from mcp.shared.exceptions import MCPError
 
 
@@ -393,7 +410,7 @@ async def test_client_session_group_establish_session_parameterized(
                 elicitation_callback=None,
                 list_roots_callback=None,
                 logging_callback=None,
-                message_handler=None,
+                message_handler=mock.ANY,
                 client_info=None,
             )
             mock_raw_session_cm.__aenter__.assert_awaited_once()
@@ -402,3 +419,420 @@ async def test_client_session_group_establish_session_parameterized(
             # 3. Assert returned values
             assert returned_server_info is mock_initialize_result.server_info
             assert returned_session is mock_entered_session
+
+
+def _library() -> MCPServer:
+    server = MCPServer("Library")
+
+    @server.tool()
+    def search(query: str) -> str:
+        return f"books about {query}"
+
+    @server.tool()
+    async def shelve(title: str, ctx: Context) -> str:
+        await ctx.session.send_resource_updated(f"library://shelf/{title}")
+        server.add_tool(lambda: title, name="read_" + title)
+        await ctx.session.send_tool_list_changed()
+        return "shelved"
+
+    return server
+
+
+def _web() -> MCPServer:
+    server = MCPServer("Web")
+
+    @server.tool()
+    def fetch(url: str) -> str:
+        return f"page at {url}"
+
+    @server.tool()
+    def read_news() -> str:
+        return "headlines"
+
+    return server
+
+
+class _NeverAnswers:
+    async def __aenter__(self) -> TransportStreams:
+        await anyio.sleep_forever()
+        raise NotImplementedError  # pragma: no cover
+
+    async def __aexit__(self, *exc_info: object) -> None:  # pragma: no cover
+        pass
+
+
+@contextlib.asynccontextmanager
+async def _fails_on_close(server: MCPServer) -> AsyncGenerator[TransportStreams]:
+    async with InMemoryTransport(server) as streams:
+        yield streams
+    raise ConnectionResetError("transport torn down badly")
+
+
+def _stdio_transports(servers: dict[str, MCPServer]) -> Callable[[StdioServerParameters], Any]:
+    """Stand in for `stdio_client`: route each command to an in-memory server."""
+
+    def connect(params: StdioServerParameters) -> Any:
+        if params.command == "hang":
+            return _NeverAnswers()
+        if params.command == "flaky":
+            return _fails_on_close(_web())
+        if params.command not in servers:
+            raise OSError(f"no such command: {params.command}")
+        return InMemoryTransport(servers[params.command])
+
+    return connect
+
+
+@contextlib.asynccontextmanager
+async def _after_both_started(
+    arrived: list[str], both: anyio.Event, name: str, server: MCPServer
+) -> AsyncGenerator[TransportStreams]:
+    """A transport that opens only once two of these are opening, which only concurrent connects can do."""
+    arrived.append(name)
+    if len(arrived) == 2:
+        both.set()
+    await both.wait()
+    async with InMemoryTransport(server) as streams:
+        yield streams
+
+
+@pytest.mark.anyio
+async def test_connect_all_connects_concurrently_and_reports_each_failure_in_place():
+    """A broken server costs its own slot only; the rest join the group, their handshakes overlapping."""
+    servers = {"library": _library(), "web": _web()}
+    arrived: list[str] = []
+    both = anyio.Event()
+    stdio = _stdio_transports({})
+
+    def connect(params: StdioServerParameters) -> Any:
+        if params.command in servers:
+            return _after_both_started(arrived, both, params.command, servers[params.command])
+        return stdio(params)
+
+    with mock.patch("mcp.client.session_group.mcp.stdio_client", connect):
+        async with ClientSessionGroup() as group:
+            # Only a sequential connect_all could hang here; no timeout races a cold first connection.
+            with anyio.fail_after(10):
+                results = await group.connect_all(
+                    [
+                        StdioServerParameters(command="library"),
+                        StdioServerParameters(command="missing"),
+                        StdioServerParameters(command="web"),
+                    ],
+                    timeout=None,
+                )
+            library, missing, web = results
+            assert isinstance(library, mcp.ClientSession)
+            assert isinstance(web, mcp.ClientSession)
+            assert isinstance(missing, OSError)
+            assert sorted(arrived) == ["library", "web"]
+            assert sorted(group.tools) == ["fetch", "read_news", "search", "shelve"]
+            assert group.sessions == [library, web] or group.sessions == [web, library]
+
+            result = await group.call_tool("fetch", {"url": "example.com"})
+            assert result.content == [types.TextContent(type="text", text="page at example.com")]
+
+            await group.disconnect_from_server(web)
+            assert sorted(group.tools) == ["search", "shelve"]
+
+
+@pytest.mark.anyio
+async def test_connect_all_reports_a_handshake_that_outlasts_its_timeout():
+    with mock.patch("mcp.client.session_group.mcp.stdio_client", _stdio_transports({})):
+        async with ClientSessionGroup() as group:
+            (hung,) = await group.connect_all([StdioServerParameters(command="hang")], timeout=0)
+            assert isinstance(hung, TimeoutError)
+            assert group.sessions == []
+
+
+@pytest.mark.anyio
+async def test_connect_all_requires_an_entered_group():
+    group = ClientSessionGroup()
+    with pytest.raises(RuntimeError) as excinfo:
+        await group.connect_all([StdioServerParameters(command="library")])
+    assert str(excinfo.value) == "connect_all requires the ClientSessionGroup to be entered with `async with`"
+
+
+@pytest.mark.anyio
+async def test_a_connection_failing_at_close_is_logged_without_failing_the_group(caplog: pytest.LogCaptureFixture):
+    with mock.patch("mcp.client.session_group.mcp.stdio_client", _stdio_transports({})):
+        async with ClientSessionGroup() as group:
+            (session,) = await group.connect_all([StdioServerParameters(command="flaky")])
+            assert isinstance(session, mcp.ClientSession)
+    assert "MCP server connection closed with an error" in caplog.text
+
+
+@pytest.mark.anyio
+async def test_connect_all_rejects_a_server_whose_names_clash_and_closes_it():
+    """A clash is reported in that server's slot, and its connection is closed rather than leaked."""
+    servers = {"first": _web(), "second": _web()}
+    with mock.patch("mcp.client.session_group.mcp.stdio_client", _stdio_transports(servers)):
+        async with ClientSessionGroup() as group:
+            first, second = await group.connect_all(
+                [StdioServerParameters(command="first"), StdioServerParameters(command="second")]
+            )
+            sessions = [r for r in (first, second) if isinstance(r, mcp.ClientSession)]
+            errors = [r for r in (first, second) if isinstance(r, MCPError)]
+            assert len(sessions) == 1 and len(errors) == 1
+            assert errors[0].error.code == types.INVALID_PARAMS
+            assert str(errors[0]).endswith("already exist in group tools.")
+            assert group.sessions == sessions
+            assert len(group._session_exit_stacks) == 1
+
+
+@pytest.mark.anyio
+async def test_a_tools_list_changed_notification_refreshes_only_that_servers_tools():
+    """The group re-lists on `list_changed`, so a tool added at runtime appears without reconnecting."""
+    seen: list[IncomingMessage] = []
+
+    async def message_handler(message: IncomingMessage) -> None:
+        seen.append(message)
+
+    servers = {"library": _library(), "web": _web()}
+    with mock.patch("mcp.client.session_group.mcp.stdio_client", _stdio_transports(servers)):
+        async with ClientSessionGroup() as group:
+            await group.connect_all(
+                [StdioServerParameters(command="library"), StdioServerParameters(command="web")],
+                ClientSessionParameters(message_handler=message_handler),
+            )
+            await group.call_tool("shelve", {"title": "dune"})
+            with anyio.fail_after(5):
+                while "read_dune" not in group.tools:
+                    await anyio.sleep(0.01)
+            assert sorted(group.tools) == ["fetch", "read_dune", "read_news", "search", "shelve"]
+            result = await group.call_tool("read_dune")
+            assert result.content == [types.TextContent(type="text", text="dune")]
+
+            # A re-listed name clashing with another server's is refused, leaving the group as it was.
+            await group.call_tool("shelve", {"title": "news"})
+            with anyio.fail_after(5):
+                while sum(isinstance(m, types.ToolListChangedNotification) for m in seen) < 2:
+                    await anyio.sleep(0.01)
+            assert sorted(group.tools) == ["fetch", "read_dune", "read_news", "search", "shelve"]
+            assert (await group.call_tool("read_news")).content == [types.TextContent(type="text", text="headlines")]
+            # The caller's own handler still sees every notification, list_changed or not.
+            assert any(isinstance(m, types.ResourceUpdatedNotification) for m in seen)
+
+
+@pytest.mark.anyio
+async def test_refresh_components_replaces_a_sessions_entries_and_refuses_clashes():
+    """Explicit refreshes serve sessions added with `connect_with_session`; a clash leaves the group unchanged."""
+    library_server, web_server = _library(), _web()
+    async with Client(library_server) as library, Client(web_server) as web:
+        group = ClientSessionGroup()
+        await group.connect_with_session(types.Implementation(name="Library", version="1"), library.session)
+        await group.connect_with_session(types.Implementation(name="Web", version="1"), web.session)
+
+        library_server.remove_tool("shelve")
+        library_server.add_tool(lambda: "ok", name="catalog")
+        await group.refresh_components(library.session, "tools")
+        assert sorted(group.tools) == ["catalog", "fetch", "read_news", "search"]
+        assert group._tool_to_session["catalog"] is library.session
+
+        library_server.add_tool(lambda: "dup", name="fetch")
+        with pytest.raises(MCPError) as excinfo:
+            await group.refresh_components(library.session)
+        assert str(excinfo.value) == "{'fetch'} already exist in group tools."
+        assert group._tool_to_session["fetch"] is web.session
+
+        await group.disconnect_from_server(web.session)
+        with pytest.raises(MCPError):
+            await group.refresh_components(web.session)
+
+
+@pytest.mark.anyio
+async def test_a_group_on_a_callers_exit_stack_refreshes_every_kind_without_a_user_message_handler():
+    server = _library()
+    server.add_prompt(Prompt.from_function(lambda: "Recommend a book.", name="recommend"))
+    server.add_resource(TextResource(uri="library://hours", name="hours", text="9-5"))
+    with mock.patch("mcp.client.session_group.mcp.stdio_client", _stdio_transports({"library": server})):
+        async with contextlib.AsyncExitStack() as stack:
+            async with ClientSessionGroup(exit_stack=stack) as group:
+                (session,) = await group.connect_all([StdioServerParameters(command="library")])
+                assert isinstance(session, mcp.ClientSession)
+                await group.refresh_components(session)
+                assert (list(group.prompts), list(group.resources)) == (["recommend"], ["hours"])
+                await group.call_tool("shelve", {"title": "dune"})
+                with anyio.fail_after(5):
+                    while "read_dune" not in group.tools:
+                        await anyio.sleep(0.01)
+            assert group.sessions == [session]
+
+
+@pytest.mark.anyio
+async def test_servers_with_an_empty_catalog_join_and_leave_the_group():
+    """A server with nothing to list is still a member: it can be disconnected, and the group still closes."""
+    servers = {"empty": MCPServer("Empty"), "bare": MCPServer("Bare")}
+    with mock.patch("mcp.client.session_group.mcp.stdio_client", _stdio_transports(servers)):
+        with anyio.fail_after(5):
+            async with ClientSessionGroup() as group:
+                empty, bare = await group.connect_all([StdioServerParameters(command=name) for name in servers])
+                assert isinstance(empty, mcp.ClientSession) and isinstance(bare, mcp.ClientSession)
+                assert group.sessions == [empty, bare] or group.sessions == [bare, empty]
+                await group.disconnect_from_server(empty)
+                assert group.sessions == [bare]
+
+
+@pytest.mark.anyio
+async def test_a_failed_list_is_empty_on_connect_but_keeps_the_catalog_on_refresh():
+    """SDK-defined: a kind a server cannot list joins empty, while a failed re-list never wipes a live catalog."""
+    failing = False
+
+    async def list_tools(
+        ctx: ServerRequestContext, params: types.PaginatedRequestParams | None
+    ) -> types.ListToolsResult:
+        if failing:
+            raise MCPError(code=types.INTERNAL_ERROR, message="tools unavailable")
+        return types.ListToolsResult(tools=[types.Tool(name="probe", input_schema={"type": "object"})])
+
+    async with Client(Server("Tools only", on_list_tools=list_tools)) as client:
+        group = ClientSessionGroup()
+        await group.connect_with_session(types.Implementation(name="Tools only", version="1"), client.session)
+        assert (list(group.tools), group.prompts, group.resources) == (["probe"], {}, {})
+
+        failing = True
+        with pytest.raises(MCPError) as excinfo:
+            await group.refresh_components(client.session, "tools")
+        assert excinfo.value.error.message == "tools unavailable"
+        with pytest.raises(MCPError):
+            await group.refresh_components(client.session)
+        assert list(group.tools) == ["probe"]
+        assert group._tool_to_session["probe"] is client.session
+
+
+def _replica(name: str, *, delay: float = 0.0, broken: bool = False) -> MCPServer:
+    server = MCPServer("Replica")
+
+    @server.tool(annotations=types.ToolAnnotations(read_only_hint=True))
+    async def whoami() -> str:
+        await anyio.sleep(delay)
+        if broken:
+            raise MCPError(code=types.INTERNAL_ERROR, message=f"{name} is down")
+        return name
+
+    @server.tool()
+    async def record(entry: str) -> str:
+        await anyio.sleep(delay)
+        return f"{name} recorded {entry}"
+
+    return server
+
+
+async def _answers(group: ClientSessionGroup, tool: str, calls: int) -> list[str]:
+    answers: list[str] = []
+    for _ in range(calls):
+        result = await group.call_tool(tool, {"entry": "x"} if tool == "record" else {})
+        assert isinstance(result, types.CallToolResult)
+        content = result.content[0]
+        assert isinstance(content, types.TextContent)
+        answers.append(content.text)
+    return answers
+
+
+@pytest.mark.anyio
+async def test_a_replica_set_shares_one_catalog_and_spreads_calls_round_robin():
+    """SDK-defined: replicas add capacity, not components, and a departing primary hands its catalog on."""
+    servers = {name: _replica(name) for name in ("a", "b", "c")}
+    with mock.patch("mcp.client.session_group.mcp.stdio_client", _stdio_transports(servers)):
+        async with ClientSessionGroup() as group:
+            sessions = await group.connect_all(
+                [StdioServerParameters(command=name) for name in servers], replica_set="replica"
+            )
+            names = dict(zip(sessions, servers, strict=True))
+            assert sorted(group.tools) == ["record", "whoami"]
+            assert set(group.sessions) == set(names)
+            assert sorted(await _answers(group, "whoami", 6)) == ["a", "a", "b", "b", "c", "c"]
+            members = group.replica_sets["replica"]
+            assert [replica.calls for replica in members] == [2, 2, 2]
+            assert all(replica.in_flight == 0 and replica.latency_ewma is not None for replica in members)
+
+            primary = group._tool_to_session["whoami"]
+            await group.disconnect_from_server(primary)
+            assert sorted(group.tools) == ["record", "whoami"]
+            assert set(await _answers(group, "whoami", 4)) == set(servers) - {names[primary]}
+            for session in reversed(group.sessions):  # Non-primary replicas leave first.
+                await group.disconnect_from_server(session)
+            assert group.tools == {} and group.replica_sets == {} and group.sessions == []
+
+
+@pytest.mark.anyio
+async def test_a_replica_set_whose_catalog_clashes_is_refused_member_by_member():
+    """Each would-be member retries the catalog after the previous one fails, so every slot reports the clash."""
+    servers = {"a": _replica("a"), "b": _replica("b"), "c": _replica("c")}
+    with mock.patch("mcp.client.session_group.mcp.stdio_client", _stdio_transports(servers)):
+        async with ClientSessionGroup() as group:
+            (solo,) = await group.connect_all([StdioServerParameters(command="a")])
+            results = await group.connect_all(
+                [StdioServerParameters(command="b"), StdioServerParameters(command="c")], replica_set="replica"
+            )
+            assert all(isinstance(result, MCPError) for result in results)
+            assert group.sessions == [solo] and group.replica_sets == {}
+
+
+@pytest.mark.anyio
+async def test_a_slow_read_only_call_is_hedged_onto_another_replica():
+    """SDK-defined: the backup wins when the first replica is slow, and the slow call is cancelled."""
+    servers = {"slow": _replica("slow", delay=math.inf), "fast": _replica("fast")}
+    with mock.patch("mcp.client.session_group.mcp.stdio_client", _stdio_transports(servers)):
+        # A zero delay hedges at the first checkpoint, and the slow replica never answers: no race on the clock.
+        async with ClientSessionGroup(hedging=HedgingPolicy(initial_delay=0)) as group:
+            for name in servers:
+                await group.connect_to_server(StdioServerParameters(command=name), replica_set="replica")
+            with anyio.fail_after(5):
+                assert await _answers(group, "whoami", 1) == ["fast"]
+            slow, fast = group.replica_sets["replica"]
+            assert (slow.calls, slow.in_flight, fast.calls) == (0, 0, 1)
+            assert len(group._tool_latencies["whoami"]) == 1
+
+
+@pytest.mark.anyio
+async def test_a_call_that_is_not_read_only_or_idempotent_is_never_hedged():
+    servers = {"first": _replica("first", delay=0.2), "second": _replica("second")}
+    with mock.patch("mcp.client.session_group.mcp.stdio_client", _stdio_transports(servers)):
+        async with ClientSessionGroup(hedging=HedgingPolicy(initial_delay=0.01)) as group:
+            for name in servers:
+                await group.connect_to_server(StdioServerParameters(command=name), replica_set="replica")
+            assert await _answers(group, "record", 1) == ["first recorded x"]
+
+
+@pytest.mark.anyio
+async def test_a_hedged_call_fails_only_once_every_attempt_has():
+    servers = {"a": _replica("a", delay=0.1, broken=True), "b": _replica("b", delay=0.1, broken=True)}
+    with mock.patch("mcp.client.session_group.mcp.stdio_client", _stdio_transports(servers)):
+        async with ClientSessionGroup(hedging=HedgingPolicy(initial_delay=0.01)) as group:
+            for name in servers:
+                await group.connect_to_server(StdioServerParameters(command=name), replica_set="replica")
+            with pytest.raises(MCPError) as excinfo:
+                await group.call_tool("whoami", {})
+            assert excinfo.value.error.message == "a is down"
+
+
+@pytest.mark.anyio
+async def test_a_fast_hedged_call_launches_no_backup():
+    servers = {"a": _replica("a"), "b": _replica("b")}
+    with mock.patch("mcp.client.session_group.mcp.stdio_client", _stdio_transports(servers)):
+        # With no deadline the backup can only be launched wrongly, never by a slow machine.
+        async with ClientSessionGroup(hedging=HedgingPolicy(initial_delay=math.inf)) as group:
+            for name in servers:
+                await group.connect_to_server(StdioServerParameters(command=name), replica_set="replica")
+            assert await _answers(group, "whoami", 2) == ["a", "b"]
+            assert [replica.calls for replica in group.replica_sets["replica"]] == [1, 1]
+
+
+def test_the_hedge_delay_is_the_observed_latency_quantile_once_enough_samples_exist():
+    group = ClientSessionGroup()
+    policy = HedgingPolicy(quantile=0.9, initial_delay=0.5, min_samples=10)
+    assert group._hedge_delay("whoami", policy) == 0.5
+    group._tool_latencies["whoami"] = deque([i / 100 for i in range(9)])
+    assert group._hedge_delay("whoami", policy) == 0.5
+    group._tool_latencies["whoami"].extend([0.09, 1.0])
+    assert group._hedge_delay("whoami", policy) == 0.09
+
+
+def test_least_in_flight_and_latency_balancers_pick_the_least_loaded_replica():
+    idle, busy, unmeasured = (Replica(mock.Mock()) for _ in range(3))
+    idle.latency_ewma, busy.latency_ewma = 0.3, 0.1
+    busy.in_flight = 3
+    assert LeastInFlightBalancer().choose([busy, idle]) is idle
+    assert LatencyEWMABalancer().choose([busy, idle]) is idle
+    assert LatencyEWMABalancer().choose([busy, idle, unmeasured]) is unmeasured
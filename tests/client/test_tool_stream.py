@@ -0,0 +1,194 @@
+"""Streamed tool calls: `Client.call_tool_stream` and async-generator tools (`mcp.shared.partial_content`)."""
+
+from collections.abc import AsyncGenerator
+
+import anyio
+import pytest
+from mcp_types import CONNECTION_CLOSED, INTERNAL_ERROR, INVALID_PARAMS, ContentBlock, TextContent
+from mcp_types.version import LATEST_HANDSHAKE_VERSION, LATEST_PROTOCOL_VERSION
+
+from mcp.client import Client, ToolStreamError
+from mcp.client._tool_stream import ContentRoute
+from mcp.server.mcpserver import Context, MCPServer
+from mcp.shared.exceptions import MCPError
+from mcp.shared.partial_content import (
+    PARTIAL_CONTENT_META_KEY,
+    PARTIAL_CONTENT_METHOD,
+    partial_content_from_wire,
+    partial_content_params,
+)
+from tests.interaction._connect import connect_over_streamable_http
+
+pytestmark = pytest.mark.anyio
+
+
+def _server() -> tuple[MCPServer, anyio.Event, anyio.Event]:
+    """`count` streams 1..n; `gated` waits for the first event after its first chunk and sets the second on exit."""
+    server = MCPServer("stream")
+    gate, exited = anyio.Event(), anyio.Event()
+
+    @server.tool()
+    async def count(n: int) -> AsyncGenerator[str]:
+        for i in range(1, n + 1):
+            yield str(i)
+
+    @server.tool()
+    async def gated() -> AsyncGenerator[str]:
+        try:
+            yield "before"
+            await gate.wait()
+            yield "after"
+        finally:
+            exited.set()
+
+    @server.tool()
+    async def failing(ctx: Context) -> AsyncGenerator[str]:
+        yield "partial"
+        raise ValueError("broke mid-stream")
+
+    @server.tool()
+    async def refused() -> AsyncGenerator[str]:
+        raise MCPError(INVALID_PARAMS, "not today")
+        yield "never"
+
+    @server.tool()
+    def plain() -> str:
+        return "whole"
+
+    return server, gate, exited
+
+
+def _texts(blocks: list[ContentBlock]) -> list[str]:
+    return [block.text for block in blocks if isinstance(block, TextContent)]
+
+
+async def test_chunks_are_yielded_before_the_tool_returns():
+    server, gate, _ = _server()
+
+    async with Client(server) as client:
+        received: list[ContentBlock] = []
+        with anyio.fail_after(5):
+            async for block in client.call_tool_stream("gated"):
+                received.append(block)
+                # The tool is still parked on the gate, so this block cannot have come with the result.
+                gate.set()
+
+    assert _texts(received) == ["before", "after"]
+
+
+async def test_streamed_and_buffered_calls_see_the_same_content():
+    server, _, _ = _server()
+
+    async with Client(server) as client:
+        streamed = [block async for block in client.call_tool_stream("count", {"n": 4})]
+        buffered = await client.call_tool("count", {"n": 4})
+        whole = [block async for block in client.call_tool_stream("plain")]
+
+    assert _texts(streamed) == _texts(buffered.content) == ["1", "2", "3", "4"]
+    assert _texts(whole) == ["whole"]
+
+
+async def test_an_error_result_raises_after_its_content():
+    server, _, _ = _server()
+
+    async with Client(server) as client:
+        stream = client.call_tool_stream("failing")
+        received = [await anext(stream), await anext(stream)]
+        with pytest.raises(ToolStreamError) as exc_info:
+            await anext(stream)
+
+    assert _texts(received) == ["partial", "Error executing tool failing: broke mid-stream"]
+    assert exc_info.value.result.is_error
+
+
+async def test_a_call_that_fails_raises_from_the_stream():
+    server, _, _ = _server()
+
+    async with Client(server) as client:
+        with pytest.raises(MCPError) as exc_info:
+            await anext(client.call_tool_stream("refused"))
+
+    assert exc_info.value.error.code == INVALID_PARAMS
+
+
+async def test_closing_the_stream_early_cancels_the_call():
+    server, _, exited = _server()
+
+    async with Client(server) as client:
+        stream = client.call_tool_stream("gated")
+        assert _texts([await anext(stream)]) == ["before"]
+        await stream.aclose()
+        with anyio.fail_after(5):
+            await exited.wait()
+
+
+async def test_a_consumer_that_falls_too_far_behind_fails_the_stream(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("mcp.client._tool_stream._MAX_PENDING_BLOCKS", 2)
+    route = ContentRoute()
+    route.deliver([TextContent(text="1"), TextContent(text="2")])
+    route.deliver([TextContent(text="3")])
+    route.deliver([TextContent(text="4")])
+
+    assert [await route.next_block(), await route.next_block(), await route.next_block()] == [
+        TextContent(text="1"),
+        TextContent(text="2"),
+        None,
+    ]
+    # The call's own end, arriving later, does not replace the reason the stream failed.
+    route.settle()
+    assert isinstance(route.error, MCPError) and route.error.error.code == INTERNAL_ERROR
+
+
+async def test_an_open_stream_fails_when_the_session_closes():
+    server, _, _ = _server()
+
+    async with Client(server) as client:
+        stream = client.call_tool_stream("gated")
+        assert _texts([await anext(stream)]) == ["before"]
+
+    with pytest.raises(MCPError) as exc_info:
+        await anext(stream)
+    assert exc_info.value.error.code == CONNECTION_CLOSED
+
+
+async def test_only_a_live_streams_well_formed_chunks_are_consumed():
+    server, _, _ = _server()
+
+    async with Client(server) as client:
+        session = client.session
+        route = session._register_content_route("stream-x")  # pyright: ignore[reportPrivateUsage]
+        chunk = partial_content_params("stream-x", [TextContent(text="hi")])
+        assert session._intercept_notification(PARTIAL_CONTENT_METHOD, chunk)  # pyright: ignore[reportPrivateUsage]
+        other = partial_content_params("stream-y", [TextContent(text="hi")])
+        assert not session._intercept_notification(PARTIAL_CONTENT_METHOD, other)  # pyright: ignore[reportPrivateUsage]
+        malformed = {"content": [{"type": "nope"}], "_meta": {PARTIAL_CONTENT_META_KEY: "stream-x"}}
+        assert not session._intercept_notification(PARTIAL_CONTENT_METHOD, malformed)  # pyright: ignore[reportPrivateUsage]
+        session._unregister_content_route("stream-x")  # pyright: ignore[reportPrivateUsage]
+
+    assert await route.next_block() == TextContent(text="hi")
+
+
+def test_chunk_params_round_trip():
+    params = partial_content_params(7, [TextContent(text="a")])
+    assert params == {"content": [{"type": "text", "text": "a"}], "_meta": {PARTIAL_CONTENT_META_KEY: 7}}
+    assert partial_content_from_wire(params) == (7, [TextContent(text="a")])
+    assert partial_content_from_wire({"content": [], "_meta": {}}) is None
+    assert partial_content_from_wire(None) is None
+
+
+@pytest.mark.parametrize("spec_version", [LATEST_HANDSHAKE_VERSION, LATEST_PROTOCOL_VERSION])
+@pytest.mark.parametrize("json_response", [False, True], ids=["sse", "json"])
+async def test_streaming_over_streamable_http(spec_version: str, json_response: bool):
+    """SSE responses carry each chunk ahead of the result; a single JSON body carries them all in the result."""
+    server, gate, _ = _server()
+    received: list[ContentBlock] = []
+
+    async with connect_over_streamable_http(server, json_response=json_response, spec_version=spec_version) as client:
+        if json_response:
+            gate.set()
+        with anyio.fail_after(5):
+            async for block in client.call_tool_stream("gated"):
+                received.append(block)
+                gate.set()
+
+    assert _texts(received) == ["before", "after"]
@@ -153,26 +153,29 @@ async def test_an_expired_entry_is_not_revived_when_the_refetch_fails() -> None:
     assert len(fetches) == 2
 
 
-async def test_two_concurrent_identical_calls_are_two_fetches() -> None:
-    """SDK ruling: no coalescing. The handler barrier releases only once both
-    calls are inside it, so the test passes only if the fetches were concurrent."""
-    both_fetching = anyio.Event()
+async def test_two_concurrent_identical_calls_share_one_fetch() -> None:
+    """The second call arrives while the first is inside the handler and waits for its result."""
+    release = anyio.Event()
     fetches: list[None] = []
+    results: list[ListToolsResult] = []
 
     async def list_tools(ctx: ServerRequestContext[Any], params: PaginatedRequestParams | None) -> ListToolsResult:
         fetches.append(None)
-        if len(fetches) == 2:
-            both_fetching.set()
-        with anyio.fail_after(5):
-            await both_fetching.wait()
+        await release.wait()
         return ListToolsResult(tools=[Tool(name="t", input_schema={"type": "object"})])
 
+    async def call(client: Client) -> None:
+        results.append(await client.list_tools())
+
     server = Server("concurrent", on_list_tools=list_tools, cache_hints={"tools/list": CacheHint(ttl_ms=60_000)})
     async with Client(server) as client:
         async with anyio.create_task_group() as tg:
-            tg.start_soon(client.list_tools)
-            tg.start_soon(client.list_tools)
-    assert len(fetches) == 2
+            tg.start_soon(call, client)
+            tg.start_soon(call, client)
+            await anyio.wait_all_tasks_blocked()
+            release.set()
+    assert len(fetches) == 1
+    assert results[0] == results[1] and results[0] is not results[1]
 
 
 async def test_a_session_tier_call_always_makes_the_round_trip() -> None:
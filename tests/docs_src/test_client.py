@@ -80,7 +80,7 @@ async def test_call_tool_result_has_three_things_to_read() -> None:
         assert not result.is_error
         (block,) = result.content
         assert isinstance(block, TextContent)
-        assert block.text == '{\n  "title": "Dune",\n  "author": "Frank Herbert",\n  "year": 1965\n}'
+        assert block.text == '{"title":"Dune","author":"Frank Herbert","year":1965}'
         assert result.structured_content == {"title": "Dune", "author": "Frank Herbert", "year": 1965}
 
 
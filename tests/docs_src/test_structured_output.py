@@ -60,7 +60,7 @@ async def test_basemodel_is_the_schema() -> None:
         )
         result = await client.call_tool("get_weather", {"city": "London"})
         assert result.structured_content == {"temperature": 16.2, "humidity": 0.83, "conditions": "Overcast"}
-        serialized = '{\n  "temperature": 16.2,\n  "humidity": 0.83,\n  "conditions": "Overcast"\n}'
+        serialized = '{"temperature":16.2,"humidity":0.83,"conditions":"Overcast"}'
         assert result.content == [TextContent(type="text", text=serialized)]
 
 
@@ -137,7 +137,10 @@ async def test_list_return_is_wrapped() -> None:
                 {"temperature": 17.2, "humidity": 0.83, "conditions": "Overcast"},
             ]
         }
-        assert len(result.content) == 2
+        assert result.content == [
+            TextContent(type="text", text='{"temperature":16.2,"humidity":0.83,"conditions":"Overcast"}'),
+            TextContent(type="text", text='{"temperature":17.2,"humidity":0.83,"conditions":"Overcast"}'),
+        ]
 
 
 async def test_dict_str_return_is_not_wrapped() -> None:
@@ -4,7 +4,7 @@ import pytest
 from inline_snapshot import snapshot
 from mcp_types import TextContent, ToolAnnotations
 
-from docs_src.tools import tutorial001, tutorial002, tutorial003, tutorial004, tutorial005
+from docs_src.tools import tutorial001, tutorial002, tutorial003, tutorial004, tutorial005, tutorial006
 from mcp import Client
 
 # See test_index.py for why this is a per-module mark and not a conftest hook.
@@ -105,3 +105,12 @@ async def test_title_and_annotations() -> None:
         (tool,) = (await client.list_tools()).tools
         assert tool.title == "Search the catalog"
         assert tool.annotations == ToolAnnotations(read_only_hint=True, open_world_hint=False)
+
+
+async def test_memoize_serves_repeated_calls_from_memory() -> None:
+    """tutorial006: one memoized result per validated arguments, dropped by `memo.forget`."""
+    async with Client(tutorial006.mcp) as client:
+        for author in ("Le Guin", "Le Guin", "Herbert"):
+            result = await client.call_tool("count_books", {"author": author})
+            assert result.structured_content == {"result": len(author)}
+    assert tutorial006.mcp.memo.forget("tools/call", "count_books") == 2
@@ -173,16 +173,7 @@ async def test_call_tool_model_return_becomes_structured_content(connect: Connec
     )
     assert unstamped(result) == snapshot(
         CallToolResult(
-            content=[
-                TextContent(
-                    text="""\
-{
-  "temperature": 22.5,
-  "conditions": "sunny"
-}\
-"""
-                )
-            ],
+            content=[TextContent(text='{"temperature":22.5,"conditions":"sunny"}')],
             structured_content={"temperature": 22.5, "conditions": "sunny"},
         )
     )
@@ -1458,3 +1458,51 @@ def test_union_of_only_input_required_subclasses_yields_no_output_schema():
 
     meta = func_metadata(fn)
     assert meta.output_schema is None
+
+
+def test_structured_output_is_mirrored_as_compact_json_from_the_one_dump():
+    class Point(BaseModel):
+        x_pos: int = Field(alias="x")
+        label: str
+
+    def point() -> Point:
+        raise NotImplementedError
+
+    def points() -> list[Point]:
+        raise NotImplementedError
+
+    def name() -> str:
+        raise NotImplementedError
+
+    model = func_metadata(point).convert_result(Point(x=1, label="é"))
+    assert model == CallToolResult(
+        content=[TextContent(type="text", text='{"x":1,"label":"é"}')], structured_content={"x": 1, "label": "é"}
+    )
+    wrapped = func_metadata(points).convert_result([Point(x=1, label="a"), Point(x=2, label="b")])
+    assert wrapped == CallToolResult(
+        content=[
+            TextContent(type="text", text='{"x":1,"label":"a"}'),
+            TextContent(type="text", text='{"x":2,"label":"b"}'),
+        ],
+        structured_content={"result": [{"x": 1, "label": "a"}, {"x": 2, "label": "b"}]},
+    )
+    assert func_metadata(name).convert_result("plain") == CallToolResult(
+        content=[TextContent(type="text", text="plain")], structured_content={"result": "plain"}
+    )
+
+
+def test_text_mirror_can_be_left_out_but_returned_content_blocks_are_kept():
+    def point() -> dict[str, int]:
+        raise NotImplementedError
+
+    def blocks() -> list[TextContent]:
+        raise NotImplementedError
+
+    bare = func_metadata(point).convert_result({"x": 1}, text_mirror=False)
+    assert bare == CallToolResult(content=[], structured_content={"x": 1})
+
+    block = TextContent(type="text", text="for the model")
+    forced = func_metadata(blocks, structured_output=True).convert_result([block], text_mirror=False)
+    assert isinstance(forced, CallToolResult)
+    assert forced.content == [block]
+    assert forced.structured_content == {"result": [IsPartialDict(type="text", text="for the model")]}
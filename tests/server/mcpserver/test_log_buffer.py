@@ -0,0 +1,285 @@
+"""Buffered `Context.log` delivery (`mcp.server.mcpserver.log_buffer`)."""
+
+import contextlib
+from typing import Any
+
+import anyio
+import pytest
+from inline_snapshot import snapshot
+from mcp_types import (
+    INVALID_PARAMS,
+    CallToolRequest,
+    CallToolRequestParams,
+    CallToolResult,
+    ClientRequest,
+    GetPromptRequest,
+    GetPromptRequestParams,
+    LoggingLevel,
+    LoggingMessageNotification,
+    LoggingMessageNotificationParams,
+    ReadResourceRequest,
+    ReadResourceRequestParams,
+)
+
+from mcp.client import Client
+from mcp.server.mcpserver import Context, LogBuffer, MCPServer
+from mcp.server.mcpserver.log_buffer import DROPPED_LOGGER, BufferedLog
+from mcp.shared.exceptions import MCPError
+from mcp.shared.log_batch import LOG_BATCH_META_KEY, log_batch_entries
+
+pytestmark = pytest.mark.anyio
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _logs(
+    server: MCPServer, request: ClientRequest
+) -> tuple[list[LoggingMessageNotificationParams], list[LoggingMessageNotificationParams]]:
+    """The messages the logging callback saw, and the notifications that carried them."""
+    received: list[LoggingMessageNotificationParams] = []
+    wire: list[LoggingMessageNotificationParams] = []
+
+    async def collect(params: LoggingMessageNotificationParams) -> None:
+        received.append(params)
+
+    async def on_message(message: Any) -> None:
+        assert isinstance(message, LoggingMessageNotification)  # the only notification these servers send
+        wire.append(message.params)
+
+    async with Client(server, logging_callback=collect, message_handler=on_message, log_level="debug") as client:
+        with contextlib.suppress(MCPError):
+            await client.session.send_request(request, CallToolResult)
+    return received, wire
+
+
+def _call(tool: str) -> CallToolRequest:
+    return CallToolRequest(params=CallToolRequestParams(name=tool))
+
+
+async def test_messages_are_batched_by_count_per_level_and_logger_and_flushed_on_return():
+    server = MCPServer("test", log_buffer=LogBuffer(max_messages=3, max_delay=60))
+
+    @server.tool()
+    async def rows(ctx: Context) -> str:
+        for row in range(1, 6):
+            await ctx.info(f"row {row}")  # pyright: ignore[reportDeprecated]
+        await ctx.log("info", "rows done", logger_name="importer")  # pyright: ignore[reportDeprecated]
+        return "done"
+
+    received, wire = await _logs(server, _call("rows"))
+    batch = {LOG_BATCH_META_KEY: True}
+    assert wire == snapshot(
+        [
+            LoggingMessageNotificationParams(level="info", data=["row 1", "row 2", "row 3"], _meta=batch),
+            LoggingMessageNotificationParams(level="info", data=["row 4", "row 5"], _meta=batch),
+            LoggingMessageNotificationParams(level="info", logger="importer", data="rows done"),
+        ]
+    )
+    assert [(params.data, params.logger, params.meta) for params in received] == snapshot(
+        [
+            ("row 1", None, None),
+            ("row 2", None, None),
+            ("row 3", None, None),
+            ("row 4", None, None),
+            ("row 5", None, None),
+            ("rows done", "importer", None),
+        ]
+    )
+
+
+async def test_a_lone_message_whose_data_is_a_list_is_not_taken_for_a_batch():
+    server = MCPServer("test", log_buffer=LogBuffer())
+
+    @server.tool()
+    async def table(ctx: Context) -> str:
+        await ctx.info(["a", "b"])  # pyright: ignore[reportDeprecated]
+        return "done"
+
+    received, wire = await _logs(server, _call("table"))
+    assert received == wire == [LoggingMessageNotificationParams(level="info", data=["a", "b"])]
+
+
+def test_a_batch_keeps_the_rest_of_its_meta_on_every_message():
+    batch = LoggingMessageNotificationParams(level="info", data=[1, 2], _meta={LOG_BATCH_META_KEY: True, "trace": "t1"})
+    assert log_batch_entries(batch) == [
+        LoggingMessageNotificationParams(level="info", data=1, _meta={"trace": "t1"}),
+        LoggingMessageNotificationParams(level="info", data=2, _meta={"trace": "t1"}),
+    ]
+
+
+async def test_a_batch_is_sent_once_its_oldest_message_has_waited_max_delay():
+    clock = _Clock()
+    server = MCPServer("test", log_buffer=LogBuffer(max_messages=100, max_delay=1.0, clock=clock))
+    sent_before_return: list[int] = []
+
+    @server.tool()
+    async def slow(ctx: Context) -> str:
+        await ctx.info("first")  # pyright: ignore[reportDeprecated]
+        clock.now += 1.5
+        await ctx.info("second")  # pyright: ignore[reportDeprecated]
+        sent_before_return.append(len(received))
+        await ctx.info("third")  # pyright: ignore[reportDeprecated]
+        return "done"
+
+    received: list[LoggingMessageNotificationParams] = []
+
+    async def collect(params: LoggingMessageNotificationParams) -> None:
+        received.append(params)
+
+    async with Client(server, logging_callback=collect, log_level="debug") as client:
+        await client.call_tool("slow", {})
+
+    assert sent_before_return == [2]
+    assert [params.data for params in received] == ["first", "second", "third"]
+
+
+async def test_a_held_message_is_sent_after_max_delay_while_the_handler_is_idle():
+    clock = _Clock()
+    server = MCPServer("test", log_buffer=LogBuffer(max_messages=100, max_delay=1.0, clock=clock))
+    delivered = anyio.Event()
+
+    @server.tool()
+    async def idle(ctx: Context) -> str:
+        await ctx.info("waiting")  # pyright: ignore[reportDeprecated]
+        clock.now += 1.5
+        # Nothing else is logged: only the timer can send the held message before the tool returns.
+        with anyio.fail_after(5):
+            await delivered.wait()
+        return "done"
+
+    async def collect(params: LoggingMessageNotificationParams) -> None:
+        delivered.set()
+
+    async with Client(server, logging_callback=collect, log_level="debug") as client:
+        result = await client.call_tool("idle", {})
+    assert result.is_error is False
+
+
+async def test_the_timer_waits_out_max_delay_from_the_oldest_message():
+    clock = _Clock()
+    buffer = BufferedLog(LogBuffer(max_delay=0.01, clock=clock))
+    sent: list[Any] = []
+    delivered = anyio.Event()
+
+    async def send(level: LoggingLevel, data: Any, logger: str | None, batch: bool) -> None:
+        sent.append(data)
+        delivered.set()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(buffer.run_timer, send)
+        buffer.add("info", "held", None)
+        await anyio.wait_all_tasks_blocked()
+        assert sent == []  # asleep until the message is due
+        clock.now = 1.0
+        with anyio.fail_after(5):
+            await delivered.wait()
+        assert sent == ["held"]
+        tg.cancel_scope.cancel()
+
+
+def _failing_server() -> MCPServer:
+    server = MCPServer("test", log_buffer=LogBuffer())
+
+    async def log_then_fail(ctx: Context, error: Exception) -> str:
+        await ctx.error("about to fail")  # pyright: ignore[reportDeprecated]
+        raise error
+
+    @server.tool()
+    async def broken(ctx: Context) -> str:
+        return await log_then_fail(ctx, RuntimeError("boom"))
+
+    @server.tool()
+    async def refused(ctx: Context) -> str:
+        return await log_then_fail(ctx, MCPError(INVALID_PARAMS, "no"))
+
+    @server.resource("broken://{name}")
+    async def broken_resource(name: str, ctx: Context) -> str:
+        return await log_then_fail(ctx, RuntimeError("boom"))
+
+    @server.prompt()
+    async def broken_prompt(ctx: Context) -> str:
+        return await log_then_fail(ctx, RuntimeError("boom"))
+
+    return server
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        _call("broken"),
+        _call("refused"),
+        ReadResourceRequest(params=ReadResourceRequestParams(uri="broken://x")),
+        GetPromptRequest(params=GetPromptRequestParams(name="broken_prompt")),
+    ],
+    ids=["tool-error-result", "tool-mcp-error", "resource", "prompt"],
+)
+async def test_buffered_messages_still_reach_the_client_when_the_handler_fails(request_: ClientRequest):
+    received, _ = await _logs(_failing_server(), request_)
+    assert received == [LoggingMessageNotificationParams(level="error", data="about to fail")]
+
+
+async def test_past_capacity_the_least_severe_messages_are_dropped_and_reported():
+    buffer = BufferedLog(LogBuffer(max_messages=2, capacity=2))
+    sent: list[tuple[LoggingLevel, Any, str | None, bool]] = []
+    release = anyio.Event()
+
+    async def send(level: LoggingLevel, data: Any, logger: str | None, batch: bool) -> None:
+        sent.append((level, data, logger, batch))
+        await release.wait()
+
+    async with anyio.create_task_group() as tg:
+        assert not buffer.add("debug", "d1", None)
+        assert buffer.add("info", "i1", None)
+        tg.start_soon(buffer.flush, send)
+        await anyio.wait_all_tasks_blocked()
+        # The first batch is in flight; these pile up behind it.
+        buffer.add("debug", "d2", None)
+        buffer.add("error", "e1", None)
+        buffer.add("warning", "w1", None)  # evicts d2, the least severe held
+        buffer.add("debug", "d3", None)  # no more severe than anything held: dropped itself
+        await buffer.flush(send)  # a no-op while the first flush is sending
+        release.set()
+
+    assert buffer.dropped == 2
+    assert sent == snapshot(
+        [
+            ("debug", "d1", None, False),
+            ("info", "i1", None, False),
+            ("warning", {"dropped": {"debug": 2}}, DROPPED_LOGGER, False),
+            ("error", "e1", None, False),
+            ("warning", "w1", None, False),
+        ]
+    )
+
+
+async def test_log_dropped_reads_zero_without_a_buffer():
+    server = MCPServer("test")
+
+    @server.tool()
+    async def quiet(ctx: Context) -> int:
+        await ctx.flush_log()
+        return ctx.log_dropped
+
+    async with Client(server) as client:
+        result = await client.call_tool("quiet", {})
+    assert result.structured_content == {"result": 0}
+
+
+@pytest.mark.parametrize(
+    ("make", "message"),
+    [
+        (lambda: LogBuffer(max_messages=0), "max_messages must be >= 1, got 0"),
+        (lambda: LogBuffer(max_messages=8, capacity=4), "capacity must be >= max_messages, got 4 < 8"),
+        (lambda: LogBuffer(max_delay=-1), "max_delay must be >= 0, got -1"),
+    ],
+)
+def test_invalid_limits_are_rejected(make: Any, message: str):
+    with pytest.raises(ValueError) as exc:
+        make()
+    assert str(exc.value) == message
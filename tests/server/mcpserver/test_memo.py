@@ -0,0 +1,311 @@
+"""Server-side memoization of tool results and resource template reads (`mcp.server.mcpserver.memo`)."""
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Annotated
+
+import pytest
+from logfire.testing import CaptureLogfire
+from mcp_types import CallToolResult, InputRequiredResult, TextContent
+
+from mcp.client import Client
+from mcp.server.auth.middleware.auth_context import auth_context_var
+from mcp.server.auth.middleware.bearer_auth import AuthenticatedUser
+from mcp.server.auth.provider import AccessToken
+from mcp.server.mcpserver import Context, MCPServer, Memoization, Resolve
+from mcp.server.mcpserver.exceptions import InvalidSignature, ToolError
+from mcp.server.mcpserver.resources import FunctionResource
+from mcp.server.mcpserver.tools import ToolManager
+from mcp.server.subscriptions import InMemorySubscriptionBus
+from mcp.shared.subscriptions import ResourcesListChanged, ResourceUpdated, ServerEvent, ToolsListChanged
+
+pytestmark = pytest.mark.anyio
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@contextmanager
+def _as(subject: str) -> Generator[None]:
+    token = auth_context_var.set(
+        AuthenticatedUser(AccessToken(token=f"at-{subject}", client_id="app", scopes=[], subject=subject))
+    )
+    try:
+        yield
+    finally:
+        auth_context_var.reset(token)
+
+
+def _counting_server(memoization: Memoization | None = None) -> tuple[MCPServer, list[int]]:
+    server = MCPServer("test", memoization=memoization)
+    calls: list[int] = []
+
+    @server.tool(memoize=60)
+    def square(n: int) -> int:
+        calls.append(n)
+        return n * n
+
+    return server, calls
+
+
+def _text(result: CallToolResult | InputRequiredResult) -> str:
+    assert isinstance(result, CallToolResult)
+    assert isinstance(result.content[0], TextContent)
+    return result.content[0].text
+
+
+async def test_a_memoized_tool_runs_once_per_validated_arguments(capfire: CaptureLogfire):
+    server, calls = _counting_server()
+
+    async with Client(server) as client:
+        first = await client.call_tool("square", {"n": 3})
+        again = await client.call_tool("square", {"n": "3"})
+        other = await client.call_tool("square", {"n": 4})
+
+    assert calls == [3, 4]
+    assert first.structured_content == again.structured_content == {"result": 9}
+    assert other.structured_content == {"result": 16}
+    metrics = {metric["name"]: metric["data"]["data_points"] for metric in capfire.get_collected_metrics()}
+    lookups = {point["attributes"]["mcp.memo.result"]: point["value"] for point in metrics["mcp.server.memo.lookups"]}
+    assert lookups == {"hit": 1, "miss": 2}
+
+
+async def test_a_result_expires_after_its_ttl():
+    clock = _Clock()
+    server, calls = _counting_server(Memoization(clock=clock))
+
+    await server.call_tool("square", {"n": 2})
+    clock.now = 59.9
+    await server.call_tool("square", {"n": 2})
+    clock.now = 60.0
+    await server.call_tool("square", {"n": 2})
+
+    assert calls == [2, 2]
+
+
+async def test_the_least_recently_used_result_is_evicted_past_max_entries():
+    server, calls = _counting_server(Memoization(max_entries=2))
+
+    for n in (1, 2, 1, 3, 1, 2):
+        await server.call_tool("square", {"n": n})
+
+    # 1 is used again before 3 arrives, so 2 is the one evicted.
+    assert calls == [1, 2, 3, 2]
+    assert len(server.memo) == 2
+
+
+async def test_each_hit_is_a_copy_the_caller_may_edit():
+    server, calls = _counting_server()
+
+    first = await server.call_tool("square", {"n": 3})
+    assert isinstance(first, CallToolResult)
+    first.content.append(TextContent(type="text", text="appended by middleware"))
+    second = await server.call_tool("square", {"n": 3})
+    assert isinstance(second, CallToolResult)
+    second.structured_content = {"result": -1}
+
+    third = await server.call_tool("square", {"n": 3})
+    assert (calls, _text(third), third) == (
+        [3],
+        "9",
+        CallToolResult(content=[TextContent(type="text", text="9")], structured_content={"result": 9}),
+    )
+
+
+async def test_callers_are_partitioned_by_authenticated_identity():
+    server = MCPServer("test")
+    calls: list[str] = []
+
+    @server.tool(memoize=60)
+    def whoami(ctx: Context) -> str:
+        calls.append("run")
+        return f"call {len(calls)}"
+
+    with _as("alice"):
+        alice = _text(await server.call_tool("whoami", {}))
+        assert _text(await server.call_tool("whoami", {})) == alice
+    with _as("bob"):
+        assert _text(await server.call_tool("whoami", {})) != alice
+    anonymous = _text(await server.call_tool("whoami", {}))
+
+    assert (alice, anonymous) == ("call 1", "call 3")
+
+
+async def test_errors_and_input_required_results_are_not_memoized():
+    server = MCPServer("test")
+    attempts: list[str] = []
+
+    @server.tool(memoize=60)
+    def flaky() -> str:
+        attempts.append("flaky")
+        raise RuntimeError("backend down")
+
+    @server.tool(memoize=60)
+    def ask() -> InputRequiredResult:
+        attempts.append("ask")
+        return InputRequiredResult(input_requests={}, request_state="opaque")
+
+    for _ in range(2):
+        with pytest.raises(ToolError):
+            await server.call_tool("flaky", {})
+        assert isinstance(await server.call_tool("ask", {}), InputRequiredResult)
+
+    assert attempts == ["flaky", "ask", "flaky", "ask"]
+    assert len(server.memo) == 0
+
+
+async def test_notify_tools_changed_and_remove_tool_drop_memoized_results():
+    server, calls = _counting_server()
+
+    @server.tool()
+    async def reload(ctx: Context) -> str:
+        await ctx.notify_tools_changed()
+        return "reloaded"
+
+    async with Client(server) as client:
+        await client.call_tool("square", {"n": 5})
+        await client.call_tool("reload", {})
+        await client.call_tool("square", {"n": 5})
+    assert calls == [5, 5]
+
+    server.remove_tool("square")
+    assert len(server.memo) == 0
+
+
+async def test_only_converted_results_are_memoized():
+    calls: list[int] = []
+
+    def inc(n: int) -> int:
+        calls.append(n)
+        return n + 1
+
+    manager = ToolManager(memo=MCPServer("test").memo)
+    manager.add_tool(inc, memoize=60)
+    context = Context(mcp_server=MCPServer("other"))
+
+    assert await manager.call_tool("inc", {"n": 1}, context) == 2
+    assert await manager.call_tool("inc", {"n": 1}, context) == 2
+    assert calls == [1, 1]
+
+    unmemoized = ToolManager()
+    unmemoized.add_tool(inc, memoize=60)
+    unmemoized.remove_tool("inc")
+    assert unmemoized.list_tools() == []
+
+
+async def test_a_memoized_template_read_is_dropped_by_resource_notifications():
+    server = MCPServer("test")
+    reads: list[str] = []
+
+    @server.resource("users://{user_id}/profile", memoize=60)
+    def profile(user_id: str) -> str:
+        reads.append(user_id)
+        return f"profile {user_id} v{len(reads)}"
+
+    @server.resource("forms://{form}", memoize=60)
+    def form(form: str) -> InputRequiredResult:
+        reads.append(form)
+        return InputRequiredResult(input_requests={}, request_state="opaque")
+
+    @server.tool()
+    async def touch(uri: str, ctx: Context, everything: bool = False) -> str:
+        if everything:
+            await ctx.notify_resources_changed()
+        else:
+            await ctx.notify_resource_updated(uri)
+        return "ok"
+
+    async def read(uri: str) -> object:
+        return await server.read_resource(uri)
+
+    first = await read("users://1/profile")
+    assert await read("users://1/profile") == first
+    await read("users://2/profile")
+    await server.call_tool("touch", {"uri": "users://1/profile"})
+    assert await read("users://1/profile") != first
+    await read("users://2/profile")
+    await server.call_tool("touch", {"uri": "", "everything": True})
+    await read("users://2/profile")
+    assert isinstance(await read("forms://signup"), InputRequiredResult)
+    assert isinstance(await read("forms://signup"), InputRequiredResult)
+
+    assert reads == ["1", "2", "1", "2", "signup", "signup"]
+
+
+async def test_templates_without_memoize_and_static_resources_are_read_each_time():
+    server = MCPServer("test")
+    reads: list[str] = []
+
+    @server.resource("plain://{name}")
+    def plain(name: str) -> str:
+        reads.append(name)
+        return name
+
+    server.add_resource(FunctionResource.from_function(lambda: "static", uri="static://one", name="one"))
+
+    for _ in range(2):
+        await server.read_resource("plain://x")
+        await server.read_resource("static://one")
+    assert reads == ["x", "x"]
+    assert len(server.memo) == 0
+
+
+def test_memoize_is_validated_at_registration():
+    server = MCPServer("test")
+
+    def user(user_id: str) -> str:
+        raise NotImplementedError
+
+    def static() -> str:
+        raise NotImplementedError
+
+    with pytest.raises(ValueError, match="memoize must be > 0 seconds, got 0"):
+        server.tool(memoize=0)(static)
+    with pytest.raises(ValueError, match="memoize must be > 0 seconds, got -1"):
+        server.resource("users://{user_id}", memoize=-1)(user)
+    with pytest.raises(ValueError, match="memoize applies to resource templates only"):
+        server.resource("static://one", memoize=5)(static)
+    with pytest.raises(ValueError, match="max_entries must be >= 1, got 0"):
+        Memoization(max_entries=0)
+
+    async def current_user() -> str:
+        raise NotImplementedError
+
+    def whoami(user: Annotated[str, Resolve(current_user)]) -> str:
+        raise NotImplementedError
+
+    with pytest.raises(InvalidSignature, match="combines Resolve"):
+        server.add_tool(whoami, memoize=5)
+
+
+def test_memo_forget_drops_one_name_across_partitions():
+    server = MCPServer("test")
+    memo = server.memo
+    with _as("alice"):
+        memo.put(memo.key("tools/call", "a"), 1, 60)
+    memo.put(memo.key("tools/call", "a"), 2, 60)
+    memo.put(memo.key("tools/call", "b"), 3, 60)
+    memo.put(memo.key("resources/read", "a"), 4, 60)
+
+    assert memo.forget("tools/call", "a") == 2
+    assert memo.get(memo.key("tools/call", "b")) == 3
+    memo.clear()
+    assert len(memo) == 0
+
+
+async def test_a_context_without_a_server_only_publishes():
+    bus = InMemorySubscriptionBus()
+    seen: list[ServerEvent] = []
+    bus.subscribe(seen.append)
+    context = Context(subscriptions=bus)
+
+    await context.notify_tools_changed()
+    await context.notify_resources_changed()
+    await context.notify_resource_updated("r://x")
+
+    assert seen == [ToolsListChanged(), ResourcesListChanged(), ResourceUpdated(uri="r://x")]
@@ -0,0 +1,166 @@
+"""Progress throttling for `Context.report_progress` (`mcp.server.mcpserver.progress`)."""
+
+import contextlib
+
+import pytest
+from inline_snapshot import snapshot
+from mcp_types import (
+    INVALID_PARAMS,
+    CallToolRequest,
+    CallToolRequestParams,
+    CallToolResult,
+    GetPromptRequest,
+    GetPromptRequestParams,
+    ReadResourceRequest,
+    ReadResourceRequestParams,
+    TextContent,
+)
+
+from mcp.client import Client
+from mcp.server.mcpserver import Context, MCPServer, ProgressThrottle
+from mcp.shared.exceptions import MCPError
+
+pytestmark = pytest.mark.anyio
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _run(server: MCPServer, tool: str) -> tuple[list[tuple[float, float | None, str | None]], str]:
+    """Call `tool` with a progress callback; the updates received and the tool's text result."""
+    received: list[tuple[float, float | None, str | None]] = []
+
+    async def on_progress(progress: float, total: float | None, message: str | None) -> None:
+        received.append((progress, total, message))
+
+    async with Client(server) as client:
+        result = await client.call_tool(tool, {}, progress_callback=on_progress)
+    assert isinstance(result.content[0], TextContent)
+    return received, result.content[0].text
+
+
+async def test_updates_inside_the_minimum_delta_are_suppressed_and_the_final_one_always_sent():
+    server = MCPServer("test", progress_throttle=ProgressThrottle(min_delta=10))
+
+    @server.tool()
+    async def crunch(ctx: Context) -> int:
+        for step in range(1, 101):
+            await ctx.report_progress(step, 100)
+        return ctx.progress_suppressed
+
+    received, suppressed = await _run(server, "crunch")
+    assert [progress for progress, _, _ in received] == [1, 11, 21, 31, 41, 51, 61, 71, 81, 91, 100]
+    assert suppressed == "89"
+
+
+async def test_updates_inside_the_minimum_interval_coalesce_into_the_latest_on_return():
+    clock = _Clock()
+    server = MCPServer("test", progress_throttle=ProgressThrottle(min_interval=1.0, clock=clock))
+
+    @server.tool()
+    async def drain(ctx: Context) -> str:
+        for row in range(1, 6):
+            await ctx.report_progress(row, message=f"row {row}")
+            clock.now += 0.2
+        return "done"
+
+    received, _ = await _run(server, "drain")
+    # 2-5 all fall inside the interval after 1; the latest of them is sent as the tool returns.
+    assert received == snapshot([(1.0, None, "row 1"), (5.0, None, "row 5")])
+
+
+async def test_a_per_call_throttle_overrides_the_servers():
+    server = MCPServer("test", progress_throttle=ProgressThrottle(min_delta=100))
+
+    @server.tool()
+    async def steps(ctx: Context) -> int:
+        await ctx.report_progress(1)
+        await ctx.report_progress(2)
+        await ctx.report_progress(3, throttle=ProgressThrottle())
+        return ctx.progress_suppressed
+
+    received, suppressed = await _run(server, "steps")
+    assert [progress for progress, _, _ in received] == [1, 3]
+    assert suppressed == "1"
+
+
+async def test_without_a_throttle_every_update_is_sent():
+    server = MCPServer("test")
+
+    @server.tool()
+    async def steps(ctx: Context) -> int:
+        for step in range(1, 4):
+            await ctx.report_progress(step)
+        return ctx.progress_suppressed
+
+    received, suppressed = await _run(server, "steps")
+    assert [progress for progress, _, _ in received] == [1, 2, 3]
+    assert suppressed == "0"
+
+
+def _failing_server() -> MCPServer:
+    """Each handler reports 1, then 2 inside the throttle interval, then fails."""
+    server = MCPServer("test", progress_throttle=ProgressThrottle(min_interval=60))
+
+    async def report_then_fail(ctx: Context, error: Exception) -> str:
+        await ctx.report_progress(1)
+        await ctx.report_progress(2)
+        raise error
+
+    @server.tool()
+    async def broken(ctx: Context) -> str:
+        return await report_then_fail(ctx, RuntimeError("boom"))
+
+    @server.tool()
+    async def refused(ctx: Context) -> str:
+        return await report_then_fail(ctx, MCPError(INVALID_PARAMS, "no"))
+
+    @server.resource("broken://{name}")
+    async def broken_resource(name: str, ctx: Context) -> str:
+        return await report_then_fail(ctx, RuntimeError("boom"))
+
+    @server.prompt()
+    async def broken_prompt(ctx: Context) -> str:
+        return await report_then_fail(ctx, RuntimeError("boom"))
+
+    return server
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        CallToolRequest(params=CallToolRequestParams(name="broken")),
+        CallToolRequest(params=CallToolRequestParams(name="refused")),
+        ReadResourceRequest(params=ReadResourceRequestParams(uri="broken://x")),
+        GetPromptRequest(params=GetPromptRequestParams(name="broken_prompt")),
+    ],
+    ids=["tool-error-result", "tool-mcp-error", "resource", "prompt"],
+)
+async def test_the_held_back_update_is_flushed_when_the_handler_fails(
+    request_: CallToolRequest | ReadResourceRequest | GetPromptRequest,
+):
+    received: list[float] = []
+
+    async def on_progress(progress: float, total: float | None, message: str | None) -> None:
+        received.append(progress)
+
+    async with Client(_failing_server()) as client:
+        with contextlib.suppress(MCPError):
+            await client.session.send_request(request_, CallToolResult, progress_callback=on_progress)
+
+    assert received == [1, 2]
+
+
+def test_negative_limits_are_rejected():
+    with pytest.raises(ValueError) as interval:
+        ProgressThrottle(min_interval=-1)
+    with pytest.raises(ValueError) as delta:
+        ProgressThrottle(min_delta=-1)
+    assert (str(interval.value), str(delta.value)) == snapshot(
+        ("min_interval must be >= 0, got -1", "min_delta must be >= 0, got -1")
+    )
@@ -524,7 +524,7 @@ class TestServerTools:
             # Content should be JSON serialized version
             assert len(result.content) == 1
             assert isinstance(result.content[0], TextContent)
-            assert '"name": "John Doe"' in result.content[0].text
+            assert result.content[0].text == '{"name":"John Doe","age":30,"active":true}'
 
     async def test_tool_structured_output_primitive(self):
         """Test tool with structured output returning primitive type"""
@@ -1163,10 +1163,18 @@ class TestContextInjection:
                 assert "Logged messages for test" in content.text
 
                 assert mock_log.call_count == 4
-                mock_log.assert_any_call(level="debug", data="Debug message", logger=None, related_request_id="2")
-                mock_log.assert_any_call(level="info", data="Info message", logger=None, related_request_id="2")
-                mock_log.assert_any_call(level="warning", data="Warning message", logger=None, related_request_id="2")
-                mock_log.assert_any_call(level="error", data="Error message", logger=None, related_request_id="2")
+                mock_log.assert_any_call(
+                    level="debug", data="Debug message", logger=None, related_request_id="2", meta=None
+                )
+                mock_log.assert_any_call(
+                    level="info", data="Info message", logger=None, related_request_id="2", meta=None
+                )
+                mock_log.assert_any_call(
+                    level="warning", data="Warning message", logger=None, related_request_id="2", meta=None
+                )
+                mock_log.assert_any_call(
+                    level="error", data="Error message", logger=None, related_request_id="2", meta=None
+                )
 
     async def test_optional_context(self):
         """Test that context is optional."""
@@ -2361,6 +2369,32 @@ def test_context_exposes_its_mcp_server() -> None:
     assert Context(mcp_server=mcp).mcp_server is mcp
 
 
+def test_context_built_without_validation_behaves_as_a_model() -> None:
+    mcp = MCPServer()
+    ctx = Context(mcp_server=mcp)
+    assert ctx.model_dump() == {}
+    assert ctx.model_fields_set == set()
+    assert ctx.mcp_server is mcp
+    assert repr(ctx) == "Context()"
+
+
+def test_middleware_can_stash_attributes_on_the_request_context() -> None:
+    request_context = _request_context(None)
+    request_context.tenant = "acme"  # pyright: ignore[reportAttributeAccessIssue]
+    assert vars(request_context)["tenant"] == "acme"
+
+
+def test_a_context_subclass_with_fields_is_still_validated() -> None:
+    class Tagged(Context):
+        tag: str = "default"
+
+    mcp = MCPServer()
+    # pyright reads a subclass with fields as a plain model, without Context's keyword-only __init__.
+    assert Tagged(mcp_server=mcp).tag == "default"  # pyright: ignore[reportCallIssue]
+    tagged = Tagged(mcp_server=mcp, tag="x")  # pyright: ignore[reportCallIssue]
+    assert (tagged.tag, tagged.mcp_server) == ("x", mcp)
+
+
 def test_remove_prompt_removes_and_unknown_name_raises() -> None:
     mcp = MCPServer()
 
@@ -2423,3 +2457,27 @@ async def test_middleware_can_refuse_subscriptions_listen_before_the_ack() -> No
                 pass  # pragma: no cover - the refusal precedes the stream
     assert exc_info.value.error.code == INVALID_REQUEST
     assert exc_info.value.error.message == "not permitted to watch the requested resources"
+
+
+async def test_structured_text_mirror_is_left_out_only_for_clients_that_read_structured_content() -> None:
+    mcp = MCPServer(structured_text_mirror=False)
+    runs: list[str] = []
+
+    @mcp.tool(memoize=60)
+    def point() -> dict[str, int]:
+        runs.append("point")
+        return {"x": 1}
+
+    async with Client(mcp) as client:
+        modern = await client.call_tool("point", {})
+    assert (modern.content, modern.structured_content) == ([], {"x": 1})
+
+    request_context = ServerRequestContext(
+        session=AsyncMock(), method="tools/call", lifespan_context=None, protocol_version="2025-03-26"
+    )
+    legacy = await mcp.call_tool("point", {}, Context(request_context=request_context, mcp_server=mcp))
+    direct = await mcp.call_tool("point", {})
+    expected = CallToolResult(content=[TextContent(type="text", text='{"x":1}')], structured_content={"x": 1})
+    assert legacy == direct == expected
+    # The mirrored and bare results are memoized apart.
+    assert runs == ["point", "point"]
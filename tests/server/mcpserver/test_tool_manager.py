@@ -1,15 +1,16 @@
 import json
 import logging
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass
-from typing import Any, TypedDict
+from typing import Annotated, Any, TypedDict
 
 import pytest
 from mcp_types import CallToolResult, TextContent, ToolAnnotations
 from pydantic import BaseModel
 
 from mcp.server.context import LifespanContextT, RequestT
-from mcp.server.mcpserver import Context, MCPServer
-from mcp.server.mcpserver.exceptions import ToolError
+from mcp.server.mcpserver import Context, MCPServer, Resolve
+from mcp.server.mcpserver.exceptions import InvalidSignature, ToolError
 from mcp.server.mcpserver.tools import Tool, ToolManager
 from mcp.server.mcpserver.utilities.func_metadata import ArgModelBase, FuncMetadata
 
@@ -436,6 +437,49 @@ class TestToolAnnotations:
         assert tools[0].annotations.read_only_hint is True
 
 
+class TestStreamingTools:
+    """Async-generator tools: chunks stream as partial content, or are kept for the result."""
+
+    @staticmethod
+    async def count(n: int) -> AsyncGenerator[str]:
+        """Count to n."""
+        for i in range(1, n + 1):
+            yield str(i)
+
+    def test_async_generator_tool_streams_without_structured_output(self):
+        tool = ToolManager().add_tool(self.count)
+        assert tool.streams and tool.output_schema is None
+        assert tool.parameters["required"] == ["n"]
+
+    def test_async_generator_tool_rejects_structured_output_and_memoize(self):
+        manager = ToolManager()
+        with pytest.raises(InvalidSignature, match="cannot have structured output"):
+            manager.add_tool(self.count, structured_output=True)
+        with pytest.raises(InvalidSignature, match="cannot be memoized"):
+            manager.add_tool(self.count, memoize=60)
+
+    @pytest.mark.anyio
+    async def test_chunks_are_kept_for_the_result_without_a_request_to_stream_on(self):
+        manager = ToolManager()
+        manager.add_tool(self.count)
+        assert await manager.call_tool("count", {"n": 3}, Context()) == ["1", "2", "3"]
+        result = await manager.call_tool("count", {"n": 3}, Context(), convert_result=True)
+        assert result == CallToolResult(content=[TextContent(text=text) for text in ("1", "2", "3")])
+
+    @pytest.mark.anyio
+    async def test_async_generator_tool_takes_resolved_arguments(self):
+        async def prefix(ctx: Context) -> str:
+            return "#"
+
+        async def numbered(n: int, mark: Annotated[str, Resolve(prefix)]) -> AsyncGenerator[str]:
+            for i in range(1, n + 1):
+                yield f"{mark}{i}"
+
+        manager = ToolManager()
+        manager.add_tool(numbered)
+        assert await manager.call_tool("numbered", {"n": 2}, Context()) == ["#1", "#2"]
+
+
 class TestStructuredOutput:
     """Test structured output functionality in tools."""
 
@@ -0,0 +1,416 @@
+"""Binary resource contents served by reference beside the streamable HTTP endpoint (`mcp.server.blob_offload`)."""
+
+import base64
+import time
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+import httpx2
+import pytest
+from mcp_types import BlobResourceContents, ReadResourceResult, TextResourceContents
+from mcp_types.version import LATEST_HANDSHAKE_VERSION, LATEST_PROTOCOL_VERSION, MODERN_PROTOCOL_VERSIONS
+
+from mcp.client import Client
+from mcp.client._blobs import BlobFetcher
+from mcp.server.auth.provider import AccessToken
+from mcp.server.blob_offload import BlobStore
+from mcp.server.mcpserver import BlobOffload, MCPServer
+from mcp.shared.blob_offload import BLOB_OFFLOAD_META_KEY, BlobRef, blob_ref
+from tests.interaction._connect import BASE_URL, NO_DNS_REBINDING_PROTECTION, base_headers, initialize_body
+from tests.interaction.auth._harness import StaticTokenVerifier, auth_settings
+from tests.interaction.transports._bridge import StreamingASGITransport
+
+pytestmark = pytest.mark.anyio
+
+BIG = bytes(range(256)) * 16
+"""4 KiB: above the test servers' `min_size`."""
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _server(clock: _Clock | None = None, **limits: int) -> MCPServer:
+    server = MCPServer("blobs", blob_offload=BlobOffload(min_size=1024, clock=clock or _Clock(), **limits))
+
+    @server.resource("blob://big", mime_type="image/png")
+    def big() -> bytes:
+        return BIG
+
+    @server.resource("blob://small")
+    def small() -> bytes:
+        return b"tiny"
+
+    @server.resource("text://note")
+    def note() -> str:
+        return "just text"
+
+    return server
+
+
+@asynccontextmanager
+async def _mounted(server: MCPServer, *, stateless_http: bool = False) -> AsyncGenerator[httpx2.AsyncClient]:
+    app = server.streamable_http_app(stateless_http=stateless_http, transport_security=NO_DNS_REBINDING_PROTECTION)
+    async with (
+        server.session_manager.run(),
+        httpx2.AsyncClient(transport=StreamingASGITransport(app), base_url=BASE_URL) as http,
+    ):
+        yield http
+
+
+def _mode(spec_version: str) -> str:
+    return spec_version if spec_version in MODERN_PROTOCOL_VERSIONS else "legacy"
+
+
+async def _wire_read(client: Client, uri: str) -> ReadResourceResult:
+    """A `resources/read` opted in to offload, as the server answered it."""
+    return await client.session.read_resource(uri, meta={BLOB_OFFLOAD_META_KEY: True})
+
+
+@pytest.mark.parametrize("spec_version", [LATEST_HANDSHAKE_VERSION, LATEST_PROTOCOL_VERSION])
+async def test_a_large_blob_travels_by_reference_and_reads_back_inline(spec_version: str):
+    server = _server()
+
+    async with _mounted(server) as http:
+        async with Client(f"{BASE_URL}/mcp", http_client=http, mode=_mode(spec_version)) as client:
+            wire = await _wire_read(client, "blob://big")
+            read = await client.read_resource("blob://big")
+
+    [offloaded] = wire.contents
+    assert isinstance(offloaded, BlobResourceContents) and offloaded.blob == ""
+    ref = blob_ref(offloaded)
+    assert ref is not None and ref["size"] == len(BIG) and ref["url"].startswith("/mcp/blobs/")
+    [inline] = read.contents
+    assert isinstance(inline, BlobResourceContents)
+    assert base64.b64decode(inline.blob) == BIG
+    assert inline.mime_type == "image/png" and inline.meta is None
+
+
+@pytest.mark.parametrize("spec_version", [LATEST_HANDSHAKE_VERSION, LATEST_PROTOCOL_VERSION])
+async def test_read_resource_bytes_fetches_only_the_requested_range(spec_version: str):
+    server = _server()
+    ranges: list[str | None] = []
+
+    async def record(request: httpx2.Request) -> None:
+        if "/blobs/" in request.url.path:
+            ranges.append(request.headers.get("range"))
+
+    async with _mounted(server) as http:
+        http.event_hooks["request"] = [record]
+        async with Client(f"{BASE_URL}/mcp", http_client=http, mode=_mode(spec_version)) as client:
+            assert await client.read_resource_bytes("blob://big") == BIG
+            assert await client.read_resource_bytes("blob://big", start=10, end=20) == BIG[10:20]
+            assert await client.read_resource_bytes("blob://big", start=4000, end=9999) == BIG[4000:]
+            assert await client.read_resource_bytes("blob://big", start=50, end=50) == b""
+            assert await client.read_resource_bytes("blob://small", start=1) == b"iny"
+
+    assert ranges == [None, "bytes=10-19", "bytes=4000-4095"]
+
+
+async def test_a_url_client_fetches_blobs_over_the_http_client_it_creates(monkeypatch: pytest.MonkeyPatch):
+    server = _server()
+    app = server.streamable_http_app(transport_security=NO_DNS_REBINDING_PROTECTION)
+    monkeypatch.setattr(
+        "mcp.client.client.create_mcp_http_client",
+        lambda: httpx2.AsyncClient(transport=StreamingASGITransport(app), base_url=BASE_URL),
+    )
+
+    async with server.session_manager.run(), Client(f"{BASE_URL}/mcp") as client:
+        assert await client.read_resource_bytes("blob://big", start=1, end=2) == BIG[1:2]
+
+    assert len(server._blob_store or ()) == 1  # pyright: ignore[reportPrivateUsage]
+
+
+async def test_small_blobs_text_and_reads_that_did_not_opt_in_stay_inline():
+    server = _server()
+
+    async with _mounted(server) as http:
+        async with Client(f"{BASE_URL}/mcp", http_client=http) as client:
+            small = await _wire_read(client, "blob://small")
+            note = await _wire_read(client, "text://note")
+            plain = await client.session.read_resource("blob://big")
+
+    assert small.contents == [BlobResourceContents(uri="blob://small", blob="dGlueQ==", mime_type="text/plain")]
+    assert note.contents == [TextResourceContents(uri="text://note", text="just text", mime_type="text/plain")]
+    [item] = plain.contents
+    assert isinstance(item, BlobResourceContents) and base64.b64decode(item.blob) == BIG
+
+
+async def test_in_process_clients_always_read_inline():
+    server = _server()
+
+    async with Client(server) as client:
+        result = await client.read_resource("blob://big")
+        assert await client.read_resource_bytes("blob://big", end=3) == BIG[:3]
+        with pytest.raises(ValueError, match="has no binary contents"):
+            await client.read_resource_bytes("text://note")
+        with pytest.raises(ValueError, match="must be >= 0"):
+            await client.read_resource_bytes("blob://big", start=-1)
+
+    [item] = result.contents
+    assert isinstance(item, BlobResourceContents) and base64.b64decode(item.blob) == BIG
+    assert len(server._blob_store or ()) == 0  # pyright: ignore[reportPrivateUsage]
+
+
+async def test_an_expired_reference_is_read_again_inline(monkeypatch: pytest.MonkeyPatch):
+    clock = _Clock()
+    server = _server(clock)
+    offload = BlobStore.offload
+
+    def offload_then_expire(store: BlobStore, request: object, data: bytes, mime_type: str) -> BlobRef | None:
+        ref = offload(store, request, data, mime_type)
+        clock.now += 120
+        return ref
+
+    monkeypatch.setattr(BlobStore, "offload", offload_then_expire)
+    async with _mounted(server) as http:
+        async with Client(f"{BASE_URL}/mcp", http_client=http) as client:
+            read = await client.read_resource("blob://big")
+            ranged = await client.read_resource_bytes("blob://big", start=1, end=3)
+
+    [item] = read.contents
+    assert isinstance(item, BlobResourceContents) and base64.b64decode(item.blob) == BIG
+    assert ranged == BIG[1:3]
+
+
+async def test_the_endpoint_serves_ranges_and_refuses_what_it_cannot():
+    server = _server()
+
+    async with _mounted(server) as http:
+        async with Client(f"{BASE_URL}/mcp", http_client=http) as client:
+            [item] = (await _wire_read(client, "blob://big")).contents
+            assert isinstance(item, BlobResourceContents)
+            ref = blob_ref(item)
+            assert ref is not None
+
+            whole = await http.get(ref["url"])
+            suffix = await http.get(ref["url"], headers={"Range": "bytes=-16"})
+            open_ended = await http.get(ref["url"], headers={"Range": "bytes=4090-"})
+            several = await http.get(ref["url"], headers={"Range": "bytes=0-1,5-6"})
+            past_end = await http.get(ref["url"], headers={"Range": "bytes=5000-"})
+            empty = await http.get(ref["url"], headers={"Range": "bytes=-"})
+            head = await http.head(ref["url"])
+            post = await http.post(ref["url"])
+            unknown = await http.get("/mcp/blobs/not-a-token")
+
+    assert (whole.status_code, whole.content, whole.headers["content-type"]) == (200, BIG, "image/png")
+    assert whole.headers["accept-ranges"] == "bytes" and whole.headers["cache-control"] == "no-store"
+    assert (suffix.status_code, suffix.content) == (206, BIG[-16:])
+    assert suffix.headers["content-range"] == f"bytes {len(BIG) - 16}-{len(BIG) - 1}/{len(BIG)}"
+    assert (open_ended.status_code, open_ended.content) == (206, BIG[4090:])
+    assert (several.status_code, several.content) == (200, BIG)
+    assert (past_end.status_code, past_end.headers["content-range"]) == (416, f"bytes */{len(BIG)}")
+    assert empty.status_code == 416
+    assert (head.status_code, head.headers["content-length"]) == (200, str(len(BIG)))
+    assert (post.status_code, post.headers["allow"]) == (405, "GET, HEAD")
+    assert (unknown.status_code, unknown.text) == (404, "Blob not found")
+
+
+async def test_a_reference_ends_with_its_ttl_and_its_session():
+    clock = _Clock()
+    server = _server(clock)
+
+    async with _mounted(server) as http:
+        async with Client(f"{BASE_URL}/mcp", http_client=http, mode="legacy") as client:
+            [first] = (await _wire_read(client, "blob://big")).contents
+            [second] = (await _wire_read(client, "blob://big")).contents
+            assert isinstance(first, BlobResourceContents) and isinstance(second, BlobResourceContents)
+            first_ref, second_ref = blob_ref(first), blob_ref(second)
+            assert first_ref is not None and second_ref is not None
+            clock.now += 60
+            expired = await http.get(first_ref["url"])
+            clock.now -= 30
+            live = await http.get(second_ref["url"])
+        after_session = await http.get(second_ref["url"])
+
+    assert expired.status_code == 404
+    assert live.status_code == 200
+    assert after_session.status_code == 404
+
+
+async def test_stateless_references_outlive_the_request_that_minted_them():
+    server = _server()
+
+    async with _mounted(server, stateless_http=True) as http:
+        async with Client(f"{BASE_URL}/mcp", http_client=http) as client:
+            assert await client.read_resource_bytes("blob://big", start=100, end=200) == BIG[100:200]
+
+
+async def test_the_oldest_references_make_room_for_new_ones():
+    server = _server(max_bytes=2 * len(BIG))
+
+    async with _mounted(server) as http:
+        async with Client(f"{BASE_URL}/mcp", http_client=http) as client:
+            refs: list[BlobRef | None] = []
+            for _ in range(3):
+                [item] = (await _wire_read(client, "blob://big")).contents
+                assert isinstance(item, BlobResourceContents)
+                refs.append(blob_ref(item))
+            statuses = [(await http.get(ref["url"])).status_code for ref in refs if ref is not None]
+
+    assert statuses == [404, 200, 200]
+    assert len(server._blob_store or ()) == 2  # pyright: ignore[reportPrivateUsage]
+
+
+_FUTURE = int(time.time()) + 3600
+TOKENS = {
+    name: AccessToken(token=name, client_id=name, scopes=["mcp:read"], expires_at=_FUTURE)
+    for name in ("tok-alice", "tok-bob")
+}
+
+
+async def test_only_the_principal_that_read_a_blob_can_fetch_it():
+    server = _server()
+    app = server._lowlevel_server.streamable_http_app(  # pyright: ignore[reportPrivateUsage]
+        stateless_http=True,
+        transport_security=NO_DNS_REBINDING_PROTECTION,
+        auth=auth_settings(required_scopes=["mcp:read"]),
+        token_verifier=StaticTokenVerifier(TOKENS),
+        blob_store=server._blob_store,  # pyright: ignore[reportPrivateUsage]
+    )
+
+    async with (
+        server.session_manager.run(),
+        httpx2.AsyncClient(
+            transport=StreamingASGITransport(app), base_url=BASE_URL, headers={"Authorization": "Bearer tok-alice"}
+        ) as http,
+    ):
+        async with Client(f"{BASE_URL}/mcp", http_client=http) as client:
+            [item] = (await _wire_read(client, "blob://big")).contents
+            assert isinstance(item, BlobResourceContents)
+            ref = blob_ref(item)
+            assert ref is not None
+            assert await client.read_resource_bytes("blob://big", end=8) == BIG[:8]
+
+        owner = await http.get(ref["url"])
+        other = await http.get(ref["url"], headers={"Authorization": "Bearer tok-bob"})
+        anonymous = await http.get(ref["url"], headers={"Authorization": ""})
+
+    assert owner.status_code == 200
+    assert other.status_code == 404
+    assert anonymous.status_code == 401
+
+
+async def test_the_endpoint_checks_dns_rebinding_like_the_mcp_endpoint():
+    server = _server()
+    app = server.streamable_http_app(host="127.0.0.1")
+
+    async with (
+        server.session_manager.run(),
+        httpx2.AsyncClient(transport=StreamingASGITransport(app), base_url=BASE_URL) as http,
+    ):
+        response = await http.get("/mcp/blobs/anything", headers={"Host": "evil.example"})
+        init = await http.post("/mcp", json=initialize_body(), headers={**base_headers(), "Host": "evil.example"})
+
+    assert response.status_code == init.status_code == 421
+
+
+def test_a_store_declines_until_its_endpoint_is_mounted():
+    store = BlobStore(BlobOffload(min_size=1))
+
+    assert store.offload(object(), b"data", "application/octet-stream") is None
+    assert len(store) == 0
+
+
+@pytest.mark.parametrize(
+    ("limits", "message"),
+    [
+        ({"min_size": 0}, "min_size must be >= 1"),
+        ({"ttl": 0}, "ttl must be > 0"),
+        ({"max_bytes": 0}, "max_bytes must be >= 1"),
+    ],
+)
+def test_limits_are_validated(limits: dict[str, float], message: str):
+    with pytest.raises(ValueError, match=message):
+        BlobOffload(**limits)  # pyright: ignore[reportArgumentType]
+
+
+def test_http_client_needs_a_url_server():
+    with pytest.raises(ValueError, match="http_client requires a URL server"):
+        Client(MCPServer("x"), http_client=httpx2.AsyncClient())
+
+
+def test_blob_refs_are_read_from_contents_meta():
+    ref = BlobRef(url="/mcp/blobs/t", size=3)
+    assert blob_ref(BlobResourceContents(uri="a://b", blob="", _meta={BLOB_OFFLOAD_META_KEY: ref})) == ref
+    assert blob_ref(BlobResourceContents(uri="a://b", blob="", _meta={BLOB_OFFLOAD_META_KEY: {"url": 1}})) is None
+    assert blob_ref(BlobResourceContents(uri="a://b", blob="")) is None
+
+
+async def test_a_server_that_answers_a_range_with_the_whole_blob_is_sliced():
+    def handler(request: httpx2.Request) -> httpx2.Response:
+        return httpx2.Response(200, content=b"0123456789")
+
+    fetcher = BlobFetcher(f"{BASE_URL}/mcp")
+    async with httpx2.AsyncClient(transport=httpx2.MockTransport(handler)) as http:
+        fetcher.http_client = http
+        assert await fetcher.fetch(BlobRef(url="/mcp/blobs/t", size=10), 2, 5) == b"234"
+
+
+@pytest.mark.parametrize(
+    "url",
+    ["http://169.254.169.254/latest/meta-data", "//evil.example/steal", "blobs/t", "/\tx", ""],
+    ids=["absolute", "network-path", "relative", "control-character", "empty"],
+)
+async def test_a_ref_off_the_endpoints_origin_is_refused_without_a_request(url: str):
+    requests: list[httpx2.Request] = []
+
+    def handler(request: httpx2.Request) -> httpx2.Response:  # pragma: no cover - the ref is refused first
+        requests.append(request)
+        return httpx2.Response(200, content=b"abc")
+
+    fetcher = BlobFetcher(f"{BASE_URL}/mcp")
+    async with httpx2.AsyncClient(transport=httpx2.MockTransport(handler)) as http:
+        fetcher.http_client = http
+        with pytest.raises(ValueError, match="is not a path on the MCP endpoint's server"):
+            await fetcher.fetch(BlobRef(url=url, size=3))
+    assert requests == []
+
+
+@pytest.mark.parametrize(
+    ("status", "body", "start", "end"),
+    [(200, b"0123456789" * 1000, 0, None), (200, b"01", 0, None), (206, b"0123", 2, 5), (200, b"0123", 2, 5)],
+    ids=["oversized", "short", "wrong-range", "whole-too-short"],
+)
+async def test_a_body_of_the_wrong_length_is_refused(status: int, body: bytes, start: int, end: int | None):
+    def handler(request: httpx2.Request) -> httpx2.Response:
+        return httpx2.Response(status, content=body)
+
+    fetcher = BlobFetcher(f"{BASE_URL}/mcp")
+    async with httpx2.AsyncClient(transport=httpx2.MockTransport(handler)) as http:
+        fetcher.http_client = http
+        with pytest.raises(ValueError, match="returned a body of the wrong length"):
+            await fetcher.fetch(BlobRef(url="/mcp/blobs/t", size=10), start, end)
+
+
+async def test_a_ranged_206_is_returned_as_sent():
+    def handler(request: httpx2.Request) -> httpx2.Response:
+        assert request.headers["range"] == "bytes=2-4"
+        return httpx2.Response(206, content=b"234")
+
+    fetcher = BlobFetcher(f"{BASE_URL}/mcp")
+    async with httpx2.AsyncClient(transport=httpx2.MockTransport(handler)) as http:
+        fetcher.http_client = http
+        assert await fetcher.fetch(BlobRef(url="/mcp/blobs/t", size=10), 2, 5) == b"234"
+
+
+async def test_only_offloaded_contents_are_fetched_back_inline():
+    def handler(request: httpx2.Request) -> httpx2.Response:
+        return httpx2.Response(200, content=b"raw")
+
+    text = TextResourceContents(uri="a://b", text="t")
+    ref = BlobRef(url="/mcp/blobs/t", size=3)
+    offloaded = BlobResourceContents(uri="a://b", blob="", _meta={BLOB_OFFLOAD_META_KEY: ref, "other": 1})
+    fetcher = BlobFetcher(f"{BASE_URL}/mcp")
+    async with httpx2.AsyncClient(transport=httpx2.MockTransport(handler)) as http:
+        fetcher.http_client = http
+        plain = ReadResourceResult(contents=[text])
+        assert await fetcher.inline(plain) is plain
+        mixed = await fetcher.inline(ReadResourceResult(contents=[text, offloaded]))
+
+    assert mixed is not None
+    assert mixed.contents == [text, BlobResourceContents(uri="a://b", blob="cmF3", _meta={"other": 1})]
@@ -11,6 +11,7 @@ from typing import Any
 
 import anyio
 import pytest
+from logfire.testing import CaptureLogfire
 from mcp_types import (
     INTERNAL_ERROR,
     INVALID_PARAMS,
@@ -269,6 +270,24 @@ async def test_validation_failure_sets_sanitized_status(server: SrvT, spans: Spa
     assert not span.events
 
 
+@pytest.mark.anyio
+async def test_operation_duration_records_the_wire_error_type(server: SrvT, capfire: CaptureLogfire):
+    """The duration metric's `error.type` matches the span's: the sanitized wire code, not the exception class."""
+    server.add_request_handler("tools/call", CallToolRequestParams, _ok_tool)
+    async with connected_runner(server) as (client, _):
+        with pytest.raises(MCPError):
+            await client.send_raw_request("tools/call", {"name": 123})
+        with pytest.raises(MCPError) as exc:
+            await client.send_raw_request("resources/list", None)
+    [metric] = [m for m in capfire.get_collected_metrics() if m["name"] == "mcp.server.operation.duration"]
+    error_types = {
+        point["attributes"]["mcp.method.name"]: point["attributes"].get("error.type")
+        for point in metric["data"]["data_points"]
+    }
+    assert error_types["tools/call"] == str(INVALID_PARAMS)
+    assert error_types["resources/list"] == str(exc.value.error.code)
+
+
 @pytest.mark.anyio
 async def test_records_error_status_on_handler_exception(server: SrvT, spans: SpanCapture):
     async def failing(ctx: Ctx, params: PaginatedRequestParams | None) -> Any:
@@ -1,6 +1,7 @@
 """Unit tests for `mcp.server.request_state`: codec, security policy, and default principal binding."""
 
 import base64
+import os
 import string
 from collections.abc import Callable
 from typing import Any, cast
@@ -16,6 +17,7 @@ from mcp.server.request_state import (
     AESGCMRequestStateCodec,
     InvalidRequestState,
     RequestStateSecurity,
+    ServerSideRequestStateCodec,
     authenticated_principal,
 )
 
@@ -329,6 +331,103 @@ def test_a_kid_transplanted_onto_another_tokens_body_is_rejected() -> None:
         AESGCMRequestStateCodec([_KEY_A, _KEY_B]).unseal(transplanted)
 
 
+def test_a_payload_at_or_above_the_threshold_is_compressed_under_the_v1z_prefix() -> None:
+    """SDK-defined: compressible payloads past `compress_threshold` seal smaller, under "v1z.", and round-trip."""
+    payload = b'{"outcomes":{}}' * 200
+    codec = AESGCMRequestStateCodec([_KEY_A], compress_threshold=1024)
+    token = codec.seal(payload)
+    assert token.startswith("v1z.")
+    assert len(_decode_body(token.replace("v1z.", _TOKEN_PREFIX, 1))) < len(payload)
+    assert codec.unseal(token) == payload
+
+
+def test_small_or_incompressible_payloads_and_the_default_codec_stay_uncompressed() -> None:
+    """SDK-defined: compression is opt-in, and applies only when it shrinks a payload past the threshold."""
+    codec = AESGCMRequestStateCodec([_KEY_A], compress_threshold=1024)
+    assert codec.seal(_PAYLOAD).startswith(_TOKEN_PREFIX)
+    assert codec.seal(os.urandom(4096)).startswith(_TOKEN_PREFIX)
+    assert AESGCMRequestStateCodec([_KEY_A]).seal(b"a" * 4096).startswith(_TOKEN_PREFIX)
+
+
+def test_a_compressed_token_reprefixed_as_uncompressed_is_rejected() -> None:
+    """Spec-mandated (basic/patterns/mrtr, server requirement 4): the compression prefix is tag-bound too."""
+    codec = AESGCMRequestStateCodec([_KEY_A], compress_threshold=1024)
+    token = codec.seal(b"a" * 4096)
+    with pytest.raises(InvalidRequestState):
+        codec.unseal(_TOKEN_PREFIX + token.removeprefix("v1z."))
+
+
+# -- ServerSideRequestStateCodec ----------------------------------------------
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_a_server_side_token_is_a_fixed_size_handle_that_unseals_to_the_stored_payload() -> None:
+    """SDK-defined: the token does not grow with the payload; unseal returns the payload the server kept."""
+    codec = ServerSideRequestStateCodec(AESGCMRequestStateCodec([_KEY_A]))
+    small, large = codec.seal(_PAYLOAD), codec.seal(bytes(range(256)) * 256)
+    assert len(small) == len(large)
+    assert codec.unseal(small) == _PAYLOAD
+    assert codec.unseal(large) == bytes(range(256)) * 256
+    assert codec.unseal(small) == _PAYLOAD
+
+
+def test_a_server_side_entry_expires_after_its_ttl() -> None:
+    """SDK-defined: entries are dropped `ttl` seconds after sealing and their handles fail as "evicted"."""
+    clock = _Clock()
+    codec = ServerSideRequestStateCodec(AESGCMRequestStateCodec([_KEY_A]), ttl=10.0, clock=clock)
+    token = codec.seal(_PAYLOAD)
+    clock.now = 9.0
+    assert codec.unseal(token) == _PAYLOAD
+    clock.now = 10.0
+    with pytest.raises(InvalidRequestState) as exc:
+        codec.unseal(token)
+    assert str(exc.value) == "evicted"
+    assert len(codec) == 0
+
+
+def test_the_server_side_store_evicts_the_oldest_entries_past_its_entry_and_byte_bounds() -> None:
+    """SDK-defined: the store is bounded by count and bytes, evicting oldest first."""
+    by_count = ServerSideRequestStateCodec(_StaticCodec(), max_entries=2)
+    first, second, third = by_count.seal(b"1"), by_count.seal(b"2"), by_count.seal(b"3")
+    assert len(by_count) == 2
+    with pytest.raises(InvalidRequestState):
+        by_count.unseal(first)
+    assert [by_count.unseal(second), by_count.unseal(third)] == [b"2", b"3"]
+
+    by_bytes = ServerSideRequestStateCodec(_StaticCodec(), max_bytes=10)
+    older, newer = by_bytes.seal(b"x" * 6), by_bytes.seal(b"y" * 6)
+    with pytest.raises(InvalidRequestState):
+        by_bytes.unseal(older)
+    assert by_bytes.unseal(newer) == b"y" * 6
+
+
+def test_a_server_side_handle_is_verified_by_the_wrapped_codec() -> None:
+    """Spec-mandated (basic/patterns/mrtr, server requirement 4): forged or foreign handles never reach the store."""
+    codec = ServerSideRequestStateCodec(AESGCMRequestStateCodec([_KEY_A]))
+    token = codec.seal(_PAYLOAD)
+    with pytest.raises(InvalidRequestState):
+        codec.unseal(_flip_ciphertext_byte(token))
+    with pytest.raises(InvalidRequestState) as exc:
+        codec.unseal(AESGCMRequestStateCodec([_KEY_A]).seal(_PAYLOAD))
+    assert str(exc.value) == "malformed"
+
+
+def test_server_side_store_bounds_are_validated_at_construction() -> None:
+    """SDK-defined: a non-positive ttl or bound is a configuration error."""
+    with pytest.raises(ValueError, match="positive finite"):
+        ServerSideRequestStateCodec(_StaticCodec(), ttl=0.0)
+    with pytest.raises(ValueError) as exc:
+        ServerSideRequestStateCodec(_StaticCodec(), max_entries=0)
+    assert str(exc.value) == snapshot("ServerSideRequestStateCodec requires positive max_entries and max_bytes")
+
+
 # -- RequestStateSecurity -----------------------------------------------------
 
 
@@ -378,6 +477,15 @@ def test_a_custom_codec_is_stored_on_the_policy_as_is() -> None:
     assert codec.unseal(codec.seal(_PAYLOAD)) == _PAYLOAD
 
 
+def test_server_side_wraps_the_policy_codec_in_a_store_bound_to_the_policy_ttl() -> None:
+    """SDK-defined: server_side=True keeps state in a server-side store sealed by the configured codec."""
+    security = RequestStateSecurity(keys=[_KEY_A], ttl=30.0, server_side=True)
+    assert isinstance(security.codec, ServerSideRequestStateCodec)
+    token = security.codec.seal(_PAYLOAD)
+    assert security.codec.unseal(token) == _PAYLOAD
+    assert _PAYLOAD not in AESGCMRequestStateCodec([_KEY_A]).unseal(token)
+
+
 def test_ephemeral_policies_are_protected_and_mutually_unintelligible() -> None:
     """SDK-defined: ephemeral() protects under a process-local key, so a sibling instance rejects its tokens."""
     first = RequestStateSecurity.ephemeral()
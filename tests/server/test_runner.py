@@ -76,6 +76,7 @@ from mcp.server.runner import (
 from mcp.server.session import ServerSession
 from mcp.server.subscriptions import SUBSCRIPTION_ID_META_KEY, InMemorySubscriptionBus, ListenHandler
 from mcp.shared._context_streams import create_context_streams
+from mcp.shared.direct_dispatcher import ObjectResult, create_direct_dispatcher_pair
 from mcp.shared.dispatcher import CallOptions
 from mcp.shared.exceptions import MCPError, NoBackChannelError
 from mcp.shared.jsonrpc_dispatcher import JSONRPCDispatcher
@@ -2109,3 +2110,26 @@ async def test_dual_era_client_propagates_body_exception_unwrapped(server: SrvT)
     with pytest.raises(RuntimeError, match="boom"):
         async with dual_era_client(server):
             raise RuntimeError("boom")
+
+
+@pytest.mark.anyio
+async def test_runner_hands_a_pass_objects_peer_the_result_model(server: SrvT):
+    """Over a `pass_objects` direct pair the result model crosses as an
+    `ObjectResult`; a handshake-era connection gets no `serverInfo` stamp, as
+    on the wire, and `send_raw_request` gets the wire dict."""
+    client, server_d = create_direct_dispatcher_pair(pass_objects=True)
+    runner = ServerRunner(
+        server=server, connection=Connection.from_envelope(LATEST_HANDSHAKE_VERSION, None, None), lifespan_state={}
+    )
+    c_req, c_notify = echo_handlers(Recorder())
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            await tg.start(client.run, c_req, c_notify)
+            await tg.start(server_d.run, runner.on_object_request, runner.on_notify)
+            handed = await client.send_request_object("tools/list", None)
+            wire = await client.send_raw_request("tools/list", None)
+            assert isinstance(handed, ObjectResult)
+            assert handed.model == ListToolsResult(tools=[Tool(name="t", input_schema={"type": "object"})])
+            assert wire == handed.to_wire()
+            client.close()
+            server_d.close()
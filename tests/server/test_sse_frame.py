@@ -0,0 +1,48 @@
+"""SSE framing shared by the streamable-HTTP transports (`mcp.server._sse_frame`)."""
+
+import anyio
+import mcp_types as types
+import pytest
+from sse_starlette import ServerSentEvent
+
+from mcp.server._sse_frame import frame
+from mcp.server.streamable_http import EventMessage, StreamableHTTPServerTransport
+
+pytestmark = pytest.mark.anyio
+
+
+def test_frames_match_sse_starlette_byte_for_byte():
+    assert frame(b'{"a":1}') == ServerSentEvent(data='{"a":1}', event="message").encode()
+    assert frame(b"{}", event_id="7") == ServerSentEvent(data="{}", id="7", event="message").encode()
+    # The priming event: no event name, empty data, a retry hint; line breaks are stripped from the id.
+    priming = frame(b"", event_id="s1:\r\n9", event=None, retry=500)
+    assert (
+        priming
+        == ServerSentEvent(data="", id="s1:\r\n9", retry=500).encode()
+        == b"id: s1:9\r\ndata: \r\nretry: 500\r\n\r\n"
+    )
+
+
+async def test_queued_events_are_coalesced_into_one_chunk_up_to_the_response():
+    transport = StreamableHTTPServerTransport(mcp_session_id=None)
+    send, receive = anyio.create_memory_object_stream[EventMessage](8)
+    note = types.JSONRPCNotification(jsonrpc="2.0", method="notifications/progress")
+    answer = types.JSONRPCResponse(jsonrpc="2.0", id=1, result={})
+    for message in (note, note, answer, note):
+        send.send_nowait(EventMessage(message))
+
+    async with send, receive:
+        first = await receive.receive()
+        chunk, answered = transport._coalesce_events(first, receive)  # pyright: ignore[reportPrivateUsage]
+        assert answered
+        assert chunk.count(b"event: message\r\n") == 3
+        assert chunk.endswith(b'data: {"jsonrpc":"2.0","id":1,"result":{}}\r\n\r\n')
+        # The event after the response stays queued.
+        assert receive.statistics().current_buffer_used == 1
+
+        leftover = await receive.receive()
+        chunk, answered = transport._coalesce_events(leftover, receive)  # pyright: ignore[reportPrivateUsage]
+        assert (chunk, answered) == (
+            b'event: message\r\ndata: {"jsonrpc":"2.0","method":"notifications/progress"}\r\n\r\n',
+            False,
+        )
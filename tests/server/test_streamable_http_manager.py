@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, patch
 import anyio
 import httpx2
 import pytest
+from logfire.testing import CaptureLogfire
 from mcp_types import INVALID_REQUEST, ListToolsResult, PaginatedRequestParams
 from starlette.types import Message, Scope
 
@@ -669,3 +670,169 @@ async def test_anonymous_session_accepts_anonymous_requests(
     session_id = await _open_session(manager, None)
 
     assert await _request_session(manager, session_id, None) != 404
+
+
+async def _new_session_status(manager: StreamableHTTPSessionManager, user: AuthenticatedUser | None) -> int:
+    """Ask for a new session as `user` and return the response status."""
+    sent_messages: list[Message] = []
+
+    async def mock_send(message: Message) -> None:
+        sent_messages.append(message)
+
+    async def mock_receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    await manager.handle_request(_request_scope(user=user), mock_receive, mock_send)
+    return next(msg for msg in sent_messages if msg["type"] == "http.response.start")["status"]
+
+
+async def _hold_stream(manager: StreamableHTTPSessionManager, session_id: str, user: AuthenticatedUser | None) -> None:
+    """Keep a standalone GET stream open on the session until cancelled."""
+
+    received: list[Message] = []
+
+    async def mock_send(message: Message) -> None:
+        pass
+
+    async def mock_receive() -> Message:
+        # The (empty) body once, then no disconnect until cancelled.
+        if received:
+            await anyio.sleep_forever()
+        received.append({"type": "http.request", "body": b"", "more_body": False})
+        return received[0]
+
+    await manager.handle_request(
+        _request_scope(session_id=session_id, user=user, method="GET"), mock_receive, mock_send
+    )
+
+
+@pytest.mark.anyio
+async def test_a_new_session_past_the_cap_evicts_the_least_recently_used_idle_one(capfire: CaptureLogfire) -> None:
+    manager = StreamableHTTPSessionManager(app=Server("test"), max_sessions=2)
+    async with manager.run():
+        first = await _open_session(manager, None)
+        second = await _open_session(manager, None)
+        await _request_session(manager, first, None)  # `second` is now the least recently used
+        third = await _open_session(manager, None)
+
+        assert [info.session_id for info in manager.sessions()] == [first, third]
+        assert await _request_session(manager, second, None) == 404
+
+    evictions = [
+        (point["attributes"], point["value"])
+        for metric in capfire.get_collected_metrics()
+        if metric["name"] == "mcp.server.sessions.evicted"
+        for point in metric["data"]["data_points"]
+    ]
+    assert evictions == [({"mcp.session.eviction.reason": "capacity"}, 1)]
+
+
+@pytest.mark.anyio
+async def test_a_new_session_is_refused_when_every_held_session_is_busy() -> None:
+    manager = StreamableHTTPSessionManager(app=Server("test"), max_sessions=1)
+    async with manager.run(), anyio.create_task_group() as tg:
+        busy = await _open_session(manager, None)
+        tg.start_soon(_hold_stream, manager, busy, None)
+        await anyio.wait_all_tasks_blocked()
+
+        assert await _new_session_status(manager, None) == 503
+        [info] = manager.sessions()
+        assert (info.session_id, info.active_requests, info.idle) == (busy, 1, 0.0)
+        tg.cancel_scope.cancel()
+
+
+@pytest.mark.anyio
+async def test_a_principal_past_its_quota_gives_up_its_own_idle_session_first() -> None:
+    manager = StreamableHTTPSessionManager(app=Server("test"), max_sessions_per_principal=1)
+    alice, bob = _user("client-a", subject="alice"), _user("client-a", subject="bob")
+    async with manager.run(), anyio.create_task_group() as tg:
+        bobs = await _open_session(manager, bob)
+        stale = await _open_session(manager, alice)
+        current = await _open_session(manager, alice)
+        assert await _request_session(manager, stale, alice) == 404
+        assert [info.session_id for info in manager.sessions()] == [bobs, current]
+        assert {info.client_id for info in manager.sessions()} == {"client-a"}
+
+        # Anonymous sessions are bounded only by `max_sessions`.
+        await _open_session(manager, None)
+        await _open_session(manager, None)
+
+        tg.start_soon(_hold_stream, manager, current, alice)
+        await anyio.wait_all_tasks_blocked()
+        assert await _new_session_status(manager, alice) == 429
+        tg.cancel_scope.cancel()
+
+
+@pytest.mark.anyio
+async def test_the_reaper_terminates_idle_sessions_and_spares_busy_ones() -> None:
+    manager = StreamableHTTPSessionManager(app=Server("test"), session_idle_timeout=0.05, session_reap_interval=0.01)
+    async with manager.run(), anyio.create_task_group() as tg:
+        idle = await _open_session(manager, None)
+        busy = await _open_session(manager, None)
+        tg.start_soon(_hold_stream, manager, busy, None)
+
+        with anyio.fail_after(5):
+            while idle in {info.session_id for info in manager.sessions()}:
+                await anyio.sleep(0.01)
+        # Past the timeout too, but its open stream keeps it alive.
+        assert [info.session_id for info in manager.sessions()] == [busy]
+        assert await _request_session(manager, idle, None) == 404
+        tg.cancel_scope.cancel()
+
+
+@pytest.mark.anyio
+async def test_the_reaper_drops_sessions_the_client_deleted() -> None:
+    manager = StreamableHTTPSessionManager(app=Server("test"), session_reap_interval=0.01)
+    async with manager.run():
+        session_id = await _open_session(manager, None)
+        await _request_session(manager, session_id, None, method="DELETE")
+
+        with anyio.fail_after(5):
+            while manager.sessions():
+                await anyio.sleep(0.01)
+
+
+@pytest.mark.anyio
+async def test_the_reaper_skips_a_session_forgotten_while_it_evicts_another() -> None:
+    manager = StreamableHTTPSessionManager(app=Server("test"), session_idle_timeout=0.05, session_reap_interval=0.01)
+    async with manager.run():
+        evicted = await _open_session(manager, None)
+        ended = await _open_session(manager, None)
+        transport = manager._server_instances[evicted]
+        terminate = transport.terminate
+
+        async def terminate_while_another_session_ends() -> None:
+            manager._forget_session(ended)
+            await terminate()
+
+        transport.terminate = terminate_while_another_session_ends
+
+        with anyio.fail_after(5):
+            while manager.sessions():
+                await anyio.sleep(0.01)
+        assert transport.is_terminated
+
+
+@pytest.mark.anyio
+async def test_a_session_whose_transport_is_already_gone_is_neither_listed_nor_evicted() -> None:
+    manager = StreamableHTTPSessionManager(app=Server("test"))
+    async with manager.run():
+        gone = await _open_session(manager, None)
+        kept = await _open_session(manager, None)
+        transport = manager._server_instances.pop(gone)
+
+        assert [info.session_id for info in manager.sessions()] == [kept]
+        await manager._evict(gone, "capacity")
+        assert not transport.is_terminated
+
+
+def test_session_limits_are_validated() -> None:
+    app = Server("test")
+    with pytest.raises(ValueError, match="max_sessions must be >= 1, got 0"):
+        StreamableHTTPSessionManager(app=app, max_sessions=0)
+    with pytest.raises(ValueError, match="max_sessions_per_principal must be >= 1, got 0"):
+        StreamableHTTPSessionManager(app=app, max_sessions_per_principal=0)
+    with pytest.raises(ValueError, match="positive number"):
+        StreamableHTTPSessionManager(app=app, session_reap_interval=0)
+    with pytest.raises(RuntimeError, match="not supported in stateless"):
+        StreamableHTTPSessionManager(app=app, max_sessions=10, stateless=True)
@@ -37,6 +37,7 @@ from mcp_types import (
     LoggingMessageNotificationParams,
     NotificationParams,
     PaginatedRequestParams,
+    TextContent,
     Tool,
 )
 from mcp_types.version import LATEST_MODERN_VERSION, MODERN_PROTOCOL_VERSIONS
@@ -813,6 +814,23 @@ def _x_mcp_server(tools: list[Tool] | None = None) -> Server[Any]:
     return Server("test", on_list_tools=list_tools, on_call_tool=_ok_call_tool)
 
 
+async def test_modern_tools_call_accepts_an_escaped_lone_surrogate_in_the_body() -> None:
+    """Regression: JSON stdlib `json.dumps` produces for a lone surrogate, `"\\ud800"`, parses as it did before
+    the wire codec moved to pydantic-core, rather than being rejected as a parse error."""
+
+    async def echo(ctx: ServerRequestContext, params: CallToolRequestParams) -> CallToolResult:
+        return CallToolResult(content=[TextContent(type="text", text=ascii((params.arguments or {})["q"]))])
+
+    async with _asgi_client(Server("test", on_call_tool=echo)) as http:
+        response = await http.post(
+            "/mcp",
+            content=json.dumps(_tool_call_body({"q": "\ud800"})),
+            headers={MCP_METHOD_HEADER: "tools/call", MCP_NAME_HEADER: "search"},
+        )
+    assert response.status_code == 200
+    assert response.json()["result"]["content"] == [{"type": "text", "text": "'\\ud800'"}]
+
+
 async def test_modern_tools_call_accepts_matching_mcp_param_header() -> None:
     """A `Mcp-Param-*` header that agrees with the body argument after sentinel decoding dispatches normally."""
     async with _asgi_client(_x_mcp_server()) as http:
@@ -0,0 +1,219 @@
+"""Batched, windowed replay of stored events to a resuming streamable-HTTP client."""
+
+from collections.abc import AsyncGenerator, Sequence
+from typing import cast
+
+import anyio
+import pytest
+from logfire.testing import CaptureLogfire
+from mcp_types import JSONRPCMessage, JSONRPCNotification
+from starlette.types import Message, Scope
+
+from mcp.server import Server, streamable_http
+from mcp.server.streamable_http import (
+    EventCallback,
+    EventId,
+    EventMessage,
+    EventReplay,
+    EventStore,
+    StreamableHTTPServerTransport,
+    StreamId,
+)
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.server.transport_security import TransportSecuritySettings
+from mcp.shared._context_streams import create_context_streams
+from mcp.shared.message import SessionMessage
+
+pytestmark = pytest.mark.anyio
+
+
+def _event(n: int) -> EventMessage:
+    return EventMessage(JSONRPCNotification(jsonrpc="2.0", method="notifications/progress", params={"n": n}), str(n))
+
+
+class _CallbackStore(EventStore):
+    """Implements only the callback API, so replay goes through the default batching."""
+
+    def __init__(self, count: int, *, fail_after: int | None = None) -> None:
+        self.count = count
+        self.fail_after = fail_after
+        self.sent = 0
+
+    async def store_event(self, stream_id: StreamId, message: JSONRPCMessage | None) -> EventId:
+        raise NotImplementedError
+
+    async def replay_events_after(self, last_event_id: EventId, send_callback: EventCallback) -> StreamId | None:
+        if last_event_id != "0":
+            return None
+        for n in range(1, self.count + 1):
+            if n == self.fail_after:
+                raise RuntimeError("storage went away")
+            await send_callback(_event(n))
+            self.sent += 1
+        return "stream"
+
+
+class _Pages:
+    """Events paged out of storage three at a time, counting the pages read."""
+
+    def __init__(self, count: int) -> None:
+        self._next = 1
+        self._count = count
+        self.read = 0
+
+    def __aiter__(self) -> "_Pages":
+        return self
+
+    async def __anext__(self) -> Sequence[EventMessage]:
+        if self._next > self._count:
+            raise StopAsyncIteration
+        self.read += 1
+        page = [_event(n) for n in range(self._next, min(self._next + 3, self._count + 1))]
+        self._next += 3
+        return page
+
+
+class _PagingStore(_CallbackStore):
+    """Replays through a lazy page iterator instead of the default batching."""
+
+    def __init__(self, count: int) -> None:
+        super().__init__(count)
+        self.pages = _Pages(count)
+
+    async def replay_batches_after(self, last_event_id: EventId, *, limit: int | None = None) -> EventReplay | None:
+        self.limit = limit
+        if last_event_id != "0":
+            return None
+        return EventReplay("stream", self.pages)
+
+
+async def _replay(
+    transport: StreamableHTTPServerTransport, store: EventStore
+) -> tuple[list[bytes], StreamId | None, bool]:
+    send, receive = anyio.create_memory_object_stream[bytes](16)
+    async with send, receive:
+        stream_id, complete = await transport._send_replay(store, "0", send)  # pyright: ignore[reportPrivateUsage]
+        send.close()
+        return [chunk async for chunk in receive], stream_id, complete
+
+
+async def test_a_callback_only_store_is_replayed_in_batches(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(streamable_http, "REPLAY_BATCH_SIZE", 2)
+    chunks, stream_id, complete = await _replay(StreamableHTTPServerTransport(None), _CallbackStore(5))
+    assert (stream_id, complete) == ("stream", True)
+    assert [chunk.count(b"event: message") for chunk in chunks] == [2, 2, 1]
+    assert chunks[0].startswith(b'id: 1\r\nevent: message\r\ndata: {"jsonrpc":"2.0","method":"notifications/progress"')
+
+
+async def test_the_default_hands_over_each_batch_while_the_store_is_still_replaying(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(streamable_http, "REPLAY_BATCH_SIZE", 2)
+    store = _CallbackStore(100)
+    replay = await store.replay_batches_after("0")
+    assert replay is not None
+    batches = cast(AsyncGenerator[Sequence[EventMessage], None], replay.batches)
+    first = await anext(batches)
+    assert [event.event_id for event in first] == ["1", "2"]
+    assert store.sent < 5
+    await batches.aclose()
+    assert replay.stream_id is None
+
+
+async def test_the_default_stops_the_store_once_the_window_is_full():
+    store = _CallbackStore(1_000)
+    chunks, _, complete = await _replay(StreamableHTTPServerTransport(None, max_replay_events=5), store)
+    assert complete is False
+    assert [chunk.count(b"event: message") for chunk in chunks] == [5]
+    assert store.sent <= 7
+
+
+async def test_a_failing_store_fails_the_replay_after_the_events_it_produced():
+    store = _CallbackStore(10, fail_after=4)
+    replay = await store.replay_batches_after("0")
+    assert replay is not None
+    received: list[EventMessage] = []
+    with pytest.raises(RuntimeError, match="storage went away"):
+        async for batch in replay.batches:
+            received.extend(batch)
+    assert [event.event_id for event in received] == ["1", "2", "3"]
+
+
+@pytest.mark.parametrize("store", [_CallbackStore(3), _PagingStore(3)], ids=["callback", "paging"])
+async def test_an_unknown_event_id_replays_nothing(store: EventStore):
+    transport = StreamableHTTPServerTransport(None)
+    send, receive = anyio.create_memory_object_stream[bytes](1)
+    async with send, receive:
+        result = await transport._send_replay(store, "missing", send)  # pyright: ignore[reportPrivateUsage]
+    assert result == (None, True)
+
+
+async def test_the_window_cuts_the_replay_short_and_stops_reading_the_store():
+    store = _PagingStore(10)
+    chunks, stream_id, complete = await _replay(StreamableHTTPServerTransport(None, max_replay_events=5), store)
+    assert (stream_id, complete) == ("stream", False)
+    assert [chunk.count(b"event: message") for chunk in chunks] == [3, 2]
+    assert b"id: 5\r\n" in chunks[-1] and b"id: 6\r\n" not in chunks[-1]
+    assert store.pages.read == 2
+    assert store.limit == 6
+
+
+@pytest.mark.parametrize(("backlog", "complete"), [(6, True), (7, False)])
+async def test_a_full_window_is_complete_only_when_nothing_follows(backlog: int, complete: bool):
+    transport = StreamableHTTPServerTransport(None, max_replay_events=6)
+    chunks, _, replayed_all = await _replay(transport, _PagingStore(backlog))
+    assert replayed_all is complete
+    assert [chunk.count(b"event: message") for chunk in chunks] == [3, 3]
+
+
+async def test_a_truncated_replay_ends_the_response_instead_of_tailing_live_messages():
+    transport = StreamableHTTPServerTransport(
+        mcp_session_id="session",
+        event_store=_PagingStore(10),
+        security_settings=TransportSecuritySettings(enable_dns_rebinding_protection=False),
+        max_replay_events=4,
+    )
+    read_stream_writer, read_stream = create_context_streams[SessionMessage | Exception](0)
+    transport._read_stream_writer = read_stream_writer  # pyright: ignore[reportPrivateUsage]
+    scope: Scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/mcp",
+        "query_string": b"",
+        "headers": [(b"accept", b"text/event-stream"), (b"mcp-session-id", b"session"), (b"last-event-id", b"0")],
+    }
+    sent: list[Message] = []
+
+    async def asgi_send(message: Message) -> None:
+        sent.append(message)
+
+    async def asgi_receive() -> Message:
+        await anyio.sleep_forever()
+        raise NotImplementedError
+
+    async with read_stream_writer, read_stream:
+        with anyio.fail_after(5):
+            await transport.handle_request(scope, asgi_receive, asgi_send)
+
+    body = b"".join(message.get("body", b"") for message in sent if message["type"] == "http.response.body")
+    assert body.count(b"event: message") == 4
+    assert sent[-1] == {"type": "http.response.body", "body": b"", "more_body": False}
+    assert "stream" not in transport._request_streams  # pyright: ignore[reportPrivateUsage]
+
+
+async def test_replay_size_and_duration_are_recorded(capfire: CaptureLogfire):
+    await _replay(StreamableHTTPServerTransport(None, max_replay_events=2), _PagingStore(4))
+    await _replay(StreamableHTTPServerTransport(None), _CallbackStore(3))
+
+    metrics = {metric["name"]: metric["data"]["data_points"] for metric in capfire.get_collected_metrics()}
+    events = {
+        point["attributes"]["mcp.replay.truncated"]: point["sum"] for point in metrics["mcp.server.replay.events"]
+    }
+    assert events == {"true": 2, "false": 3}
+    assert sum(point["count"] for point in metrics["mcp.server.replay.duration"]) == 2
+
+
+def test_a_window_below_one_event_is_rejected():
+    with pytest.raises(ValueError) as transport_exc:
+        StreamableHTTPServerTransport(None, max_replay_events=0)
+    with pytest.raises(ValueError) as manager_exc:
+        StreamableHTTPSessionManager(app=Server("test"), max_replay_events=0)
+    assert str(transport_exc.value) == str(manager_exc.value) == "max_replay_events must be >= 1, got 0"
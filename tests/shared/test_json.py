@@ -0,0 +1,71 @@
+"""The SDK's JSON codec (`mcp.shared._json`)."""
+
+import json
+from datetime import date
+
+import mcp_types as types
+import pytest
+from pydantic import ValidationError
+
+from mcp.shared._json import (
+    canonical_dumps,
+    canonical_loads,
+    decode_message,
+    dump_bytes,
+    dumps,
+    encode_message,
+    loads,
+)
+
+
+def test_wire_json_is_compact_utf8():
+    assert dump_bytes({"a": [1, "é"]}) == '{"a":[1,"é"]}'.encode()
+    assert dumps({"a": 1}, indent=2) == '{\n  "a": 1\n}'
+    assert loads(b'{"a": [1, 2.5, null]}') == {"a": [1, 2.5, None]}
+
+
+def test_fallback_converts_what_pydantic_cannot_serialize():
+    class Opaque:
+        def __str__(self) -> str:
+            return "opaque"
+
+    assert dumps({"when": date(2026, 1, 2), "what": Opaque()}, fallback=str) == '{"when":"2026-01-02","what":"opaque"}'
+
+
+@pytest.mark.parametrize("text", ["{", "[" * 10_000 + "]" * 10_000], ids=["truncated", "deep"])
+def test_unparseable_wire_json_raises_value_error(text: str):
+    with pytest.raises(ValueError):
+        loads(text)
+
+
+def test_escaped_lone_surrogates_parse_as_they_did_on_stdlib():
+    assert loads(b'{"q": "\\ud800-x"}') == {"q": "\ud800-x"}
+    request = types.JSONRPCRequest(jsonrpc="2.0", id=1, method="tools/call", params={"q": "\udfff"})
+    assert decode_message(json.dumps(request.model_dump(exclude_none=True))) == request
+
+
+def test_encode_message_serialises_compact_utf8_json_once():
+    message = types.JSONRPCNotification(jsonrpc="2.0", method="notifications/message", params={"data": "héllo"})
+    assert (
+        encode_message(message)
+        == '{"jsonrpc":"2.0","method":"notifications/message","params":{"data":"héllo"}}'.encode()
+    )
+    error = types.JSONRPCError(jsonrpc="2.0", id=1, error=types.ErrorData(code=-1, message="x", data=None))
+    assert encode_message(error, exclude_none=True) == b'{"jsonrpc":"2.0","id":1,"error":{"code":-1,"message":"x"}}'
+
+
+def test_decode_message_round_trips_encode_message():
+    request = types.JSONRPCRequest(jsonrpc="2.0", id=7, method="tools/list", params={"cursor": "c"})
+    assert decode_message(encode_message(request)) == request
+    with pytest.raises(ValidationError):
+        decode_message(b'{"jsonrpc": "2.0"')
+    with pytest.raises(ValidationError):
+        decode_message(b'{"jsonrpc": "2.0", "id": 1}')
+
+
+def test_canonical_json_is_ascii_and_stable():
+    value = {"b": "é\ud800", "a": [1, None]}
+    assert canonical_dumps(value) == '{"b":"\\u00e9\\ud800","a":[1,null]}'
+    assert canonical_dumps(value, sort_keys=True).startswith('{"a":')
+    assert canonical_dumps(["arm", None], compact=False) == json.dumps(["arm", None]) == '["arm", null]'
+    assert canonical_loads(canonical_dumps(value)) == value
@@ -0,0 +1,165 @@
+"""Tests for the OpenTelemetry metrics instruments in `mcp.shared._metrics`."""
+
+from __future__ import annotations
+
+import gc
+from typing import Any
+
+import anyio
+import httpx2
+import mcp_types as types
+import pytest
+from logfire.testing import CaptureLogfire
+
+from mcp.client.caching import CacheConfig
+from mcp.client.client import Client
+from mcp.server.mcpserver import MCPServer
+from mcp.server.streamable_http import StreamableHTTPServerTransport
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.server.subscriptions import InMemorySubscriptionBus, ListenHandler
+from mcp.shared import _metrics
+from mcp.shared.exceptions import MCPError
+
+pytestmark = pytest.mark.anyio
+
+
+def _collect(capfire: CaptureLogfire) -> dict[str, list[tuple[dict[str, Any], Any]]]:
+    """Every `mcp.*` instrument's data points as `(attributes, value or count)`, by instrument name."""
+    return {
+        metric["name"]: [
+            (point["attributes"], point.get("value", point.get("count"))) for point in metric["data"]["data_points"]
+        ]
+        for metric in capfire.get_collected_metrics()
+        if metric["name"].startswith("mcp.")
+    }
+
+
+def _greeter() -> MCPServer:
+    server = MCPServer("test")
+
+    @server.tool()
+    def greet(name: str) -> str:
+        """Greet someone."""
+        return f"Hello, {name}!"
+
+    return server
+
+
+async def test_request_durations_carry_method_tool_and_error_type(capfire: CaptureLogfire):
+    async with Client(_greeter(), mode="legacy") as client:
+        await client.call_tool("greet", {"name": "World"})
+        await client.call_tool("missing", {})
+
+    metrics = _collect(capfire)
+    client_points = [attributes for attributes, _ in metrics["mcp.client.operation.duration"]]
+    assert {"mcp.method.name": "tools/call", "gen_ai.tool.name": "greet"} in client_points
+    server_points = [attributes for attributes, _ in metrics["mcp.server.operation.duration"]]
+    assert {"mcp.method.name": "tools/call", "gen_ai.tool.name": "greet"} in server_points
+    assert {"mcp.method.name": "tools/call", "gen_ai.tool.name": "missing", "error.type": "tool_error"} in server_points
+
+
+async def test_client_duration_records_the_peer_error_code(capfire: CaptureLogfire):
+    async with Client(_greeter(), mode="legacy") as client:
+        with pytest.raises(MCPError) as exc:
+            await client.get_prompt("missing")
+
+    points = [attributes for attributes, _ in _collect(capfire)["mcp.client.operation.duration"]]
+    [failed] = [attributes for attributes in points if attributes["mcp.method.name"] == "prompts/get"]
+    assert failed == {
+        "mcp.method.name": "prompts/get",
+        "gen_ai.prompt.name": "missing",
+        "error.type": str(exc.value.error.code),
+    }
+
+
+async def test_dispatcher_gauges_count_requests_in_flight(capfire: CaptureLogfire):
+    server = MCPServer("test")
+    started = anyio.Event()
+    release = anyio.Event()
+
+    @server.tool()
+    async def wait() -> str:
+        """Block until released."""
+        started.set()
+        await release.wait()
+        return "done"
+
+    async with Client(server, mode="legacy") as client, anyio.create_task_group() as tg:
+        tg.start_soon(client.call_tool, "wait")
+        await started.wait()
+        metrics = _collect(capfire)
+        assert metrics["mcp.dispatcher.requests.active"] == [({}, 1)]
+        assert metrics["mcp.dispatcher.requests.pending"] == [({}, 1)]
+        release.set()
+
+
+async def test_server_gauges_observe_live_sessions_streams_and_backlogs(capfire: CaptureLogfire):
+    server = MCPServer("test")
+    manager = StreamableHTTPSessionManager(app=server._lowlevel_server)
+    transport = StreamableHTTPServerTransport(mcp_session_id="session")
+    manager._server_instances["session"] = transport
+    send, receive = anyio.create_memory_object_stream[Any](4)
+    transport._request_streams[1] = (send, receive)
+    send.send_nowait(object())
+    send.send_nowait(object())
+    handler = ListenHandler(InMemorySubscriptionBus())
+    listen_send, listen_receive = anyio.create_memory_object_stream[Any](4)
+    handler._streams.add(listen_send)
+    listen_send.send_nowait(object())
+
+    metrics = _collect(capfire)
+    assert metrics["mcp.server.sessions.active"] == [({}, 1)]
+    assert metrics["mcp.server.sse.backlog"] == [({}, 2)]
+    assert metrics["mcp.server.listen.streams.active"] == [({}, 1)]
+    assert metrics["mcp.server.listen.backlog"] == [({}, 1)]
+
+    for stream in (send, receive, listen_send, listen_receive):
+        stream.close()
+    del manager, transport, handler
+    gc.collect()
+    # Collected owners stop counting rather than pinning their last value.
+    assert _collect(capfire)["mcp.server.sessions.active"] == [({}, 0)]
+
+
+async def test_streamable_http_counts_payload_bytes_each_way(capfire: CaptureLogfire):
+    server = _greeter()
+    app = server.streamable_http_app(json_response=True, stateless_http=True)
+    request = types.JSONRPCRequest(
+        jsonrpc="2.0",
+        id=1,
+        method="initialize",
+        params={
+            "protocolVersion": "2025-11-25",
+            "capabilities": {},
+            "clientInfo": {"name": "probe", "version": "1"},
+        },
+    ).model_dump_json(by_alias=True, exclude_unset=True)
+    async with server.session_manager.run():
+        transport = httpx2.ASGITransport(app=app)
+        async with httpx2.AsyncClient(transport=transport, base_url="http://127.0.0.1:8000") as http:
+            response = await http.post(
+                "/mcp",
+                content=request,
+                headers={"Content-Type": "application/json", "Accept": "application/json, text/event-stream"},
+            )
+    assert response.status_code == 200
+
+    io = {attributes["network.io.direction"]: value for attributes, value in _collect(capfire)["mcp.server.http.io"]}
+    assert io == {"receive": len(request.encode()), "transmit": len(response.content)}
+
+
+async def test_client_cache_counts_lookups_by_outcome(capfire: CaptureLogfire):
+    async with Client(_greeter(), mode="legacy", cache=CacheConfig(default_ttl_ms=60_000)) as client:
+        await client.list_tools()
+        await client.list_tools()
+
+    lookups = _collect(capfire)["mcp.client.cache.lookups"]
+    outcomes = {attributes["mcp.cache.result"]: value for attributes, value in lookups}
+    assert outcomes == {"miss": 1, "hit": 1}
+    assert all(attributes["mcp.method.name"] == "tools/list" for attributes, _ in lookups)
+
+
+def test_wire_names_are_capped_to_bound_cardinality(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_metrics, "_NAME_CAP", 2)
+    names = _metrics._BoundedValues()
+    assert [names(name) for name in ("a", "b", "c", "a")] == ["a", "b", _metrics.OTHER, "a"]
@@ -503,3 +503,44 @@ def test_bare_import_mcp_binds_the_types_submodule():
     )
     assert result.returncode == 0, result.stderr
     assert result.stdout == snapshot("Tool\n")
+
+
+def test_mcp_lazy_exports_are_listed_and_unknown_names_raise():
+    """SDK-defined: deferred top-level exports still show up in `dir(mcp)` like eager ones."""
+    assert set(mcp.__all__) <= set(dir(mcp))
+    with pytest.raises(AttributeError):
+        getattr(mcp, "NotAnExport")
+
+
+_IMPORT_PROBE = """
+import sys
+import mcp
+
+heavy = ("mcp_types._v2025_11_25", "mcp_types._v2026_07_28", "mcp.client", "mcp.server")
+print(sorted(name for name in heavy if name in sys.modules))
+import mcp_types.methods as methods
+methods.CLIENT_REQUESTS["tools/call", "2025-11-25"]
+print(sorted(name for name in heavy if name in sys.modules))
+print(mcp.Client.__module__, sorted(name for name in heavy if name in sys.modules))
+"""
+
+
+def test_bare_import_mcp_defers_version_packages_and_client_server_stacks():
+    """SDK-defined: `import mcp` builds neither era's surface models nor the client/server stacks.
+
+    Each is imported on first use instead: a surface-map lookup loads only its own era's
+    package, and a top-level export like `mcp.Client` loads only its own stack.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "utf8", "-c", _IMPORT_PROBE],
+        capture_output=True,
+        encoding="utf-8",
+        check=False,
+        timeout=20,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == snapshot("""\
+[]
+['mcp_types._v2025_11_25']
+mcp.client.client ['mcp.client', 'mcp.server', 'mcp_types._v2025_11_25']
+""")
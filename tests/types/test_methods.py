@@ -2,7 +2,7 @@
 
 import importlib.util
 from collections.abc import Mapping
-from types import MappingProxyType, UnionType
+from types import UnionType
 from typing import Any, get_args
 
 import mcp_types as types
@@ -544,11 +544,20 @@ def test_built_in_maps_are_immutable():
     ]
     for map_name in map_names:
         built_in = getattr(methods, map_name)
-        assert isinstance(built_in, MappingProxyType), map_name
+        assert isinstance(built_in, Mapping), map_name
         with pytest.raises(TypeError):
             _assign_item(built_in)
 
 
+def test_surface_maps_resolve_rows_on_lookup_and_agree_across_views():
+    """SDK-defined: a surface map imports its rows lazily but reads like the dict it wraps."""
+    surface = methods.CLIENT_REQUESTS
+    assert len(surface) == len(list(surface))
+    assert dict(surface.items())[("tools/call", "2025-11-25")] is v2025.CallToolRequest
+    assert surface[("tools/call", "2026-07-28")] is v2026.CallToolRequest
+    assert repr(surface).startswith("_SurfaceMap({")
+
+
 def test_cacheable_methods_mirror_the_cacheable_method_literal():
     """SEP-2549 weld: the hand-written Literal and the set derived from `MONOLITH_RESULTS` must agree."""
     assert methods.CACHEABLE_METHODS == frozenset(get_args(methods.CacheableMethod))
@@ -846,6 +855,56 @@ def test_validate_functions_accept_reject_and_gate_like_their_parse_siblings():
         methods.validate_client_request("ping", "2099-01-01", None)
 
 
+def _monolith_params_type(method: str) -> type[BaseModel]:
+    annotation = methods.MONOLITH_REQUESTS[method].model_fields["params"].annotation
+    params_type = next(arg for arg in (get_args(annotation) or (annotation,)) if arg is not type(None))
+    assert isinstance(params_type, type) and issubclass(params_type, BaseModel)
+    return params_type
+
+
+def test_one_pass_params_parse_agrees_with_the_two_step_parse_on_every_request_row():
+    for (method, version), surface_type in methods.CLIENT_REQUESTS.items():
+        params = REQUEST_PARAMS_FIXTURES[surface_type]
+        params_type = _monolith_params_type(method)
+        parsed = methods.parse_client_request_params(method, version, params, params_type)
+        assert parsed == params_type.model_validate(params or {}, by_name=False), f"{method} at {version}"
+
+
+def test_one_pass_params_parse_rejects_what_either_step_rejects_and_gates_like_validate():
+    # Surface-only failure: 2026 requires the reserved `_meta` entries the monolith leaves optional.
+    with pytest.raises(pydantic.ValidationError):
+        methods.parse_client_request_params("tools/call", "2026-07-28", {"name": "echo"}, types.CallToolRequestParams)
+    # Monolith-only failure: a non-file root in an embedded roots response.
+    retry_params = {"_meta": META_TRIPLE, "name": "echo", "inputResponses": {"r1": {"roots": [{"uri": "https://x"}]}}}
+    with pytest.raises(pydantic.ValidationError):
+        methods.parse_client_request_params("tools/call", "2026-07-28", retry_params, types.CallToolRequestParams)
+    # Absent params: the surface row sees them absent, so required params reject.
+    with pytest.raises(pydantic.ValidationError):
+        methods.parse_client_request_params("tools/call", "2025-11-25", None, types.CallToolRequestParams)
+    with pytest.raises(KeyError):
+        methods.parse_client_request_params("resources/subscribe", "2026-07-28", None, types.SubscribeRequestParams)
+    with pytest.raises(ValueError):
+        methods.parse_client_request_params("ping", "2099-01-01", None, types.RequestParams)
+
+
+def test_one_pass_params_parse_compiles_one_validator_per_row_and_params_type():
+    methods._params_validator.cache_clear()
+    for version in ("2024-11-05", "2025-03-26", "2025-11-25"):
+        methods.parse_client_request_params("tools/call", version, {"name": "echo"}, types.CallToolRequestParams)
+    assert methods._params_validator.cache_info().currsize == 1
+
+
+def test_one_pass_params_parse_of_a_frame_without_params_checks_only_the_params_type():
+    class Bare(BaseModel):
+        method: str
+
+    surface = {("custom/bare", "2025-11-25"): Bare}
+    parsed = methods.parse_client_request_params(
+        "custom/bare", "2025-11-25", None, types.RequestParams, surface=surface
+    )
+    assert parsed == types.RequestParams()
+
+
 # One minimal monolith result instance per request method, dumped via the same
 # `_dump_result` path the runner uses. Cacheable results set `ttl_ms`/`cache_scope`
 # explicitly because the monolith no longer defaults them and 2026 requires them.